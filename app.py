@@ -1,191 +1,58 @@
 # app.py — Halaman Training/Evaluasi + Pilih Algoritma + Outlier + Diagnostik + Save Bundle
 # Jalankan: streamlit run app.py
 
-import io, os, re, json, unicodedata, pickle
+import os, json, hashlib, logging, time, pickle
+from importlib.util import find_spec
+from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import streamlit as st
 
-from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.compose import ColumnTransformer
+from sklearn.base import BaseEstimator, TransformerMixin, clone
 from sklearn.pipeline import Pipeline
-from sklearn.impute import SimpleImputer
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
-from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import r2_score, mean_absolute_error, mean_squared_error
 
-# Algo umum (selalu ada)
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.linear_model import LinearRegression, ElasticNet
-from sklearn.svm import SVR
-from sklearn.neighbors import KNeighborsRegressor
-
 # Custom encoders
-from custom_transformers import AddressTopTokens, FrequencyEncoder
-
-# Algo opsional
-XGB_OK = LGBM_OK = CAT_OK = False
-try:
-    from xgboost import XGBRegressor
-    XGB_OK = True
-except Exception:
-    pass
-try:
-    from lightgbm import LGBMRegressor
-    LGBM_OK = True
-except Exception:
-    pass
-try:
-    from catboost import CatBoostRegressor
-    CAT_OK = True
-except Exception:
-    pass
+from custom_transformers import RARE_LABEL, AddressTopTokens, FrequencyEncoder
+from canonical import SYNONYMS_FILE, compile_canon_tables, load_synonyms
+from comps import build_comps_index
+from drift import build_sketches
+from out_of_core import OOC_DIR, inputs_hash, list_stream_inputs, train_out_of_core
+from incremental import DEFAULT_ADD, UPDATE_DIR, estimator_kind, n_members, update_pipeline, update_record
+from inference import (dump_bundle, get_default_loader, load_bundle, model_version_of, named_bundle_path,
+                       promote_bundle, save_bundle, write_json)
+from intervals import calibrate_intervals, calibration_frame, tree_predictions
+from run_store import RunStore, training_run_key
+from training_pipeline import (
+    stage_key, content_key, read_table, column_nunique, column_is_numeric_like, try_convert_numeric_series,
+    prepare_xy, apply_outliers, split_xy, build_preprocess, fit_preprocess, slugify_name, matrix_memory,
+    prediction_diff, category_consolidation, build_estimator, ALGOS_NEED_SCALING, XGB_OK, LGBM_OK, CAT_OK,
+)
+from instrumentation import begin_run, records_frame, stage, summary_frame
+from export import FORMATS, available_formats, deferred_reader, discard_export, export_frames
 
 # --- (opsional) SciPy untuk fit distribusi ---
-try:
-    import scipy.stats as ss
-    SCIPY_OK = True
-except Exception:
-    SCIPY_OK = False
-
-
-# =========================
-# Util parsing angka lokal
-# =========================
-def _to_float_local(num_str: str) -> Optional[float]:
-    if not isinstance(num_str, str):
-        return None
-    s = re.sub(r"[^0-9\-,\.]", "", num_str.strip())
-    if "," in s and "." in s:
-        s = s.replace(".", "").replace(",", ".")
-    elif "," in s:
-        s = s.replace(",", ".")
-    try:
-        return float(s)
-    except:
-        return None
-
-def rupiah_to_number(text: str) -> Optional[float]:
-    if not isinstance(text, str):
-        return None
-    s = text.lower()
-    m = re.search(r"([0-9\.\,]+)", s)
-    if not m:
-        return None
-    val = _to_float_local(m.group(1))
-    if val is None:
-        return None
-    if   "triliun" in s: val *= 1_000_000_000_000
-    elif "milyar" in s or "miliar" in s: val *= 1_000_000_000
-    elif "juta"  in s: val *= 1_000_000
-    elif "ribu"  in s: val *= 1_000
-    return float(val)
-
-def try_convert_numeric_series(ser: pd.Series, force_currency=False) -> pd.Series:
-    s = ser.copy()
-    if pd.api.types.is_numeric_dtype(s):
-        return s
-    if force_currency:
-        conv = s.apply(rupiah_to_number)
-        if pd.notna(conv).mean() >= 0.5:
-            return pd.to_numeric(conv, errors="coerce")
-    conv = s.apply(_to_float_local)
-    if pd.notna(conv).mean() >= 0.7:
-        return pd.to_numeric(conv, errors="coerce")
-    return s
+SCIPY_OK = find_spec("scipy") is not None
 
-def compute_rmse(y_true, y_pred) -> float:
-    return float(np.sqrt(mean_squared_error(y_true, y_pred)))
 
+def _pyplot():
+    import matplotlib.pyplot as plt
+    return plt
 
-# =========================
-# Encoder & helper
-# =========================
-def make_ohe():
-    try:
-        return OneHotEncoder(handle_unknown="ignore", sparse_output=False)
-    except TypeError:
-        return OneHotEncoder(handle_unknown="ignore", sparse=False)
 
-def slugify_name(text: str) -> str:
-    if not isinstance(text, str):
-        text = str(text)
-    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
-    text = re.sub(r'[^0-9A-Za-z_]+', '_', text)
-    text = re.sub(r'_+', '_', text).strip('_')
-    text = text.replace('__', '_')
-    return text or "col"
+def _scipy_stats():
+    import scipy.stats as ss
+    return ss
 
 
 # =========================
-# Outlier helpers
+# Metrik
 # =========================
-def _numeric_copy(s: pd.Series) -> pd.Series:
-    if pd.api.types.is_numeric_dtype(s):
-        return s.astype(float)
-    s1 = try_convert_numeric_series(s, force_currency=True)
-    return pd.to_numeric(s1, errors="coerce")
-
-def _bounds_iqr(x: pd.Series, k: float = 1.5) -> Tuple[float, float]:
-    q1, q3 = x.quantile(0.25), x.quantile(0.75)
-    iqr = q3 - q1
-    return (q1 - k * iqr, q3 + k * iqr)
-
-def _bounds_zscore(x: pd.Series, z: float = 3.0) -> Tuple[float, float]:
-    mu, sd = x.mean(), x.std(ddof=0)
-    if sd == 0 or np.isnan(sd):
-        return (x.min(), x.max())
-    return (mu - z * sd, mu + z * sd)
-
-def _bounds_log_iqr(x: pd.Series, k: float = 1.5) -> Tuple[float, float]:
-    pos = x[x > 0]
-    if pos.empty:
-        return _bounds_iqr(x, k)
-    min_pos = float(pos.min())
-    x_clip = x.clip(lower=max(min_pos * 0.1, 1e-9))
-    lx = np.log10(x_clip)
-    llo, lhi = _bounds_iqr(lx, k)
-    return (10 ** llo, 10 ** lhi)
-
-def _bounds_quantile(x: pd.Series, q_low: float = 0.01, q_high: float = 0.99) -> Tuple[float, float]:
-    return (x.quantile(q_low), x.quantile(q_high))
-
-def detect_outlier_mask_series(
-    s_raw: pd.Series,
-    method: str = "auto",
-    iqr_k: float = 1.5,
-    z_k: float = 3.0,
-    q_low: float = 0.01,
-    q_high: float = 0.99,
-) -> Tuple[pd.Series, Tuple[float, float]]:
-    x = _numeric_copy(s_raw).dropna()
-    if x.empty:
-        return pd.Series(False, index=s_raw.index), (np.nan, np.nan)
-    if method == "auto":
-        sk = float(x.skew())
-        method_eff = "log_iqr" if sk > 1.0 else "iqr"
-    else:
-        method_eff = method
-    if method_eff == "iqr":
-        lo, hi = _bounds_iqr(x, iqr_k)
-    elif method_eff == "zscore":
-        lo, hi = _bounds_zscore(x, z_k)
-    elif method_eff == "log_iqr":
-        lo, hi = _bounds_log_iqr(x, iqr_k)
-    elif method_eff == "quantile":
-        lo, hi = _bounds_quantile(x, q_low, q_high)
-    else:
-        lo, hi = _bounds_iqr(x, iqr_k)
-    xx = pd.to_numeric(s_raw, errors="coerce")
-    mask = (xx < lo) | (xx > hi)
-    return mask.fillna(False), (lo, hi)
-
-def winsorize_series(s_raw: pd.Series, lower: float, upper: float) -> pd.Series:
-    x = pd.to_numeric(s_raw, errors="coerce")
-    return x.clip(lower=lower, upper=upper)
+def compute_rmse(y_true, y_pred) -> float:
+    return float(np.sqrt(mean_squared_error(y_true, y_pred)))
 
 
 # =========================
@@ -195,6 +62,7 @@ def fit_distributions(x: np.ndarray) -> pd.DataFrame:
     results = []
     if not SCIPY_OK:
         return pd.DataFrame(results)
+    ss = _scipy_stats()
     candidates = [
         ("Normal", ss.norm, False),
         ("Lognormal", ss.lognorm, True),
@@ -242,22 +110,287 @@ def recommend_outlier_method(skew: float, best_dist: Optional[str]) -> str:
     return "IQR (aman)."
 
 
+# =========================
+# Tahap ter-cache: load → parse → clean → split → preprocess
+# =========================
+# Tiap tahap punya key = stage_key(key hulu, parameter widget tahap itu); argumen data berawalan "_"
+# tidak di-hash Streamlit (cukup key-nya). Widget yang berubah hanya membatalkan tahap di hilirnya.
+# cache_resource: output dibagi antar rerun tanpa salinan → diperlakukan read-only.
+@st.cache_resource(max_entries=2, show_spinner="Membaca file...")
+def cached_load(key: str, name: str, _raw: bytes) -> pd.DataFrame:
+    with stage("read_file", file=name):
+        return read_table(_raw, name)
+
+@st.cache_data(max_entries=2048, show_spinner=False)
+def cached_nunique(load_key: str, col: str, _df0: pd.DataFrame) -> int:
+    return column_nunique(_df0[col])
+
+@st.cache_data(max_entries=2048, show_spinner=False)
+def cached_numeric_like(load_key: str, col: str, _df0: pd.DataFrame) -> bool:
+    return column_is_numeric_like(_df0[col])
+
+@st.cache_resource(max_entries=4, show_spinner="Parsing angka...")
+def cached_parse(key: str, _df0: pd.DataFrame, target_col: str, numeric_feats: List[str],
+                 force_currency_cols: List[str], auto_num_convert: bool):
+    with stage("parse_numeric"):
+        return prepare_xy(_df0, target_col, numeric_feats, force_currency_cols, auto_num_convert)
+
+@st.cache_resource(max_entries=4, show_spinner="Outlier handling...")
+def cached_clean(key: str, _df: pd.DataFrame, _y: pd.Series, out_cols: List[str], method: str,
+                 iqr_k: float, z_k: float, q_low: float, q_high: float, action: str):
+    with stage("outliers"):
+        return apply_outliers(_df, _y, out_cols, method, iqr_k, z_k, q_low, q_high, action)
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def cached_split(key: str, _df: pd.DataFrame, _y: pd.Series, chosen_feats: List[str], test_size: float, random_state: int):
+    with stage("split"):
+        return split_xy(_df, _y, chosen_feats, test_size, random_state)
+
+@st.cache_resource(max_entries=1, show_spinner="Memuat bundle...")
+def cached_bundle(path: str, version: str):
+    with stage("load_bundle"):
+        return load_bundle(path)
+
+@st.cache_resource(max_entries=2, show_spinner="Fit ColumnTransformer...")
+def cached_preprocess(key: str, _preprocess, _X_train: pd.DataFrame, _y_train: pd.Series):
+    with stage("fit.preprocess"):
+        return fit_preprocess(_preprocess, _X_train, _y_train)
+
+
+@st.cache_resource
+def get_run_store():
+    return RunStore("models/runs")
+
+
+def profile_panel():
+    prof_df = records_frame()
+    if not prof_df.empty:
+        with st.expander("⏱️ Profil Tahapan (wall / CPU / puncak RSS)"):
+            st.dataframe(prof_df.style.format({"wall_s": "{:.3f}", "cpu_s": "{:.3f}", "peak_rss_delta_mb": "{:,.1f}",
+                                               "rss_end_mb": "{:,.0f}"}), use_container_width=True, hide_index=True)
+            st.caption("Ringkasan per tahap:")
+            st.dataframe(summary_frame(), use_container_width=True, hide_index=True)
+            st.caption("Record yang sama ditulis sebagai JSON ke logger `tanah.stages` (file: env TANAH_PROFILE_LOG).")
+
+
+def promote_panel(bundle_dir: Path, label: str, key: str):
+    """Promosi bundle tersimpan ke default = langkah terpisah + konfirmasi (semua sesi Form Prediksi ikut pindah)."""
+    bundles = sorted(Path(bundle_dir).glob("model_bundle_*.pkl"), reverse=True)
+    if not bundles:
+        return
+    st.markdown("#### Jadikan model default")
+    pick = st.selectbox(label, bundles, format_func=lambda p: p.name, key=f"{key}_promote_pick")
+    ok = st.checkbox("Saya yakin: timpa models/model_bundle_latest.pkl dan models/config_latest.json. Halaman Form "
+                     "Prediksi memuat model ini di background saat rerun berikutnya; model lama tetap dipakai "
+                     "sampai model baru siap.", key=f"{key}_promote_ok")
+    if st.button("⭐ Jadikan default", disabled=not ok, key=f"{key}_promote"):
+        with stage("save.promote"):
+            promote_bundle(pick)
+        get_default_loader(Path(__file__).resolve().parent / "models")  # mulai memuat versi baru sekarang
+        st.success(f"✅ {pick.name} → models/model_bundle_latest.pkl dan models/config_latest.json")
+
+
 # =========================
 # APP — TRAINING
 # =========================
 st.set_page_config(page_title="Training Model • Tanah", layout="wide")
+
+# Mulai muat + warm-up model default untuk halaman Form Prediksi di background (tidak memblokir)
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+get_default_loader(Path(__file__).resolve().parent / "models")
+
+# Profiling per tahap (wall/CPU/puncak RSS); nonaktif = no-op
+begin_run(st.sidebar.toggle("⏱️ Profiling tahapan", value=os.environ.get("TANAH_PROFILE", "0") == "1"))
 st.title("Training & Evaluasi Model (Regresi)")
+MODE_NEW, MODE_UPDATE, MODE_OOC = "Latih baru", "Perbarui model (data baru)", "Out-of-core (file besar di server)"
+train_mode = st.sidebar.radio("Mode", [MODE_NEW, MODE_UPDATE] + ([MODE_OOC] if LGBM_OK else []),
+                              help="Perbarui: bundle lama diperluas dengan listing baru tanpa fit ulang dari nol. "
+                                   "Out-of-core: file di server dialirkan per potongan → LightGBM (data > RAM).")
+
+# =========================
+# MODE OUT-OF-CORE — file di server dialirkan per potongan (upload browser selalu masuk RAM; lihat out_of_core.py)
+# =========================
+if train_mode == MODE_OOC:
+    st.subheader("💽 Training Out-of-Core (LightGBM, data dialirkan dari disk)")
+    ooc_src = st.text_input("File / folder / pola glob di server (CSV, CSV.gz, Parquet)", "data/*.parquet")
+    ooc_cfg_path = Path(st.text_input("Config fitur (target & daftar fitur)", "models/config_latest.json"))
+    try:
+        ooc_files = list_stream_inputs(ooc_src)
+        ooc_cfg = json.loads(ooc_cfg_path.read_text(encoding="utf-8"))
+        ooc_missing = [k for k in ("target_col", "numeric_feats", "onehot_feats", "freq_feats", "addr_feats")
+                       if k not in ooc_cfg]
+        if ooc_missing:
+            raise ValueError(f"kunci config hilang: {ooc_missing}")
+    except (OSError, ValueError) as e:
+        st.error(f"Input/config belum valid: {e}")
+        st.stop()
+    st.caption(f"{len(ooc_files)} file ({sum(p.stat().st_size for p in ooc_files) / 2**20:,.0f} MB) • target "
+               f"`{ooc_cfg['target_col']}` • numerik {len(ooc_cfg['numeric_feats'])} • One-Hot "
+               f"{len(ooc_cfg['onehot_feats'])} • freq {len(ooc_cfg['freq_feats'])} • "
+               f"alamat {len(ooc_cfg['addr_feats'])}")
+    o1, o2, o3 = st.columns(3)
+    with o1:
+        ooc_params = {"n_estimators": st.slider("n_estimators", 100, 5000, 1000, 100),
+                      "learning_rate": st.number_input("learning_rate", 0.001, 1.0, 0.05, 0.01),
+                      "num_leaves": st.slider("num_leaves", 8, 512, 64, 4)}
+    with o2:
+        ooc_chunk = int(st.number_input("Baris per potongan", 10_000, 1_000_000, 100_000, 10_000))
+        ooc_sample = int(st.number_input("Sampel fit encoder", 10_000, 2_000_000, 200_000, 10_000))
+    with o3:
+        ooc_holdout = st.slider("Holdout", 0.05, 0.3, 0.1, 0.05)
+        ooc_min_cat = int(st.number_input("Konsolidasi One-Hot: level < N baris (0 = nonaktif)", 0, 100_000, 10, 1))
+
+    if st.button("🚀 Latih Out-of-Core"):
+        bar = st.progress(0.0, text="Pass 1: membaca data...")
+        spans = {"pass2": (0.25, 0.35), "binning": (0.6, 0.1), "train": (0.7, 0.3)}
+
+        def ooc_progress(step, value):
+            if step == "pass1":
+                bar.progress(0.1, text=f"Pass 1: {value:,.0f} baris terbaca")
+            else:
+                a, w = spans[step]
+                bar.progress(min(1.0, a + w * value), text=f"{step}: {value:.0%}")
+
+        bundle = train_out_of_core(ooc_files, ooc_cfg, ooc_params, chunk_rows=ooc_chunk, sample_rows=ooc_sample,
+                                   holdout=float(ooc_holdout), min_category_count=ooc_min_cat or None,
+                                   on_progress=ooc_progress)
+        bar.empty()
+        info = bundle["config"]["out_of_core"]
+        st.markdown("#### Hasil (Holdout)")
+        a, b, c = st.columns(3)
+        a.metric("R²", f"{info['metrics'].get('r2', float('nan')):.4f}")
+        b.metric("MAE", f"{info['metrics'].get('mae', float('nan')):,.0f}")
+        c.metric("RMSE", f"{info['metrics'].get('rmse', float('nan')):,.0f}")
+        st.caption(f"{info['n_rows']:,} baris (train {info['n_train']:,}, holdout {info['n_holdout']:,}) • "
+                   f"{info['n_features']:,} fitur • {info['rounds']:,} iterasi • "
+                   + " • ".join(f"{k} {v:.1f} s" for k, v in info["timings"].items()))
+        # disimpan ke path bertanda waktu; model default (dipakai halaman Form Prediksi) tidak tersentuh
+        with stage("save.bundle"):
+            ooc_out = save_bundle(bundle, named_bundle_path(OOC_DIR))
+        ooc_data_hash = inputs_hash(ooc_files)
+        ooc_key = hashlib.sha256(json.dumps(
+            {"data": ooc_data_hash, "cfg": {k: ooc_cfg.get(k) for k in ("target_col", "numeric_feats",
+             "onehot_feats", "freq_feats", "addr_feats", "top_n_addr", "target_is_per_m2")},
+             "params": bundle["config"]["params"], "chunk": ooc_chunk, "sample": ooc_sample,
+             "holdout": float(ooc_holdout), "min_cat": ooc_min_cat, "out": str(ooc_out)},
+            sort_keys=True, default=str).encode()).hexdigest()
+        run = get_run_store().record(
+            ooc_key, bundle["pipeline"], algo="LightGBM (out-of-core)", params=bundle["config"]["params"],
+            metrics=info["metrics"], timings=info["timings"], data_hash=ooc_data_hash,
+            n_train=info["n_train"], n_test=info["n_holdout"], target_col=ooc_cfg["target_col"],
+            features={"numeric": ooc_cfg["numeric_feats"], "onehot": ooc_cfg["onehot_feats"],
+                      "freq": ooc_cfg["freq_feats"], "addr": ooc_cfg["addr_feats"],
+                      "files": [str(p) for p in ooc_files], "bundle": str(ooc_out)})
+        st.success(f"✅ Disimpan: {ooc_out} (+ config .json) • run #{run['id']} tercatat di models/runs/runs.sqlite. "
+                   "Model default belum berubah — jadikan default di bawah bila sudah yakin.")
+        st.download_button(f"⬇️ Download {ooc_out.name}", data=deferred_reader(str(ooc_out)),
+                           file_name=ooc_out.name, mime="application/octet-stream", on_click="ignore")
+
+    promote_panel(OOC_DIR, "Bundle out-of-core", "ooc")
+    profile_panel()
+    st.stop()
 
 uploaded = st.file_uploader("Upload Excel/CSV", type=["xlsx", "xls", "csv"])
 if uploaded is None:
     st.info("Silakan upload data dulu.")
     st.stop()
 
-# baca file
-df0 = pd.read_csv(uploaded) if uploaded.name.lower().endswith(".csv") else pd.read_excel(uploaded, sheet_name=0)
+# baca file (key = file_id upload; fallback hash isi file)
+raw = uploaded.getvalue()
+load_key = stage_key("load", uploaded.name, getattr(uploaded, "file_id", None) or content_key(raw))
+df0 = cached_load(load_key, uploaded.name, raw)
 st.success(f"Data dimuat: {df0.shape[0]} baris × {df0.shape[1]} kolom")
 st.dataframe(df0.head(15), use_container_width=True)
 
+# =========================
+# MODE PERBARUI — bundle lama + listing baru (ruang fitur tetap; lihat incremental.py)
+# =========================
+if train_mode == MODE_UPDATE:
+    st.subheader("🔁 Perbarui Model dengan Data Baru")
+    bundle_path = Path(st.text_input("Bundle yang diperbarui", "models/model_bundle_latest.pkl"))
+    if not bundle_path.is_file():
+        st.error(f"Bundle tidak ditemukan: {bundle_path}")
+        st.stop()
+    base = cached_bundle(str(bundle_path), model_version_of(bundle_path))
+    base_model, cfg = (base["pipeline"], base["config"]) if base else (None, {})
+    kind = estimator_kind(base_model) if base_model is not None else None
+    if kind is None or not hasattr(base_model, "steps"):
+        st.error("Bundle tidak memuat pipeline RandomForest/XGBoost/LightGBM/CatBoost — pakai mode Latih baru.")
+        st.stop()
+    upd_target, upd_feats = cfg.get("target_col"), list(cfg.get("features_in") or [])
+    missing = [c for c in [upd_target] + upd_feats if c not in df0.columns]
+    if not upd_feats or missing:
+        st.error(f"Kolom bundle tidak ada di data baru: {missing or 'features_in kosong'}")
+        st.stop()
+    st.caption(f"{kind} • {n_members(base_model):,} pohon/iterasi • target `{upd_target}` • "
+               f"{len(upd_feats)} fitur • {len(cfg.get('updates', []))} pembaruan sebelumnya")
+    u1, u2, u3 = st.columns(3)
+    with u1:
+        n_add = int(st.number_input("Tambah pohon/iterasi", 10, 5000, DEFAULT_ADD[kind], 10))
+    with u2:
+        holdout = st.slider("Holdout data baru (evaluasi)", 0.1, 0.5, 0.2, 0.05)
+    with u3:
+        upd_seed = int(st.number_input("random_state", 0, 9999, 42, 1))
+    st.caption("Encoder (One-Hot, token alamat, peta frekuensi) dibekukan agar pohon lama tetap memprediksi sama; "
+               "kategori/frekuensi dari data baru hanya terpakai setelah latih ulang penuh.")
+
+    upd_numeric = [c for c in cfg.get("numeric_feats", []) if c in df0.columns]
+    upd_parse_key = stage_key(load_key, "update", upd_target, upd_numeric)
+    df_new, y_new = cached_parse(upd_parse_key, df0, upd_target, upd_numeric, [], True)
+    X_up, X_ho, y_up, y_ho, _ = cached_split(stage_key(upd_parse_key, upd_feats, holdout, upd_seed),
+                                             df_new, y_new, upd_feats, float(holdout), upd_seed)
+    st.write(f"Data baru: {len(X_up):,} baris untuk pembaruan, {len(X_ho):,} baris holdout.")
+
+    if st.button("🔁 Perbarui Model"):
+        with stage("update.predict_before"):
+            pred_before = base_model.predict(X_ho)
+        t0 = time.perf_counter()
+        try:
+            model = update_pipeline(base_model, X_up, y_up, n_add)
+        except RuntimeError as e:  # cek ensemble lama gagal → bundle tidak ditulis
+            st.error(str(e))
+            st.stop()
+        upd_seconds = time.perf_counter() - t0
+        with stage("update.predict_after"):
+            pred_after = model.predict(X_ho)
+        m_before = {"r2": r2_score(y_ho, pred_before), "mae": mean_absolute_error(y_ho, pred_before),
+                    "rmse": compute_rmse(y_ho, pred_before)}
+        m_after = {"r2": r2_score(y_ho, pred_after), "mae": mean_absolute_error(y_ho, pred_after),
+                   "rmse": compute_rmse(y_ho, pred_after)}
+
+        st.markdown("#### Holdout Data Baru: Sebelum vs Sesudah Pembaruan")
+        st.dataframe(pd.DataFrame({"sebelum": m_before, "sesudah": m_after})
+                     .assign(selisih=lambda d: d["sesudah"] - d["sebelum"]).rename(index=str.upper),
+                     use_container_width=True)
+        st.caption(f"Pembaruan {upd_seconds:.1f} s • {n_members(base_model):,} → {n_members(model):,} pohon/iterasi")
+
+        # kalibrasi interval ulang di holdout (forest saja); selain itu kalibrasi lama dipertahankan
+        interval_cal = cfg.get("interval_calibration")
+        with stage("calibrate_intervals"):
+            per_tree = tree_predictions(model, X_ho)
+            if per_tree is not None:
+                interval_cal = calibrate_intervals(per_tree, y_ho.values)
+
+        rec = update_record(len(X_up), len(X_ho), n_add, n_members(base_model), n_members(model),
+                            m_before, m_after, upd_seconds)
+        new_cfg = dict(cfg, interval_calibration=interval_cal, updates=list(cfg.get("updates", [])) + [rec])
+        # disimpan ke path bertanda waktu; bundle asal & model default tidak ditimpa
+        with stage("save.bundle"):
+            upd_out = save_bundle(dict(base, pipeline=model, config=new_cfg), named_bundle_path(UPDATE_DIR))
+            # basis = bundle default → config .json ikut membawa kunci config_latest.json (precision, algo, ...)
+            cfg_latest = Path("models/config_latest.json")
+            if bundle_path.resolve() == Path("models/model_bundle_latest.pkl").resolve() and cfg_latest.exists():
+                latest = json.loads(cfg_latest.read_text(encoding="utf-8"))
+                write_json({**latest, **new_cfg}, upd_out.with_suffix(".json"))
+        st.success(f"✅ Disimpan: {upd_out} (+ config .json). Model default belum berubah — "
+                   "jadikan default di bawah bila sudah yakin.")
+        st.download_button(f"⬇️ Download {upd_out.name}", data=deferred_reader(str(upd_out)),
+                           file_name=upd_out.name, mime="application/octet-stream", on_click="ignore")
+
+    promote_panel(UPDATE_DIR, "Bundle hasil pembaruan", "update")
+    profile_panel()
+    st.stop()
+
 # target
 numeric_cols_all = [c for c in df0.columns if pd.api.types.is_numeric_dtype(df0[c])]
 default_target = None
@@ -305,7 +438,7 @@ with c2:
 cat_remaining = [c for c in remaining]
 low_card_default, high_card_default = [], []
 for c in cat_remaining:
-    nunique = df0[c].astype(str).nunique(dropna=True)
+    nunique = cached_nunique(load_key, c, df0)
     (low_card_default if nunique <= 50 else high_card_default).append(c)
 
 c3, c4 = st.columns(2)
@@ -322,6 +455,11 @@ top_n_addr = st.slider("Top-N token alamat", 10, 120, 40, 5) if addr_feats else
 onehot_feats = [c for c in onehot_feats if c not in addr_feats]
 freq_feats   = [c for c in freq_feats   if c not in addr_feats]
 
+# konsolidasi kategori One-Hot (dipelajari saat fit; pemetaan ikut bundle → dipakai juga di halaman prediksi)
+consol_on = bool(onehot_feats) and st.checkbox(
+    "Konsolidasi kategori One-Hot (lipat huruf besar/kecil & spasi + gabung level jarang)", value=True)
+min_cat_count = int(st.number_input(f"Level dengan < N baris → \"{RARE_LABEL}\"", 1, 100_000, 10, 1)) if consol_on else None
+
 # konversi angka
 st.subheader("4) Opsi Konversi Angka")
 force_currency_cols = st.multiselect("Kolom rupiah (paksa parsing Rp→angka)", options=[c for c in numeric_feats if c in df0.columns], default=[])
@@ -331,8 +469,7 @@ auto_num_convert = st.checkbox("Coba konversi string→angka (≥70% sukses)", v
 st.subheader("4.2) Diagnostik Distribusi Target/Kolom Numerik")
 num_like_cols = []
 for c in [target_col] + chosen_feats:
-    ser = try_convert_numeric_series(df0[c], force_currency=True)
-    if pd.notna(ser).mean() >= 0.7:
+    if cached_numeric_like(load_key, c, df0):
         num_like_cols.append(c)
 num_like_cols = list(dict.fromkeys(num_like_cols))
 
@@ -355,6 +492,7 @@ if st.button("🔍 Diagnosa Distribusi"):
             st.success(f"Terbaik: **{best_name}** | KS p-value: {best['ks_pvalue']:.4f}")
             st.info(f"Saran outlier: {recommend_outlier_method(skew, best_name)}")
             try:
+                ss, plt = _scipy_stats(), _pyplot()
                 name_map = {"Normal": ss.norm, "Lognormal": ss.lognorm, "Exponential": ss.expon,
                             "Gamma": ss.gamma, "Weibull": ss.weibull_min, "Laplace": ss.laplace, "StudentT": ss.t}
                 dist = name_map[best_name]; params = best["params"]
@@ -380,32 +518,14 @@ with c7:
 action = st.selectbox("Aksi", ["Drop rows outlier", "Winsorize (clip)"], 0)
 
 # siapkan X,y
-df = df0.copy()
-y = pd.to_numeric(df[target_col], errors="coerce"); mask = y.notna()
-df = df.loc[mask].reset_index(drop=True); y = y.loc[mask].reset_index(drop=True)
-
-for c in numeric_feats:
-    if c in df.columns and (auto_num_convert or (c in force_currency_cols)):
-        df[c] = try_convert_numeric_series(df[c], force_currency=(c in force_currency_cols))
-
-if out_cols:
-    full_mask_out = pd.Series(False, index=df.index); bounds_info = {}
-    for c in out_cols:
-        ser_num = try_convert_numeric_series(df[c], force_currency=True); df[c] = ser_num
-        m_out, (lo, hi) = detect_outlier_mask_series(ser_num, method=method, iqr_k=iqr_k, z_k=z_k, q_low=q_low, q_high=q_high)
-        bounds_info[c] = (lo, hi, int(m_out.sum()))
-        full_mask_out = full_mask_out | m_out.reindex(df.index, fill_value=False)
+parse_key = stage_key(load_key, target_col, numeric_feats, force_currency_cols, auto_num_convert)
+df, y = cached_parse(parse_key, df0, target_col, numeric_feats, force_currency_cols, auto_num_convert)
+
+clean_key = stage_key(parse_key, out_cols, method, iqr_k, z_k, q_low, q_high, action)
+df, y, bounds_info = cached_clean(clean_key, df, y, out_cols, method, iqr_k, z_k, q_low, q_high, action)
+if bounds_info:
     st.caption("Ringkasan batas outlier (skala asli):")
     st.write(pd.DataFrame([{"kolom": k, "lower": v[0], "upper": v[1], "n_outlier": v[2]} for k, v in bounds_info.items()]))
-    if action == "Drop rows outlier":
-        keep_mask = ~full_mask_out
-        df = df.loc[keep_mask].reset_index(drop=True)
-        y  = y.loc[keep_mask].reset_index(drop=True)
-    else:
-        for c in out_cols:
-            lo, hi, _ = bounds_info[c]
-            if np.isfinite(lo) and np.isfinite(hi):
-                df[c] = winsorize_series(df[c], lo, hi)
 
 if len(df) < 10:
     st.error("Data terlalu sedikit (≥ 10 baris).")
@@ -506,115 +626,21 @@ with c8:
 with c9:
     random_state = st.number_input("random_state", 0, 9999, 42, 1)
 
-X_train, X_test, y_train, y_test = train_test_split(
-    df[chosen_feats], y, test_size=float(test_size), random_state=int(random_state)
-)
-
-# =========================
-# ColumnTransformer
-# =========================
-transformers = []
-freq_step_names: Dict[str, str] = {}
-addr_tok_step_names: Dict[str, str] = {}
-
-if numeric_feats:
-    transformers.append(("num", SimpleImputer(strategy="median"), numeric_feats))
-
-if onehot_feats:
-    transformers.append((
-        "catOneHot",
-        Pipeline(steps=[("imp", SimpleImputer(strategy="most_frequent")),
-                        ("ohe", make_ohe())]),
-        onehot_feats
-    ))
-
-for c in freq_feats:
-    safe = slugify_name(c)
-    name = f"freq_{safe}"
-    transformers.append((name, FrequencyEncoder(c), [c]))
-    freq_step_names[c] = name
-
-for c in addr_feats:
-    safe = slugify_name(c)
-    tok_name  = f"addrTok_{safe}"
-    freq_name = f"addrFreq_{safe}"
-    transformers.append((tok_name,  AddressTopTokens(c, top_n=int(top_n_addr)), [c]))
-    transformers.append((freq_name, FrequencyEncoder(c), [c]))
-    addr_tok_step_names[c]  = tok_name
-
-preprocess = ColumnTransformer(transformers=transformers, remainder="drop")
+split_key = stage_key(clean_key, chosen_feats, test_size, random_state)
+X_train, X_test, y_train, y_test, data_hash = cached_split(split_key, df, y, chosen_feats, float(test_size), int(random_state))
 
 # =========================
-# Build estimator sesuai pilihan
+# ColumnTransformer (belum di-fit; fit-nya ter-cache per split + konfigurasi encoding)
 # =========================
-def build_estimator(name: str, params: Dict, random_state: int):
-    if name == "RandomForest":
-        max_features = 1.0 if params.get("max_features") == "1.0" else params.get("max_features", "sqrt")
-        return RandomForestRegressor(
-            n_estimators=int(params.get("n_estimators", 600)),
-            max_depth=params.get("max_depth", None),
-            max_features=max_features,
-            min_samples_split=int(params.get("min_samples_split", 2)),
-            min_samples_leaf=int(params.get("min_samples_leaf", 1)),
-            n_jobs=-1,
-            random_state=int(random_state),
-        )
-    if name == "LinearRegression":
-        return LinearRegression()
-    if name == "ElasticNet":
-        return ElasticNet(alpha=float(params.get("alpha", 1.0)),
-                          l1_ratio=float(params.get("l1_ratio", 0.5)),
-                          max_iter=int(params.get("max_iter", 5000)),
-                          random_state=int(random_state))
-    if name == "SVR":
-        return SVR(kernel=params.get("kernel", "rbf"),
-                   C=float(params.get("C", 10.0)),
-                   epsilon=float(params.get("epsilon", 0.2)))
-    if name == "KNN":
-        return KNeighborsRegressor(n_neighbors=int(params.get("n_neighbors", 7)),
-                                   weights=params.get("weights", "distance"),
-                                   p=int(params.get("p", 2)))
-    if name == "XGBoost" and XGB_OK:
-        return XGBRegressor(
-            n_estimators=int(params.get("n_estimators", 800)),
-            max_depth=int(params.get("max_depth", 8)),
-            learning_rate=float(params.get("learning_rate", 0.05)),
-            subsample=float(params.get("subsample", 0.9)),
-            colsample_bytree=float(params.get("colsample_bytree", 0.9)),
-            reg_lambda=float(params.get("reg_lambda", 1.0)),
-            min_child_weight=float(params.get("min_child_weight", 1.0)),
-            n_jobs=-1,
-            random_state=int(random_state),
-            tree_method="hist",
-            objective="reg:squarederror",
-        )
-    if name == "LightGBM" and LGBM_OK:
-        return LGBMRegressor(
-            n_estimators=int(params.get("n_estimators", 1000)),
-            num_leaves=int(params.get("num_leaves", 64)),
-            max_depth=int(params.get("max_depth", -1)),
-            learning_rate=float(params.get("learning_rate", 0.05)),
-            subsample=float(params.get("subsample", 0.9)),
-            colsample_bytree=float(params.get("colsample_bytree", 0.9)),
-            reg_lambda=float(params.get("reg_lambda", 1.0)),
-            min_child_samples=int(params.get("min_child_samples", 20)),
-            random_state=int(random_state),
-            n_jobs=-1,
-        )
-    if name == "CatBoost" and CAT_OK:
-        return CatBoostRegressor(
-            iterations=int(params.get("iterations", 1000)),
-            learning_rate=float(params.get("learning_rate", 0.05)),
-            depth=int(params.get("depth", 8)),
-            l2_leaf_reg=float(params.get("l2_leaf_reg", 3.0)),
-            random_seed=int(random_state),
-            loss_function="RMSE",
-            verbose=False
-        )
-    raise ValueError("Algoritma tidak tersedia atau dependency belum terpasang.")
+precision = "float32" if st.checkbox(
+    "🪶 Mode presisi float32 (matriks fitur float32, flag biner uint8 → ±½ memori; model pohon tetap setara)",
+    value=False) else "float64"
+preprocess = build_preprocess(numeric_feats, onehot_feats, freq_feats, addr_feats, int(top_n_addr), precision,
+                              min_cat_count)
+prep_key = stage_key(split_key, numeric_feats, onehot_feats, freq_feats, addr_feats, int(top_n_addr), precision,
+                     min_cat_count)
 
 # Apakah butuh scaling?
-ALGOS_NEED_SCALING = {"LinearRegression", "ElasticNet", "SVR", "KNN"}
 scaler_step = ("scale", StandardScaler(with_mean=False)) if algo in ALGOS_NEED_SCALING else None
 
 est = build_estimator(algo, params, random_state=int(random_state))
@@ -627,9 +653,44 @@ model = Pipeline(steps=steps)
 # =========================
 # Train & Evaluasi
 # =========================
+run_store = get_run_store()
+reuse_runs = st.checkbox("♻️ Pakai ulang run identik (data, fitur & parameter sama → tanpa fit ulang)", value=True)
+compare_f64 = precision == "float32" and st.checkbox(
+    "Bandingkan dengan jalur float64 (fit ulang estimator yang sama → selisih prediksi & metrik)", value=False)
+export_fmt = st.radio("Format unduhan hasil test", available_formats(), horizontal=True,
+                      format_func=lambda f: FORMATS[f]["label"])
+
 if st.button("🚀 Latih Model"):
-    model.fit(X_train, y_train)
-    y_pred = model.predict(X_test)
+    # key run = hash split train/test + pipeline (belum di-fit) beserta semua parameternya
+    timings = {}
+    t0 = time.perf_counter()
+    run_key = training_run_key(data_hash, model, extra={"target_col": target_col, "target_is_per_m2": bool(target_is_per_m2)})
+    timings["hash"] = time.perf_counter() - t0
+    mem = None
+
+    cached_run = run_store.find(run_key) if reuse_runs else None
+    t0 = time.perf_counter()
+    if cached_run is not None:
+        model = run_store.load_pipeline(cached_run)
+        timings["load_run"] = time.perf_counter() - t0
+        st.info(f"♻️ Konfigurasi identik dengan run #{cached_run['id']} ({cached_run['created']}, "
+                f"fit {cached_run['timings'].get('fit', 0):.1f} s) — pipeline diambil dari run store tanpa fit ulang.")
+    else:
+        # sama dengan model.fit: ColumnTransformer ter-fit + X_train ter-transform diambil dari cache tahap
+        # (ganti hyperparameter estimator saja tidak mengulang preprocessing), lalu scaler & estimator di-fit
+        prep_fitted, Xt_train = cached_preprocess(prep_key, preprocess, X_train, y_train)
+        mem = matrix_memory(Xt_train)
+        model.steps[0] = ("prep", prep_fitted)
+        with stage("fit.estimator", algo=algo):
+            for _, step in model.steps[1:-1]:
+                Xt_train = step.fit_transform(Xt_train, y_train)
+            model.steps[-1][1].fit(Xt_train, y_train)
+        del Xt_train
+        timings["fit"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    with stage("predict_test"):
+        y_pred = model.predict(X_test)
+    timings["predict_test"] = time.perf_counter() - t0
 
     r2  = r2_score(y_test, y_pred)
     mae = mean_absolute_error(y_test, y_pred)
@@ -640,9 +701,75 @@ if st.button("🚀 Latih Model"):
     a.metric("R²", f"{r2:.4f}")
     b.metric("MAE", f"{mae:,.0f}")
     c.metric("RMSE", f"{rmse:,.0f}")
+    if mem is not None:
+        st.caption(f"Matriks fitur train {mem['dtype']}: {mem['mb']:,.1f} MB (float64: {mem['mb_float64']:,.1f} MB → "
+                   f"hemat {mem['saved_mb']:,.1f} MB / {mem['saved_frac']:.0%})")
+
+    consolidation = category_consolidation(model.named_steps["prep"])
+    if consolidation is not None:
+        st.markdown("#### Konsolidasi Kategori One-Hot")
+        cons_df = pd.DataFrame(consolidation["stats"]).T
+        st.dataframe(cons_df, use_container_width=True)
+        st.caption(f"Kolom One-Hot: {int(cons_df['level_akhir'].sum()):,} (tanpa konsolidasi "
+                   f"{int(cons_df['level_mentah'].sum()):,}) • level < {consolidation['min_count']} baris → \"{RARE_LABEL}\"")
+
+    # Jalur float64 sebagai pembanding mode float32 (estimator & parameter identik, tidak dicatat di run store)
+    if compare_f64:
+        t0 = time.perf_counter()
+        with stage("compare_float64", algo=algo):
+            preprocess64 = build_preprocess(numeric_feats, onehot_feats, freq_feats, addr_feats, int(top_n_addr),
+                                            min_category_count=min_cat_count)
+            prep64, Xt64 = cached_preprocess(stage_key(prep_key, "float64"), preprocess64, X_train, y_train)
+            mem64 = matrix_memory(Xt64)
+            model64 = clone(model)
+            model64.steps[0] = ("prep", prep64)
+            for _, step in model64.steps[1:-1]:
+                Xt64 = step.fit_transform(Xt64, y_train)
+            model64.steps[-1][1].fit(Xt64, y_train)
+            del Xt64
+            y_pred64 = model64.predict(X_test)
+        timings["compare_float64"] = time.perf_counter() - t0
+        diff = prediction_diff(y_pred64, y_pred)
+        st.markdown("#### Presisi float32 vs float64 (Test Set)")
+        st.dataframe(pd.DataFrame({
+            "float64": [r2_score(y_test, y_pred64), mean_absolute_error(y_test, y_pred64), compute_rmse(y_test, y_pred64),
+                        mem64["mb"]],
+            "float32": [r2, mae, rmse, mem["mb"] if mem is not None else np.nan],
+        }, index=["R²", "MAE", "RMSE", "Matriks fitur train (MB)"]).assign(selisih=lambda d: d["float32"] - d["float64"]),
+            use_container_width=True)
+        st.caption(f"Selisih prediksi: {diff['n_diff']:,}/{len(y_pred):,} baris berbeda • maks {diff['max_abs']:,.2f} "
+                   f"({diff['max_rel']:.2e} relatif) • rata-rata {diff['mean_abs']:,.4f} ({diff['mean_rel']:.2e} relatif)")
+
+    # Coverage interval prediksi (kuantil antar pohon) di test set → faktor kalibrasi untuk halaman prediksi
+    t0 = time.perf_counter()
+    interval_cal = None
+    with stage("calibrate_intervals"):
+        per_tree_test = tree_predictions(model, X_test)
+        if per_tree_test is not None:
+            interval_cal = calibrate_intervals(per_tree_test, y_test.values)
+    if per_tree_test is not None:
+        st.markdown("#### Coverage Interval Prediksi (Test Set)")
+        st.dataframe(calibration_frame(interval_cal).style.format({
+            "coverage_raw": "{:.1%}", "coverage_calibrated": "{:.1%}", "scale": "{:.3f}",
+            "median_width_raw": "{:,.0f}", "median_width_calibrated": "{:,.0f}"}), use_container_width=True)
+        st.caption("coverage_raw = kuantil antar pohon apa adanya; coverage_calibrated = setelah lebar dikali `scale` "
+                   "(diukur silang antar separuh test set).")
+    timings["calibrate"] = time.perf_counter() - t0
+
+    # catat run baru (run hasil memoization tidak dicatat ulang; hits-nya bertambah)
+    if cached_run is None:
+        run = run_store.record(
+            run_key, model, algo=algo, params=params, metrics={"r2": r2, "mae": mae, "rmse": rmse},
+            timings=timings, data_hash=data_hash, n_train=len(X_train), n_test=len(X_test), target_col=target_col,
+            features={"numeric": numeric_feats, "onehot": onehot_feats, "freq": freq_feats, "addr": addr_feats,
+                      "test_size": float(test_size), "random_state": int(random_state), "precision": precision,
+                      "min_category_count": min_cat_count})
+        st.caption(f"Run #{run['id']} tercatat di models/runs/runs.sqlite • "
+                   + " • ".join(f"{k} {v:.2f} s" for k, v in timings.items()))
 
     # Scatter Prediksi vs Aktual
     st.markdown("#### Prediksi vs Aktual")
+    plt = _pyplot()
     fig = plt.figure()
     plt.scatter(y_test, y_pred, alpha=0.6)
     lo = float(min(np.min(y_test), np.min(y_pred)))
@@ -743,9 +870,29 @@ if st.button("🚀 Latih Model"):
     # kolom numerik yang boleh dipaksa numeric saat inferensi
     force_numeric_cols = [c for c in features_in if c.lower() in ["luas","jarak_cbd","latitude","longitude"]]
 
-    # simpan model & config (legacy terpisah)
-    import joblib
-    joblib.dump(model, "models/model_latest.pkl")
+    # tabel kanonikalisasi input (nilai form/Excel → kategori OHE persis seperti training);
+    # sinonim yang mengubah makna hanya dari file tinjauan domain models/category_synonyms.json
+    synonyms = load_synonyms(Path("models") / SYNONYMS_FILE)
+    canon_tables = compile_canon_tables(ohe_cats_map, synonyms=synonyms,
+                                        consolidation=consolidation["mapping"] if consolidation else None)
+
+    # comps & sketsa drift memakai kategori terkonsolidasi (input prediksi juga dipetakan lewat canon_tables)
+    df_cat = df
+    if consolidation is not None:
+        consol = model.named_steps["prep"].named_transformers_["catOneHot"].named_steps["consol"]
+        df_cat = df.assign(**dict(consol.transform(df[onehot_feats]).items()))
+
+    # indeks pembanding (comps): lokasi + atribut + harga semua listing training (setelah filter outlier)
+    with stage("build_comps_index"):
+        comps_index = build_comps_index(df_cat, y, numeric_feats, onehot_feats, price_is_per_m2=bool(target_is_per_m2))
+
+    # sketsa distribusi fitur training (bin kuantil / tabel frekuensi) untuk deteksi drift input batch
+    with stage("build_drift_sketches"):
+        drift_sketches = build_sketches(df_cat, numeric_feats, list(onehot_feats) + list(freq_feats) + list(addr_feats))
+
+    # simpan model & config (legacy terpisah); atomik — model default bisa sedang di-mmap halaman Form Prediksi
+    with stage("save.model_latest"):
+        dump_bundle(model, "models/model_latest.pkl")
     feature_config = {
         "target_col": target_col,
         "numeric_feats": numeric_feats,
@@ -753,13 +900,18 @@ if st.button("🚀 Latih Model"):
         "freq_feats": freq_feats,
         "addr_feats": addr_feats,
         "top_n_addr": int(top_n_addr),
+        "precision": precision,
         "ohe_categories": ohe_cats_map,
         "freq_top_values": freq_top_map,
+        "canon_tables": canon_tables,
+        "synonyms": synonyms,
+        "category_consolidation": consolidation,
+        "interval_calibration": interval_cal,
+        "drift_sketches": drift_sketches,
         "algo": algo,
         "params": params
     }
-    with open("models/config_latest.json", "w", encoding="utf-8") as f:
-        json.dump(feature_config, f, ensure_ascii=False, indent=2)
+    write_json(feature_config, "models/config_latest.json")
 
     # bundle untuk end-user (single file)
     bundle = {
@@ -776,38 +928,58 @@ if st.button("🚀 Latih Model"):
             "freq_top_values": freq_top_map,
             "canon_text_cols": canon_text_cols,
             "force_numeric_cols": force_numeric_cols,
-            "synonyms": {}
-        }
+            "canon_tables": canon_tables,
+            "category_consolidation": consolidation,
+            "interval_calibration": interval_cal,
+            "drift_sketches": drift_sketches,
+            "synonyms": synonyms
+        },
+        "comps": comps_index,
     }
-    joblib.dump(bundle, "models/model_bundle_latest.pkl")
+    with stage("save.bundle"):
+        dump_bundle(bundle, "models/model_bundle_latest.pkl")
     st.success("✅ Disimpan: models/model_latest.pkl, models/config_latest.json, dan models/model_bundle_latest.pkl")
 
-    # tombol unduhan
+    # tombol unduhan (file temp ditulis per potongan; dibaca saat tombol diklik)
     out = pd.DataFrame({"y_true": y_test.values, "y_pred": y_pred, "residual": y_test.values - y_pred})
-    try:
-        import openpyxl
-        buf = io.BytesIO()
-        with pd.ExcelWriter(buf, engine="openpyxl") as w:
-            out.to_excel(w, sheet_name="Prediksi_Test", index=False)
-            if fi is not None:
-                fi.to_excel(w, sheet_name="Feature_Importance", index=False)
-        st.download_button(
-            "⬇️ Download (Excel Hasil Test)",
-            data=buf.getvalue(),
-            file_name="training_results.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
-    except Exception:
-        st.download_button("⬇️ Prediksi (CSV)", data=out.to_csv(index=False).encode("utf-8"),
-                           file_name="prediksi_test.csv", mime="text/csv")
+    sheets = {"Prediksi_Test": out}
+    if fi is not None:
+        sheets["Feature_Importance"] = fi
+    with stage("export", rows=len(out), fmt=export_fmt):
+        exp = export_frames(sheets, export_fmt, "training_results")
+    discard_export(st.session_state.get("train_export"))
+    st.session_state["train_export"] = exp
+    st.download_button(f"⬇️ Download Hasil Test ({FORMATS[export_fmt]['label']})", data=deferred_reader(exp["path"]),
+                       file_name=exp["file_name"], mime=exp["mime"], on_click="ignore")
+    if export_fmt != "xlsx" and fi is not None:
+        st.caption("Feature importance hanya ikut di format Excel (sheet terpisah).")
 
     # download bundle pkl langsung
-    try:
-        with open("models/model_bundle_latest.pkl", "rb") as f:
-            st.download_button("⬇️ Download model_bundle_latest.pkl", data=f.read(),
-                               file_name="model_bundle_latest.pkl", mime="application/octet-stream")
-    except Exception:
-        pass
+    if os.path.exists("models/model_bundle_latest.pkl"):
+        st.download_button("⬇️ Download model_bundle_latest.pkl", data=deferred_reader("models/model_bundle_latest.pkl"),
+                           file_name="model_bundle_latest.pkl", mime="application/octet-stream", on_click="ignore")
+
+# =========================
+# Riwayat & Perbandingan Run
+# =========================
+with st.expander("📚 Riwayat Run Training"):
+    runs_df = run_store.runs_frame()
+    if runs_df.empty:
+        st.caption("Belum ada run tercatat.")
+    else:
+        st.dataframe(runs_df, use_container_width=True, hide_index=True)
+        cmp_ids = st.multiselect("Bandingkan run", options=runs_df["id"].tolist(), default=runs_df["id"].tolist()[:2],
+                                 format_func=lambda i: f"#{i}")
+        if cmp_ids:
+            cmp = run_store.compare(cmp_ids).astype(str)
+            differs = cmp.nunique(axis=1) > 1
+            only_diff = st.toggle("Hanya tampilkan yang berbeda", value=True)
+            st.dataframe(cmp[differs] if only_diff else cmp, use_container_width=True)
+
+# =========================
+# Panel profiling
+# =========================
+profile_panel()
 
 st.caption("Catatan: Outlier & diagnostik distribusi tetap seperti versi Anda. "
            "App ini juga menyimpan single-file bundle untuk dipakai end-user.")
@@ -0,0 +1,233 @@
+# audit_log.py — Audit trail prediksi (input, versi model, output) yang ditulis asinkron ke SQLite
+#
+# log_single / log_batch hanya memasukkan event ke antrean memori (put_nowait, tanpa I/O di jalur klik);
+# satu thread writer mengambil event sebanyak yang ada (≤ batch_rows baris) lalu executemany dalam satu
+# transaksi. Tabel append-only (trigger menolak UPDATE/DELETE), satu baris per properti yang diprediksi.
+# Antrean dibatasi jumlah event & total baris; bila penuh event dibuang dan dihitung di metrics().
+# Saat proses berhenti (atexit) sisa antrean di-flush.
+import atexit, json, logging, queue, sqlite3, threading, time, uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS predictions (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id      TEXT NOT NULL,
+    ts            TEXT NOT NULL,
+    kind          TEXT NOT NULL,
+    session       TEXT,
+    model_version TEXT,
+    source        TEXT,
+    row_idx       INTEGER,
+    input_json    TEXT,
+    prediction    REAL,
+    lower         REAL,
+    upper         REAL,
+    extra_json    TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_predictions_event ON predictions(event_id);
+CREATE INDEX IF NOT EXISTS idx_predictions_ts ON predictions(ts);
+CREATE TRIGGER IF NOT EXISTS predictions_no_update BEFORE UPDATE ON predictions
+BEGIN SELECT RAISE(ABORT, 'audit log append-only'); END;
+CREATE TRIGGER IF NOT EXISTS predictions_no_delete BEFORE DELETE ON predictions
+BEGIN SELECT RAISE(ABORT, 'audit log append-only'); END;
+"""
+
+_INSERT = ("INSERT INTO predictions (event_id, ts, kind, session, model_version, source, row_idx, input_json, "
+           "prediction, lower, upper, extra_json) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+
+_STOP = object()
+
+
+def _float_or_none(v) -> Optional[float]:
+    try:
+        f = float(v)
+    except (TypeError, ValueError):
+        return None
+    return f if np.isfinite(f) else None
+
+
+class AuditLogger:
+    def __init__(self, db_path, max_queue_events: int = 1_000, max_queue_rows: int = 200_000,
+                 batch_rows: int = 5_000):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_queue_rows = int(max_queue_rows)
+        self.batch_rows = int(batch_rows)
+        self._q: "queue.Queue" = queue.Queue(maxsize=int(max_queue_events))
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending_events = 0
+        self._queued_rows = 0
+        self._m = {"enqueued_events": 0, "enqueued_rows": 0, "written_events": 0, "written_rows": 0,
+                   "dropped_events": 0, "dropped_rows": 0, "failed_rows": 0, "batches": 0,
+                   "lag_s_last": None, "lag_s_max": 0.0, "last_write": None, "last_error": None}
+        with closing(self._connect()) as con, con:
+            con.executescript(_SCHEMA)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _connect(self):
+        con = sqlite3.connect(self.db_path, timeout=30)
+        con.execute("PRAGMA journal_mode=WAL")
+        return con
+
+    # ---------- jalur klik (tanpa I/O) ----------
+    def _enqueue(self, event: Dict) -> bool:
+        n = event["n_rows"]
+        with self._lock:
+            full = self._closed or self._queued_rows + n > self.max_queue_rows
+            if not full:
+                try:
+                    self._q.put_nowait(event)
+                except queue.Full:
+                    full = True
+            if full:
+                self._m["dropped_events"] += 1
+                self._m["dropped_rows"] += n
+                return False
+            self._pending_events += 1
+            self._queued_rows += n
+            self._m["enqueued_events"] += 1
+            self._m["enqueued_rows"] += n
+        return True
+
+    def log_batch(self, inputs: pd.DataFrame, predictions, model_version: str = "", session: str = "",
+                  source: str = "", kind: str = "batch", lower=None, upper=None, extra: Optional[Dict] = None) -> bool:
+        """Antrekan satu event prediksi (inputs: satu baris per properti). False bila dibuang karena antrean penuh.
+
+        `inputs` disimpan sebagai referensi — jangan diubah in-place setelah dicatat.
+        """
+        return self._enqueue({
+            "event_id": uuid.uuid4().hex, "t_enqueue": time.time(), "kind": kind, "session": session,
+            "model_version": model_version, "source": source, "inputs": inputs,
+            "pred": np.asarray(predictions, dtype=float).reshape(-1),
+            "lower": None if lower is None else np.asarray(lower, dtype=float).reshape(-1),
+            "upper": None if upper is None else np.asarray(upper, dtype=float).reshape(-1),
+            "extra": extra or {}, "n_rows": len(inputs)})
+
+    def log_single(self, X_row: pd.DataFrame, prediction: float, model_version: str = "", session: str = "",
+                   lower: Optional[float] = None, upper: Optional[float] = None, extra: Optional[Dict] = None) -> bool:
+        return self.log_batch(X_row, [prediction], model_version, session, source="form", kind="single",
+                              lower=None if lower is None else [lower], upper=None if upper is None else [upper],
+                              extra=extra)
+
+    # ---------- writer ----------
+    @staticmethod
+    def _rows(ev: Dict):
+        ts = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(ev["t_enqueue"])) + f".{int(ev['t_enqueue'] % 1 * 1000):03d}"
+        inputs = ev["inputs"].copy(deep=False)
+        inputs.attrs = {}
+        input_json = inputs.to_json(orient="records", lines=True, date_format="iso", default_handler=str).splitlines()
+        extra = json.dumps(ev["extra"], default=str) if ev["extra"] else None
+        lo, hi = ev["lower"], ev["upper"]
+        for i, (inp, p) in enumerate(zip(input_json, ev["pred"])):
+            yield (ev["event_id"], ts, ev["kind"], ev["session"], ev["model_version"], ev["source"], i, inp,
+                   _float_or_none(p), None if lo is None else _float_or_none(lo[i]),
+                   None if hi is None else _float_or_none(hi[i]), extra)
+
+    def _write(self, con, events):
+        n_rows = sum(ev["n_rows"] for ev in events)
+        try:
+            with con:
+                for ev in events:
+                    con.executemany(_INSERT, self._rows(ev))
+            ok = True
+        except Exception as e:
+            ok = False
+            logger.exception("Gagal menulis %d baris audit", n_rows)
+            self._m["last_error"] = f"{type(e).__name__}: {e}"
+        now = time.time()
+        with self._lock:
+            self._m["batches"] += 1
+            if ok:
+                self._m["written_events"] += len(events)
+                self._m["written_rows"] += n_rows
+            else:
+                self._m["failed_rows"] += n_rows
+            lag = now - min(ev["t_enqueue"] for ev in events)
+            self._m["lag_s_last"] = lag
+            self._m["lag_s_max"] = max(self._m["lag_s_max"], lag)
+            self._m["last_write"] = now
+            self._queued_rows -= n_rows
+            self._pending_events -= len(events)
+            self._idle.notify_all()
+
+    def _run(self):
+        con = self._connect()
+        stop = False
+        while not stop:
+            ev = self._q.get()
+            if ev is _STOP:
+                break
+            events, rows = [ev], ev["n_rows"]
+            # kumpulkan yang sudah menunggu (tanpa menunda) → satu transaksi
+            while rows < self.batch_rows:
+                try:
+                    ev = self._q.get_nowait()
+                except queue.Empty:
+                    break
+                if ev is _STOP:
+                    stop = True
+                    break
+                events.append(ev)
+                rows += ev["n_rows"]
+            self._write(con, events)
+        con.close()
+
+    # ---------- kontrol ----------
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """Tunggu semua event yang sudah diantrekan tertulis; False bila timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._pending_events > 0:
+                left = None if deadline is None else deadline - time.monotonic()
+                if left is not None and left <= 0:
+                    return False
+                self._idle.wait(left)
+        return True
+
+    def close(self, timeout: float = 30.0):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.flush(timeout)
+        try:
+            self._q.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            m = dict(self._m)
+            m.update(queue_events=self._pending_events, queue_rows=self._queued_rows,
+                     writer_alive=self._thread.is_alive())
+        return m
+
+    def recent(self, limit: int = 50) -> pd.DataFrame:
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as con:
+            return pd.read_sql_query("SELECT * FROM predictions ORDER BY id DESC LIMIT ?", con, params=(int(limit),))
+
+
+_AUDIT_LOGGERS: Dict[str, AuditLogger] = {}
+_AUDIT_LOGGERS_LOCK = threading.Lock()
+
+
+def get_audit_logger(db_path, **kwargs) -> AuditLogger:
+    """Logger singleton per file DB per proses (dibagi semua sesi & halaman Streamlit)."""
+    key = str(Path(db_path).resolve())
+    with _AUDIT_LOGGERS_LOCK:
+        log = _AUDIT_LOGGERS.get(key)
+        if log is None:
+            log = _AUDIT_LOGGERS[key] = AuditLogger(db_path, **kwargs)
+    return log
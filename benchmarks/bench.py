@@ -0,0 +1,222 @@
+# benchmarks/bench.py — Suite benchmark performa di atas data sintetis (skema models/config_latest.json)
+# Jalankan:
+#   python benchmarks/bench.py run --rows 1000 100000 1000000 [--fit-rows 20000] [--algos RandomForest XGBoost] [--precision float32]
+#   python benchmarks/bench.py compare benchmarks/results/<lama>.json benchmarks/results/<baru>.json [--threshold 0.1]
+#
+# Yang diukur per ukuran data: pembangkitan data, parsing rupiah, deteksi outlier (semua metode),
+# fit/transform AddressTopTokens & FrequencyEncoder, fit ColumnTransformer, fit tiap algoritma build_estimator,
+# prediksi satu baris & batch (predict_frame), dan fungsi penjelasan (explain.py, satu baris & batch top-k).
+# Hasil: JSON (meta commit/versi library + satu record per kasus) di benchmarks/results/.
+import argparse, json, os, platform, statistics, subprocess, sys, time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from custom_transformers import AddressTopTokens, FrequencyEncoder
+from explain import explain_categorical_contrast, explain_frame, explain_numeric_local
+from inference import predict_frame
+from training_pipeline import (
+    ALGOS_NEED_SCALING, CAT_OK, LGBM_OK, PRECISIONS, XGB_OK, build_estimator, build_preprocess, detect_outlier_mask_series,
+    fit_preprocess, rupiah_to_number, try_convert_numeric_series,
+)
+from synth import DEFAULT_CONFIG, load_schema, rupiah_texts, synthetic_frame
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+OUTLIER_METHODS = ["auto", "iqr", "zscore", "log_iqr", "quantile"]
+ALL_ALGOS = ["RandomForest", "LinearRegression", "ElasticNet", "SVR", "KNN"] + \
+            (["XGBoost"] if XGB_OK else []) + (["LightGBM"] if LGBM_OK else []) + (["CatBoost"] if CAT_OK else [])
+
+
+# ---------- pencatat ----------
+class Bench:
+    def __init__(self, repeats: int = 3):
+        self.repeats = repeats
+        self.results: List[Dict] = []
+        self.data_rows = 0  # ukuran dataset yang sedang diuji (kunci perbandingan bersama nama kasus)
+
+    def case(self, name: str, rows: int, fn: Callable, repeats: Optional[int] = None, warmup: int = 0, **extra):
+        """Jalankan fn (warmup + repeats kali), simpan median/min; kembalikan output pemanggilan terakhir."""
+        for _ in range(warmup):
+            fn()
+        times, out = [], None
+        for _ in range(repeats or self.repeats):
+            t0 = time.perf_counter()
+            out = fn()
+            times.append(time.perf_counter() - t0)
+        med = statistics.median(times)
+        self.results.append({"name": name, "data_rows": self.data_rows, "rows": int(rows), "repeats": len(times), "median_s": med,
+                             "min_s": min(times), "rows_per_s": rows / med if med > 0 else None, **extra})
+        print(f"{name:<44} {rows:>11,} baris {med * 1e3:>12.2f} ms", flush=True)
+        return out
+
+
+def _git(*args) -> str:
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, timeout=30).stdout.strip()
+    except Exception:
+        return ""
+
+
+def run_meta(args) -> Dict:
+    import sklearn
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(), "platform": platform.platform(),
+        "cpus": len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count(),
+        "numpy": np.__version__, "pandas": pd.__version__, "sklearn": sklearn.__version__,
+        "args": {k: v for k, v in vars(args).items() if k != "func"},
+    }
+
+
+# ---------- kasus ----------
+def bench_size(b: Bench, n: int, schema: Dict, args):
+    target = schema["target_col"]
+    numeric, onehot, freq, addr = schema["numeric_feats"], schema["onehot_feats"], schema["freq_feats"], schema["addr_feats"]
+    df = b.case("synth.generate", n, lambda: synthetic_frame(n, schema, seed=args.seed), repeats=1)
+
+    # parsing angka rupiah (teks iklan campuran)
+    texts = rupiah_texts(df[target].to_numpy(), np.random.default_rng(args.seed))
+    b.case("parse.rupiah_to_number", n, lambda: texts.map(rupiah_to_number))
+    b.case("parse.try_convert_numeric_series", n, lambda: try_convert_numeric_series(texts, force_currency=True))
+
+    # deteksi outlier pada target
+    for m in OUTLIER_METHODS:
+        b.case(f"outlier.{m}", n, lambda m=m: detect_outlier_mask_series(df[target], method=m))
+
+    # encoder kustom (kolom alamat: token + frekuensi; kolom freq: frekuensi)
+    for c in addr:
+        tok = AddressTopTokens(c, top_n=int(schema["top_n_addr"]))
+        b.case(f"AddressTopTokens.fit[{c}]", n, lambda: tok.fit(df[[c]]))
+        b.case(f"AddressTopTokens.transform[{c}]", n, lambda: tok.transform(df[[c]]))
+    for c in list(freq) + list(addr):
+        enc = FrequencyEncoder(c)
+        b.case(f"FrequencyEncoder.fit[{c}]", n, lambda: enc.fit(df[[c]]))
+        b.case(f"FrequencyEncoder.transform[{c}]", n, lambda: enc.transform(df[[c]]))
+
+    # fit: sampel fit_rows baris (fit model penuh di jutaan baris tidak praktis di satu mesin)
+    fit_df = df.sample(min(n, args.fit_rows), random_state=args.seed) if n > args.fit_rows else df
+    features = list(dict.fromkeys(list(numeric) + list(onehot) + list(freq) + list(addr)))
+    X, y = fit_df[features], fit_df[target]
+    preprocess = build_preprocess(numeric, onehot, freq, addr, int(schema["top_n_addr"]), args.precision)
+    prep, Xt = b.case("fit.preprocess", len(X), lambda: fit_preprocess(preprocess, X, y), repeats=1)
+
+    params = {"n_estimators": args.n_estimators, "iterations": args.n_estimators} if args.n_estimators else {}
+    fitted = {}
+    for algo in args.algos:
+        rows = min(len(X), args.svr_rows) if algo == "SVR" else len(X)
+        Xa, ya = Xt[:rows], y.iloc[:rows]
+
+        def fit(algo=algo, Xa=Xa, ya=ya):
+            steps = [("scale", StandardScaler(with_mean=False).fit(Xa))] if algo in ALGOS_NEED_SCALING else []
+            Xs = steps[0][1].transform(Xa) if steps else Xa
+            return steps + [("reg", build_estimator(algo, params, random_state=args.seed).fit(Xs, ya))]
+        fitted[algo] = b.case(f"fit.{algo}", rows, fit, repeats=1, algo=algo)
+
+    # prediksi & penjelasan memakai pipeline algoritma default app (RandomForest bila dipilih)
+    algo = "RandomForest" if "RandomForest" in fitted else next(iter(fitted), None)
+    if algo is None:
+        return
+    model = Pipeline([("prep", prep)] + fitted[algo])
+    row = X.iloc[[0]]
+    b.case("predict.single_row", 1, lambda: model.predict(row), repeats=args.single_repeats, warmup=2, algo=algo)
+    pred_df = df.iloc[:min(n, args.predict_rows)]
+    b.case("predict.batch", len(pred_df), lambda: predict_frame(model, pred_df, features), repeats=1, algo=algo)
+
+    num_row = row.copy()
+    for c in numeric:
+        if pd.isna(num_row.iloc[0][c]):
+            num_row[c] = float(np.nanmedian(X[c]))
+    choices = {c: schema["ohe_categories"].get(c, []) for c in onehot}
+    b.case("explain.numeric", 1, lambda: explain_numeric_local(model, num_row, pct=0.10), repeats=1, algo=algo)
+    b.case("explain.categorical", 1, lambda: explain_categorical_contrast(model, row, choices), repeats=1, algo=algo)
+    X_exp = X.iloc[:min(len(X), args.explain_rows)]
+    b.case("explain.batch_top3", len(X_exp), lambda: explain_frame(model, X_exp, 0.10, choices, top_k=3), repeats=1, algo=algo)
+
+
+def cmd_run(args):
+    schema = load_schema(args.config)
+    b = Bench(repeats=args.repeats)
+    meta = run_meta(args)
+    for n in args.rows:
+        print(f"--- {n:,} baris ---", flush=True)
+        b.data_rows = int(n)
+        bench_size(b, int(n), schema, args)
+    out = Path(args.out) if args.out else RESULTS_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}_{(meta['commit'] or 'nogit')[:10]}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": b.results}, f, indent=2, default=str)
+    print(f"Hasil → {out}")
+
+
+# ---------- perbandingan ----------
+def compare_results(old: Dict, new: Dict, threshold: float = 0.10) -> pd.DataFrame:
+    """Gabung dua hasil per (data_rows, name): rasio median baru/lama dan status regresi/lebih cepat."""
+    a = pd.DataFrame(old["results"])[["data_rows", "name", "rows", "median_s"]]
+    b = pd.DataFrame(new["results"])[["data_rows", "name", "median_s"]]
+    m = a.merge(b, on=["data_rows", "name"], how="outer", suffixes=("_lama", "_baru"))
+    m["rasio"] = m["median_s_baru"] / m["median_s_lama"]
+    m["status"] = np.select([m["rasio"] > 1 + threshold, m["rasio"] < 1 - threshold, m["rasio"].notna()],
+                            ["REGRESI", "lebih cepat", "sama"], default="-")
+    return m.sort_values(["data_rows", "name"], kind="stable").reset_index(drop=True)
+
+
+def cmd_compare(args):
+    with open(args.old, encoding="utf-8") as f:
+        old = json.load(f)
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)
+    print(f"lama: {old['meta'].get('commit', '')[:10]}{'+dirty' if old['meta'].get('dirty') else ''}  "
+          f"baru: {new['meta'].get('commit', '')[:10]}{'+dirty' if new['meta'].get('dirty') else ''}")
+    cmp = compare_results(old, new, args.threshold)
+    with pd.option_context("display.max_rows", None, "display.width", 200):
+        print(cmp.to_string(index=False, formatters={"median_s_lama": "{:.4f}".format,
+                                                     "median_s_baru": "{:.4f}".format, "rasio": "{:.2f}".format}))
+    n_reg = int((cmp["status"] == "REGRESI").sum())
+    print(f"{n_reg} kasus regresi (> {args.threshold:.0%} lebih lambat)")
+    if args.fail_on_regression and n_reg:
+        sys.exit(1)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark performa pipeline tanah (data sintetis).")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    r = sub.add_parser("run", help="jalankan benchmark dan simpan JSON")
+    r.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000])
+    r.add_argument("--config", default=str(DEFAULT_CONFIG))
+    r.add_argument("--algos", nargs="+", default=ALL_ALGOS, choices=ALL_ALGOS)
+    r.add_argument("--fit-rows", type=int, default=20_000, help="maks. baris sampel untuk fit model")
+    r.add_argument("--svr-rows", type=int, default=5_000, help="maks. baris untuk SVR (kompleksitas kuadratik)")
+    r.add_argument("--predict-rows", type=int, default=1_000_000, help="maks. baris untuk predict.batch")
+    r.add_argument("--explain-rows", type=int, default=2_000, help="maks. baris untuk explain.batch_top3")
+    r.add_argument("--precision", default="float64", choices=PRECISIONS, help="presisi matriks fitur (fit.* & predict.*)")
+    r.add_argument("--n-estimators", type=int, default=None, help="override jumlah pohon/iterasi (default = default app)")
+    r.add_argument("--repeats", type=int, default=3)
+    r.add_argument("--single-repeats", type=int, default=20)
+    r.add_argument("--seed", type=int, default=0)
+    r.add_argument("--out", default=None, help="path JSON (default benchmarks/results/<waktu>_<commit>.json)")
+    r.set_defaults(func=cmd_run)
+
+    c = sub.add_parser("compare", help="bandingkan dua file hasil")
+    c.add_argument("old"); c.add_argument("new")
+    c.add_argument("--threshold", type=float, default=0.10)
+    c.add_argument("--fail-on-regression", action="store_true")
+    c.set_defaults(func=cmd_compare)
+
+    args = ap.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
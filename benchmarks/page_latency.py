@@ -0,0 +1,220 @@
+# benchmarks/page_latency.py — Harness latensi rerun halaman Streamlit (headless, AppTest) untuk kedua halaman
+# Jalankan:
+#   python benchmarks/page_latency.py [--repeats 10] [--train-rows 3000] [--algos RandomForest KNN] [--bundle path.pkl]
+#   python benchmarks/bench.py compare benchmarks/results/<lama>.json benchmarks/results/<baru>.json
+#
+# Skenario (interaksi khas pengguna, satu record per skenario: p50/p95 latensi rerun + puncak RSS):
+#   Form Prediksi : muat model default (cold → siap), rerun idle, ubah lat/lon, klik "HITUNG PREDIKSI & ANALISIS",
+#                   upload file batch, klik "Proses Batch"
+#   app.py        : upload data training, ganti algoritma, klik "Latih Model" untuk tiap algoritma
+# Sepenuhnya offline: app dijalankan dari salinan sementara (sandbox) berisi kode repo + bundle sintetis
+# (benchmarks/synth.py) sehingga models/ & models/runs di repo tidak tersentuh dan pointer LFS tidak dibutuhkan.
+# Puncak RSS per rerun diukur lewat instrumentation.stage (RSS disampling selama rerun; nilai per proses).
+import argparse, json, logging, os, shutil, sys, tempfile, time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+sys.path.append(str(Path(__file__).resolve().parent))
+
+os.environ["TANAH_PROFILE"] = "0"  # tahap di dalam script tidak dicatat (overhead pencatatan tidak ikut terukur)
+
+import joblib
+from sklearn.pipeline import Pipeline
+from streamlit.testing.v1 import AppTest
+
+from comps import build_comps_index
+from instrumentation import begin_run, records, stage
+from training_pipeline import build_estimator, build_preprocess, fit_preprocess
+from synth import DEFAULT_CONFIG, load_schema, synthetic_frame
+from bench import RESULTS_DIR, run_meta
+
+PAGE = "pages/Form Prediksi.py"
+
+
+# ---------- pencatat ----------
+class LatencyRecorder:
+    def __init__(self, data_rows: int = 0):
+        self.data_rows = data_rows
+        self.samples: Dict[str, List[Dict]] = {}
+
+    def rerun(self, scenario: str, action: Callable[[], AppTest]) -> AppTest:
+        """Ukur satu rerun (wall + puncak RSS); exception di script dilaporkan, tidak menghentikan harness."""
+        begin_run(True)  # script AppTest berjalan di thread ini dan memanggil begin_run(False) sendiri
+        with stage(scenario):
+            at = action()
+        rec = records()[-1]
+        err = [e.value for e in at.exception]
+        self.samples.setdefault(scenario, []).append({**rec, "errors": err})
+        if err:
+            print(f"  ! {scenario}: {err[0][:160]}", flush=True)
+        return at
+
+    def results(self) -> List[Dict]:
+        out = []
+        for name, recs in self.samples.items():
+            wall = np.array([r["wall_s"] for r in recs])
+            out.append({"name": name, "data_rows": self.data_rows, "rows": 1, "repeats": len(recs),
+                        "median_s": float(np.median(wall)), "p95_s": float(np.percentile(wall, 95)),
+                        "min_s": float(wall.min()), "max_s": float(wall.max()),
+                        "peak_rss_mb": max(r.get("peak_rss_mb", 0.0) for r in recs),
+                        "peak_rss_delta_mb": max(r["peak_rss_delta_mb"] for r in recs),
+                        "errors": sum(bool(r["errors"]) for r in recs)})
+        return out
+
+
+# ---------- sandbox ----------
+def train_bundle(df: pd.DataFrame, schema: Dict, n_estimators: int, seed: int) -> Dict:
+    """Bundle seperti output app.py (pipeline + config + comps) dari data sintetis, RandomForest kecil."""
+    numeric, onehot, freq, addr = schema["numeric_feats"], schema["onehot_feats"], schema["freq_feats"], schema["addr_feats"]
+    features = list(dict.fromkeys(list(numeric) + list(onehot) + list(freq) + list(addr)))
+    X, y = df[features], df[schema["target_col"]]
+    prep, Xt = fit_preprocess(build_preprocess(numeric, onehot, freq, addr, int(schema["top_n_addr"])), X, y)
+    reg = build_estimator("RandomForest", {"n_estimators": n_estimators}, random_state=seed).fit(Xt, y)
+    with open(DEFAULT_CONFIG, encoding="utf-8") as f:
+        cfg = json.load(f)
+    cfg.update(target_is_per_m2=False)
+    return {"pipeline": Pipeline([("prep", prep), ("reg", reg)]), "config": cfg,
+            "comps": build_comps_index(X, y, numeric, onehot)}
+
+
+def make_sandbox(args, schema: Dict) -> Path:
+    """Salin kode app ke folder sementara + siapkan bundle default, data training & file batch sintetis."""
+    box = Path(tempfile.mkdtemp(prefix="tanah_latency_"))
+    for p in ROOT.glob("*.py"):
+        shutil.copy2(p, box / p.name)
+    shutil.copytree(ROOT / "pages", box / "pages", ignore=shutil.ignore_patterns("__pycache__"))
+    if (ROOT / ".streamlit").is_dir():
+        shutil.copytree(ROOT / ".streamlit", box / ".streamlit")
+    (box / "models").mkdir()
+    shutil.copy2(DEFAULT_CONFIG, box / "models" / "config_latest.json")
+
+    df = synthetic_frame(args.train_rows, schema, seed=args.seed)
+    if args.bundle:
+        shutil.copy2(args.bundle, box / "models" / "model_bundle_latest.pkl")
+    else:
+        joblib.dump(train_bundle(df, schema, args.bundle_trees, args.seed), box / "models" / "model_bundle_latest.pkl")
+    df.to_csv(box / "train.csv", index=False)
+    synthetic_frame(args.batch_rows, schema, seed=args.seed + 1).drop(columns=[schema["target_col"]]) \
+        .to_csv(box / "batch.csv", index=False)
+    return box
+
+
+# ---------- skenario ----------
+def _by_label(widgets, text: str):
+    return next(w for w in widgets if text in w.label)
+
+
+def page_scenarios(rec: LatencyRecorder, box: Path, args):
+    at = AppTest.from_file(str(box / PAGE), default_timeout=args.timeout)
+    rec.rerun("page.first_run", at.run)
+    # model default dimuat di thread background; rerun sampai siap (fragment run_every tidak jalan di AppTest)
+    t0 = time.perf_counter()
+    while not any("Model Default Aktif" in s.value for s in at.sidebar.success):
+        if time.perf_counter() - t0 > args.timeout:
+            raise TimeoutError("model default tidak siap: " + "; ".join(e.value for e in at.sidebar.error))
+        time.sleep(0.2)
+        at.run()
+    rec.samples["page.default_model_ready"] = [{"wall_s": time.perf_counter() - t0, "peak_rss_delta_mb": 0.0,
+                                                "peak_rss_mb": rec.samples["page.first_run"][0]["peak_rss_mb"], "errors": []}]
+
+    rng = np.random.default_rng(args.seed)
+    for _ in range(args.repeats):
+        rec.rerun("page.rerun_idle", at.run)
+    for _ in range(args.repeats):
+        lat, lon = -6.2 + rng.normal(0, 0.08), 106.82 + rng.normal(0, 0.08)
+        _by_label(at.number_input, "Latitude").set_value(round(lat, 6))
+        rec.rerun("page.latlon_change", _by_label(at.number_input, "Longitude").set_value(round(lon, 6)).run)
+    for _ in range(args.repeats):
+        rec.rerun("page.predict", _by_label(at.button, "HITUNG PREDIKSI").click().run)
+
+    batch = (box / "batch.csv").read_bytes()
+    for _ in range(args.repeats):
+        up = at.file_uploader(key="batch_file")
+        rec.rerun("page.batch_upload", up.set_value(("batch.csv", batch, "text/csv")).run)
+        rec.rerun("page.batch_process", _by_label(at.button, "Proses Batch").click().run)
+        at.file_uploader(key="batch_file").set_value(None).run()
+
+
+def train_scenarios(rec: LatencyRecorder, box: Path, args):
+    at = AppTest.from_file(str(box / "app.py"), default_timeout=args.timeout)
+    at.run()
+    data = (box / "train.csv").read_bytes()
+    at = rec.rerun("train.upload", at.file_uploader[0].set_value(("train.csv", data, "text/csv")).run)
+    for _ in range(args.repeats):
+        rec.rerun("train.rerun_idle", at.run)
+
+    algos = args.algos or list(_by_label(at.selectbox, "Algoritma").options)
+    for algo in algos:
+        rec.rerun("train.select_algo", _by_label(at.selectbox, "Algoritma").set_value(algo).run)
+        for s in at.slider:  # jumlah pohon/iterasi minimum supaya skenario tetap cepat
+            if args.min_trees and s.label in ("n_estimators", "iterations"):
+                s.set_value(s.min)
+        at.run()
+        for k in range(args.train_repeats):
+            # random_state berbeda tiap ulangan → bukan hit memoization run store
+            _by_label(at.number_input, "random_state").set_value(1000 + k).run()
+            rec.rerun(f"train.fit[{algo}]", _by_label(at.button, "Latih Model").click().run)
+
+
+def print_table(results: List[Dict]):
+    df = pd.DataFrame(results)[["name", "repeats", "median_s", "p95_s", "peak_rss_mb", "peak_rss_delta_mb", "errors"]]
+    with pd.option_context("display.width", 200, "display.max_rows", None):
+        print(df.to_string(index=False, formatters={"median_s": "{:.3f}".format, "p95_s": "{:.3f}".format,
+                                                    "peak_rss_mb": "{:,.0f}".format, "peak_rss_delta_mb": "{:,.1f}".format}))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Latensi rerun halaman Streamlit (AppTest, offline).")
+    ap.add_argument("--repeats", type=int, default=10, help="ulangan per skenario interaksi")
+    ap.add_argument("--train-repeats", type=int, default=1, help="ulangan fit per algoritma")
+    ap.add_argument("--algos", nargs="+", default=None, help="default: semua opsi selectbox Algoritma")
+    ap.add_argument("--no-min-trees", dest="min_trees", action="store_false",
+                    help="pakai n_estimators/iterations default app (lambat)")
+    ap.add_argument("--train-rows", type=int, default=3_000)
+    ap.add_argument("--batch-rows", type=int, default=2_000)
+    ap.add_argument("--bundle", default=None, help="bundle default lokal (default: RandomForest sintetis)")
+    ap.add_argument("--bundle-trees", type=int, default=100)
+    ap.add_argument("--pages", nargs="+", default=["predict", "train"], choices=["predict", "train"])
+    ap.add_argument("--timeout", type=float, default=600)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--keep-sandbox", action="store_true")
+    ap.add_argument("--out", default=None, help="path JSON (default benchmarks/results/latency_<waktu>_<commit>.json)")
+    args = ap.parse_args()
+    if not os.environ.get("TANAH_PROFILE_LOG"):
+        logging.getLogger("tanah.stages").setLevel(logging.WARNING)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)  # peringatan deprecation per rerun
+
+    schema = load_schema()
+    meta = run_meta(args)
+    box = make_sandbox(args, schema)
+    print(f"sandbox: {box}", flush=True)
+    cwd = os.getcwd()
+    os.chdir(box)  # app.py menulis models/runs relatif terhadap cwd
+    rec = LatencyRecorder(data_rows=args.train_rows)
+    try:
+        if "predict" in args.pages:
+            page_scenarios(rec, box, args)
+        if "train" in args.pages:
+            train_scenarios(rec, box, args)
+    finally:
+        os.chdir(cwd)
+        if not args.keep_sandbox:
+            shutil.rmtree(box, ignore_errors=True)
+
+    results = rec.results()
+    print_table(results)
+    out = Path(args.out) if args.out else RESULTS_DIR / f"latency_{time.strftime('%Y%m%d-%H%M%S')}_{(meta['commit'] or 'nogit')[:10]}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2, default=str)
+    print(f"Hasil → {out}")
+
+
+if __name__ == "__main__":
+    main()
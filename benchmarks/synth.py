@@ -0,0 +1,206 @@
+# benchmarks/synth.py — Generator data listing tanah sintetis sesuai skema models/config_latest.json
+# Jalankan: python benchmarks/synth.py --rows 1000000 --out data_1m.parquet [--config models/config_latest.json]
+#
+# - kategori one-hot: level persis dari config (ohe_categories), proporsi mirip data listing (sebaran Zipf,
+#   varian ejaan/kapitalisasi sebagai minoritas, ~1% kosong); dokumen_kepemilikan pakai prior SHM dominan
+# - lokasi: titik acak di sekitar CBD_POINTS_JAKARTA (sebaran ~ radius CBD); nama_cbd/jarak_cbd dihitung
+#   dengan pick_cbd_vectorized (sama dengan inferensi); kota_kabupaten/provinsi = pusat kota terdekat
+# - luas & harga heavy-tailed (lognormal + ekor Pareto); Rp/m² turun terhadap jarak CBD
+# Dibangkitkan per potongan (chunk_rows) sehingga 10 juta baris bisa ditulis ke parquet tanpa memuat semuanya.
+import argparse, json, sys, time
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from canonical import norm_key
+from inference import CBD_POINTS_JAKARTA, pick_cbd_vectorized
+
+DEFAULT_CONFIG = ROOT / "models" / "config_latest.json"
+
+# (kota_kabupaten, provinsi, lat, lon) — pusat kira-kira wilayah Jabodetabek
+KOTA_CENTERS = [
+    ("Jakarta Pusat", "DKI Jakarta", -6.1865, 106.8341),
+    ("Jakarta Selatan", "DKI Jakarta", -6.2615, 106.8106),
+    ("Jakarta Barat", "DKI Jakarta", -6.1674, 106.7637),
+    ("Jakarta Timur", "DKI Jakarta", -6.2250, 106.9004),
+    ("Jakarta Utara", "DKI Jakarta", -6.1381, 106.8636),
+    ("Kota Bekasi", "Jawa Barat", -6.2383, 106.9756),
+    ("Kabupaten Bekasi", "Jawa Barat", -6.2474, 107.1485),
+    ("Kota Depok", "Jawa Barat", -6.4025, 106.7942),
+    ("Kota Bogor", "Jawa Barat", -6.5971, 106.8060),
+    ("Kabupaten Bogor", "Jawa Barat", -6.4800, 106.8900),
+    ("Kota Tangerang", "Banten", -6.1783, 106.6319),
+    ("Kota Tangerang Selatan", "Banten", -6.2886, 106.7179),
+    ("Kabupaten Tangerang", "Banten", -6.1870, 106.4880),
+]
+
+# Prior proporsi (sisanya dibagi Zipf ke level lain)
+CATEGORY_PRIORS = {
+    "dokumen_kepemilikan": {"SHM": 0.46, "AJB": 0.14, "Girik": 0.10, "SHGB": 0.08, "HGB": 0.05},
+    "sumber_data": {"Eksternal": 0.7, "Internal": 0.3},
+    "kondisi_jalan": {"Baik": 0.6, "Sedang": 0.25},
+    "kontruksi_jalan": {"Aspal": 0.5, "Beton": 0.2, "Paving": 0.1},
+    "pemanfaatan_sekitar": {"Residensial": 0.5, "Campuran": 0.15, "Komersial": 0.12},
+}
+# Faktor Rp/m² per kategori (sisanya 1.0)
+PRICE_FACTORS = {
+    "dokumen_kepemilikan": {"SHM": 1.15, "SHGB": 1.05, "HGB": 1.05, "Girik": 0.75, "Surat Ijo": 0.7},
+    "pemanfaatan_sekitar": {"Komersial": 1.3, "Perkantoran": 1.35, "Industrial": 0.85, "Pertanian": 0.5, "Perkebunan": 0.5},
+    "kondisi_jalan": {"Jelek/Rusak": 0.85},
+}
+MISSING_RATE = 0.01
+
+
+def load_schema(config_path=DEFAULT_CONFIG) -> Dict:
+    with open(config_path, encoding="utf-8") as f:
+        cfg = json.load(f)
+    return {"target_col": cfg.get("target_col", "harga"), "numeric_feats": cfg.get("numeric_feats", []),
+            "onehot_feats": cfg.get("onehot_feats", []), "freq_feats": cfg.get("freq_feats", []),
+            "addr_feats": cfg.get("addr_feats", []), "top_n_addr": cfg.get("top_n_addr", 40),
+            "ohe_categories": cfg.get("ohe_categories", {})}
+
+
+def category_probs(col: str, levels) -> np.ndarray:
+    """Proporsi per level: prior bila ada, sisanya Zipf; duplikat ejaan (kunci ternormalisasi sama) jadi minoritas."""
+    prior = CATEGORY_PRIORS.get(col, {})
+    seen, rest = set(), []
+    p = np.zeros(len(levels))
+    for i, lv in enumerate(levels):
+        key = norm_key(lv)
+        if lv in prior:
+            p[i] = prior[lv]
+        else:
+            rest.append((i, key in seen))
+        seen.add(key)
+    remaining = max(1.0 - p.sum(), 0.05)
+    if rest:
+        w = np.array([(1.0 / (r + 1)) * (0.08 if dup else 1.0) for r, (_, dup) in enumerate(rest)])
+        p[[i for i, _ in rest]] = remaining * w / w.sum()
+    return p / p.sum()
+
+
+def _pick(rng, levels, probs, n, missing_rate=MISSING_RATE) -> np.ndarray:
+    # objek string dibagi antar baris (array pointer) → hemat memori untuk jutaan baris
+    vals = np.array(list(levels) + [None], dtype=object)
+    codes = rng.choice(len(levels), size=n, p=probs)
+    codes[rng.random(n) < missing_rate] = len(levels)
+    return vals[codes]
+
+
+def _locations(rng, n):
+    lat0 = np.array([r["lat"] for r in CBD_POINTS_JAKARTA]); lon0 = np.array([r["lon"] for r in CBD_POINTS_JAKARTA])
+    rad = np.array([r["radius_km"] for r in CBD_POINTS_JAKARTA])
+    j = rng.integers(0, len(CBD_POINTS_JAKARTA), size=n)
+    spread_km = rad[j] * rng.lognormal(0.3, 0.5, size=n)
+    lat = lat0[j] + rng.normal(0, 1, n) * spread_km / 110.574
+    lon = lon0[j] + rng.normal(0, 1, n) * spread_km / (111.320 * np.cos(np.radians(lat0[j])))
+    return lat, lon
+
+
+def _nearest_kota(lat, lon):
+    c_lat = np.array([k[2] for k in KOTA_CENTERS]); c_lon = np.array([k[3] for k in KOTA_CENTERS])
+    d = (lat[:, None] - c_lat) ** 2 + ((lon[:, None] - c_lon) * np.cos(np.radians(-6.2))) ** 2
+    j = d.argmin(axis=1)
+    kota = np.array([k[0] for k in KOTA_CENTERS], dtype=object)[j]
+    prov = np.array([k[1] for k in KOTA_CENTERS], dtype=object)[j]
+    return kota, prov
+
+
+def synth_chunk(n: int, schema: Dict, rng: np.random.Generator) -> pd.DataFrame:
+    lat, lon = _locations(rng, n)
+    nama_cbd, jarak_cbd = pick_cbd_vectorized(lat, lon)
+    kota, prov = _nearest_kota(lat, lon)
+    luas = rng.lognormal(np.log(160), 0.9, size=n)
+    tail = rng.random(n) < 0.04
+    luas[tail] = 1000 * (1 + rng.pareto(1.4, size=int(tail.sum())))  # lahan besar (ekor Pareto)
+    luas = np.clip(luas, 15, 200_000)
+    cols = {
+        "latitude": lat, "longitude": lon,
+        "jarak_ke_jalan": np.round(rng.lognormal(1.7, 0.7, size=n), 1),
+        "luas": np.round(luas, 0),
+        "jarak_cbd": jarak_cbd,
+    }
+    for c, levels in schema["ohe_categories"].items():
+        cols[c] = _pick(rng, levels, category_probs(c, levels), n)
+    cols["provinsi"], cols["kota_kabupaten"], cols["nama_cbd"] = prov, kota, nama_cbd
+
+    per_m2 = rng.lognormal(np.log(12e6), 0.45, size=n) * np.exp(-0.05 * np.minimum(jarak_cbd, 40))
+    for c, factors in PRICE_FACTORS.items():
+        if c in cols:
+            per_m2 *= pd.Series(cols[c]).map(factors).fillna(1.0).to_numpy()
+    per_m2 /= np.sqrt(np.maximum(cols["luas"], 1) / 160) ** 0.3  # lahan luas → Rp/m² lebih rendah
+    df = pd.DataFrame(cols)
+    df[schema["target_col"]] = np.round(per_m2 * cols["luas"], -3)
+    for c in schema["numeric_feats"]:
+        if c in ("latitude", "longitude") or c not in df.columns:
+            continue
+        df.loc[rng.random(n) < MISSING_RATE, c] = np.nan
+    return df
+
+
+def iter_synthetic(n_rows: int, schema: Optional[Dict] = None, seed: int = 0,
+                   chunk_rows: int = 500_000) -> Iterator[pd.DataFrame]:
+    schema = schema or load_schema()
+    rng = np.random.default_rng(seed)
+    for s in range(0, n_rows, chunk_rows):
+        part = synth_chunk(min(chunk_rows, n_rows - s), schema, rng)
+        part.index = pd.RangeIndex(s, s + len(part))
+        yield part
+
+
+def synthetic_frame(n_rows: int, schema: Optional[Dict] = None, seed: int = 0, chunk_rows: int = 500_000) -> pd.DataFrame:
+    return pd.concat(list(iter_synthetic(n_rows, schema, seed, chunk_rows)))
+
+
+def rupiah_texts(values: np.ndarray, rng: np.random.Generator) -> pd.Series:
+    """Harga sebagai teks iklan campuran ("Rp 1,5 miliar", "850 juta", "Rp1.250.000.000") untuk uji parsing."""
+    v = np.asarray(values, dtype=float)
+    fmt = rng.integers(0, 3, size=len(v))
+    out = np.empty(len(v), dtype=object)
+    for i, (x, f) in enumerate(zip(v, fmt)):
+        if not np.isfinite(x):
+            out[i] = None
+        elif f == 0 and x >= 1e9:
+            out[i] = f"Rp {x / 1e9:.2f} miliar".replace(".", ",")
+        elif f <= 1 and x >= 1e6:
+            out[i] = f"{x / 1e6:.0f} juta"
+        else:
+            out[i] = f"Rp{x:,.0f}".replace(",", ".")
+    return pd.Series(out)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Bangkitkan data listing tanah sintetis (skema config model).")
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--out", required=True, help="file .parquet / .csv / .csv.gz")
+    ap.add_argument("--config", default=str(DEFAULT_CONFIG))
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--chunk-rows", type=int, default=500_000)
+    args = ap.parse_args()
+
+    schema = load_schema(args.config)
+    t0 = time.perf_counter()
+    out = Path(args.out)
+    if out.suffix == ".parquet":
+        import pyarrow as pa, pyarrow.parquet as pq
+        writer = None
+        for part in iter_synthetic(args.rows, schema, args.seed, args.chunk_rows):
+            table = pa.Table.from_pandas(part, preserve_index=False)
+            writer = writer or pq.ParquetWriter(out, table.schema)
+            writer.write_table(table)
+        if writer is not None:
+            writer.close()
+    else:
+        for k, part in enumerate(iter_synthetic(args.rows, schema, args.seed, args.chunk_rows)):
+            part.to_csv(out, mode="w" if k == 0 else "a", header=(k == 0), index=False)
+    print(f"{args.rows:,} baris → {out} ({time.perf_counter() - t0:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
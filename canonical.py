@@ -0,0 +1,163 @@
+# canonical.py — Tabel kanonikalisasi kategori (dikompilasi dari kategori OHE hasil training)
+import json, re
+import difflib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Tabel bawaan hanya melipat kapitalisasi/spasi/tanda baca (norm_key) + konsolidasi dari data training.
+# Sinonim yang mengubah makna (mis. "iklan" → "Eksternal") TIDAK ada di kode: disimpan di config (`synonyms`),
+# dibaca dari models/category_synonyms.json yang ditinjau pemilik domain saat training.
+SYNONYMS_FILE = "category_synonyms.json"
+
+
+def load_synonyms(path) -> Dict[str, Dict[str, str]]:
+    """{kolom: {alias: label training}} dari file JSON; {} bila file tidak ada."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {str(col): {str(k): str(v) for k, v in (m or {}).items()} for col, m in data.items()}
+
+
+def norm_key(value) -> str:
+    s = str(value).casefold().strip()
+    s = re.sub(r"\s*([/\-&()])\s*", r"\1", s)
+    return re.sub(r"\s+", " ", s)
+
+
+def _preferred(cands: List[str]) -> str:
+    # Dari beberapa ejaan yang sama (mis. "Komersial"/"komersial "), pilih yang rapi
+    for c in cands:
+        if c == c.strip() and c[:1].isupper():
+            return c
+    return cands[0]
+
+
+def compile_canon_tables(ohe_categories: Dict[str, List[str]],
+                         synonyms: Optional[Dict[str, Dict[str, str]]] = None,
+                         consolidation: Optional[Dict[str, Dict[str, str]]] = None) -> Dict[str, Dict]:
+    """
+    Kompilasi tabel lookup per kolom: kunci ternormalisasi → kategori persis seperti saat training.
+    `consolidation` (mapping CategoryConsolidator) menambahkan varian ejaan & level jarang dari data training
+    sehingga form/batch memakai pemetaan yang sama dengan pipeline. `synonyms` = sinonim dari config
+    (hanya dipakai bila targetnya kategori training).
+    Hasilnya JSON-serializable; disimpan di config bundle sebagai `canon_tables`.
+    """
+    synonyms = synonyms or {}
+    consolidation = consolidation or {}
+    tables = {}
+    for col, cats in (ohe_categories or {}).items():
+        groups: Dict[str, List[str]] = {}
+        for c in cats:
+            groups.setdefault(norm_key(c), []).append(str(c))
+        lookup = {k: _preferred(v) for k, v in groups.items()}
+        for k, label in consolidation.get(col, {}).items():
+            lookup.setdefault(k, label)
+        for alias, target in synonyms.get(col, {}).items():
+            t = lookup.get(norm_key(target))
+            if t is not None:
+                lookup.setdefault(norm_key(alias), t)
+        tables[col] = {"lookup": lookup, "categories": sorted(set(lookup.values()))}
+    return tables
+
+
+def tables_from_config(cfg) -> Dict[str, Dict]:
+    """Ambil `canon_tables` dari config; config lama (tanpa tabel) dikompilasi dari `ohe_categories`."""
+    if not isinstance(cfg, dict):
+        return {}
+    if cfg.get("canon_tables"):
+        return cfg["canon_tables"]
+    return compile_canon_tables(cfg.get("ohe_categories", {}), synonyms=cfg.get("synonyms"))
+
+
+def _resolve(key: str, table: Dict, fuzzy_cutoff: float) -> Tuple[Optional[str], bool]:
+    lookup = table["lookup"]
+    if key in lookup:
+        return lookup[key], False
+    if fuzzy_cutoff < 1.0:
+        m = difflib.get_close_matches(key, list(lookup), n=1, cutoff=fuzzy_cutoff)
+        if m:
+            return lookup[m[0]], True
+    return None, False
+
+
+def canonicalize_series(s: pd.Series, table: Dict, fuzzy_cutoff: float = 0.85):
+    """
+    Petakan per nilai unik (bukan per baris). Return (series_baru, {nilai_tak_terpetakan: jumlah_baris}, n_fuzzy,
+    {"nilai → label": jumlah_baris}). Dipetakan ulang = label berbeda setelah norm_key (sinonim config,
+    level jarang, fuzzy), bukan sekadar lipat kapitalisasi/spasi.
+    """
+    codes, uniques = pd.factorize(s, use_na_sentinel=True)
+    mapped = np.empty(len(uniques), dtype=object)
+    unmapped_idx, remapped_idx, n_fuzzy = [], [], 0
+    for i, u in enumerate(uniques):
+        key = norm_key(u)
+        val, fuzzy = _resolve(key, table, fuzzy_cutoff)
+        if val is None:
+            mapped[i] = str(u).strip(); unmapped_idx.append(i)
+        else:
+            mapped[i] = val; n_fuzzy += int(fuzzy)
+            if norm_key(val) != key:
+                remapped_idx.append(i)
+    result = np.full(len(s), np.nan, dtype=object)
+    valid = codes >= 0
+    result[valid] = mapped[codes[valid]]
+    out = pd.Series(result, index=s.index)
+    unmapped, remapped = {}, {}
+    if unmapped_idx or remapped_idx:
+        counts = np.bincount(codes[valid], minlength=len(uniques))
+        unmapped = {str(uniques[i]): int(counts[i]) for i in unmapped_idx}
+        remapped = {f"{uniques[i]} → {mapped[i]}": int(counts[i]) for i in remapped_idx}
+    return out, unmapped, n_fuzzy, remapped
+
+
+def canonicalize_frame(df: pd.DataFrame, tables: Dict[str, Dict], fuzzy_cutoff: float = 0.85):
+    """Terapkan tabel ke semua kolom yang tersedia → (df, laporan per kolom)."""
+    report = {}
+    for col, table in tables.items():
+        if col not in df.columns:
+            continue
+        df[col], unmapped, n_fuzzy, remapped = canonicalize_series(df[col], table, fuzzy_cutoff)
+        report[col] = {"unmapped_rows": int(sum(unmapped.values())), "unmapped_values": unmapped, "fuzzy_values": n_fuzzy,
+                       "remapped_rows": int(sum(remapped.values())), "remapped_values": remapped}
+    return df, report
+
+
+def merge_reports(reports) -> Dict[str, Dict]:
+    """Gabungkan laporan beberapa potongan batch."""
+    out: Dict[str, Dict] = {}
+    for rep in reports:
+        for col, r in (rep or {}).items():
+            acc = out.setdefault(col, {"unmapped_rows": 0, "unmapped_values": {}, "fuzzy_values": 0,
+                                       "remapped_rows": 0, "remapped_values": {}})
+            acc["unmapped_rows"] += r["unmapped_rows"]; acc["fuzzy_values"] += r["fuzzy_values"]
+            acc["remapped_rows"] += r.get("remapped_rows", 0)
+            for key in ("unmapped_values", "remapped_values"):
+                for v, n in r.get(key, {}).items():
+                    acc[key][v] = acc[key].get(v, 0) + n
+    return out
+
+
+def report_frame(report: Dict[str, Dict]) -> pd.DataFrame:
+    """Laporan → tabel ringkas (kolom, baris tak terpetakan / dipetakan ulang, contoh nilai)."""
+    cols = ["kolom", "baris_tak_terpetakan", "nilai_fuzzy", "contoh_nilai", "baris_dipetakan_ulang", "contoh_pemetaan"]
+    rows = [{"kolom": col, "baris_tak_terpetakan": r["unmapped_rows"], "nilai_fuzzy": r["fuzzy_values"],
+             "contoh_nilai": ", ".join(list(r["unmapped_values"])[:5]),
+             "baris_dipetakan_ulang": r.get("remapped_rows", 0),
+             "contoh_pemetaan": ", ".join(list(r.get("remapped_values", {}))[:5])}
+            for col, r in report.items()]
+    return pd.DataFrame(rows, columns=cols)
+
+
+def canonicalize_choices(choices_map: Dict[str, List[str]], tables: Dict[str, Dict]) -> Dict[str, List[str]]:
+    """Pilihan UI (mis. untuk analisis kontras kategori) dipetakan ke kategori training, tanpa duplikat."""
+    out = {}
+    for col, vals in choices_map.items():
+        if col in tables:
+            mapped, _, _, _ = canonicalize_series(pd.Series(vals, dtype=object), tables[col])
+            vals = list(dict.fromkeys(mapped.dropna()))
+        out[col] = vals
+    return out
@@ -0,0 +1,141 @@
+# comps.py — Indeks pembanding (comparable listings) untuk disimpan di bundle
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import KDTree
+
+from canonical import norm_key
+
+KM_PER_DEG_LAT = 110.574
+KM_PER_DEG_LON_EQ = 111.320
+
+
+def _haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6371.0088 * np.arcsin(np.sqrt(a))
+
+
+class ComparablesIndex:
+    """
+    KD-tree atas [posisi (km / geo_scale_km), atribut numerik ter-standardisasi] — dimensi rendah agar cepat.
+    Atribut kategori (dokumen, kontur, ...) disimpan sebagai kode int16 dan dipakai untuk re-rank kandidat:
+    tiap kategori yang berbeda menambah cat_weight² ke jarak kuadrat (setara one-hot, tanpa memperbesar tree).
+    """
+    def __init__(self, lat_col: str = "latitude", lon_col: str = "longitude",
+                 numeric_cols: Optional[List[str]] = None, cat_cols: Optional[List[str]] = None,
+                 geo_scale_km: float = 2.0, attr_weight: float = 1.0, cat_weight: float = 0.7,
+                 oversample: int = 40, price_is_per_m2: bool = False, area_col: str = "luas"):
+        self.lat_col = lat_col
+        self.lon_col = lon_col
+        self.numeric_cols = list(numeric_cols or [])
+        self.cat_cols = list(cat_cols or [])
+        self.geo_scale_km = geo_scale_km
+        self.attr_weight = attr_weight
+        self.cat_weight = cat_weight
+        self.oversample = oversample
+        self.price_is_per_m2 = price_is_per_m2
+        self.area_col = area_col
+
+    # ---- vektor fitur ----
+    def _numeric_raw(self, df: pd.DataFrame) -> np.ndarray:
+        x = np.column_stack([pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=float) for c in self.numeric_cols])
+        return np.log1p(np.clip(x, 0, None))  # luas/jarak heavy-tailed → skala log
+
+    def _vectors(self, df: pd.DataFrame) -> np.ndarray:
+        lat = pd.to_numeric(df[self.lat_col], errors="coerce").to_numpy(dtype=float)
+        lon = pd.to_numeric(df[self.lon_col], errors="coerce").to_numpy(dtype=float)
+        geo = np.column_stack([(lat - self.lat0_) * KM_PER_DEG_LAT,
+                               (lon - self.lon0_) * KM_PER_DEG_LON_EQ * np.cos(np.radians(self.lat0_))]) / self.geo_scale_km
+        if not self.numeric_cols:
+            return geo.astype(np.float32)
+        x = self._numeric_raw(df)
+        x = np.where(np.isnan(x), self.num_center_, x)
+        num = (x - self.num_center_) / self.num_scale_ * self.attr_weight
+        return np.hstack([geo, num]).astype(np.float32)
+
+    def _cat_codes(self, df: pd.DataFrame) -> np.ndarray:
+        cols = []
+        for c in self.cat_cols:
+            if c not in df.columns:
+                cols.append(np.full(len(df), -1, dtype=np.int16)); continue
+            pos = {k: i for i, k in enumerate(self.cat_levels_[c])}
+            codes, uniq = pd.factorize(df[c], use_na_sentinel=True)
+            lut = np.array([pos.get(norm_key(u), -1) for u in uniq] + [-1], dtype=np.int16)
+            cols.append(lut[codes])  # kode -1 (NaN) → elemen terakhir lut = -1
+        return np.column_stack(cols) if cols else np.zeros((len(df), 0), dtype=np.int16)
+
+    # ---- build & query ----
+    def fit(self, df: pd.DataFrame, price: pd.Series) -> "ComparablesIndex":
+        df = df.reset_index(drop=True)
+        price = pd.to_numeric(pd.Series(price).reset_index(drop=True), errors="coerce")
+        lat = pd.to_numeric(df[self.lat_col], errors="coerce"); lon = pd.to_numeric(df[self.lon_col], errors="coerce")
+        keep = (lat.notna() & lon.notna() & price.notna()).to_numpy()
+        df = df.loc[keep].reset_index(drop=True); price = price[keep].reset_index(drop=True)
+        self.lat0_, self.lon0_ = float(lat[keep].mean()), float(lon[keep].mean())
+
+        if self.numeric_cols:
+            x = self._numeric_raw(df)
+            self.num_center_ = np.nan_to_num(np.nanmedian(x, axis=0))
+            sd = np.nanstd(x, axis=0)
+            self.num_scale_ = np.where((sd > 0) & np.isfinite(sd), sd, 1.0)
+        # level = kunci ternormalisasi; label tampilan = ejaan asli pertama per kunci
+        self.cat_levels_: Dict[str, List[str]] = {}
+        self.cat_labels_: Dict[str, List[str]] = {}
+        for c in self.cat_cols:
+            uniq = pd.unique(df[c].dropna().astype(str))
+            labels = pd.Series(uniq, index=[norm_key(u) for u in uniq]).groupby(level=0).first()
+            self.cat_levels_[c] = labels.index.tolist()
+            self.cat_labels_[c] = labels.tolist()
+        self.tree_ = KDTree(self._vectors(df), leaf_size=40)
+        self.cat_codes_ = self._cat_codes(df)
+
+        # data tampilan ringkas (lokasi + atribut numerik float32, kategori sebagai kode)
+        self.latlon_ = np.column_stack([lat[keep], lon[keep]]).astype(np.float64)
+        self.num_values_ = (np.column_stack([pd.to_numeric(df[c], errors="coerce") for c in self.numeric_cols]).astype(np.float32)
+                            if self.numeric_cols else np.zeros((len(df), 0), dtype=np.float32))
+        self.price_ = price.to_numpy(dtype=float)
+        self.n_ = len(df)
+        return self
+
+    def query(self, X_row: pd.DataFrame, k: int = 5) -> pd.DataFrame:
+        """Top-k pembanding untuk baris input (sudah dibersihkan) → tabel dengan harga & Rp/m²."""
+        k = int(min(k, self.n_))
+        row = X_row.iloc[:1]
+        dist, idx = self.tree_.query(self._vectors(row), k=int(min(k * self.oversample, self.n_)))
+        dist, idx = dist[0], idx[0]
+        if self.cat_cols:
+            mismatch = (self.cat_codes_[idx] != self._cat_codes(row)[0]).sum(axis=1)
+            dist = np.sqrt(dist ** 2 + mismatch * self.cat_weight ** 2)
+        order = np.argsort(dist, kind="stable")[:k]
+        dist, idx = dist[order], idx[order]
+
+        lat0, lon0 = float(row.iloc[0][self.lat_col]), float(row.iloc[0][self.lon_col])
+        cols = {"jarak_km": np.round(_haversine_km(lat0, lon0, self.latlon_[idx, 0], self.latlon_[idx, 1]), 2),
+                self.lat_col: self.latlon_[idx, 0], self.lon_col: self.latlon_[idx, 1]}
+        for j, c in enumerate(self.numeric_cols):
+            cols[c] = self.num_values_[idx, j]
+        for j, c in enumerate(self.cat_cols):
+            cols[c] = [self.cat_labels_[c][v] if v >= 0 else None for v in self.cat_codes_[idx, j]]
+        cols["harga"] = self.price_[idx]
+        if self.price_is_per_m2:
+            cols["rp_per_m2"] = cols["harga"]
+        elif self.area_col in cols:
+            area = cols[self.area_col].astype(float)
+            cols["rp_per_m2"] = np.where(area > 0, cols["harga"] / np.where(area > 0, area, 1.0), np.nan)
+        cols["skor_kemiripan"] = np.round(1.0 / (1.0 + dist), 3)
+        return pd.DataFrame(cols)
+
+
+def build_comps_index(df: pd.DataFrame, y: pd.Series, numeric_feats: List[str], onehot_feats: List[str],
+                      price_is_per_m2: bool = False) -> Optional[ComparablesIndex]:
+    """Bangun indeks dari data training; None jika kolom latitude/longitude tidak ada."""
+    cols = {c.lower(): c for c in df.columns}
+    lat_col, lon_col = cols.get("latitude"), cols.get("longitude")
+    if lat_col is None or lon_col is None:
+        return None
+    num = [c for c in numeric_feats if c not in (lat_col, lon_col) and c in df.columns]
+    cat = [c for c in onehot_feats if c in df.columns]
+    area_col = cols.get("luas", "luas")
+    return ComparablesIndex(lat_col, lon_col, num, cat, price_is_per_m2=price_is_per_m2, area_col=area_col).fit(df, y)
@@ -5,12 +5,21 @@ import pandas as pd
 from typing import List
 from sklearn.base import BaseEstimator, TransformerMixin
 
+from canonical import _preferred, norm_key
+from instrumentation import timed
+
+RARE_LABEL = "Lainnya (jarang)"
+
 class AddressTopTokens(BaseEstimator, TransformerMixin):
-    """Ekstrak Top-N token dari kolom alamat → fitur biner 0/1 per token."""
-    def __init__(self, col_name: str, top_n: int = 40, min_len: int = 3):
+    """Ekstrak Top-N token dari kolom alamat → fitur biner 0/1 per token.
+
+    dtype=None → int64 (perilaku lama); mode presisi float32 memakai "uint8" (1 byte per flag).
+    """
+    def __init__(self, col_name: str, top_n: int = 40, min_len: int = 3, dtype=None):
         self.col_name = col_name
         self.top_n = top_n
         self.min_len = min_len
+        self.dtype = dtype
         self.tokens_: List[str] = []
 
     def _series(self, X):
@@ -27,6 +36,7 @@ class AddressTopTokens(BaseEstimator, TransformerMixin):
         s = re.sub(r'\s+', ' ', s).strip()
         return s
 
+    @timed("AddressTopTokens.fit")
     def fit(self, X, y=None):
         s = self._series(X).astype(str).map(self._clean)
         tokens = s.str.split().explode()
@@ -35,13 +45,15 @@ class AddressTopTokens(BaseEstimator, TransformerMixin):
         self.tokens_ = list(vc.head(self.top_n).index)
         return self
 
+    @timed("AddressTopTokens.transform")
     def transform(self, X):
         s = self._series(X).astype(str).map(self._clean)
+        dtype = getattr(self, "dtype", None) or int  # pickle lama belum punya atribut dtype
         out = {}
         for t in self.tokens_:
-            out[f"{self.col_name}__TOK_{t}"] = s.str.contains(rf"\b{re.escape(t)}\b").astype(int).values
+            out[f"{self.col_name}__TOK_{t}"] = s.str.contains(rf"\b{re.escape(t)}\b").astype(dtype).values
         if not out:
-            return pd.DataFrame({f"{self.col_name}__TOK_NONE": np.zeros(len(s), dtype=int)},
+            return pd.DataFrame({f"{self.col_name}__TOK_NONE": np.zeros(len(s), dtype=dtype)},
                                 index=getattr(X, "index", None))
         return pd.DataFrame(out, index=getattr(X, "index", None))
 
@@ -51,9 +63,10 @@ class AddressTopTokens(BaseEstimator, TransformerMixin):
         return np.array([f"{self.col_name}__TOK_NONE"], dtype=object)
 
 class FrequencyEncoder(BaseEstimator, TransformerMixin):
-    """Frequency Encoding 1 kolom kategori → 1 kolom numerik <col>__freq."""
-    def __init__(self, col_name: str):
+    """Frequency Encoding 1 kolom kategori → 1 kolom numerik <col>__freq (dtype=None → float64)."""
+    def __init__(self, col_name: str, dtype=None):
         self.col_name = col_name
+        self.dtype = dtype
         self.freq_map_ = None
 
     def _series(self, X):
@@ -63,15 +76,101 @@ class FrequencyEncoder(BaseEstimator, TransformerMixin):
             s = pd.Series(X)
         return s.fillna("NA").astype(str)
 
+    @timed("FrequencyEncoder.fit")
     def fit(self, X, y=None):
         s = self._series(X)
         self.freq_map_ = s.value_counts()
         return self
 
+    @timed("FrequencyEncoder.partial_fit")
+    def partial_fit(self, X, y=None):
+        """Tambah hitungan potongan data ke peta frekuensi (fit per potongan sebelum model dilatih, lihat out_of_core.py).
+
+        Jangan dipakai pada encoder milik model yang sudah dilatih: nilai encoding bergeser dari ambang split pohon.
+        """
+        counts = self._series(X).value_counts()
+        if self.freq_map_ is None:
+            self.freq_map_ = counts
+        else:
+            merged = self.freq_map_.add(counts, fill_value=0).astype("int64")
+            self.freq_map_ = merged.sort_values(ascending=False, kind="stable")
+        return self
+
+    @timed("FrequencyEncoder.transform")
     def transform(self, X):
         s = self._series(X)
-        vals = s.map(self.freq_map_).fillna(1).astype(float).values
+        vals = s.map(self.freq_map_).fillna(1).astype(getattr(self, "dtype", None) or float).values
         return pd.DataFrame({f"{self.col_name}__freq": vals}, index=getattr(X, "index", None))
 
     def get_feature_names_out(self, input_features=None):
         return np.array([f"{self.col_name}__freq"], dtype=object)
+
+class CastDtype(BaseEstimator, TransformerMixin):
+    """Ubah dtype output langkah sebelumnya (mis. SimpleImputer float64 → float32); kolom & nilai tetap."""
+    def __init__(self, dtype="float32"):
+        self.dtype = dtype
+
+    def fit(self, X, y=None):
+        self.n_features_in_ = X.shape[1]
+        return self
+
+    def transform(self, X):
+        if isinstance(X, pd.DataFrame):
+            return X.astype(self.dtype)
+        return np.asarray(X, dtype=self.dtype)
+
+    def get_feature_names_out(self, input_features=None):
+        if input_features is None:
+            input_features = [f"x{i}" for i in range(self.n_features_in_)]
+        return np.asarray(input_features, dtype=object)
+
+class CategoryConsolidator(BaseEstimator, TransformerMixin):
+    """
+    Rapikan level kategori sebelum One-Hot: varian ejaan (huruf besar/kecil, spasi, mis. "Komersial"/"komersial ")
+    dilipat ke satu label; level dengan < min_count baris (setelah dilipat) → rare_label. Nilai yang tidak
+    dikenal saat transform juga → rare_label; NaN tetap NaN (diisi imputer sesudahnya).
+    mapping_ = {kolom: {kunci ternormalisasi (canonical.norm_key): label}} — ikut disimpan di config bundle.
+    """
+    def __init__(self, min_count: int = 10, rare_label: str = RARE_LABEL):
+        self.min_count = min_count
+        self.rare_label = rare_label
+
+    def _frame(self, X) -> pd.DataFrame:
+        if isinstance(X, pd.DataFrame):
+            return X
+        return pd.DataFrame(np.asarray(X, dtype=object), columns=getattr(self, "columns_", None))
+
+    @timed("CategoryConsolidator.fit")
+    def fit(self, X, y=None):
+        X = self._frame(X)
+        self.columns_ = list(X.columns)
+        self.n_features_in_ = len(self.columns_)
+        self.mapping_, self.stats_ = {}, {}
+        for col in self.columns_:
+            vc = X[col].dropna().astype(str).value_counts()  # urut frekuensi → ejaan terbanyak diutamakan
+            groups = {}
+            for v, n in vc.items():
+                g = groups.setdefault(norm_key(v), [[], 0])
+                g[0].append(v)
+                g[1] += int(n)
+            mapping = {k: (_preferred(vs) if n >= self.min_count else self.rare_label) for k, (vs, n) in groups.items()}
+            self.mapping_[col] = mapping
+            self.stats_[col] = {"level_mentah": len(vc), "setelah_lipat": len(groups),
+                                "level_jarang": sum(1 for v in mapping.values() if v == self.rare_label),
+                                "level_akhir": len(set(mapping.values()))}
+        return self
+
+    @timed("CategoryConsolidator.transform")
+    def transform(self, X):
+        X = self._frame(X)
+        out = {}
+        for col in self.columns_:
+            mapping = self.mapping_[col]
+            # petakan per nilai unik (kolom kategori listing sangat berulang)
+            codes, uniq = pd.factorize(X[col], use_na_sentinel=True)
+            mapped = np.array([mapping.get(norm_key(u), self.rare_label) for u in uniq] + [np.nan], dtype=object)
+            out[col] = mapped[codes]  # kode -1 (NaN) → elemen terakhir
+        return pd.DataFrame(out, index=X.index)
+
+    def get_feature_names_out(self, input_features=None):
+        return np.asarray(self.columns_ if input_features is None else input_features, dtype=object)
@@ -0,0 +1,175 @@
+# drift.py — Sketsa statistik fitur training + monitor drift streaming untuk input batch
+#
+# Sketsa (JSON, disimpan di config bundle):
+#   numerik  : batas bin kuantil training + proporsi per bin + missing rate
+#   kategori : tabel frekuensi (maks. max_levels level teratas) + sisa "lainnya" + missing rate
+# DriftMonitor hanya menyimpan hitungan per bin/level (memori tetap), di-update per potongan baris
+# dan bisa digabung antar worker. Skor: PSI (numerik & kategori) dan KS aproksimasi dari CDF bin (numerik).
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from canonical import norm_key
+
+PSI_EPS = 1e-4
+PSI_MODERATE = 0.1
+PSI_HIGH = 0.25
+
+
+def _numeric_values(s: pd.Series) -> np.ndarray:
+    return pd.to_numeric(s, errors="coerce").to_numpy(dtype=float)
+
+
+def _norm_keys(s: pd.Series) -> pd.Series:
+    # normalisasi per nilai unik (bukan per baris)
+    codes, uniq = pd.factorize(s)
+    keys = np.array([norm_key(u) for u in uniq] + [None], dtype=object)
+    return pd.Series(keys[codes], index=s.index)
+
+
+def build_sketches(df: pd.DataFrame, numeric_cols: Iterable[str], cat_cols: Iterable[str],
+                   n_bins: int = 20, max_levels: int = 200) -> Dict:
+    """Sketsa ringkas per fitur dari data training."""
+    out = {"n_rows": int(len(df)), "numeric": {}, "categorical": {}}
+    for c in numeric_cols:
+        if c not in df.columns:
+            continue
+        x = _numeric_values(df[c])
+        ok = x[~np.isnan(x)]
+        if ok.size == 0:
+            continue
+        edges = np.unique(np.quantile(ok, np.linspace(0, 1, n_bins + 1)))[1:-1]
+        counts = np.bincount(np.searchsorted(edges, ok, side="right"), minlength=len(edges) + 1)
+        out["numeric"][c] = {
+            "edges": edges.tolist(),
+            "probs": (counts / ok.size).tolist(),
+            "missing_rate": float(1 - ok.size / len(x)),
+            "min": float(ok.min()), "max": float(ok.max()),
+        }
+    for c in cat_cols:
+        if c not in df.columns:
+            continue
+        keys = _norm_keys(df[c])
+        n_missing = int(keys.isna().sum())
+        vc = keys.dropna().value_counts()
+        n_ok = max(int(vc.sum()), 1)
+        top = vc.head(max_levels)
+        out["categorical"][c] = {
+            "freq": {k: float(v / n_ok) for k, v in top.items()},
+            "other": float(1 - top.sum() / n_ok),
+            "missing_rate": float(n_missing / max(len(keys), 1)),
+            "truncated": bool(len(vc) > max_levels),
+        }
+    return out
+
+
+def _psi(expected: np.ndarray, actual: np.ndarray) -> float:
+    e = np.maximum(expected, PSI_EPS); a = np.maximum(actual, PSI_EPS)
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+def drift_status(psi: float) -> str:
+    if np.isnan(psi):
+        return "-"
+    return "tinggi" if psi >= PSI_HIGH else ("sedang" if psi >= PSI_MODERATE else "stabil")
+
+
+class DriftMonitor:
+    """Akumulator hitungan per bin/level terhadap sketsa training; memori tidak bergantung jumlah baris."""
+    def __init__(self, sketches: Dict, max_examples: int = 10):
+        self.sketches = sketches or {}
+        self.max_examples = max_examples
+        self.n_rows = 0
+        self._num = {c: {"edges": np.asarray(s["edges"], dtype=float),
+                         "counts": np.zeros(len(s["edges"]) + 1, dtype=np.int64), "missing": 0}
+                     for c, s in self.sketches.get("numeric", {}).items()}
+        self._cat = {c: {"index": {k: i for i, k in enumerate(s["freq"])},
+                         "counts": np.zeros(len(s["freq"]) + 1, dtype=np.int64),  # slot terakhir = lainnya/baru
+                         "missing": 0, "unseen_rows": 0, "unseen": Counter()}
+                     for c, s in self.sketches.get("categorical", {}).items()}
+
+    def update(self, df: pd.DataFrame) -> "DriftMonitor":
+        self.n_rows += len(df)
+        for c, st in self._num.items():
+            if c not in df.columns:
+                st["missing"] += len(df); continue
+            x = _numeric_values(df[c])
+            miss = np.isnan(x)
+            st["missing"] += int(miss.sum())
+            st["counts"] += np.bincount(np.searchsorted(st["edges"], x[~miss], side="right"),
+                                        minlength=len(st["counts"]))
+        for c, st in self._cat.items():
+            if c not in df.columns:
+                st["missing"] += len(df); continue
+            vc = _norm_keys(df[c]).value_counts(dropna=False)
+            for k, n in vc.items():
+                if k is None or (isinstance(k, float) and np.isnan(k)):
+                    st["missing"] += int(n)
+                elif k in st["index"]:
+                    st["counts"][st["index"][k]] += int(n)
+                else:
+                    st["counts"][-1] += int(n)
+                    st["unseen_rows"] += int(n)
+                    st["unseen"][k] += int(n)
+            self._trim_examples(st)
+        return self
+
+    def _trim_examples(self, st: Dict):
+        # Counter hanya untuk contoh_baru (memori dibatasi); porsi_baru memakai unseen_rows yang tidak dipangkas
+        if len(st["unseen"]) > self.max_examples * 4:
+            st["unseen"] = Counter(dict(st["unseen"].most_common(self.max_examples)))
+
+    def merge(self, other: "DriftMonitor") -> "DriftMonitor":
+        self.n_rows += other.n_rows
+        for c, st in self._num.items():
+            st["counts"] += other._num[c]["counts"]; st["missing"] += other._num[c]["missing"]
+        for c, st in self._cat.items():
+            st["counts"] += other._cat[c]["counts"]; st["missing"] += other._cat[c]["missing"]
+            st["unseen_rows"] += other._cat[c]["unseen_rows"]
+            st["unseen"].update(other._cat[c]["unseen"])
+            self._trim_examples(st)
+        return self
+
+    def report(self) -> pd.DataFrame:
+        """Satu baris per fitur: PSI, KS (numerik), missing rate training vs batch, porsi nilai baru/di luar rentang."""
+        rows = []
+        n = max(self.n_rows, 1)
+        for c, st in self._num.items():
+            sk = self.sketches["numeric"][c]
+            n_ok = int(st["counts"].sum())
+            exp = np.asarray(sk["probs"], dtype=float)
+            act = st["counts"] / n_ok if n_ok else np.full_like(exp, np.nan)
+            psi = _psi(exp, act) if n_ok else float("nan")
+            ks = float(np.max(np.abs(np.cumsum(exp) - np.cumsum(act)))) if n_ok else float("nan")
+            rows.append({"kolom": c, "tipe": "numerik", "psi": psi, "ks": ks,
+                         "missing_train": sk["missing_rate"], "missing_batch": st["missing"] / n,
+                         "porsi_baru": float("nan"), "contoh_baru": ""})
+        for c, st in self._cat.items():
+            sk = self.sketches["categorical"][c]
+            n_ok = int(st["counts"].sum())
+            exp = np.asarray(list(sk["freq"].values()) + [sk["other"]], dtype=float)
+            act = st["counts"] / n_ok if n_ok else np.full_like(exp, np.nan)
+            psi = _psi(exp, act) if n_ok else float("nan")
+            rows.append({"kolom": c, "tipe": "kategori", "psi": psi, "ks": float("nan"),
+                         "missing_train": sk["missing_rate"], "missing_batch": st["missing"] / n,
+                         "porsi_baru": st["unseen_rows"] / n_ok if n_ok else float("nan"),
+                         "contoh_baru": ", ".join(k for k, _ in st["unseen"].most_common(self.max_examples))})
+        rep = pd.DataFrame(rows, columns=["kolom", "tipe", "psi", "ks", "missing_train", "missing_batch",
+                                          "porsi_baru", "contoh_baru"])
+        rep["status"] = rep["psi"].map(drift_status)
+        return rep.sort_values("psi", ascending=False, na_position="last").reset_index(drop=True)
+
+
+def merge_monitors(monitors: Iterable[Optional[DriftMonitor]]) -> Optional[DriftMonitor]:
+    total = None
+    for m in monitors:
+        if m is None:
+            continue
+        total = m if total is None else total.merge(m)
+    return total
+
+
+def sketches_from_config(cfg) -> Optional[Dict]:
+    return cfg.get("drift_sketches") if isinstance(cfg, dict) else None
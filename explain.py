@@ -0,0 +1,363 @@
+# explain.py — Penjelasan lokal prediksi (sensitivitas numerik & kontras kategori), satu baris maupun batch
+#
+# Semua perturbasi (±pct tiap fitur numerik, tiap alternatif tiap fitur kategori) untuk sekumpulan baris
+# disusun jadi satu blok besar lalu diprediksi dengan satu model.predict per blok (≤ block_rows baris),
+# bukan satu predict per baris × fitur × alternatif.
+# explain_frame: top-k faktor per baris untuk file batch; model boosting (XGBoost/LightGBM/CatBoost) bisa
+# memakai atribusi pohon native (SHAP, satu pass) yang dipetakan balik ke kolom input ColumnTransformer.
+import warnings
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+
+DEFAULT_BLOCK_ROWS = 200_000
+FACTOR_COL = "Faktor_{}"
+EFFECT_COL = "Efek_{}"
+
+
+def _is_number(x): return isinstance(x, (int, float, np.integer, np.floating)) and np.isfinite(x)
+
+
+def _numeric_values(s: pd.Series) -> np.ndarray:
+    """Nilai float per baris; NaN bila bukan angka hingga (aturan sama dengan _is_number)."""
+    if pd.api.types.is_numeric_dtype(s.dtype):
+        v = s.to_numpy(dtype=float, na_value=np.nan)
+    else:
+        v = np.array([float(x) if _is_number(x) else np.nan for x in s.to_numpy(dtype=object)], dtype=float)
+    return np.where(np.isfinite(v), v, np.nan)
+
+
+# ---------- rencana & prediksi blok perturbasi ----------
+def _variant_plan(X: pd.DataFrame, pct: float, choices_map: Optional[Dict], skip, numeric: bool, categorical: bool):
+    """[(fitur, jenis, label, nilai per baris, valid per baris)] — satu entri = satu salinan X di blok."""
+    plan = []
+    for col in X.columns:
+        if col in skip:
+            continue
+        if numeric:
+            v = _numeric_values(X[col])
+            ok = ~np.isnan(v)
+            if ok.any():
+                delta = pct * np.where(v != 0, np.abs(v), 1.0)
+                plan.append((col, "up", None, v + delta, ok))
+                plan.append((col, "down", None, v - delta, ok))
+        if categorical and col in (choices_map or {}):
+            for alt in choices_map[col]:
+                ok = ~X[col].isin([alt]).to_numpy()
+                if ok.any():
+                    plan.append((col, "alt", alt, np.full(len(X), alt, dtype=object), ok))
+    return plan
+
+
+def _assemble_block(chunk: pd.DataFrame, plan, s: int) -> pd.DataFrame:
+    """Salinan 0 = baris asli, salinan j = varian plan[j-1] (baris tidak valid tetap nilai asli)."""
+    m, reps = len(chunk), len(plan) + 1
+    by_col: Dict[str, List] = {}
+    for j, entry in enumerate(plan, start=1):
+        by_col.setdefault(entry[0], []).append((j, entry))
+    cols = {}
+    for c in chunk.columns:
+        s_c = chunk[c]
+        if c not in by_col:
+            cols[c] = s_c.take(np.tile(np.arange(m), reps)).reset_index(drop=True)
+            continue
+        numeric_col = pd.api.types.is_numeric_dtype(s_c.dtype) and not pd.api.types.is_bool_dtype(s_c.dtype)
+        arr = np.tile(s_c.to_numpy(dtype=float, na_value=np.nan) if numeric_col else s_c.to_numpy(dtype=object), reps)
+        for j, (_, _, _, vals, ok) in by_col[c]:
+            seg = slice(j * m, (j + 1) * m)
+            arr[seg] = np.where(ok[s:s + m], vals[s:s + m], arr[seg])
+        cols[c] = arr if numeric_col or s_c.dtype == object else pd.array(arr, dtype=s_c.dtype)
+    return pd.DataFrame(cols, columns=chunk.columns)
+
+
+def _predict_block(model, big: pd.DataFrame, m: int) -> np.ndarray:
+    try:
+        return np.asarray(model.predict(big), dtype=float)
+    except Exception:
+        # satu varian gagal (mis. nilai di luar domain encoder) → jangan gagalkan seluruh blok
+        out = np.full(len(big), np.nan)
+        for j in range(0, len(big), m):
+            try:
+                out[j:j + m] = model.predict(big[j:j + m] if isinstance(big, np.ndarray) else big.iloc[j:j + m])
+            except Exception:
+                if j == 0:
+                    raise
+        return out
+
+
+def _split_column_transformer(model):
+    """(ColumnTransformer, sisa pipeline) bila langkah pertama ColumnTransformer ter-fit berkeluaran padat; selain itu None."""
+    if not hasattr(model, "steps") or len(model.steps) < 2:
+        return None
+    ct = model.steps[0][1]
+    if not isinstance(ct, ColumnTransformer) or not hasattr(ct, "output_indices_") or getattr(ct, "sparse_output_", False):
+        return None
+    if ct.output_indices_.get("remainder", slice(0, 0)).stop - ct.output_indices_.get("remainder", slice(0, 0)).start:
+        return None
+    return ct, model[1:]
+
+
+def _transform_rows(trans, frame: pd.DataFrame) -> np.ndarray:
+    """transform per baris; transformer satu kolom cukup menghitung nilai unik lalu disebar (varian = nilai konstan)."""
+    if trans == "passthrough":
+        return frame.to_numpy(dtype=float)
+    codes, uniq = None, None
+    if frame.shape[1] == 1:
+        codes, uniq = pd.factorize(frame.iloc[:, 0], use_na_sentinel=False)
+        if len(uniq) < len(frame):
+            frame = pd.DataFrame({frame.columns[0]: pd.Series(uniq, dtype=frame.dtypes.iloc[0])})
+        else:
+            codes = None
+    out = trans.transform(frame)
+    out = np.asarray(out.toarray() if hasattr(out, "toarray") else out, dtype=float)
+    return out if codes is None else out[codes]
+
+
+def _assemble_block_transformed(ct: ColumnTransformer, chunk: pd.DataFrame, plan, s: int) -> Optional[np.ndarray]:
+    """
+    Blok perturbasi langsung di ruang fitur: chunk di-transform sekali lalu di-tile; tiap varian hanya
+    menghitung ulang transformer yang memakai kolom yang diubah (mis. tokenisasi alamat tidak diulang
+    untuk perturbasi luas). Setara _assemble_block → prep.transform karena transformer per kolom independen.
+    """
+    X0 = ct.transform(chunk)
+    if not isinstance(X0, np.ndarray):
+        return None
+    m = len(chunk)
+    big = np.tile(X0, (len(plan) + 1, 1))
+    by_col: Dict[str, List[int]] = {}
+    for j, entry in enumerate(plan, start=1):
+        by_col.setdefault(entry[0], []).append(j)
+    for c, js in by_col.items():
+        # satu frame berisi semua varian kolom c (len(js) × m baris); kolom lain tetap nilai asli
+        sub = _assemble_block(chunk, [plan[j - 1] for j in js], s).iloc[m:].reset_index(drop=True)
+        for name, trans, cols in ct.transformers_:
+            cols = [cols] if isinstance(cols, str) else list(cols)
+            sl = ct.output_indices_.get(name, slice(0, 0))
+            if c not in cols or trans == "drop" or sl.stop == sl.start:
+                continue
+            out = _transform_rows(trans, sub[cols])
+            for k, j in enumerate(js):
+                big[j * m:(j + 1) * m, sl] = out[k * m:(k + 1) * m]
+    return big
+
+
+def perturbation_predictions(model, X: pd.DataFrame, plan, block_rows: int = DEFAULT_BLOCK_ROWS,
+                             on_progress: Optional[Callable[[float], None]] = None):
+    """(prediksi dasar (n,), prediksi varian (len(plan), n)); varian tidak valid = NaN."""
+    n, V = len(X), len(plan)
+    base = np.empty(n)
+    P = np.full((V, n), np.nan)
+    step = max(1, int(block_rows) // (V + 1))
+    split = _split_column_transformer(model)
+    for s in range(0, n, step):
+        chunk = X.iloc[s:s + step]
+        m = len(chunk)
+        pred = None
+        if split is not None:
+            try:
+                big_t = _assemble_block_transformed(split[0], chunk, plan, s)
+                pred = None if big_t is None else _predict_block(split[1], big_t, m)
+            except Exception:
+                pred = None  # struktur tak terduga → jalur umum lewat pipeline penuh
+        if pred is None:
+            pred = _predict_block(model, _assemble_block(chunk, plan, s), m)
+        pred = pred.reshape(V + 1, m)
+        base[s:s + m] = pred[0]
+        P[:, s:s + m] = pred[1:]
+        if on_progress is not None:
+            on_progress(min(1.0, (s + m) / n))
+    for j, entry in enumerate(plan):
+        P[j, ~entry[4]] = np.nan
+    return base, P
+
+
+def _numeric_effects(X, plan, base, P) -> Dict[str, Dict[str, np.ndarray]]:
+    idx = {(e[0], e[1]): j for j, e in enumerate(plan) if e[1] in ("up", "down")}
+    out = {}
+    for col in dict.fromkeys(c for c, _ in idx):
+        ju, jd = idx[(col, "up")], idx[(col, "down")]
+        pu, pdn = P[ju], P[jd]
+        up, dn = plan[ju][3], plan[jd][3]
+        eu, ed = pu - base, pdn - base
+        out[col] = {"effect_up": eu, "effect_down": ed, "sensitivity": (pu - pdn) / (up - dn + 1e-12),
+                    "abs_effect": np.fmax(np.abs(eu), np.abs(ed))}
+    return out
+
+
+def _categorical_effects(X, plan, base, P) -> Dict[str, Dict[str, np.ndarray]]:
+    groups: Dict[str, List[int]] = {}
+    for j, e in enumerate(plan):
+        if e[1] == "alt":
+            groups.setdefault(e[0], []).append(j)
+    out = {}
+    for col, js in groups.items():
+        A = P[js]
+        n_valid = (~np.isnan(A)).sum(axis=0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # kolom tanpa alternatif valid → NaN
+            avg_alt = np.nanmean(A, axis=0)
+        dist = np.where(np.isnan(A), -np.inf, np.abs(A - base))
+        best = dist.argmax(axis=0)
+        labels = np.array([plan[j][2] for j in js], dtype=object)
+        delta = np.where(n_valid > 0, base - avg_alt, np.nan)
+        out[col] = {"delta_vs_avg_alt": delta, "best_alt": labels[best],
+                    "effect_if_best_alt": np.take_along_axis(A, best[None, :], axis=0)[0] - base,
+                    "n_valid_alts": n_valid, "abs_effect": np.abs(delta)}
+    return out
+
+
+# ---------- satu baris (panel interaktif) ----------
+def explain_numeric_local(model, X_row, pct, skip_cols=None):
+    plan = _variant_plan(X_row, pct, None, set(skip_cols or []), numeric=True, categorical=False)
+    base, P = perturbation_predictions(model, X_row, plan)
+    recs = []
+    for col, e in _numeric_effects(X_row, plan, base, P).items():
+        if np.isnan(e["abs_effect"][0]):
+            continue
+        recs.append({"feature": col, "type": "numeric", "current": X_row.iloc[0][col], "base_pred": float(base[0]),
+                     "effect_up": e["effect_up"][0], "effect_down": e["effect_down"][0],
+                     "sensitivity": e["sensitivity"][0], "abs_effect": e["abs_effect"][0]})
+    return pd.DataFrame(recs)
+
+
+def explain_categorical_contrast(model, X_row, choices_map, skip_cols=None):
+    plan = _variant_plan(X_row, 0.0, choices_map, set(skip_cols or []), numeric=False, categorical=True)
+    base, P = perturbation_predictions(model, X_row, plan)
+    recs = []
+    for col, e in _categorical_effects(X_row, plan, base, P).items():
+        if e["n_valid_alts"][0] == 0:
+            continue
+        recs.append({"feature": col, "type": "categorical", "current": X_row.iloc[0][col], "base_pred": float(base[0]),
+                     "delta_vs_avg_alt": e["delta_vs_avg_alt"][0], "best_alt": e["best_alt"][0],
+                     "effect_if_best_alt": e["effect_if_best_alt"][0], "n_valid_alts": int(e["n_valid_alts"][0]),
+                     "abs_effect": e["abs_effect"][0]})
+    return pd.DataFrame(recs)
+
+
+# ---------- atribusi pohon native (boosting) ----------
+def _input_columns_per_output(ct: ColumnTransformer) -> Optional[np.ndarray]:
+    """Nama kolom input untuk tiap kolom output ColumnTransformer ter-fit; None bila tidak bisa dipetakan."""
+    n_out = max((sl.stop for sl in ct.output_indices_.values()), default=0)
+    owner = np.empty(n_out, dtype=object)
+    for name, trans, cols in ct.transformers_:
+        sl = ct.output_indices_.get(name, slice(0, 0))
+        width = sl.stop - sl.start
+        if width == 0 or trans == "drop":
+            continue
+        cols = [cols] if isinstance(cols, str) else list(cols)
+        if len(cols) == 1:
+            owner[sl] = cols[0]
+        elif width == len(cols):
+            owner[sl] = cols
+        else:
+            try:  # mis. one-hot: "<kolom>_<level>" → kolom dengan prefix terpanjang
+                names = trans.get_feature_names_out(cols)
+            except Exception:
+                return None
+            for k, nm in enumerate(names):
+                hit = max((c for c in cols if str(nm).startswith(f"{c}_") or str(nm) == c), key=len, default=None)
+                if hit is None:
+                    return None
+                owner[sl.start + k] = hit
+    return None if any(o is None for o in owner) else owner
+
+
+def _tree_lib(est) -> str:
+    # pembungkus booster (mis. out_of_core.BoosterRegressor) menandai library-nya lewat atribut tree_lib
+    return getattr(est, "tree_lib", None) or type(est).__module__.split(".")[0]
+
+
+def _native_contribs(est, Xt) -> Optional[np.ndarray]:
+    lib = _tree_lib(est)
+    if lib == "xgboost":
+        import xgboost
+        c = est.get_booster().predict(xgboost.DMatrix(Xt), pred_contribs=True)
+    elif lib == "lightgbm":
+        c = est.predict(Xt, pred_contrib=True)
+    elif lib == "catboost":
+        from catboost import Pool
+        c = est.get_feature_importance(Pool(Xt), type="ShapValues")
+    else:
+        return None
+    return np.asarray(c)[:, :-1]  # kolom terakhir = bias (nilai harapan)
+
+
+def supports_tree_attributions(model) -> bool:
+    if not hasattr(model, "steps") or len(model.steps) < 2 or not isinstance(model.steps[0][1], ColumnTransformer):
+        return False
+    return _tree_lib(model.steps[-1][1]) in ("xgboost", "lightgbm", "catboost")
+
+
+def tree_attributions(model, X: pd.DataFrame, block_rows: int = DEFAULT_BLOCK_ROWS) -> Optional[pd.DataFrame]:
+    """Kontribusi SHAP per kolom input (n × fitur, satuan prediksi); None bila model tidak mendukung."""
+    if not supports_tree_attributions(model):
+        return None
+    owner = _input_columns_per_output(model.steps[0][1])
+    if owner is None:
+        return None
+    pre, est = model[:-1], model.steps[-1][1]
+    feats = list(dict.fromkeys(owner))
+    onehot = (owner[:, None] == np.array(feats, dtype=object)[None, :]).astype(float)  # output → input
+    parts = []
+    for s in range(0, len(X), int(block_rows)):
+        contrib = _native_contribs(est, pre.transform(X.iloc[s:s + int(block_rows)]))
+        if contrib is None or contrib.shape[1] != len(owner):
+            return None
+        parts.append(contrib @ onehot)
+    return pd.DataFrame(np.vstack(parts) if parts else np.empty((0, len(feats))), index=X.index, columns=feats)
+
+
+# ---------- batch: top-k faktor per baris ----------
+def _top_k_frame(effects: pd.DataFrame, k: int) -> pd.DataFrame:
+    names = np.array(effects.columns, dtype=object)
+    E = effects.to_numpy(dtype=float)
+    A = np.where(np.isnan(E), -1.0, np.abs(E))
+    k = min(int(k), E.shape[1])
+    order = np.argsort(-A, axis=1, kind="stable")[:, :k]
+    out = {}
+    for i in range(k):
+        j = order[:, i]
+        valid = A[np.arange(len(E)), j] >= 0
+        out[FACTOR_COL.format(i + 1)] = np.where(valid, names[j], None)
+        out[EFFECT_COL.format(i + 1)] = np.where(valid, E[np.arange(len(E)), j], np.nan)
+    return pd.DataFrame(out, index=effects.index)
+
+
+def perturbation_effects(model, X: pd.DataFrame, pct: float, choices_map: Optional[Dict], skip_cols=None,
+                         block_rows: int = DEFAULT_BLOCK_ROWS,
+                         on_progress: Optional[Callable[[float], None]] = None) -> pd.DataFrame:
+    """Efek bertanda per baris × fitur (Rp): numerik = ±max|Δ| searah sensitivitas, kategori = prediksi − rerata alternatif."""
+    plan = _variant_plan(X, pct, choices_map, set(skip_cols or []), numeric=True, categorical=True)
+    base, P = perturbation_predictions(model, X, plan, block_rows, on_progress)
+    eff = {}
+    for col, e in _numeric_effects(X, plan, base, P).items():
+        eff[col] = np.where(e["sensitivity"] < 0, -1.0, 1.0) * e["abs_effect"]
+    for col, e in _categorical_effects(X, plan, base, P).items():
+        eff[col] = e["delta_vs_avg_alt"] if col not in eff else np.where(
+            np.abs(e["delta_vs_avg_alt"]) > np.abs(eff[col]), e["delta_vs_avg_alt"], eff[col])
+    return pd.DataFrame(eff, index=X.index)
+
+
+def explain_frame(model, X: pd.DataFrame, pct: float, choices_map: Optional[Dict], skip_cols=None, top_k: int = 3,
+                  method: str = "auto", block_rows: int = DEFAULT_BLOCK_ROWS,
+                  on_progress: Optional[Callable[[float], None]] = None) -> pd.DataFrame:
+    """
+    Top-k faktor penentu tiap baris X → kolom Faktor_1..k (nama fitur) & Efek_1..k (Rp, bertanda), index = X.index.
+    method: "perturbation" (metode panel interaktif), "attribution" (SHAP native boosting) atau "auto"
+    (atribusi bila model mendukung, selain itu perturbasi). attrs["method"] = metode yang dipakai.
+    """
+    effects = None
+    if method in ("auto", "attribution"):
+        effects = tree_attributions(model, X, block_rows)
+        if effects is not None:
+            effects = effects.drop(columns=[c for c in (skip_cols or []) if c in effects.columns])
+            if on_progress is not None:
+                on_progress(1.0)
+    used = "attribution" if effects is not None else "perturbation"
+    if effects is None:
+        effects = perturbation_effects(model, X, pct, choices_map, skip_cols, block_rows, on_progress)
+    out = _top_k_frame(effects, top_k)
+    out.attrs["method"] = used
+    return out
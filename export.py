@@ -0,0 +1,168 @@
+# export.py — Ekspor hasil (prediksi batch / hasil test training) ke file sementara dengan memori konstan
+#
+# Format:
+#   xlsx    : openpyxl write_only (baris di-stream per potongan, tanpa menyimpan sel di memori);
+#             > 1.048.575 baris data otomatis dipecah ke sheet lanjutan (Sheet, Sheet_2, ...)
+#   csv.gz  : CSV gzip ditulis per potongan — jauh lebih cepat dari xlsx
+#   parquet : pyarrow ParquetWriter per potongan (row group) — tercepat & terkecil
+# File ditulis ke folder temp proses; tombol unduhan Streamlit membaca file itu baru saat diklik
+# (deferred_reader), bukan blob bytes yang dibangun tiap rerun. File lama dibersihkan otomatis.
+import gzip, os, tempfile, time
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+import pandas as pd
+
+PARQUET_OK = find_spec("pyarrow") is not None
+XLSX_OK = find_spec("openpyxl") is not None
+
+EXCEL_MAX_ROWS = 1_048_576            # batas baris per sheet (termasuk header)
+EXCEL_SHEET_NAME_MAX = 31
+DEFAULT_CHUNK_ROWS = 50_000
+EXPORT_MAX_AGE_S = 6 * 3600
+
+FORMATS = {
+    "xlsx": {"label": "Excel (.xlsx)", "suffix": ".xlsx",
+             "mime": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"},
+    "csv.gz": {"label": "CSV gzip (.csv.gz)", "suffix": ".csv.gz", "mime": "application/gzip"},
+    "parquet": {"label": "Parquet (.parquet)", "suffix": ".parquet", "mime": "application/vnd.apache.parquet"},
+}
+
+_EXPORT_DIR = Path(tempfile.gettempdir()) / "tanah_exports"
+
+
+def available_formats():
+    return [f for f in FORMATS if (f != "xlsx" or XLSX_OK) and (f != "parquet" or PARQUET_OK)]
+
+
+def _plain(df: pd.DataFrame) -> pd.DataFrame:
+    # attrs (laporan kanonikalisasi/drift) disalin pandas di tiap slicing → buang untuk ekspor
+    df = df.copy(deep=False)
+    df.attrs = {}
+    return df
+
+
+def _chunks(df: pd.DataFrame, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    for s in range(0, len(df), chunk_rows):
+        yield df.iloc[s:s + chunk_rows]
+
+
+# ---------- penulis per format ----------
+def excel_sheet_parts(name: str, n_rows: int):
+    """[(nama_sheet, awal, akhir)] — pecah per batas baris Excel; nama ≤ 31 karakter."""
+    per_sheet = EXCEL_MAX_ROWS - 1
+    parts = []
+    for k, s in enumerate(range(0, max(n_rows, 1), per_sheet)):
+        sheet = name[:EXCEL_SHEET_NAME_MAX] if k == 0 else f"{name[:EXCEL_SHEET_NAME_MAX - 4]}_{k + 1}"
+        parts.append((sheet, s, min(s + per_sheet, n_rows)))
+    return parts
+
+
+def write_excel(sheets: Dict[str, pd.DataFrame], path, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Dict[str, int]:
+    """Tulis beberapa DataFrame (satu per sheet) dengan workbook write_only; kembalikan jumlah sheet per frame."""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    n_sheets = {}
+    for name, df in sheets.items():
+        df = _plain(df)
+        header = [str(c) for c in df.columns]
+        parts = excel_sheet_parts(name, len(df))
+        n_sheets[name] = len(parts)
+        for sheet, s, e in parts:
+            ws = wb.create_sheet(sheet)
+            ws.append(header)
+            for chunk in _chunks(df.iloc[s:e], chunk_rows):
+                # objek Python (float/int/str/Timestamp) + NaN/NA → sel kosong
+                vals = chunk.astype(object).where(chunk.notna(), None)
+                for row in vals.itertuples(index=False, name=None):
+                    ws.append(row)
+    wb.save(path)
+    return n_sheets
+
+
+def write_csv_gz(df: pd.DataFrame, path, chunk_rows: int = DEFAULT_CHUNK_ROWS, compresslevel: int = 6):
+    df = _plain(df)
+    with gzip.open(path, "wt", encoding="utf-8", newline="", compresslevel=compresslevel) as f:
+        if df.empty:
+            df.to_csv(f, index=False)
+        for k, chunk in enumerate(_chunks(df, chunk_rows)):
+            chunk.to_csv(f, index=False, header=(k == 0))
+
+
+def write_parquet(df: pd.DataFrame, path, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+    """Parquet per row group; kolom object (campuran angka + teks dari Excel) ditulis sebagai string."""
+    import pyarrow as pa, pyarrow.parquet as pq
+
+    df = _plain(df)
+    as_str = {c: "string" for c in df.select_dtypes(include=["object", "string"]).columns}
+    schema = pa.Schema.from_pandas(df.iloc[:0].astype(as_str), preserve_index=False)
+    with pq.ParquetWriter(path, schema) as w:
+        for chunk in _chunks(df, chunk_rows):
+            w.write_table(pa.Table.from_pandas(chunk.astype(as_str), schema=schema, preserve_index=False))
+
+
+# ---------- file sementara ----------
+def cleanup_exports(max_age_s: float = EXPORT_MAX_AGE_S) -> int:
+    """Hapus file ekspor lebih tua dari max_age_s; kembalikan jumlah file terhapus."""
+    if not _EXPORT_DIR.is_dir():
+        return 0
+    n, now = 0, time.time()
+    for p in _EXPORT_DIR.iterdir():
+        try:
+            if now - p.stat().st_mtime > max_age_s:
+                p.unlink()
+                n += 1
+        except OSError:
+            pass
+    return n
+
+
+def discard_export(result: Optional[Dict]):
+    if result:
+        try:
+            os.unlink(result["path"])
+        except OSError:
+            pass
+
+
+def export_frames(sheets: Dict[str, pd.DataFrame], fmt: str, stem: str,
+                  chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Dict:
+    """Ekspor ke file temp. xlsx menulis semua sheet; csv.gz/parquet hanya frame pertama (frame utama).
+
+    Kembalikan dict: path, file_name, mime, fmt, rows, bytes, seconds, sheets (jumlah sheet per frame, xlsx).
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Format ekspor tidak dikenal: {fmt}")
+    cleanup_exports()
+    _EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+    spec = FORMATS[fmt]
+    fd, path = tempfile.mkstemp(prefix=f"{stem}_", suffix=spec["suffix"], dir=_EXPORT_DIR)
+    os.close(fd)
+    main_df = next(iter(sheets.values()))
+    t0 = time.perf_counter()
+    try:
+        n_sheets = {}
+        if fmt == "xlsx":
+            n_sheets = write_excel(sheets, path, chunk_rows)
+        elif fmt == "csv.gz":
+            write_csv_gz(main_df, path, chunk_rows)
+        else:
+            write_parquet(main_df, path, chunk_rows)
+    except Exception:
+        discard_export({"path": path})
+        raise
+    return {"path": path, "file_name": f"{stem}{spec['suffix']}", "mime": spec["mime"], "fmt": fmt,
+            "rows": len(main_df), "bytes": os.path.getsize(path), "seconds": time.perf_counter() - t0,
+            "sheets": n_sheets}
+
+
+def deferred_reader(path):
+    """Callable untuk st.download_button(data=...): file baru dibaca saat tombol diklik."""
+    path = os.path.abspath(path)
+
+    def read():
+        with open(path, "rb") as f:
+            return f.read()
+    return read
@@ -0,0 +1,168 @@
+# heatmap_tiles.py — Job offline: tile heatmap prediksi Rp/m² di area Jabodetabek
+# Jalankan: python heatmap_tiles.py models/model_bundle_latest.pkl --profile profil.json --cell-deg 0.0025
+#
+# Hasil: models/tiles/<versi_model>/<key_profil>/{meta.json, tile_<ty>_<tx>.npy}
+# Tiap tile = array float32 (tile_size × tile_size) Rp/m²; baris 0 = lintang paling utara.
+# Halaman prediksi membaca tile (mmap) untuk heatmap & lookup harga per koordinat tanpa menjalankan model.
+
+import argparse, hashlib, json, os, sys, time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from canonical import tables_from_config
+from inference import (
+    BATCH_DEFAULTS, CBD_POINTS_JAKARTA, DEFAULT_REQUIRED_COLS, PRED_COL,
+    load_bundle, model_version_of, predict_frame,
+)
+
+# (lat_min, lat_max, lon_min, lon_max) Jabodetabek; diperluas otomatis agar semua titik CBD tercakup
+JABODETABEK_BBOX = (-6.65, -6.05, 106.45, 107.15)
+
+# Atribut tanah default untuk profil tile (lokasi diisi per sel)
+DEFAULT_PROFILE = dict(BATCH_DEFAULTS, luas=100.0, jarak_ke_jalan=6.0, kota_kabupaten="Jakarta Selatan")
+DEFAULT_PROFILE.pop("nama_cbd")
+
+
+def coverage_bbox(margin_deg: float = 0.05) -> Tuple[float, float, float, float]:
+    lats = [r["lat"] for r in CBD_POINTS_JAKARTA]; lons = [r["lon"] for r in CBD_POINTS_JAKARTA]
+    b = JABODETABEK_BBOX
+    return (min(b[0], min(lats) - margin_deg), max(b[1], max(lats) + margin_deg),
+            min(b[2], min(lons) - margin_deg), max(b[3], max(lons) + margin_deg))
+
+
+def profile_key(profile: Dict) -> str:
+    return hashlib.sha1(json.dumps(profile, sort_keys=True, default=str).encode()).hexdigest()[:10]
+
+
+def build_tiles(model, cfg, out_root: Path, model_version: str, profile: Dict,
+                bbox=None, cell_deg: float = 0.0025, tile_size: int = 128,
+                per_m2_target: bool = False, n_workers: Optional[int] = None, batch_rows: int = 200_000) -> Path:
+    bbox = bbox or coverage_bbox()
+    lat_min, lat_max, lon_min, lon_max = bbox
+    # toleransi pembulatan float: 0.12 / 0.01 = 12.000000000000002 bukan 13 sel
+    n_rows = int(np.ceil((lat_max - lat_min) / cell_deg - 1e-9))
+    n_cols = int(np.ceil((lon_max - lon_min) / cell_deg - 1e-9))
+    # pusat sel; baris 0 = utara (lat_max) agar langsung cocok untuk imshow
+    lat_c = lat_max - (np.arange(n_rows) + 0.5) * cell_deg
+    lon_c = lon_min + (np.arange(n_cols) + 0.5) * cell_deg
+
+    required_cols = cfg.get("required_cols", DEFAULT_REQUIRED_COLS) if isinstance(cfg, dict) else DEFAULT_REQUIRED_COLS
+    canon_tables = tables_from_config(cfg)
+    luas = float(profile.get("luas", 100.0)) or 1.0
+
+    grid = np.empty((n_rows, n_cols), dtype=np.float32)
+    lat_all = np.repeat(lat_c, n_cols); lon_all = np.tile(lon_c, n_rows)
+    for s in range(0, lat_all.size, batch_rows):
+        df = pd.DataFrame({k: v for k, v in profile.items() if k not in ("nama_cbd", "jarak_cbd")},
+                          index=range(min(batch_rows, lat_all.size - s)))
+        df["latitude"] = lat_all[s:s + batch_rows]; df["longitude"] = lon_all[s:s + batch_rows]
+        # nama_cbd/jarak_cbd per sel diturunkan dari lat/lon (enrich_cbd di predict_frame)
+        pred = predict_frame(model, df, required_cols, n_workers=n_workers, canon_tables=canon_tables)[PRED_COL].to_numpy()
+        grid.flat[s:s + len(pred)] = pred if per_m2_target else pred / luas
+
+    out_dir = out_root / model_version / profile_key(profile)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    n_ty = -(-n_rows // tile_size); n_tx = -(-n_cols // tile_size)
+    for ty in range(n_ty):
+        for tx in range(n_tx):
+            tile = np.full((tile_size, tile_size), np.nan, dtype=np.float32)
+            part = grid[ty * tile_size:(ty + 1) * tile_size, tx * tile_size:(tx + 1) * tile_size]
+            tile[:part.shape[0], :part.shape[1]] = part
+            np.save(out_dir / f"tile_{ty}_{tx}.npy", tile)
+    meta = {"model_version": model_version, "profile": profile, "profile_key": profile_key(profile),
+            "bbox": list(bbox), "cell_deg": cell_deg, "tile_size": tile_size, "n_rows": n_rows, "n_cols": n_cols,
+            "n_tiles": [n_ty, n_tx], "value": "rp_per_m2",
+            "created": time.strftime("%Y-%m-%d %H:%M:%S")}
+    (out_dir / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+    return out_dir
+
+
+class TileStore:
+    """Baca tile satu profil (mmap) → lookup Rp/m² per koordinat & mosaic untuk heatmap."""
+    def __init__(self, tile_dir):
+        self.dir = Path(tile_dir)
+        self.meta = json.loads((self.dir / "meta.json").read_text(encoding="utf-8"))
+        self._tile = lru_cache(maxsize=64)(self._load_tile)
+
+    def _load_tile(self, ty: int, tx: int) -> Optional[np.ndarray]:
+        f = self.dir / f"tile_{ty}_{tx}.npy"
+        return np.load(f, mmap_mode="r") if f.exists() else None
+
+    def lookup(self, lat: float, lon: float) -> float:
+        m = self.meta
+        lat_min, lat_max, lon_min, lon_max = m["bbox"]
+        r = int((lat_max - lat) // m["cell_deg"]); c = int((lon - lon_min) // m["cell_deg"])
+        if not (0 <= r < m["n_rows"] and 0 <= c < m["n_cols"]):
+            return float("nan")
+        ts = m["tile_size"]
+        tile = self._tile(r // ts, c // ts)
+        return float("nan") if tile is None else float(tile[r % ts, c % ts])
+
+    def mosaic(self, max_px: int = 600) -> np.ndarray:
+        """Gabungkan semua tile (dengan downsample) untuk ditampilkan sebagai gambar."""
+        m = self.meta; ts = m["tile_size"]
+        full = np.full((m["n_tiles"][0] * ts, m["n_tiles"][1] * ts), np.nan, dtype=np.float32)
+        for ty in range(m["n_tiles"][0]):
+            for tx in range(m["n_tiles"][1]):
+                t = self._tile(ty, tx)
+                if t is not None:
+                    full[ty * ts:(ty + 1) * ts, tx * ts:(tx + 1) * ts] = t
+        full = full[:m["n_rows"], :m["n_cols"]]
+        step = max(1, int(np.ceil(max(full.shape) / max_px)))
+        return full[::step, ::step]
+
+    @property
+    def extent(self) -> List[float]:
+        lat_min, lat_max, lon_min, lon_max = self.meta["bbox"]
+        return [lon_min, lon_min + self.meta["n_cols"] * self.meta["cell_deg"],
+                lat_max - self.meta["n_rows"] * self.meta["cell_deg"], lat_max]
+
+
+def list_tile_sets(tiles_root, model_version: str) -> List[Path]:
+    """Semua folder profil tile untuk versi model tertentu."""
+    d = Path(tiles_root) / model_version
+    return sorted(p for p in d.iterdir() if (p / "meta.json").exists()) if d.exists() else []
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Bangun tile heatmap Rp/m² dari model (offline).")
+    ap.add_argument("bundle", help="Path bundle/pipeline (.pkl)")
+    ap.add_argument("--profile", default=None, help="JSON atribut tanah (default: atribut default batch)")
+    ap.add_argument("--config", default=None, help="Config JSON (default: config_latest.json di sebelah bundle)")
+    ap.add_argument("--out", default=None, help="Folder root tile (default: <folder bundle>/tiles)")
+    ap.add_argument("--cell-deg", type=float, default=0.0025, help="Ukuran sel (derajat); 0.0025° ≈ 280 m")
+    ap.add_argument("--tile-size", type=int, default=128)
+    ap.add_argument("--bbox", type=float, nargs=4, metavar=("LAT_MIN", "LAT_MAX", "LON_MIN", "LON_MAX"))
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = ap.parse_args(argv)
+
+    bundle_path = Path(args.bundle)
+    bundle = load_bundle(bundle_path)
+    if bundle is None:
+        print(f"Bundle tidak berisi model yang valid: {bundle_path}", file=sys.stderr)
+        return 1
+    cfg_path = Path(args.config) if args.config else bundle_path.parent / "config_latest.json"
+    cfg = json.loads(cfg_path.read_text(encoding="utf-8")) if cfg_path.exists() else bundle["config"]
+    profile = dict(DEFAULT_PROFILE)
+    if args.profile:
+        profile.update(json.loads(Path(args.profile).read_text(encoding="utf-8")))
+
+    t0 = time.perf_counter()
+    out = build_tiles(bundle["pipeline"], cfg, Path(args.out) if args.out else bundle_path.parent / "tiles",
+                      model_version_of(bundle_path), profile, bbox=tuple(args.bbox) if args.bbox else None,
+                      cell_deg=args.cell_deg, tile_size=args.tile_size,
+                      per_m2_target=bool(bundle["config"].get("target_is_per_m2", False)), n_workers=args.workers)
+    meta = json.loads((out / "meta.json").read_text(encoding="utf-8"))
+    n_cells = meta["n_rows"] * meta["n_cols"]
+    dt = time.perf_counter() - t0
+    print(f"{n_cells:,} sel ({meta['n_rows']}×{meta['n_cols']}) → {meta['n_tiles'][0] * meta['n_tiles'][1]} tile di {out}")
+    print(f"Waktu: {dt:.1f} s ({n_cells / dt:,.0f} sel/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
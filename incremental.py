@@ -0,0 +1,144 @@
+# incremental.py — Perbarui bundle yang sudah ada dengan listing baru tanpa fit ulang dari nol (fungsi murni,
+# tanpa Streamlit; dipakai mode "Perbarui model" di app.py)
+#
+# Ruang fitur dibekukan: kolom One-Hot, token alamat, median imputer, scaler DAN peta FrequencyEncoder
+# tetap seperti bundle lama. Pohon lama di-split pada ambang nilai encoding lama; menambah hitungan baru
+# ke peta frekuensi akan menggeser nilai encoding sehingga bagian ensemble lama ikut berubah prediksinya.
+# Setelah pembaruan, prediksi n pohon/iterasi pertama dicek sama dengan model lama (check_old_members).
+# Yang diperbarui:
+#   RandomForest     : warm_start → pohon baru dilatih di data baru, pohon lama tetap
+#   XGBoost/LightGBM : boosting dilanjutkan dari booster tersimpan (xgb_model / init_model), termasuk
+#                      BoosterRegressor hasil training out-of-core
+#   CatBoost         : init_model = model lama
+# Algoritma lain (Linear/ElasticNet/SVR/KNN) tidak mendukung pembaruan → fit ulang penuh.
+import copy, time
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import stage
+
+# nama kelas estimator → nama algoritma di app.py
+_KINDS = {"RandomForestRegressor": "RandomForest", "XGBRegressor": "XGBoost",
+          "LGBMRegressor": "LightGBM", "CatBoostRegressor": "CatBoost",
+          "BoosterRegressor": "LightGBM"}  # bundle out-of-core (out_of_core.py)
+INCREMENTAL_ALGOS = tuple(dict.fromkeys(_KINDS.values()))
+DEFAULT_ADD = {"RandomForest": 100, "XGBoost": 200, "LightGBM": 200, "CatBoost": 200}
+UPDATE_DIR = Path("models/updates")  # bundle hasil pembaruan; jadi default hanya lewat promote_bundle
+
+
+def estimator_kind(model) -> Optional[str]:
+    """Nama algoritma estimator akhir bila bisa diperbarui bertahap, selain itu None."""
+    est = model.steps[-1][1] if hasattr(model, "steps") else model
+    return _KINDS.get(type(est).__name__)
+
+
+def n_members(model) -> int:
+    """Jumlah pohon / iterasi boosting di estimator akhir."""
+    est = model.steps[-1][1] if hasattr(model, "steps") else model
+    kind = _KINDS.get(type(est).__name__)
+    if kind == "RandomForest":
+        return len(est.estimators_)
+    if kind == "XGBoost":
+        return int(est.get_booster().num_boosted_rounds())
+    if kind == "LightGBM":
+        booster = est.booster if type(est).__name__ == "BoosterRegressor" else est.booster_
+        return int(booster.current_iteration())
+    if kind == "CatBoost":
+        return int(est.tree_count_)
+    return 0
+
+
+def transform_features(model, X: pd.DataFrame):
+    """Matriks fitur yang masuk ke estimator akhir (semua langkah pipeline kecuali yang terakhir)."""
+    Xt = X
+    for _, step in model.steps[:-1]:
+        Xt = step.transform(Xt)
+    return Xt
+
+
+def prefix_predict(model, X: pd.DataFrame, n: int) -> np.ndarray:
+    """Prediksi dari n pohon/iterasi pertama estimator akhir (= bagian ensemble lama setelah pembaruan)."""
+    est = model.steps[-1][1]
+    kind, Xt = _KINDS.get(type(est).__name__), transform_features(model, X)
+    if kind == "RandomForest":
+        return np.mean([t.predict(Xt) for t in est.estimators_[:n]], axis=0)
+    if kind == "XGBoost":
+        return est.predict(Xt, iteration_range=(0, n))
+    if type(est).__name__ == "BoosterRegressor":
+        return est.booster.predict(Xt, num_iteration=n)
+    if kind == "LightGBM":
+        return est.booster_.predict(Xt, num_iteration=n)
+    if kind == "CatBoost":
+        return est.predict(Xt, ntree_end=n)
+    raise ValueError(f"{type(est).__name__} tidak mendukung pembaruan bertahap.")
+
+
+def check_old_members(old, new, X: pd.DataFrame, rtol: float = 1e-5) -> float:
+    """Selisih relatif maks. prediksi model lama vs n_members(old) pohon pertama model baru; error bila berubah."""
+    ref = old.predict(X)
+    diff = float(np.max(np.abs(prefix_predict(new, X, n_members(old)) - ref) / np.maximum(np.abs(ref), 1e-9)))
+    if diff > rtol:
+        raise RuntimeError(f"Prediksi ensemble lama berubah setelah pembaruan (selisih relatif {diff:.2e}).")
+    return diff
+
+
+def extend_estimator(est, Xt, y, n_add: int):
+    """Tambah n_add pohon/iterasi yang dilatih di (Xt, y) ke estimator ter-fit (in-place; CatBoost: objek baru)."""
+    kind = _KINDS.get(type(est).__name__)
+    n_add = int(n_add)
+    if kind == "RandomForest":
+        est.set_params(warm_start=True, n_estimators=len(est.estimators_) + n_add)
+        est.fit(Xt, y)
+        est.set_params(warm_start=False)
+    elif kind == "XGBoost":
+        booster = est.get_booster()
+        est.set_params(n_estimators=n_add)
+        est.fit(Xt, y, xgb_model=booster)
+    elif type(est).__name__ == "BoosterRegressor":
+        import lightgbm as lgb
+        params = {k: v for k, v in (est.params or {}).items() if k != "num_boost_round"}
+        est.booster = lgb.train(params, lgb.Dataset(Xt, label=np.asarray(y, dtype=float)),
+                                num_boost_round=n_add, init_model=est.booster)
+    elif kind == "LightGBM":
+        booster = est.booster_
+        est.set_params(n_estimators=n_add)
+        est.fit(Xt, y, init_model=booster)
+    elif kind == "CatBoost":
+        # model CatBoost ter-fit tidak bisa set_params → estimator baru yang melanjutkan dari model lama
+        init = est
+        est = type(init)(**{**init.get_params(), "iterations": n_add})
+        est.fit(Xt, y, init_model=init, verbose=False)
+    else:
+        raise ValueError(f"{type(est).__name__} tidak mendukung pembaruan bertahap — latih ulang penuh.")
+    return est
+
+
+def update_pipeline(pipeline, X_new: pd.DataFrame, y_new: pd.Series, n_add: int, check_rows: int = 256):
+    """
+    Salinan pipeline yang diperluas dengan data baru; pipeline asli (mis. model default ter-cache) tidak diubah.
+    Preprocessor tidak di-fit ulang; hasil dicek dengan check_old_members pada ≤ check_rows baris data baru.
+    """
+    if estimator_kind(pipeline) is None:
+        raise ValueError("Estimator bundle tidak mendukung pembaruan bertahap — latih ulang penuh.")
+    model = copy.deepcopy(pipeline)
+    with stage("update.transform"):
+        Xt = transform_features(model, X_new)
+    with stage("update.estimator", rows=len(X_new), n_add=int(n_add)):
+        name, est = model.steps[-1]
+        model.steps[-1] = (name, extend_estimator(est, Xt, y_new, n_add))
+    with stage("update.check"):
+        check_old_members(pipeline, model, X_new.iloc[:check_rows])
+    return model
+
+
+def update_record(n_new: int, n_holdout: int, n_add: int, members_before: int, members_after: int,
+                  metrics_before: Dict, metrics_after: Dict, seconds: float) -> Dict:
+    """Entri riwayat pembaruan (disimpan di config bundle → `updates`)."""
+    return {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "n_new": int(n_new), "n_holdout": int(n_holdout),
+            "n_add": int(n_add), "members_before": int(members_before), "members_after": int(members_after),
+            "seconds": float(seconds),
+            "metrics_before": {k: float(v) for k, v in metrics_before.items()},
+            "metrics_after": {k: float(v) for k, v in metrics_after.items()}}
@@ -0,0 +1,221 @@
+# instrumentation.py — Timing & memori per tahap (wall, CPU, puncak RSS) untuk app.py / Form Prediksi / transformer
+#
+# Pakai:
+#   with stage("fit.estimator"): ...          # context manager
+#   @timed("FrequencyEncoder.fit")             # decorator
+# Aktifkan per thread (= per script run Streamlit) dengan begin_run(enabled=True), atau global lewat
+# env TANAH_PROFILE=1. Saat nonaktif, stage() mengembalikan satu objek no-op bersama (tanpa alokasi/syscall).
+# Tiap record juga ditulis sebagai satu baris JSON ke logger "tanah.stages" (+ file jika TANAH_PROFILE_LOG di-set).
+#
+# Puncak RSS per tahap: satu thread sampler per proses membaca RSS (/proc/self/statm) tiap
+# TANAH_PROFILE_SAMPLE_MS ms (default 10) selama ada tahap aktif dan menaikkan puncak semua tahap aktif
+# (nested stage otomatis benar). VmHWM proses tidak pernah di-reset — tahap/sesi lain tidak saling menghapus;
+# puncak VmHWM proses dicatat apa adanya di record (process_peak_rss_mb). Tanpa /proc: kenaikan ru_maxrss.
+# RSS tetap per proses: alokasi sesi/thread lain selama tahap berjalan ikut terhitung.
+# CPU per tahap = time.thread_time() thread pemanggil (CPU thread/proses worker, mis. n_jobs, tidak termasuk).
+import functools, json, logging, os, threading, time
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+try:
+    import resource
+except Exception:  # Windows
+    resource = None
+
+_LOG = logging.getLogger("tanah.stages")
+_DEFAULT_ENABLED = os.environ.get("TANAH_PROFILE", "0") == "1"
+_tls = threading.local()
+
+_log_path = os.environ.get("TANAH_PROFILE_LOG")
+if _log_path:
+    _fh = logging.FileHandler(_log_path, encoding="utf-8")
+    _fh.setFormatter(logging.Formatter("%(message)s"))
+    _LOG.addHandler(_fh)
+    _LOG.setLevel(logging.INFO)
+
+
+# ---------- RSS ----------
+def _rss_kb() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except Exception:
+        return _maxrss_kb()
+
+
+def _maxrss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource is not None else 0
+
+
+def _hwm_kb() -> Optional[int]:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM"):
+                    return int(line.split()[1])
+    except Exception:
+        return None
+    return None
+
+
+_RSS_SAMPLABLE = os.path.exists("/proc/self/statm")
+_SAMPLE_S = float(os.environ.get("TANAH_PROFILE_SAMPLE_MS", "10")) / 1000
+_active = set()  # tahap yang sedang berjalan (semua thread)
+_active_lock = threading.Lock()
+_wake = threading.Event()
+_sampler_thread = None
+
+
+def _sampler():
+    while True:
+        _wake.wait()
+        with _active_lock:
+            if not _active:
+                _wake.clear()
+                continue
+            rss = _rss_kb()
+            for s in _active:
+                if rss > s.peak:
+                    s.peak = rss
+        time.sleep(_SAMPLE_S)
+
+
+def _track(stage_obj):
+    global _sampler_thread
+    with _active_lock:
+        _active.add(stage_obj)
+        if _sampler_thread is None:
+            _sampler_thread = threading.Thread(target=_sampler, name="stage-rss-sampler", daemon=True)
+            _sampler_thread.start()
+        _wake.set()
+
+
+def _untrack(stage_obj):
+    with _active_lock:
+        _active.discard(stage_obj)
+
+
+# ---------- state per thread ----------
+def _state():
+    st = getattr(_tls, "state", None)
+    if st is None:
+        st = _tls.state = {"enabled": _DEFAULT_ENABLED, "records": [], "stack": []}
+    return st
+
+
+def begin_run(enabled: Optional[bool] = None):
+    """Mulai koleksi baru untuk thread ini (panggil di awal tiap script run)."""
+    st = _state()
+    st["enabled"] = _DEFAULT_ENABLED if enabled is None else bool(enabled)
+    st["records"] = []
+    st["stack"] = []
+
+
+def is_enabled() -> bool:
+    return _state()["enabled"]
+
+
+class _NoopStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoopStage()
+
+
+class _Stage:
+    __slots__ = ("name", "meta", "st", "t_wall", "t_cpu", "rss0", "peak", "maxrss0", "depth")
+
+    def __init__(self, name: str, meta: Dict, st: Dict):
+        self.name, self.meta, self.st = name, meta, st
+
+    def __enter__(self):
+        stack = self.st["stack"]
+        self.depth = len(stack)
+        self.rss0 = self.peak = _rss_kb()
+        self.maxrss0 = _maxrss_kb()
+        if _RSS_SAMPLABLE:
+            _track(self)
+        stack.append(self)
+        self.t_cpu = time.thread_time()
+        self.t_wall = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self.t_wall
+        cpu = time.thread_time() - self.t_cpu
+        stack = self.st["stack"]
+        if stack and stack[-1] is self:
+            stack.pop()
+        rss_end = _rss_kb()
+        if _RSS_SAMPLABLE:
+            _untrack(self)
+            peak_abs = max(self.peak, rss_end)
+            peak_delta = max(peak_abs - self.rss0, 0)
+        else:
+            peak_delta = max(_maxrss_kb() - self.maxrss0, 0)
+            peak_abs = _maxrss_kb()
+        hwm = _hwm_kb()
+        rec = {"stage": self.name, "depth": self.depth, "wall_s": wall, "cpu_s": cpu,
+               "peak_rss_delta_mb": peak_delta / 1024, "peak_rss_mb": peak_abs / 1024, "rss_end_mb": rss_end / 1024,
+               "process_peak_rss_mb": None if hwm is None else hwm / 1024,
+               "ok": exc_type is None, "ts": time.time(), **self.meta}
+        self.st["records"].append(rec)
+        _LOG.info(json.dumps(rec, default=str))
+        return False
+
+
+def stage(name: str, **meta):
+    """Context manager pengukur satu tahap; no-op bersama saat profiling nonaktif."""
+    st = _state()
+    if not st["enabled"]:
+        return _NOOP
+    return _Stage(name, meta, st)
+
+
+def timed(name: Optional[str] = None):
+    """Decorator: ukur tiap panggilan fungsi sebagai satu tahap."""
+    def deco(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            st = getattr(_tls, "state", None)
+            if st is None or not st["enabled"]:
+                return fn(*args, **kwargs)
+            with _Stage(label, {}, st):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+def records() -> List[Dict]:
+    return list(_state()["records"])
+
+
+def records_frame() -> pd.DataFrame:
+    """Record thread ini sebagai tabel, urut waktu selesai; nama tahap diindentasi sesuai kedalaman."""
+    recs = records()
+    if not recs:
+        return pd.DataFrame(columns=["tahap", "wall_s", "cpu_s", "peak_rss_delta_mb", "rss_end_mb"])
+    df = pd.DataFrame(recs)
+    df["tahap"] = ["  " * d + s for d, s in zip(df["depth"], df["stage"])]
+    return df[["tahap", "wall_s", "cpu_s", "peak_rss_delta_mb", "rss_end_mb"]]
+
+
+def summary_frame() -> pd.DataFrame:
+    """Agregasi per nama tahap (jumlah panggilan, total wall/CPU, puncak RSS terbesar)."""
+    recs = records()
+    if not recs:
+        return pd.DataFrame(columns=["stage", "calls", "wall_s", "cpu_s", "peak_rss_delta_mb"])
+    df = pd.DataFrame(recs)
+    return (df.groupby("stage", sort=False)
+              .agg(calls=("wall_s", "size"), wall_s=("wall_s", "sum"), cpu_s=("cpu_s", "sum"),
+                   peak_rss_delta_mb=("peak_rss_delta_mb", "max"))
+              .reset_index().sort_values("wall_s", ascending=False))
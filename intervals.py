@@ -0,0 +1,166 @@
+# intervals.py — Interval prediksi dari output per-pohon (RandomForest / ExtraTrees)
+#
+# Semua output pohon diambil dalam satu pass: forest.apply(X) → indeks leaf (n_baris × n_pohon),
+# lalu dibaca dari satu array nilai leaf gabungan. Tidak ada loop Python per baris/per estimator.
+import time, weakref
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+LOWER_COL = "Prediksi_Bawah"
+UPPER_COL = "Prediksi_Atas"
+STD_COL = "Prediksi_Std"
+
+# (nilai leaf gabungan, offset node per pohon) per objek forest
+_LEAF_TABLES: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def split_forest(model) -> Optional[Tuple[object, object]]:
+    """(preprocessor, forest) jika estimator akhir punya pohon regresi sklearn; selain itu None."""
+    est = model.steps[-1][1] if hasattr(model, "steps") else model
+    trees = getattr(est, "estimators_", None)
+    if trees is None or not hasattr(est, "apply") or not all(hasattr(t, "tree_") for t in trees[:1]):
+        return None
+    if getattr(est, "n_outputs_", 1) != 1:
+        return None
+    pre = model[:-1] if hasattr(model, "steps") and len(model.steps) > 1 else None
+    return pre, est
+
+
+def supports_intervals(model) -> bool:
+    return split_forest(model) is not None
+
+
+def leaf_value_table(forest) -> Tuple[np.ndarray, np.ndarray]:
+    tbl = _LEAF_TABLES.get(forest)
+    if tbl is None:
+        values = [t.tree_.value.reshape(-1) for t in forest.estimators_]
+        offsets = np.cumsum([0] + [len(v) for v in values[:-1]]).astype(np.int64)
+        tbl = (np.concatenate(values), offsets)
+        _LEAF_TABLES[forest] = tbl
+    return tbl
+
+
+def tree_predictions(model, X: pd.DataFrame) -> Optional[np.ndarray]:
+    """Output semua pohon untuk X → array (n_baris, n_pohon); None jika model bukan forest."""
+    parts = split_forest(model)
+    if parts is None:
+        return None
+    pre, forest = parts
+    Xt = pre.transform(X) if pre is not None else X
+    leaves = forest.apply(Xt)
+    values, offsets = leaf_value_table(forest)
+    return values[leaves + offsets]
+
+
+def _raw_bounds(per_tree: np.ndarray, level: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    a = (1.0 - level) / 2.0
+    lo, med, hi = np.quantile(per_tree, [a, 0.5, 1.0 - a], axis=1)
+    return lo, med, hi
+
+
+def interval_bounds(per_tree: np.ndarray, level: float = 0.8,
+                    calibration: Optional[Dict] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batas bawah/atas interval `level`. Tanpa kalibrasi = kuantil antar pohon.
+    Dengan kalibrasi, lebar sisi bawah/atas terhadap median dikali faktor hasil `calibrate_intervals`.
+    """
+    lo, med, hi = _raw_bounds(per_tree, level)
+    scale = ((calibration or {}).get("levels", {}).get(f"{level:.2f}", {}) or {}).get("scale")
+    if scale is None:
+        return lo, hi
+    return med - scale * (med - lo), med + scale * (hi - med)
+
+
+def interval_frame(per_tree: np.ndarray, level: float = 0.8, calibration: Optional[Dict] = None) -> pd.DataFrame:
+    lo, hi = interval_bounds(per_tree, level, calibration)
+    return pd.DataFrame({LOWER_COL: lo, UPPER_COL: hi, STD_COL: per_tree.std(axis=1)})
+
+
+def _conformal_scale(score: np.ndarray, level: float) -> float:
+    n = len(score)
+    if n == 0:
+        return 1.0
+    return float(np.quantile(score, min(1.0, np.ceil((n + 1) * level) / n)))
+
+
+def calibrate_intervals(per_tree: np.ndarray, y_true, levels: Iterable[float] = (0.8, 0.9),
+                        random_state: int = 0) -> Dict:
+    """
+    Cek coverage interval kuantil-pohon di data test dan hitung faktor skala (split-conformal)
+    agar coverage ≈ level nominal. Hasil disimpan di config bundle sebagai `interval_calibration`.
+    `coverage_calibrated` diukur silang (skala dari separuh test, dicek di separuh lain) agar tidak bias.
+    """
+    y = np.asarray(y_true, dtype=float)
+    n = len(y)
+    halves = np.array_split(np.random.default_rng(random_state).permutation(n), 2)
+    out = {"n_test": int(n), "n_trees": int(per_tree.shape[1]), "levels": {}}
+    for level in levels:
+        lo, med, hi = _raw_bounds(per_tree, level)
+        err = y - med
+        score = np.abs(err) / np.maximum(np.where(err > 0, hi - med, med - lo), 1e-9)
+        scale = _conformal_scale(score, level)
+        covered = np.zeros(n, dtype=bool)
+        for a, b in ((halves[0], halves[1]), (halves[1], halves[0])):
+            covered[b] = score[b] <= _conformal_scale(score[a], level)
+        out["levels"][f"{level:.2f}"] = {
+            "coverage_raw": float(np.mean(score <= 1.0)) if n else float("nan"),
+            "scale": scale,
+            "coverage_calibrated": float(np.mean(covered)) if n else float("nan"),
+            "median_width_raw": float(np.median(hi - lo)) if n else float("nan"),
+            "median_width_calibrated": float(np.median(scale * (hi - lo))) if n else float("nan"),
+        }
+    return out
+
+
+def calibration_frame(calibration: Optional[Dict]) -> pd.DataFrame:
+    """Ringkasan kalibrasi untuk ditampilkan (satu baris per level)."""
+    rows = [{"level": float(k), **v} for k, v in ((calibration or {}).get("levels") or {}).items()]
+    return pd.DataFrame(rows)
+
+
+def progressive_tree_predictions(model, X: pd.DataFrame, chunk_trees: int = 32, rel_tol: float = 0.01,
+                                 z: float = 2.0, min_trees: int = 64, deadline_s: Optional[float] = None):
+    """
+    Evaluasi pohon per potongan (anytime). Tiap potongan menghasilkan dict:
+    n_trees, n_total, mean, std, rel_sem, per_tree (output pohon sejauh ini), done,
+    reason ("semua_pohon" | "konvergen" | "deadline").
+    rel_sem = perkiraan selisih relatif rerata sementara terhadap rerata seluruh ensemble
+    (galat standar dengan koreksi populasi hingga, maks antar baris).
+    Berhenti saat z·rel_sem ≤ rel_tol (setelah ≥ min_trees pohon) atau deadline; rel_tol=0 → semua pohon.
+    """
+    parts = split_forest(model)
+    if parts is None:
+        raise ValueError("Model bukan forest pohon sklearn; prediksi progresif tidak tersedia.")
+    t0 = time.perf_counter()
+    pre, forest = parts
+    Xt = forest._validate_X_predict(pre.transform(X) if pre is not None else X)
+    trees = forest.estimators_
+    n_total = len(trees)
+    per_tree = np.empty((Xt.shape[0], n_total), dtype=float)
+    done_n = 0
+    while done_n < n_total:
+        stop = min(done_n + chunk_trees, n_total)
+        for j in range(done_n, stop):
+            tree = trees[j].tree_
+            per_tree[:, j] = tree.value.reshape(-1)[tree.apply(Xt)]
+        done_n = stop
+        cur = per_tree[:, :done_n]
+        mean = cur.mean(axis=1)
+        std = cur.std(axis=1)
+        fpc = np.sqrt((n_total - done_n) / max(n_total - 1, 1))
+        rel_sem = float(np.max(std / np.sqrt(done_n) * fpc / np.maximum(np.abs(mean), 1e-9)))
+        if done_n >= n_total:
+            reason = "semua_pohon"
+        elif done_n >= min_trees and z * rel_sem <= rel_tol:
+            reason = "konvergen"
+        elif deadline_s is not None and time.perf_counter() - t0 >= deadline_s:
+            reason = "deadline"
+        else:
+            reason = None
+        yield {"n_trees": done_n, "n_total": n_total, "mean": mean, "std": std, "rel_sem": rel_sem,
+               "per_tree": cur, "done": reason is not None, "reason": reason,
+               "elapsed_s": time.perf_counter() - t0}
+        if reason is not None:
+            return
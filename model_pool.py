@@ -0,0 +1,114 @@
+# model_pool.py — Pool model per proses (dibagi antar sesi) dengan batas memori + eviksi LRU
+import hashlib, threading, time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Ukuran struct Node pohon sklearn (left/right/feature/threshold/impurity/n_samples/weighted/missing_go_to_left)
+_SKLEARN_NODE_BYTES = 64
+
+
+def content_key(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _iter_components(obj, _depth: int = 0):
+    if obj is None or _depth > 6:
+        return
+    yield obj
+    children = []
+    if hasattr(obj, "steps"):
+        children += [s for _, s in obj.steps]
+    if hasattr(obj, "transformers_"):
+        children += [t for _, t, _ in obj.transformers_]
+    if hasattr(obj, "estimators_"):
+        children += list(np.ravel(np.asarray(obj.estimators_, dtype=object)))
+    for c in children:
+        if not isinstance(c, str):
+            yield from _iter_components(c, _depth + 1)
+
+
+def estimate_model_bytes(model, fallback: int = 0) -> int:
+    """Perkiraan memori model: array node pohon sklearn + nilai leaf; selain itu pakai `fallback` (ukuran file)."""
+    total = 0
+    for comp in _iter_components(model):
+        tree = getattr(comp, "tree_", None)
+        if tree is not None and hasattr(tree, "capacity"):
+            total += int(tree.capacity) * _SKLEARN_NODE_BYTES + int(tree.value.nbytes)
+    return total if total > 0 else int(fallback)
+
+
+class _Entry:
+    __slots__ = ("model", "nbytes", "label", "loaded_at", "last_used", "hits")
+
+    def __init__(self, model, nbytes: int, label: str):
+        self.model = model
+        self.nbytes = nbytes
+        self.label = label
+        self.loaded_at = self.last_used = time.time()
+        self.hits = 0
+
+
+class ModelPool:
+    """
+    Model di-key dengan hash isi file, jadi upload identik dari beberapa analis memakai satu salinan.
+    Jika total memori melewati `budget_mb`, model yang paling lama tidak dipakai dikeluarkan.
+    """
+    def __init__(self, budget_mb: float = 2048):
+        self.budget_bytes = int(budget_mb * 1e6)
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(e.nbytes for e in self._entries.values())
+
+    def get(self, key: Optional[str]):
+        if not key:
+            return None
+        with self._lock:
+            e = self._entries.get(key)
+            if e is None:
+                return None
+            self._entries.move_to_end(key)
+            e.last_used = time.time(); e.hits += 1
+            return e.model
+
+    def load_bytes(self, data: bytes, loader: Callable[[bytes], object], label: str = "") -> Tuple[str, object]:
+        """Ambil model dari pool (berdasarkan hash) atau muat dengan `loader(data)` lalu simpan."""
+        key = content_key(data)
+        model = self.get(key)
+        if model is not None:
+            return key, model
+        model = loader(data)
+        if model is None:
+            raise ValueError("File tidak berisi model dengan method predict().")
+        nbytes = estimate_model_bytes(model, fallback=len(data))
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = _Entry(model, nbytes, label)
+            self._entries.move_to_end(key)
+            self._evict_locked(keep=key)
+            return key, self._entries[key].model
+
+    def _evict_locked(self, keep: str):
+        total = sum(e.nbytes for e in self._entries.values())
+        for k in list(self._entries):
+            if total <= self.budget_bytes:
+                break
+            if k == keep:
+                continue
+            total -= self._entries.pop(k).nbytes
+            self.evictions += 1
+
+    def footprint(self) -> pd.DataFrame:
+        """Ringkasan memori per model (urut dari yang paling baru dipakai)."""
+        with self._lock:
+            rows = [{"key": k[:12], "file": e.label, "memori_mb": round(e.nbytes / 1e6, 1), "hits": e.hits,
+                     "terakhir_dipakai": pd.Timestamp(e.last_used, unit="s").strftime("%H:%M:%S")}
+                    for k, e in reversed(self._entries.items())]
+        return pd.DataFrame(rows, columns=["key", "file", "memori_mb", "hits", "terakhir_dipakai"])
@@ -0,0 +1,329 @@
+# out_of_core.py — Training out-of-core: data lebih besar dari RAM dialirkan per potongan dari disk
+# (fungsi murni, tanpa Streamlit; dipakai train_cli.py dan mode "Out-of-core" di app.py)
+#
+# Alur (memori ≈ satu potongan + sampel fit + dataset ter-binning LightGBM, bukan seluruh DataFrame):
+#   1. pass 1  : baca per potongan → prepare_xy → sampel acak seragam (kunci acak terkecil) untuk fit
+#                imputer/One-Hot/token alamat + hitungan frekuensi penuh (FrequencyEncoder.partial_fit)
+#   2. pass 2  : transform per potongan dengan preprocessor ter-fit (float32) → memmap .npy di disk;
+#                baris train ditulis dari depan, baris holdout dari belakang
+#   3. binning : lightgbm.Dataset dari Sequence atas memmap (batas bin dari sampel baris, data didorong
+#                per batch) → save_binary; memmap float32 dihapus
+#   4. train   : lightgbm.train (histogram) dari file biner → Pipeline [("prep", ...), ("reg", BoosterRegressor)]
+#                dengan format bundle yang sama seperti app.py (halaman Form Prediksi & score_cli bisa langsung memuat)
+import hashlib, json, shutil, tempfile, time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.pipeline import Pipeline
+
+from canonical import compile_canon_tables
+from comps import build_comps_index
+from custom_transformers import FrequencyEncoder
+from drift import build_sketches
+from instrumentation import stage
+from training_pipeline import LGBM_OK, build_preprocess, category_consolidation, fit_preprocess, prepare_xy
+
+STREAM_SUFFIXES = (".csv", ".csv.gz", ".parquet", ".pq")  # dicek via nama file (".gz" saja tidak cukup)
+OOC_DIR = Path("models/ooc")  # bundle hasil out-of-core; jadi default hanya lewat promote_bundle
+DEFAULT_PARAMS = {"n_estimators": 1000, "learning_rate": 0.05, "num_leaves": 64, "min_child_samples": 20,
+                  "subsample": 0.9, "colsample_bytree": 0.9, "reg_lambda": 1.0, "max_bin": 255}
+
+
+class BoosterRegressor(BaseEstimator, RegressorMixin):
+    """Pembungkus lightgbm.Booster (hasil lightgbm.train) sebagai langkah "reg" Pipeline sklearn."""
+    tree_lib = "lightgbm"  # explain.py: atribusi pohon via predict(pred_contrib=True)
+
+    def __init__(self, booster=None, params: Optional[Dict] = None, n_jobs: int = -1):
+        self.booster = booster
+        self.params = params
+        self.n_jobs = n_jobs
+
+    def fit(self, X, y):
+        """Latih dari array di memori (mis. pembaruan kecil); data besar lewat train_out_of_core."""
+        import lightgbm as lgb
+        params = dict(self.params or {})
+        rounds = int(params.pop("num_boost_round", DEFAULT_PARAMS["n_estimators"]))
+        self.booster = lgb.train(params, lgb.Dataset(X, label=np.asarray(y, dtype=float)), num_boost_round=rounds)
+        return self
+
+    def __sklearn_is_fitted__(self) -> bool:
+        return self.booster is not None
+
+    @property
+    def n_features_in_(self) -> int:
+        return int(self.booster.num_feature())
+
+    def predict(self, X, **kwargs):
+        return self.booster.predict(X, num_threads=max(int(self.n_jobs), 0), **kwargs)
+
+
+# ---------- baca per potongan ----------
+def is_stream_input(p: Path) -> bool:
+    return p.name.lower().endswith(STREAM_SUFFIXES)
+
+
+def list_stream_inputs(path) -> List[Path]:
+    """File, folder, atau pola glob (mis. data/listing_*.csv) → daftar file CSV/CSV.gz/Parquet."""
+    path = Path(path)
+    if path.is_dir() or any(ch in path.name for ch in "*?["):
+        found = path.iterdir() if path.is_dir() else path.parent.glob(path.name)
+        files = sorted(p for p in found if is_stream_input(p))
+    else:
+        files = [path]
+    bad = [p.name for p in files if not is_stream_input(p) or not p.is_file()]
+    if not files or bad:
+        raise ValueError(f"Input out-of-core harus CSV/CSV.gz/Parquet: {bad or str(path)}")
+    return files
+
+
+def inputs_hash(paths: List[Path]) -> str:
+    """Sidik file input (path, ukuran, mtime) untuk kunci run store; isi file besar tidak di-hash."""
+    meta = [(str(p.resolve()), p.stat().st_size, p.stat().st_mtime_ns) for p in paths]
+    return hashlib.sha256(json.dumps(meta).encode()).hexdigest()
+
+
+def iter_chunks(paths: List[Path], chunk_rows: int, columns: List[str]) -> Iterator[pd.DataFrame]:
+    """Potongan ≤ chunk_rows baris, hanya kolom yang dipakai; XLSX tidak bisa dialirkan → tidak didukung."""
+    for p in paths:
+        if p.name.lower().endswith((".parquet", ".pq")):
+            import pyarrow.parquet as pq
+            for batch in pq.ParquetFile(p).iter_batches(batch_size=chunk_rows, columns=columns):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(p, chunksize=chunk_rows, usecols=lambda c: c in columns)
+
+
+def _parse_chunk(chunk: pd.DataFrame, cfg: Dict, force_currency_cols: List[str]):
+    df, y = prepare_xy(chunk, cfg["target_col"], cfg["numeric_feats"], force_currency_cols, True)
+    # konversi otomatis (≥70%) bisa berbeda antar potongan → fitur numerik selalu dipaksa numerik
+    for c in cfg["numeric_feats"]:
+        if c in df.columns and not pd.api.types.is_numeric_dtype(df[c]):
+            df[c] = pd.to_numeric(df[c], errors="coerce")
+    return df[cfg["features_in"]], y
+
+
+def _memmap_sequence(arr, batch_size: int):
+    import lightgbm as lgb
+
+    class MemmapSequence(lgb.Sequence):
+        def __init__(self):
+            self.batch_size = batch_size
+
+        def __getitem__(self, idx):
+            return np.asarray(arr[idx], dtype=np.float64)  # LightGBM butuh double; dikonversi per batch
+
+        def __len__(self):
+            return len(arr)
+    return MemmapSequence()
+
+
+def _progress_callback(progress, rounds: int):
+    def callback(env):
+        progress("train", (env.iteration + 1) / rounds)
+    callback.order = 40
+    return callback
+
+
+def _booster_params(params: Dict, seed: int) -> Dict:
+    p = {**DEFAULT_PARAMS, **(params or {})}
+    return {"objective": "regression", "learning_rate": float(p["learning_rate"]), "num_leaves": int(p["num_leaves"]),
+            "min_data_in_leaf": int(p["min_child_samples"]), "bagging_fraction": float(p["subsample"]),
+            "bagging_freq": 1 if float(p["subsample"]) < 1 else 0, "feature_fraction": float(p["colsample_bytree"]),
+            "lambda_l2": float(p["reg_lambda"]), "max_bin": int(p["max_bin"]), "seed": int(seed), "verbose": -1}
+
+
+def _metrics(y_true, y_pred) -> Dict[str, float]:
+    return {"r2": float(r2_score(y_true, y_pred)), "mae": float(mean_absolute_error(y_true, y_pred)),
+            "rmse": float(np.sqrt(mean_squared_error(y_true, y_pred)))}
+
+
+# ---------- training ----------
+def train_out_of_core(paths: List[Path], cfg: Dict, params: Optional[Dict] = None, chunk_rows: int = 100_000,
+                      sample_rows: int = 200_000, holdout: float = 0.1, max_holdout_rows: int = 200_000,
+                      early_stopping_rounds: Optional[int] = 50, min_category_count: Optional[int] = 10,
+                      force_currency_cols: Optional[List[str]] = None, seed: int = 42, work_dir=None,
+                      keep_binary: Optional[Path] = None,
+                      on_progress: Optional[Callable[[str, float], None]] = None) -> Dict:
+    """
+    Latih LightGBM dari file yang dialirkan per potongan. on_progress(tahap, nilai): "pass1" → jumlah baris
+    terbaca, tahap lain → fraksi 0..1. `cfg` memakai kunci config bundle: target_col,
+    numeric_feats, onehot_feats, freq_feats, addr_feats, top_n_addr (features_in diturunkan bila tidak ada).
+    Kembalikan bundle {"pipeline", "config", "comps"} siap joblib.dump.
+    """
+    if not LGBM_OK:
+        raise RuntimeError("Mode out-of-core butuh paket lightgbm.")
+    import lightgbm as lgb
+
+    cfg = dict(cfg)
+    cfg["features_in"] = list(cfg.get("features_in") or dict.fromkeys(
+        list(cfg["numeric_feats"]) + list(cfg["onehot_feats"]) + list(cfg["freq_feats"]) + list(cfg["addr_feats"])))
+    features, target = cfg["features_in"], cfg["target_col"]
+    force_currency_cols = list(force_currency_cols or [])
+    progress = on_progress or (lambda step, frac: None)
+    rng = np.random.default_rng(seed)
+    timings: Dict[str, float] = {}
+
+    # 1) pass 1: sampel seragam + hitungan frekuensi penuh + jumlah baris valid
+    t0 = time.perf_counter()
+    freq_cols = list(dict.fromkeys(list(cfg["freq_feats"]) + list(cfg["addr_feats"])))
+    counters = {c: FrequencyEncoder(c) for c in freq_cols}
+    sample, n_rows, n_raw = None, 0, 0
+    with stage("ooc.pass1"):
+        for chunk in iter_chunks(paths, chunk_rows, [target] + features):
+            n_raw += len(chunk)
+            X, y = _parse_chunk(chunk, cfg, force_currency_cols)
+            n_rows += len(X)
+            for c, enc in counters.items():
+                enc.partial_fit(X[[c]])
+            part = X.assign(**{"__y": y.to_numpy(), "__u": rng.random(len(X))})
+            sample = part if sample is None else pd.concat([sample, part], ignore_index=True)
+            if len(sample) > sample_rows:
+                sample = sample.nsmallest(sample_rows, "__u").reset_index(drop=True)
+            progress("pass1", n_raw)
+    if not n_rows:
+        raise ValueError(f"Tidak ada baris dengan target `{target}` valid.")
+    y_sample = sample.pop("__y")
+    sample = sample.drop(columns="__u")
+    timings["pass1"] = time.perf_counter() - t0
+
+    # 2) fit preprocessor di sampel; peta frekuensi diganti hitungan data penuh
+    t0 = time.perf_counter()
+    with stage("ooc.fit_preprocess", rows=len(sample)):
+        preprocess = build_preprocess(cfg["numeric_feats"], cfg["onehot_feats"], cfg["freq_feats"], cfg["addr_feats"],
+                                      int(cfg.get("top_n_addr", 40)), "float32", min_category_count)
+        prep, Xt_sample = fit_preprocess(preprocess, sample, y_sample)
+        for _, trans, _ in prep.transformers_:
+            if isinstance(trans, FrequencyEncoder):
+                trans.freq_map_ = counters[trans.col_name].freq_map_
+    n_features = Xt_sample.shape[1]
+    del Xt_sample
+    timings["fit_preprocess"] = time.perf_counter() - t0
+
+    # 3) pass 2: transform per potongan → memmap float32 (train dari depan, holdout dari belakang)
+    t0 = time.perf_counter()
+    work = Path(tempfile.mkdtemp(prefix="tanah_ooc_", dir=work_dir))
+    try:
+        X_mm = np.lib.format.open_memmap(work / "X.npy", mode="w+", dtype=np.float32, shape=(n_rows, n_features))
+        y_mm = np.lib.format.open_memmap(work / "y.npy", mode="w+", dtype=np.float64, shape=(n_rows,))
+        cap_ho = min(int(max_holdout_rows), int(np.ceil(n_rows * float(holdout))))
+        n_tr = n_ho = done = 0
+        with stage("ooc.pass2", rows=n_rows):
+            for chunk in iter_chunks(paths, chunk_rows, [target] + features):
+                X, y = _parse_chunk(chunk, cfg, force_currency_cols)
+                Xt = prep.transform(X)
+                ho = rng.random(len(X)) < float(holdout)
+                ho &= np.cumsum(ho) <= cap_ho - n_ho
+                k_tr, k_ho = int((~ho).sum()), int(ho.sum())
+                X_mm[n_tr:n_tr + k_tr], y_mm[n_tr:n_tr + k_tr] = Xt[~ho], y.to_numpy()[~ho]
+                if k_ho:
+                    X_mm[n_rows - n_ho - k_ho:n_rows - n_ho], y_mm[n_rows - n_ho - k_ho:n_rows - n_ho] = Xt[ho], y.to_numpy()[ho]
+                n_tr, n_ho, done = n_tr + k_tr, n_ho + k_ho, done + len(X)
+                progress("pass2", done / n_rows)
+        X_mm.flush(); y_mm.flush()
+        timings["pass2"] = time.perf_counter() - t0
+
+        # 4) binning → dataset biner di disk
+        t0 = time.perf_counter()
+        lgb_params = _booster_params(params, seed)
+        bin_path = work / "train.bin"
+        # parameter yang memengaruhi binning/pre-filter fitur harus sama dengan lgb.train
+        ds_params = {"max_bin": lgb_params["max_bin"], "min_data_in_leaf": lgb_params["min_data_in_leaf"],
+                     "verbose": -1}
+        with stage("ooc.binning", rows=n_tr):
+            ds = lgb.Dataset([_memmap_sequence(X_mm[:n_tr], chunk_rows)], label=np.asarray(y_mm[:n_tr]),
+                             params=ds_params, free_raw_data=True)
+            ds.construct().save_binary(str(bin_path))
+            del ds
+        timings["binning"] = time.perf_counter() - t0
+        progress("binning", 1.0)
+
+        # 5) train histogram booster dari file biner (+ holdout untuk early stopping & metrik)
+        t0 = time.perf_counter()
+        rounds = int((params or {}).get("n_estimators", DEFAULT_PARAMS["n_estimators"]))
+        with stage("ooc.train", rounds=rounds):
+            train_ds = lgb.Dataset(str(bin_path), params=ds_params).construct()
+            valid_sets, callbacks = [], [_progress_callback(progress, rounds)]
+            X_ho, y_ho = X_mm[n_rows - n_ho:], np.asarray(y_mm[n_rows - n_ho:])
+            if n_ho:
+                valid_sets = [lgb.Dataset([_memmap_sequence(X_ho, chunk_rows)], label=y_ho, reference=train_ds,
+                                          params=ds_params)]
+                if early_stopping_rounds:
+                    callbacks.append(lgb.early_stopping(int(early_stopping_rounds), verbose=False))
+            booster = lgb.train(lgb_params, train_ds, num_boost_round=rounds, valid_sets=valid_sets,
+                                callbacks=callbacks)
+            if booster.best_iteration and booster.best_iteration < booster.current_iteration():
+                booster = lgb.Booster(model_str=booster.model_to_string(num_iteration=booster.best_iteration))
+            del train_ds
+        timings["train"] = time.perf_counter() - t0
+
+        metrics = {}
+        if n_ho:
+            with stage("ooc.evaluate", rows=n_ho):
+                pred = np.concatenate([booster.predict(X_ho[s:s + chunk_rows]) for s in range(0, n_ho, chunk_rows)])
+                metrics = _metrics(y_ho, pred)
+        if keep_binary is not None:
+            shutil.copy2(bin_path, keep_binary)
+        del X_mm, y_mm, X_ho
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    model = Pipeline([("prep", prep), ("reg", BoosterRegressor(booster, params={**lgb_params, "num_boost_round": rounds}))])
+    info = {"n_raw": n_raw, "n_rows": n_rows, "n_train": n_tr, "n_holdout": n_ho, "n_features": n_features,
+            "sample_rows": len(sample), "chunk_rows": int(chunk_rows), "rounds": int(booster.current_iteration()),
+            "metrics": metrics, "timings": timings, "files": [str(p) for p in paths]}
+    return _bundle(model, cfg, sample, y_sample, params, info)
+
+
+def _bundle(model, cfg: Dict, sample: pd.DataFrame, y_sample: pd.Series, params: Optional[Dict], info: Dict) -> Dict:
+    """Bundle dengan kunci config yang sama seperti app.py; comps & sketsa drift dari sampel."""
+    prep = model.named_steps["prep"]
+    onehot, freq = list(cfg["onehot_feats"]), list(cfg["freq_feats"])
+    ohe_cats_map = {}
+    if onehot:
+        ohe = prep.named_transformers_["catOneHot"].named_steps["ohe"]
+        ohe_cats_map = {c: [str(v) for v in list(cats)[:200]] for c, cats in zip(onehot, ohe.categories_)}
+    freq_top_map = {}
+    for _, trans, _ in prep.transformers_:
+        if isinstance(trans, FrequencyEncoder) and trans.col_name in freq:
+            freq_top_map[trans.col_name] = [str(v) for v in list(trans.freq_map_.index[:200])]
+    consolidation = category_consolidation(prep)
+    sample_cat = sample
+    if consolidation is not None:
+        consol = prep.named_transformers_["catOneHot"].named_steps["consol"]
+        sample_cat = sample.assign(**dict(consol.transform(sample[onehot]).items()))
+    features_in = cfg["features_in"]
+    with stage("build_comps_index"):
+        comps = build_comps_index(sample_cat, y_sample, cfg["numeric_feats"], onehot,
+                                  price_is_per_m2=bool(cfg.get("target_is_per_m2", False)))
+    with stage("build_drift_sketches"):
+        sketches = build_sketches(sample_cat, cfg["numeric_feats"], onehot + freq + list(cfg["addr_feats"]))
+    config = {
+        "target_col": cfg["target_col"],
+        "target_is_per_m2": bool(cfg.get("target_is_per_m2", False)),
+        "features_in": features_in,
+        "numeric_feats": list(cfg["numeric_feats"]),
+        "onehot_feats": onehot,
+        "freq_feats": freq,
+        "addr_feats": list(cfg["addr_feats"]),
+        "top_n_addr": int(cfg.get("top_n_addr", 40)),
+        "precision": "float32",
+        "ohe_categories": ohe_cats_map,
+        "freq_top_values": freq_top_map,
+        "canon_text_cols": [c for c in features_in if any(x in c.lower() for x in
+                            ["alamat", "provinsi", "kota", "kecamatan", "kelurahan", "kode_pos"])],
+        "force_numeric_cols": [c for c in features_in if c.lower() in ["luas", "jarak_cbd", "latitude", "longitude"]],
+        "canon_tables": compile_canon_tables(ohe_cats_map, synonyms=cfg.get("synonyms"),
+                                             consolidation=consolidation["mapping"] if consolidation else None),
+        "category_consolidation": consolidation,
+        "interval_calibration": None,
+        "drift_sketches": sketches,
+        "algo": "LightGBM",
+        "params": {**DEFAULT_PARAMS, **(params or {})},
+        "out_of_core": info,
+        "synonyms": dict(cfg.get("synonyms") or {}),
+    }
+    return {"pipeline": model, "config": config, "comps": comps}
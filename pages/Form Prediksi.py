@@ -1,6 +1,6 @@
-import io, os, sys, json, time
+import io, os, sys, json, time, uuid
+from importlib.util import find_spec
 from pathlib import Path
-from math import radians, sin, cos, asin, sqrt
 
 import numpy as np
 import pandas as pd
@@ -13,13 +13,8 @@ except Exception:
     JOBLIB_OK = False
     import pickle  # type: ignore
 
-# Optional plotting
-try:
-    import matplotlib.pyplot as plt
-    import seaborn as sns 
-    MPL_OK = True
-except Exception:
-    MPL_OK = False
+# Optional plotting — hanya dicek (find_spec); matplotlib di-import saat grafik benar-benar digambar
+MPL_OK = find_spec("matplotlib") is not None
 
 # ---------- PAGE CONFIG & CUSTOM CSS ----------
 st.set_page_config(
@@ -88,6 +83,28 @@ ROOT = THIS_FILE.parents[1] if THIS_FILE.parent.name == "pages" else THIS_FILE.p
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
 
+import inference
+from inference import (
+    DEFAULT_REQUIRED_COLS, PRED_COL, CBD_POINTS_JAKARTA,
+    pick_cbd_jakarta, clean_and_standardize_data, _coerce_to_predictor, predict_frame,
+)
+from canonical import tables_from_config, canonicalize_choices, report_frame
+from drift import sketches_from_config
+from explain import explain_numeric_local, explain_categorical_contrast, explain_frame
+from instrumentation import begin_run, records_frame, stage, summary_frame
+from export import FORMATS, available_formats, deferred_reader, discard_export, export_frames
+
+from model_pool import ModelPool
+from audit_log import get_audit_logger
+from whatif import whatif_axes, price_surface, plot_surface
+from heatmap_tiles import TileStore, list_tile_sets
+from intervals import (
+    LOWER_COL, UPPER_COL, STD_COL, interval_bounds, progressive_tree_predictions, supports_intervals, tree_predictions,
+)
+
+# Profiling per tahap (wall/CPU/puncak RSS); nonaktif = no-op
+begin_run(st.sidebar.toggle("⏱️ Profiling tahapan", value=os.environ.get("TANAH_PROFILE", "0") == "1"))
+
 def fmt_rp(x) -> str:
     try:
         if np.isnan(x): return "-"
@@ -95,27 +112,6 @@ def fmt_rp(x) -> str:
     except Exception:
         return str(x)
 
-def haversine_km(lat1, lon1, lat2, lon2):
-    R = 6371.0088
-    dlat = radians(lat2 - lat1)
-    dlon = radians(lon2 - lon1)
-    a = sin(dlat/2)**2 + cos(radians(lat1))*cos(radians(lat2))*sin(dlon/2)**2
-    return 2 * R * asin(sqrt(a))
-
-# ---------- CBD points (DKI) ----------
-CBD_POINTS_JAKARTA = [{'cbd': 'AEON Jakarta Garden City', 'lat': -6.155535, 'lon': 106.96006, 'radius_km': 3.96}, {'cbd': 'aeon jgc cakung', 'lat': -6.204614, 'lon': 106.959887, 'radius_km': 6.0}, {'cbd': 'AEON Mall', 'lat': -6.170278, 'lon': 106.95212, 'radius_km': 2.54}, {'cbd': 'Aeon Mall Jakarta Garden City', 'lat': -6.167722, 'lon': 106.963306, 'radius_km': 4.2}, {'cbd': 'Aeon Mall JGC', 'lat': -6.179085, 'lon': 106.955886, 'radius_km': 3.22}, {'cbd': 'AEON Mall Tanjung Barat', 'lat': -6.301133, 'lon': 106.839398, 'radius_km': 2.77}, {'cbd': 'AEON Mall Tj Barat', 'lat': -6.300507, 'lon': 106.828651, 'radius_km': 3.38}, {'cbd': 'AEON tanjung barat', 'lat': -6.312971, 'lon': 106.826237, 'radius_km': 6.0}, {'cbd': 'AEON TJ Barat', 'lat': -6.307096, 'lon': 106.835972, 'radius_km': 2.99}, {'cbd': 'amaris hotel senen', 'lat': -6.18226, 'lon': 106.84392, 'radius_km': 1.0}, {'cbd': 'Apartemen Puri Imperium', 'lat': -6.207227, 'lon': 106.830617, 'radius_km': 1.0}, {'cbd': 'Apartemen Puri Orchard', 'lat': -6.164583, 'lon': 106.727583, 'radius_km': 1.0}, {'cbd': 'Apartemen Puru Orchard', 'lat': -6.163698, 'lon': 106.727345, 'radius_km': 1.0}, {'cbd': 'Apartemen Somerset Berlian Jakarta', 'lat': -6.22318, 'lon': 106.781774, 'radius_km': 1.0}, {'cbd': 'Apartemen West Vista', 'lat': -6.161049, 'lon': 106.724582, 'radius_km': 1.0}, {'cbd': 'arandra residence', 'lat': -6.177716, 'lon': 106.871752, 'radius_km': 1.0}, {'cbd': 'Area Cibis Park', 'lat': -6.300319, 'lon': 106.831345, 'radius_km': 3.0}, {'cbd': 'Area ITC Fatmawati', 'lat': -6.262164, 'lon': 106.79698, 'radius_km': 1.0}, {'cbd': 'Ario Mall', 'lat': -6.190812, 'lon': 106.893276, 'radius_km': 0.75}, {'cbd': 'arion', 'lat': -6.206294, 'lon': 106.890322, 'radius_km': 2.0}, {'cbd': 'Arion Mall', 'lat': -6.195042, 'lon': 106.887893, 'radius_km': 1.78}, {'cbd': 'Arion XXI', 'lat': -6.204671, 'lon': 106.889993, 'radius_km': 2.0}, {'cbd': 'Astha District 8', 'lat': -6.234328, 'lon': 106.808193, 'radius_km': 1.25}, {'cbd': 'Atrium Mall Kelapa Gading', 'lat': -6.148829, 'lon': 106.9165, 'radius_km': 2.0}, {'cbd': 'Atrium Senen', 'lat': -6.180729, 'lon': 106.840162, 'radius_km': 4.15}, {'cbd': 'Bandara City Mall', 'lat': -6.10002, 'lon': 106.703973, 'radius_km': 4.35}, {'cbd': 'Bandara Halim Perdana Kusuma', 'lat': -6.32, 'lon': 106.85, 'radius_km': 6.0}, {'cbd': 'Bandara Internasional Halim Perdana Kusuma', 'lat': -6.274662, 'lon': 106.819054, 'radius_km': 6.0}, {'cbd': 'BANDARA SOEKARNO HAT', 'lat': -6.127875, 'lon': 106.743665, 'radius_km': 6.0}, {'cbd': 'bandara soetta', 'lat': -6.135114, 'lon': 106.671717, 'radius_km': 4.0}, {'cbd': 'BCA Sunter Danau', 'lat': -6.145612, 'lon': 106.859995, 'radius_km': 1.0}, {'cbd': 'beach city jakarta', 'lat': -6.121575, 'lon': 106.857104, 'radius_km': 1.8}, {'cbd': 'Becakayu', 'lat': -6.245729, 'lon': 106.911179, 'radius_km': 3.0}, {'cbd': 'Bekasi CBD', 'lat': -6.180074, 'lon': 106.898075, 'radius_km': 6.0}, {'cbd': 'Bella Terra Lifestyle Center', 'lat': -6.180109, 'lon': 106.898119, 'radius_km': 0.72}, {'cbd': 'Bellagio Boutique Mall', 'lat': -6.227887, 'lon': 106.821433, 'radius_km': 0.72}, {'cbd': 'Bintaro Plaza', 'lat': -6.271262, 'lon': 106.757087, 'radius_km': 2.37}, {'cbd': 'Bintaro Sektor 5A', 'lat': -6.258431, 'lon': 106.760174, 'radius_km': 3.82}, {'cbd': 'Bizpark Commercial Estate', 'lat': -6.182552, 'lon': 106.912274, 'radius_km': 2.1}, {'cbd': 'Blok M', 'lat': -6.246485, 'lon': 106.809906, 'radius_km': 2.47}, {'cbd': 'blok M plasa', 'lat': -6.252067, 'lon': 106.813366, 'radius_km': 4.02}, {'cbd': 'blok M square', 'lat': -6.247573, 'lon': 106.804717, 'radius_km': 2.8}, {'cbd': 'Buaran Plaza', 'lat': -6.23098, 'lon': 106.920222, 'radius_km': 2.98}, {'cbd': 'bundaran HI', 'lat': -6.191583, 'lon': 106.836444, 'radius_km': 2.5}, {'cbd': 'Business Park Kb. Jeruk', 'lat': -6.197434, 'lon': 106.765028, 'radius_km': 0.5}, {'cbd': 'Carrefour Cempaka Putih', 'lat': -6.172701, 'lon': 106.884405, 'radius_km': 0.95}, {'cbd': 'CBC CENGKARENG BUSSINESS CITY', 'lat': -6.098509, 'lon': 106.707115, 'radius_km': 2.0}, {'cbd': 'CBD Ciledug', 'lat': -6.219658, 'lon': 106.733437, 'radius_km': 2.8}, {'cbd': 'CBD Ciledug Family Mall', 'lat': -6.221412, 'lon': 106.724476, 'radius_km': 2.76}, {'cbd': 'CBD Mega Kuningan', 'lat': -6.220197, 'lon': 106.824413, 'radius_km': 2.26}, {'cbd': 'Central Cakung Business Park', 'lat': -6.128996, 'lon': 106.931999, 'radius_km': 3.0}, {'cbd': 'Central Park', 'lat': -6.177083, 'lon': 106.795419, 'radius_km': 1.42}, {'cbd': 'central park mall', 'lat': -6.192707, 'lon': 106.771435, 'radius_km': 5.57}, {'cbd': 'Cibis Tower', 'lat': -6.309737, 'lon': 106.810143, 'radius_km': 2.11}, {'cbd': 'Cibubur Juction', 'lat': -6.326576, 'lon': 106.886629, 'radius_km': 6.0}, {'cbd': 'cibubur junction', 'lat': -6.350262, 'lon': 106.893855, 'radius_km': 5.76}, {'cbd': 'Cibubur Plaza', 'lat': -6.383381, 'lon': 106.913653, 'radius_km': 1.1}, {'cbd': 'Cibubur Square', 'lat': -6.339977, 'lon': 106.8975, 'radius_km': 6.0}, {'cbd': 'Cijantung Mal', 'lat': -6.324665, 'lon': 106.858936, 'radius_km': 2.0}, {'cbd': 'Cijantung Mall', 'lat': -6.321245, 'lon': 106.877178, 'radius_km': 2.9}, {'cbd': 'Cilandak Mall', 'lat': -6.333381, 'lon': 106.807429, 'radius_km': 5.4}, {'cbd': 'Cilandak Town Square', 'lat': -6.288456, 'lon': 106.801712, 'radius_km': 4.22}, {'cbd': 'CILEDUG PLAZA', 'lat': -6.219268, 'lon': 106.721608, 'radius_km': 1.0}, {'cbd': 'Cinere Bellevue Mall', 'lat': -6.316469, 'lon': 106.780519, 'radius_km': 0.5}, {'cbd': 'cinere mall', 'lat': -6.349428, 'lon': 106.805495, 'radius_km': 5.39}, {'cbd': 'Cipadu Trade Center', 'lat': -6.235184, 'lon': 106.751341, 'radius_km': 4.08}, {'cbd': 'Cipinang Indah Mall', 'lat': -6.25168, 'lon': 106.93546, 'radius_km': 5.3}, {'cbd': 'Cipinang Muara', 'lat': -6.228348, 'lon': 106.885422, 'radius_km': 3.0}, {'cbd': 'ciplaz cengkareng', 'lat': -6.155291, 'lon': 106.7491, 'radius_km': 3.4}, {'cbd': 'Ciplaz Ciledug', 'lat': -6.222296, 'lon': 106.743375, 'radius_km': 2.0}, {'cbd': 'Ciplaz Klender', 'lat': -6.209139, 'lon': 106.904601, 'radius_km': 2.5}, {'cbd': 'Ciplaz Klender (RAMAYANA)', 'lat': -6.22705, 'lon': 106.897397, 'radius_km': 2.48}, {'cbd': 'Ciputra Mall', 'lat': -6.165195, 'lon': 106.783875, 'radius_km': 0.5}, {'cbd': 'Ciputra Superblok', 'lat': -6.163879, 'lon': 106.727679, 'radius_km': 1.1}, {'cbd': 'CIPUTRA WORLD', 'lat': -6.226395, 'lon': 106.821394, 'radius_km': 0.55}, {'cbd': 'CityPlaza Jatinegara', 'lat': -6.210424, 'lon': 106.858475, 'radius_km': 0.79}, {'cbd': 'Citywalk Sudirman', 'lat': -6.208188, 'lon': 106.820875, 'radius_km': 0.93}, {'cbd': 'Citywalk Sudirman Jakarta', 'lat': -6.206681, 'lon': 106.81674, 'radius_km': 1.0}, {'cbd': 'Daerah Kalibata City', 'lat': -6.244715, 'lon': 106.868662, 'radius_km': 3.0}, {'cbd': 'Depok town square', 'lat': -6.351017, 'lon': 106.812611, 'radius_km': 6.0}, {'cbd': 'DM Mall', 'lat': -6.14172, 'lon': 106.698366, 'radius_km': 2.0}, {'cbd': 'emporium mall', 'lat': -6.133069, 'lon': 106.761766, 'radius_km': 3.0}, {'cbd': 'Emporium Pluit Mall', 'lat': -6.12554, 'lon': 106.794196, 'radius_km': 3.0}, {'cbd': 'Epicentrum XXI', 'lat': -6.208114, 'lon': 106.831816, 'radius_km': 2.0}, {'cbd': 'farmers family', 'lat': -6.2296, 'lon': 106.94452, 'radius_km': 1.0}, {'cbd': 'Farmers Family Pondok kopi', 'lat': -6.225994, 'lon': 106.942682, 'radius_km': 0.5}, {'cbd': 'FK UI', 'lat': -6.196139, 'lon': 106.849417, 'radius_km': 1.0}, {'cbd': 'Gajah Mada Plaza', 'lat': -6.158164, 'lon': 106.817901, 'radius_km': 1.2}, {'cbd': 'GANDARIA CITY', 'lat': -6.25115, 'lon': 106.773544, 'radius_km': 3.6}, {'cbd': 'Gandaria City Mall', 'lat': -6.249924, 'lon': 106.778016, 'radius_km': 2.36}, {'cbd': 'Gelanggang remaja', 'lat': -6.339621, 'lon': 106.881062, 'radius_km': 3.0}, {'cbd': 'glodok china town market', 'lat': -6.144608, 'lon': 106.810502, 'radius_km': 1.0}, {'cbd': 'Glodok Chinatown Market', 'lat': -6.145326, 'lon': 106.80773, 'radius_km': 1.0}, {'cbd': 'Glodok Plaza', 'lat': -6.144628, 'lon': 106.81059, 'radius_km': 1.0}, {'cbd': 'Golden Trully Mall', 'lat': -6.153219, 'lon': 106.836122, 'radius_km': 1.0}, {'cbd': 'Golden Truly Mall', 'lat': -6.159027, 'lon': 106.838485, 'radius_km': 3.0}, {'cbd': 'grade mall koja', 'lat': -6.110053, 'lon': 106.88557, 'radius_km': 1.0}, {'cbd': 'Gramedia Matraman', 'lat': -6.201717, 'lon': 106.851394, 'radius_km': 1.0}, {'cbd': 'grand cakung', 'lat': -6.193017, 'lon': 106.953123, 'radius_km': 6.0}, {'cbd': 'Grand Indonesia', 'lat': -6.202103, 'lon': 106.808833, 'radius_km': 1.66}, {'cbd': 'Grand ITC Permata Hijau', 'lat': -6.214348, 'lon': 106.780243, 'radius_km': 3.1}, {'cbd': 'Grand Paragon Mall', 'lat': -6.15253, 'lon': 106.81967, 'radius_km': 1.0}, {'cbd': 'grand sedayu', 'lat': -6.131907, 'lon': 106.728697, 'radius_km': 1.0}, {'cbd': 'Grandlucky - Green lake city', 'lat': -6.183728, 'lon': 106.700572, 'radius_km': 1.5}, {'cbd': 'Green Garden', 'lat': -6.17551, 'lon': 106.76561, 'radius_km': 1.0}, {'cbd': 'Green Pramuka', 'lat': -6.192692, 'lon': 106.865728, 'radius_km': 3.0}, {'cbd': 'Green pramuka mall', 'lat': -6.194808, 'lon': 106.883896, 'radius_km': 2.0}, {'cbd': 'Green Pramuka Square', 'lat': -6.184958, 'lon': 106.867106, 'radius_km': 1.9}, {'cbd': 'Green Pramuka Square Mall', 'lat': -6.192152, 'lon': 106.864407, 'radius_km': 2.82}, {'cbd': 'Green Sedayu Biz Park Cakung', 'lat': -6.131331, 'lon': 106.955587, 'radius_km': 3.4}, {'cbd': 'green sedayu mall', 'lat': -6.128704, 'lon': 106.726527, 'radius_km': 2.0}, {'cbd': 'Green Sendayu Mall', 'lat': -6.131543, 'lon': 106.716293, 'radius_km': 4.51}, {'cbd': 'Green Terace TMII', 'lat': -6.307177, 'lon': 106.888486, 'radius_km': 0.5}, {'cbd': 'Halim Perdana Kusuma', 'lat': -6.192886, 'lon': 106.875369, 'radius_km': 1.0}, {'cbd': 'Harco Mangga 2', 'lat': -6.139077, 'lon': 106.826936, 'radius_km': 0.5}, {'cbd': 'Harco Mangga Dua', 'lat': -6.147519, 'lon': 106.83907, 'radius_km': 2.0}, {'cbd': 'Harco Pasar Besar', 'lat': -6.165951, 'lon': 106.8316, 'radius_km': 1.0}, {'cbd': 'hari-hari duta harapan indah', 'lat': -6.147278, 'lon': 106.771555, 'radius_km': 2.0}, {'cbd': 'Hero Alfa Indah', 'lat': -6.218559, 'lon': 106.725366, 'radius_km': 3.0}, {'cbd': 'Hero Supermarket Alfa Indah', 'lat': -6.218279, 'lon': 106.752211, 'radius_km': 0.5}, {'cbd': 'hipermart puri', 'lat': -6.184099, 'lon': 106.740145, 'radius_km': 1.0}, {'cbd': 'ITC Cempaka Mas', 'lat': -6.169556, 'lon': 106.867885, 'radius_km': 3.0}, {'cbd': 'ITC Cipulir', 'lat': -6.240922, 'lon': 106.756499, 'radius_km': 4.17}, {'cbd': 'ITC Cipulir Mas', 'lat': -6.242366, 'lon': 106.756615, 'radius_km': 3.34}, {'cbd': 'ITC Fatmawati', 'lat': -6.262645, 'lon': 106.79425, 'radius_km': 2.0}, {'cbd': 'ITC Mangga Dua', 'lat': -6.119622, 'lon': 106.822245, 'radius_km': 2.7}, {'cbd': 'ITC Permata Hijau', 'lat': -6.215713, 'lon': 106.775154, 'radius_km': 2.43}, {'cbd': 'ITC Roxy Mas', 'lat': -6.165868, 'lon': 106.8083, 'radius_km': 2.62}, {'cbd': 'Jakarta International Stadium', 'lat': -6.131411, 'lon': 106.861389, 'radius_km': 1.0}, {'cbd': 'Jalan Jenderal Sudirman', 'lat': -6.206349, 'lon': 106.815087, 'radius_km': 1.0}, {'cbd': 'Jalan Metro Pondok Indah', 'lat': -6.254919, 'lon': 106.78232, 'radius_km': 1.0}, {'cbd': 'Jalan Perjuangan', 'lat': -6.194606, 'lon': 106.769081, 'radius_km': 1.0}, {'cbd': 'Jatijajar', 'lat': -6.327378, 'lon': 106.86412, 'radius_km': 5.0}, {'cbd': 'JIEXPO', 'lat': -6.169133, 'lon': 106.848, 'radius_km': 6.0}, {'cbd': 'kalibata city', 'lat': -6.275191, 'lon': 106.82951, 'radius_km': 6.0}, {'cbd': 'Kalibata City Square', 'lat': -6.250291, 'lon': 106.840769, 'radius_km': 1.0}, {'cbd': 'Kalibata Mall', 'lat': -6.247303, 'lon': 106.841262, 'radius_km': 3.0}, {'cbd': 'Kantor Walikota Jakarta Barat', 'lat': -6.185019, 'lon': 106.733633, 'radius_km': 0.5}, {'cbd': 'Kawasan AEON MALL Tanjung Barat', 'lat': -6.303823, 'lon': 106.842488, 'radius_km': 1.0}, {'cbd': 'Kawasan AEON Tanjung Barat', 'lat': -6.307093, 'lon': 106.845476, 'radius_km': 1.0}, {'cbd': 'Kawasan AEON Tj Barat', 'lat': -6.307065, 'lon': 106.832935, 'radius_km': 3.3}, {'cbd': 'Kawasan Atrium', 'lat': -6.165469, 'lon': 106.848047, 'radius_km': 4.6}, {'cbd': 'Kawasan Beltway Office Park', 'lat': -6.278717, 'lon': 106.813002, 'radius_km': 2.0}, {'cbd': 'Kawasan Bintaro', 'lat': -6.272673, 'lon': 106.760062, 'radius_km': 2.87}, {'cbd': 'Kawasan Bintaro Jaya', 'lat': -6.248304, 'lon': 106.763183, 'radius_km': 4.37}, {'cbd': 'Kawasan Bintaro Sektor 3', 'lat': -6.26965, 'lon': 106.756482, 'radius_km': 2.44}, {'cbd': 'Kawasan Bintaro Sektor 3A', 'lat': -6.27314, 'lon': 106.761265, 'radius_km': 2.77}, {'cbd': 'Kawasan Blok M', 'lat': -6.248797, 'lon': 106.809222, 'radius_km': 3.36}, {'cbd': 'Kawasan Blok M Square', 'lat': -6.239353, 'lon': 106.811072, 'radius_km': 2.0}, {'cbd': 'Kawasan Centraland Cengkareng', 'lat': -6.154898, 'lon': 106.744377, 'radius_km': 3.0}, {'cbd': 'Kawasan Centraland Jakarta', 'lat': -6.155027, 'lon': 106.746193, 'radius_km': 3.0}, {'cbd': 'Kawasan Cibis Park', 'lat': -6.302718, 'lon': 106.82091, 'radius_km': 3.84}, {'cbd': 'Kawasan Cibis Tower', 'lat': -6.302589, 'lon': 106.826876, 'radius_km': 5.0}, {'cbd': 'Kawasan Cibis Tower CBD', 'lat': -6.3012, 'lon': 106.828778, 'radius_km': 1.99}, {'cbd': 'Kawasan Cikini', 'lat': -6.183892, 'lon': 106.843831, 'radius_km': 1.0}, {'cbd': 'Kawasan Cilandak Town Square', 'lat': -6.30075, 'lon': 106.802057, 'radius_km': 3.73}, {'cbd': 'Kawasan Cilandak Town Square (CITOS)', 'lat': -6.289888, 'lon': 106.801747, 'radius_km': 1.0}, {'cbd': 'Kawasan Ciplaz Ciledug', 'lat': -6.224683, 'lon': 106.743643, 'radius_km': 3.64}, {'cbd': 'Kawasan Citos', 'lat': -6.289025, 'lon': 106.812009, 'radius_km': 3.89}, {'cbd': 'Kawasan Depok Town Square', 'lat': -6.351017, 'lon': 106.81261, 'radius_km': 6.0}, {'cbd': 'Kawasan Dharmawangsa Square', 'lat': -6.254692, 'lon': 106.804545, 'radius_km': 1.0}, {'cbd': 'Kawasan Fatmawati', 'lat': -6.302071, 'lon': 106.797098, 'radius_km': 3.29}, {'cbd': 'Kawasan Gandaria City', 'lat': -6.245235, 'lon': 106.760165, 'radius_km': 6.0}, {'cbd': 'Kawasan Giant Ciledug', 'lat': -6.232607, 'lon': 106.753025, 'radius_km': 1.5}, {'cbd': 'Kawasan Gran ITC Permata Hijau', 'lat': -6.220462, 'lon': 106.785075, 'radius_km': 0.77}, {'cbd': 'Kawasan ITC Cipulir', 'lat': -6.240635, 'lon': 106.767745, 'radius_km': 1.67}, {'cbd': 'Kawasan ITC Fatmawati', 'lat': -6.274286, 'lon': 106.81085, 'radius_km': 3.7}, {'cbd': 'Kawasan ITC Mangga Dua', 'lat': -6.162066, 'lon': 106.843733, 'radius_km': 4.0}, {'cbd': 'Kawasan Jakarta Convention Center', 'lat': -6.208771, 'lon': 106.811779, 'radius_km': 2.0}, {'cbd': 'Kawasan Jakarta Design Center', 'lat': -6.198774, 'lon': 106.804992, 'radius_km': 1.9}, {'cbd': 'Kawasan Kalibata', 'lat': -6.25446, 'lon': 106.838741, 'radius_km': 1.56}, {'cbd': 'Kawasan Kalibata City', 'lat': -6.260906, 'lon': 106.834862, 'radius_km': 3.46}, {'cbd': 'Kawasan Klender', 'lat': -6.304714, 'lon': 106.872292, 'radius_km': 2.0}, {'cbd': 'Kawasan Kota Casablanca', 'lat': -6.241403, 'lon': 106.844874, 'radius_km': 2.67}, {'cbd': 'Kawasan Kota Kasablanka', 'lat': -6.238231, 'lon': 106.841909, 'radius_km': 5.68}, {'cbd': 'Kawasan Kuningan City', 'lat': -6.234312, 'lon': 106.855625, 'radius_km': 3.8}, {'cbd': 'Kawasan Lebak Bulus Grab', 'lat': -6.299983, 'lon': 106.776649, 'radius_km': 2.9}, {'cbd': 'Kawasan Lenteng Agung', 'lat': -6.347619, 'lon': 106.81251, 'radius_km': 4.6}, {'cbd': 'Kawasan Lippa Mall Kemang', 'lat': -6.266396, 'lon': 106.815858, 'radius_km': 1.85}, {'cbd': 'Kawasan Lippo Mall Kemang', 'lat': -6.26504, 'lon': 106.812141, 'radius_km': 3.26}, {'cbd': 'Kawasan LOTTE GROS Pasar Rebo', 'lat': -6.30272, 'lon': 106.853456, 'radius_km': 2.0}, {'cbd': 'Kawasan lotte mart fatmawati', 'lat': -6.280217, 'lon': 106.802635, 'radius_km': 1.0}, {'cbd': 'Kawasan Margocity', 'lat': -6.353262, 'lon': 106.815015, 'radius_km': 6.0}, {'cbd': 'Kawasan Mega Kuningan', 'lat': -6.238324, 'lon': 106.822885, 'radius_km': 2.18}, {'cbd': 'Kawasan Pasar Besar Lenteng Agung', 'lat': -6.338845, 'lon': 106.82236, 'radius_km': 3.0}, {'cbd': 'Kawasan Pasar Cijantung', 'lat': -6.306246, 'lon': 106.854921, 'radius_km': 1.02}, {'cbd': 'Kawasan Pasar Grosir Cililitan', 'lat': -6.274333, 'lon': 106.877336, 'radius_km': 3.0}, {'cbd': 'Kawasan Pasar Lenteng Agung', 'lat': -6.340341, 'lon': 106.813336, 'radius_km': 4.14}, {'cbd': 'Kawasan pasar rebo cijantung', 'lat': -6.297496, 'lon': 106.848001, 'radius_km': 2.85}, {'cbd': 'kawasan Pejanten Village Mall Plaza', 'lat': -6.278734, 'lon': 106.825857, 'radius_km': 0.67}, {'cbd': 'Kawasan Pejaten Raya', 'lat': -6.285179, 'lon': 106.826179, 'radius_km': 1.0}, {'cbd': 'Kawasan Pejaten Village', 'lat': -6.276617, 'lon': 106.82466, 'radius_km': 1.0}, {'cbd': 'Kawasan Pelabuhan Tanjung Priok', 'lat': -6.1056, 'lon': 106.93039, 'radius_km': 1.0}, {'cbd': 'Kawasan Pondok Indah', 'lat': -6.275578, 'lon': 106.788773, 'radius_km': 3.94}, {'cbd': 'Kawasan Pondok Indah Mall', 'lat': -6.257876, 'lon': 106.760929, 'radius_km': 5.7}, {'cbd': 'Kawasan Pondok Kelapa Town Square', 'lat': -6.244345, 'lon': 106.939851, 'radius_km': 2.01}, {'cbd': 'Kawasan pondon indah jakarta', 'lat': -6.284155, 'lon': 106.789099, 'radius_km': 3.0}, {'cbd': 'Kawasan Radio Dalam Square', 'lat': -6.261137, 'lon': 106.787759, 'radius_km': 1.0}, {'cbd': 'Kawasan Ramayanan Kebayoran Lama', 'lat': -6.236094, 'lon': 106.758309, 'radius_km': 5.0}, {'cbd': 'Kawasan RS Dr Suyoto', 'lat': -6.279872, 'lon': 106.76252, 'radius_km': 1.9}, {'cbd': 'Kawasan RS Siloam Asri', 'lat': -6.267996, 'lon': 106.831089, 'radius_km': 2.0}, {'cbd': 'Kawasan Senayan', 'lat': -6.226015, 'lon': 106.78625, 'radius_km': 3.47}, {'cbd': 'Kawasan Senayan City', 'lat': -6.229409, 'lon': 106.808494, 'radius_km': 2.34}, {'cbd': 'Kawasan Senayan GBK', 'lat': -6.229011, 'lon': 106.790314, 'radius_km': 1.0}, {'cbd': 'Kawasan Simpang Jl TB Simatupang', 'lat': -6.287761, 'lon': 106.803631, 'radius_km': 2.0}, {'cbd': 'Kawasan Simpang Lenteng Agung', 'lat': -6.309627, 'lon': 106.828376, 'radius_km': 2.0}, {'cbd': 'Kawasan Sudirman Hill Residence', 'lat': -6.20925, 'lon': 106.807236, 'radius_km': 1.0}, {'cbd': 'Kawasan Tamansari Hive', 'lat': -6.236812, 'lon': 106.875126, 'radius_km': 0.92}, {'cbd': 'Kawasan TB Simatupang', 'lat': -6.291796, 'lon': 106.811375, 'radius_km': 1.0}, {'cbd': 'Kawasan The Dharmawangsa Square', 'lat': -6.257319, 'lon': 106.804825, 'radius_km': 1.0}, {'cbd': 'Kawasan The Hive DI Panjaitan', 'lat': -6.240778, 'lon': 106.874806, 'radius_km': 0.5}, {'cbd': 'Kawasan Transmart Cilandak', 'lat': -6.31305, 'lon': 106.816071, 'radius_km': 2.0}, {'cbd': 'Kawasan Universitas 17 Agustus', 'lat': -6.140196, 'lon': 106.861414, 'radius_km': 2.0}, {'cbd': 'Kawasan Universitas Negeri Jakarta', 'lat': -6.192162, 'lon': 106.866951, 'radius_km': 2.0}, {'cbd': 'KawasanCitos (Cilandak Town Square)', 'lat': -6.295542, 'lon': 106.793039, 'radius_km': 2.0}, {'cbd': 'Kawsan Pondok Indah', 'lat': -6.294781, 'lon': 106.79998, 'radius_km': 2.97}, {'cbd': 'KBN Cakung', 'lat': -6.14758, 'lon': 106.9526, 'radius_km': 2.0}, {'cbd': 'KBN Marunda', 'lat': -6.10994, 'lon': 106.95543, 'radius_km': 1.0}, {'cbd': 'Kedoya Green Garden', 'lat': -6.161675, 'lon': 106.763142, 'radius_km': 1.0}, {'cbd': 'KELAPA GADING TRADE CENTRE', 'lat': -6.159642, 'lon': 106.882236, 'radius_km': 1.0}, {'cbd': 'Kemang Square', 'lat': -6.269263, 'lon': 106.830736, 'radius_km': 3.6}, {'cbd': 'Kemang Village', 'lat': -6.252092, 'lon': 106.816662, 'radius_km': 2.0}, {'cbd': 'Kencana Tower', 'lat': -6.199317, 'lon': 106.761749, 'radius_km': 0.5}, {'cbd': 'Koja Trade Mall', 'lat': -6.115577, 'lon': 106.926684, 'radius_km': 2.8}, {'cbd': 'Kota Casablanca', 'lat': -6.230105, 'lon': 106.844151, 'radius_km': 0.8}, {'cbd': 'Kota Casablanka', 'lat': -6.213087, 'lon': 106.845427, 'radius_km': 1.1}, {'cbd': 'Kota Kasablanka', 'lat': -6.221248, 'lon': 106.849259, 'radius_km': 3.0}, {'cbd': 'Kota Tua', 'lat': -6.134582, 'lon': 106.809896, 'radius_km': 0.5}, {'cbd': 'Kuningan', 'lat': -6.202955, 'lon': 106.840577, 'radius_km': 2.7}, {'cbd': 'Kuningan City', 'lat': -6.243926, 'lon': 106.826932, 'radius_km': 2.9}, {'cbd': 'La Piazza', 'lat': -6.166412, 'lon': 106.91711, 'radius_km': 1.0}, {'cbd': 'Landmark Pluit', 'lat': -6.124625, 'lon': 106.797942, 'radius_km': 0.7}, {'cbd': 'Lippo Mal Puri', 'lat': -6.207456, 'lon': 106.746253, 'radius_km': 2.0}, {'cbd': 'Lippo Mall Kemang', 'lat': -6.258306, 'lon': 106.815165, 'radius_km': 4.1}, {'cbd': 'Lippo mall nusantara', 'lat': -6.21524, 'lon': 106.813645, 'radius_km': 1.5}, {'cbd': 'Lippo Mall Puri', 'lat': -6.183482, 'lon': 106.742975, 'radius_km': 3.0}, {'cbd': 'lippo mall puri indah', 'lat': -6.197809, 'lon': 106.738524, 'radius_km': 2.27}, {'cbd': 'Lippo Plaza Kramat Jati', 'lat': -6.279883, 'lon': 106.87091, 'radius_km': 2.14}, {'cbd': 'Lippo Puri Indah Mall', 'lat': -6.200238, 'lon': 106.731339, 'radius_km': 1.0}, {'cbd': 'Lippo Puri Mall', 'lat': -6.187382, 'lon': 106.759041, 'radius_km': 2.87}, {'cbd': 'Lokasari Square', 'lat': -6.148485, 'lon': 106.826415, 'radius_km': 0.57}, {'cbd': 'Lotte Grosir Kelapa Gading', 'lat': -6.156248, 'lon': 106.896635, 'radius_km': 1.03}, {'cbd': 'Lotte Grosir Meruya', 'lat': -6.198439, 'lon': 106.733312, 'radius_km': 0.97}, {'cbd': 'lotte grosir pasar rebo', 'lat': -6.308252, 'lon': 106.867685, 'radius_km': 0.5}, {'cbd': 'Lotte Mall Jakarta', 'lat': -6.221532, 'lon': 106.82369, 'radius_km': 0.95}, {'cbd': 'Lotte Mart Fatmawati', 'lat': -6.279212, 'lon': 106.796861, 'radius_km': 1.0}, {'cbd': 'Lotte Mart Taman Surya', 'lat': -6.127257, 'lon': 106.705359, 'radius_km': 2.64}, {'cbd': 'Lotte Meruya', 'lat': -6.211804, 'lon': 106.729976, 'radius_km': 2.0}, {'cbd': 'LTC Glodok', 'lat': -6.149929, 'lon': 106.812754, 'radius_km': 0.61}, {'cbd': 'LTC Glodok Hayam Wuruk', 'lat': -6.148223, 'lon': 106.811214, 'radius_km': 1.0}, {'cbd': 'Lulu Hypermart', 'lat': -6.195163, 'lon': 106.950218, 'radius_km': 2.2}, {'cbd': 'M Blok Space', 'lat': -6.251746, 'lon': 106.79233, 'radius_km': 2.0}, {'cbd': 'Mal Atrium Senen', 'lat': -6.176978, 'lon': 106.840445, 'radius_km': 0.5}, {'cbd': 'Mal Cijantung', 'lat': -6.326734, 'lon': 106.864431, 'radius_km': 2.8}, {'cbd': 'Mal Ciputra Jakarta', 'lat': -6.16548, 'lon': 106.791383, 'radius_km': 1.0}, {'cbd': 'Mal Kota Kasablanka', 'lat': -6.241789, 'lon': 106.84633, 'radius_km': 2.0}, {'cbd': 'Mall AEON tanjung barat', 'lat': -6.310416, 'lon': 106.827063, 'radius_km': 5.38}, {'cbd': 'Mall Ambassador', 'lat': -6.223184, 'lon': 106.82704, 'radius_km': 0.5}, {'cbd': 'Mall Arta Gading', 'lat': -6.12916, 'lon': 106.893413, 'radius_km': 2.0}, {'cbd': 'Mall Artha Gading', 'lat': -6.148491, 'lon': 106.885668, 'radius_km': 3.26}, {'cbd': 'mall atha gading', 'lat': -6.122351, 'lon': 106.875968, 'radius_km': 2.0}, {'cbd': 'mall atrium', 'lat': -6.1775, 'lon': 106.84016, 'radius_km': 1.0}, {'cbd': 'Mall Atrium Senen', 'lat': -6.176427, 'lon': 106.841206, 'radius_km': 1.0}, {'cbd': 'Mall Bassura', 'lat': -6.228434, 'lon': 106.874402, 'radius_km': 4.0}, {'cbd': 'Mall Basura', 'lat': -6.227639, 'lon': 106.874417, 'radius_km': 2.54}, {'cbd': 'Mall Bella Tera', 'lat': -6.17371, 'lon': 106.89994, 'radius_km': 1.0}, {'cbd': 'Mall Bellagio Boutique', 'lat': -6.229913, 'lon': 106.824555, 'radius_km': 1.0}, {'cbd': 'mall central park', 'lat': -6.17885, 'lon': 106.77356, 'radius_km': 2.0}, {'cbd': 'Mall Cijantung', 'lat': -6.313224, 'lon': 106.873327, 'radius_km': 4.38}, {'cbd': 'MALL CINERE', 'lat': -6.348248, 'lon': 106.795114, 'radius_km': 3.8}, {'cbd': 'Mall Cipinang Indah', 'lat': -6.239047, 'lon': 106.908, 'radius_km': 5.0}, {'cbd': 'Mall Ciputra', 'lat': -6.16218, 'lon': 106.775883, 'radius_km': 3.0}, {'cbd': 'mall ciputra (citraland)', 'lat': -6.155659, 'lon': 106.752878, 'radius_km': 2.0}, {'cbd': 'Mall Ciputra Jakarta', 'lat': -6.164528, 'lon': 106.784057, 'radius_km': 0.5}, {'cbd': 'Mall Daan Mogot', 'lat': -6.155731, 'lon': 106.712015, 'radius_km': 3.0}, {'cbd': 'mall daan mogot cengkareng', 'lat': -6.158052, 'lon': 106.708884, 'radius_km': 3.0}, {'cbd': 'Mall Gajah Mada', 'lat': -6.169509, 'lon': 106.814343, 'radius_km': 5.0}, {'cbd': 'Mall Gandaria City', 'lat': -6.248009, 'lon': 106.778605, 'radius_km': 6.0}, {'cbd': 'Mall Graha Cijantung', 'lat': -6.314517, 'lon': 106.875444, 'radius_km': 2.7}, {'cbd': 'Mall Grand Cakung', 'lat': -6.184866, 'lon': 106.951161, 'radius_km': 2.4}, {'cbd': 'mall green terrace TMII', 'lat': -6.310046, 'lon': 106.887541, 'radius_km': 1.0}, {'cbd': 'Mall ITC Roxy Mas', 'lat': -6.1667, 'lon': 106.81227, 'radius_km': 1.0}, {'cbd': 'Mall Kelapa Gading', 'lat': -6.1594, 'lon': 106.91424, 'radius_km': 2.44}, {'cbd': 'Mall Kelapa Hading', 'lat': -6.15226, 'lon': 106.91543, 'radius_km': 1.0}, {'cbd': 'Mall Koja', 'lat': -6.114254, 'lon': 106.899016, 'radius_km': 2.6}, {'cbd': 'Mall Matahari Daan Mogot', 'lat': -6.134308, 'lon': 106.70003, 'radius_km': 2.68}, {'cbd': 'mall metro cipulir', 'lat': -6.22542, 'lon': 106.74643, 'radius_km': 3.0}, {'cbd': 'Mall Neo Soho', 'lat': -6.170339, 'lon': 106.787644, 'radius_km': 1.0}, {'cbd': 'Mall Of Indonesia', 'lat': -6.15074, 'lon': 106.89477, 'radius_km': 1.02}, {'cbd': 'Mall PIK Avenue', 'lat': -6.10473, 'lon': 106.74893, 'radius_km': 1.0}, {'cbd': 'mall plaza semanggj', 'lat': -6.238735, 'lon': 106.829068, 'radius_km': 4.0}, {'cbd': 'mall pondok indah', 'lat': -6.276064, 'lon': 106.781927, 'radius_km': 2.24}, {'cbd': 'Mall Pondok Kelapa Town Square', 'lat': -6.229374, 'lon': 106.935242, 'radius_km': 1.2}, {'cbd': 'MALL PURI', 'lat': -6.188052, 'lon': 106.73285, 'radius_km': 1.0}, {'cbd': 'mall puri indah', 'lat': -6.187185, 'lon': 106.7348, 'radius_km': 4.0}, {'cbd': 'Mall Slipi Jaya', 'lat': -6.189181, 'lon': 106.787289, 'radius_km': 1.0}, {'cbd': 'Mall Sunter', 'lat': -6.137531, 'lon': 106.867654, 'radius_km': 2.0}, {'cbd': 'mall taman anggrek', 'lat': -6.187103, 'lon': 106.782936, 'radius_km': 2.97}, {'cbd': 'MALL TAMAN ANGREK', 'lat': -6.185005, 'lon': 106.782869, 'radius_km': 1.0}, {'cbd': 'Mall Taman Palem', 'lat': -6.135776, 'lon': 106.746323, 'radius_km': 3.1}, {'cbd': 'Mampang Business Park', 'lat': -6.255905, 'lon': 106.828336, 'radius_km': 1.3}, {'cbd': 'Mangga 2 Square', 'lat': -6.147427, 'lon': 106.838613, 'radius_km': 2.26}, {'cbd': 'MANGGA DUA', 'lat': -6.147558, 'lon': 106.839105, 'radius_km': 1.7}, {'cbd': 'mangga dua mall', 'lat': -6.129718, 'lon': 106.82488, 'radius_km': 1.84}, {'cbd': 'Mangga dua square', 'lat': -6.145244, 'lon': 106.836233, 'radius_km': 4.24}, {'cbd': 'Manhattan', 'lat': -6.068837, 'lon': 106.701717, 'radius_km': 1.0}, {'cbd': 'Margo City', 'lat': -6.35452, 'lon': 106.807364, 'radius_km': 3.65}, {'cbd': 'margo city mall', 'lat': -6.338918, 'lon': 106.836627, 'radius_km': 4.0}, {'cbd': 'Marunda Center', 'lat': -6.113037, 'lon': 106.969979, 'radius_km': 2.4}, {'cbd': 'Marunda Centre', 'lat': -6.10578, 'lon': 106.96264, 'radius_km': 2.0}, {'cbd': 'Matahari Mall Daan Mogot Baru', 'lat': -6.142997, 'lon': 106.708245, 'radius_km': 2.9}, {'cbd': 'Mega Kuningan', 'lat': -6.230202, 'lon': 106.824224, 'radius_km': 2.98}, {'cbd': 'Mega Kuningan City', 'lat': -6.247716, 'lon': 106.829785, 'radius_km': 3.25}, {'cbd': 'Menteng Huis', 'lat': -6.189904, 'lon': 106.838798, 'radius_km': 4.0}, {'cbd': 'Metro Atom Plaza', 'lat': -6.160338, 'lon': 106.82338, 'radius_km': 1.5}, {'cbd': 'Metro Kebayoran', 'lat': -6.241663, 'lon': 106.764935, 'radius_km': 1.0}, {'cbd': 'metro sunter plaza', 'lat': -6.133174, 'lon': 106.870432, 'radius_km': 1.0}, {'cbd': 'Metropole XXI Cikini', 'lat': -6.204044, 'lon': 106.841397, 'radius_km': 1.49}, {'cbd': 'MGK Mall Kemayoran', 'lat': -6.157843, 'lon': 106.841843, 'radius_km': 1.16}, {'cbd': 'MOI', 'lat': -6.149911, 'lon': 106.873746, 'radius_km': 6.0}, {'cbd': 'MOI KELAPA GADING', 'lat': -6.151441, 'lon': 106.883343, 'radius_km': 3.8}, {'cbd': 'Naga Swalayan', 'lat': -6.207539, 'lon': 106.97778, 'radius_km': 1.6}, {'cbd': 'Office Park TB Simatupang', 'lat': -6.325219, 'lon': 106.82588, 'radius_km': 4.0}, {'cbd': 'one bell park', 'lat': -6.307854, 'lon': 106.793934, 'radius_km': 0.5}, {'cbd': 'one bellpark mall', 'lat': -6.307376, 'lon': 106.799157, 'radius_km': 1.82}, {'cbd': 'One Belpark', 'lat': -6.306884, 'lon': 106.796036, 'radius_km': 0.5}, {'cbd': 'One Belpark Mall', 'lat': -6.308583, 'lon': 106.795635, 'radius_km': 0.98}, {'cbd': 'Orion Sports Center', 'lat': -6.136253, 'lon': 106.805818, 'radius_km': 1.0}, {'cbd': 'pacific place', 'lat': -6.23907, 'lon': 106.82893, 'radius_km': 3.0}, {'cbd': 'Pacific Place Mall', 'lat': -6.239311, 'lon': 106.824244, 'radius_km': 2.99}, {'cbd': 'Pantai Ancol', 'lat': -6.12205, 'lon': 106.85601, 'radius_km': 1.0}, {'cbd': 'Pantai Qncol', 'lat': -6.12289, 'lon': 106.8579, 'radius_km': 1.0}, {'cbd': 'PASAR ANYAR BAHARI', 'lat': -6.121245, 'lon': 106.876561, 'radius_km': 1.0}, {'cbd': 'Pasar Baru', 'lat': -6.164923, 'lon': 106.832702, 'radius_km': 1.0}, {'cbd': 'Pasar Benhil', 'lat': -6.206733, 'lon': 106.805958, 'radius_km': 2.0}, {'cbd': 'Pasar Besar Lenteng Agung', 'lat': -6.325782, 'lon': 106.823958, 'radius_km': 1.46}, {'cbd': 'Pasar Cempaka Putih', 'lat': -6.177083, 'lon': 106.8685, 'radius_km': 3.0}, {'cbd': 'Pasar Cengkareeng', 'lat': -6.147511, 'lon': 106.728711, 'radius_km': 0.5}, {'cbd': 'Pasar Cengkareng', 'lat': -6.164415, 'lon': 106.728223, 'radius_km': 1.4}, {'cbd': 'Pasar Cibubur', 'lat': -6.349578, 'lon': 106.867551, 'radius_km': 1.3}, {'cbd': 'Pasar Cikini', 'lat': -6.202301, 'lon': 106.841986, 'radius_km': 1.0}, {'cbd': 'Pasar Cipinang Muara', 'lat': -6.226653, 'lon': 106.885887, 'radius_km': 1.8}, {'cbd': 'Pasar Dadap', 'lat': -6.09581, 'lon': 106.7184, 'radius_km': 1.0}, {'cbd': 'Pasar Gaplok', 'lat': -6.182225, 'lon': 106.843866, 'radius_km': 0.6}, {'cbd': 'Pasar Gembrong Baru', 'lat': -6.179333, 'lon': 106.858806, 'radius_km': 0.5}, {'cbd': 'pasar gembrong lama', 'lat': -6.17724, 'lon': 106.855365, 'radius_km': 1.0}, {'cbd': 'PASAR IKAN LUAR BATANG', 'lat': -6.127925, 'lon': 106.819109, 'radius_km': 1.82}, {'cbd': 'Pasar induk Kramat Jati', 'lat': -6.287067, 'lon': 106.864735, 'radius_km': 3.72}, {'cbd': 'Pasar Induk Kramatjati', 'lat': -6.29034, 'lon': 106.860208, 'radius_km': 2.5}, {'cbd': 'Pasar Jasa Mulya', 'lat': -6.209342, 'lon': 106.940152, 'radius_km': 0.5}, {'cbd': 'Pasar Jaya Cawang Kavling', 'lat': -6.243679, 'lon': 106.872651, 'radius_km': 1.0}, {'cbd': 'Pasar Jaya Cengkareng', 'lat': -6.14767, 'lon': 106.72891, 'radius_km': 0.5}, {'cbd': 'Pasar Jaya Cibubur', 'lat': -6.349018, 'lon': 106.874265, 'radius_km': 1.75}, {'cbd': 'Pasar Jaya Ciracas', 'lat': -6.337097, 'lon': 106.857167, 'radius_km': 1.88}, {'cbd': 'Pasar Jaya Enjo', 'lat': -6.205465, 'lon': 106.873482, 'radius_km': 1.03}, {'cbd': 'Pasar Jaya Pesanggrahan', 'lat': -6.256391, 'lon': 106.756397, 'radius_km': 0.55}, {'cbd': 'Pasar Kamal', 'lat': -6.09823, 'lon': 106.714424, 'radius_km': 1.0}, {'cbd': 'Pasar Kedoya', 'lat': -6.166817, 'lon': 106.773285, 'radius_km': 1.4}, {'cbd': 'Pasar Kemayoran', 'lat': -6.169218, 'lon': 106.854898, 'radius_km': 2.8}, {'cbd': 'Pasar Kenari Lama', 'lat': -6.190393, 'lon': 106.843752, 'radius_km': 0.75}, {'cbd': 'Pasar Kenari Mas', 'lat': -6.18553, 'lon': 106.858211, 'radius_km': 1.7}, {'cbd': 'Pasar Koja Baru', 'lat': -6.118065, 'lon': 106.915211, 'radius_km': 1.0}, {'cbd': 'Pasar Kombongan', 'lat': -6.156581, 'lon': 106.841261, 'radius_km': 1.18}, {'cbd': 'Pasar Kopro', 'lat': -6.175631, 'lon': 106.782122, 'radius_km': 1.0}, {'cbd': 'Pasar Kwitang Dalam', 'lat': -6.183374, 'lon': 106.840656, 'radius_km': 0.5}, {'cbd': 'Pasar Lenteng Agung', 'lat': -6.32146, 'lon': 106.826735, 'radius_km': 1.83}, {'cbd': 'PASAR LONTAR', 'lat': -6.113074, 'lon': 106.905897, 'radius_km': 1.0}, {'cbd': 'Pasar Maja Rawabadak', 'lat': -6.120403, 'lon': 106.904665, 'radius_km': 1.0}, {'cbd': 'Pasar Malaka', 'lat': -6.13198, 'lon': 106.95528, 'radius_km': 1.0}, {'cbd': 'pasar Mampang Prapatan', 'lat': -6.2477, 'lon': 106.826943, 'radius_km': 1.0}, {'cbd': 'pasar mandiri kelapa gading', 'lat': -6.162527, 'lon': 106.908332, 'radius_km': 1.0}, {'cbd': 'Pasar Mede', 'lat': -6.279246, 'lon': 106.79702, 'radius_km': 0.8}, {'cbd': 'Pasar Meruya Ilir', 'lat': -6.214311, 'lon': 106.739434, 'radius_km': 3.5}, {'cbd': 'Pasar Muara Angke', 'lat': -6.11125, 'lon': 106.762466, 'radius_km': 1.17}, {'cbd': 'Pasar Munjul', 'lat': -6.35619, 'lon': 106.894271, 'radius_km': 0.95}, {'cbd': 'Pasar Nangka Bungur', 'lat': -6.170563, 'lon': 106.851629, 'radius_km': 1.0}, {'cbd': 'PASAR OKAN LUAR BATANG', 'lat': -6.127249, 'lon': 106.813436, 'radius_km': 1.0}, {'cbd': 'Pasar Pagi Kayu Putih', 'lat': -6.181265, 'lon': 106.893508, 'radius_km': 1.8}, {'cbd': 'Pasar Palmerah', 'lat': -6.207368, 'lon': 106.790753, 'radius_km': 0.93}, {'cbd': 'Pasar Paseban', 'lat': -6.192715, 'lon': 106.8587, 'radius_km': 2.0}, {'cbd': 'Pasar Patra', 'lat': -6.179729, 'lon': 106.772446, 'radius_km': 1.3}, {'cbd': 'PASAR PELITA', 'lat': -6.127979, 'lon': 106.891733, 'radius_km': 1.0}, {'cbd': 'Pasar Perumnas Klender', 'lat': -6.221568, 'lon': 106.929001, 'radius_km': 1.0}, {'cbd': 'Pasar Poncol', 'lat': -6.174817, 'lon': 106.846941, 'radius_km': 0.5}, {'cbd': 'Pasar Pondok Bambu', 'lat': -6.234665, 'lon': 106.913135, 'radius_km': 2.29}, {'cbd': 'Pasar Pondok Gede', 'lat': -6.299373, 'lon': 106.909467, 'radius_km': 3.12}, {'cbd': 'Pasar Pramuka', 'lat': -6.197462, 'lon': 106.860058, 'radius_km': 0.96}, {'cbd': 'Pasar Pulo Jahe', 'lat': -6.198655, 'lon': 106.929976, 'radius_km': 0.83}, {'cbd': 'Pasar Pulogadung', 'lat': -6.190516, 'lon': 106.901216, 'radius_km': 1.8}, {'cbd': 'Pasar Puri Indah', 'lat': -6.186385, 'lon': 106.755859, 'radius_km': 1.49}, {'cbd': 'Pasar Rakyat Kosambi Baru', 'lat': -6.174219, 'lon': 106.699443, 'radius_km': 3.0}, {'cbd': 'PASAR RAWA BADAK', 'lat': -6.112276, 'lon': 106.891068, 'radius_km': 1.0}, {'cbd': 'pasar rawasari', 'lat': -6.18257, 'lon': 106.871812, 'radius_km': 1.0}, {'cbd': 'Pasar Raya Manggarai', 'lat': -6.20215, 'lon': 106.8528, 'radius_km': 2.0}, {'cbd': 'Pasar Rumput', 'lat': -6.203419, 'lon': 106.841752, 'radius_km': 1.18}, {'cbd': 'Pasar Senen', 'lat': -6.16814, 'lon': 106.846056, 'radius_km': 2.88}, {'cbd': 'Pasar Senen Jaya', 'lat': -6.17151, 'lon': 106.844209, 'radius_km': 2.8}, {'cbd': 'PASAR SERDANG', 'lat': -6.149508, 'lon': 106.873845, 'radius_km': 1.0}, {'cbd': 'Pasar Suka Pura', 'lat': -6.14127, 'lon': 106.921511, 'radius_km': 1.0}, {'cbd': 'Pasar Sukapura', 'lat': -6.141372, 'lon': 106.921779, 'radius_km': 2.0}, {'cbd': 'Pasar Sumur Batu', 'lat': -6.16, 'lon': 106.870409, 'radius_km': 1.1}, {'cbd': 'PASAR SUNTER PODOMORO', 'lat': -6.142747, 'lon': 106.862353, 'radius_km': 1.0}, {'cbd': 'Pasar Tanah Abang', 'lat': -6.177717, 'lon': 106.816727, 'radius_km': 2.6}, {'cbd': 'Pasar Tanah Abang Blok A', 'lat': -6.186942, 'lon': 106.818277, 'radius_km': 1.1}, {'cbd': 'Pasar Timbul', 'lat': -6.338987, 'lon': 106.806162, 'radius_km': 2.24}, {'cbd': 'Pasar Tubun', 'lat': -6.202445, 'lon': 106.896401, 'radius_km': 0.8}, {'cbd': 'PASAR TUGU KRAMAT JAYA', 'lat': -6.129876, 'lon': 106.910083, 'radius_km': 1.0}, {'cbd': 'Pasar Ular', 'lat': -6.12986, 'lon': 106.893358, 'radius_km': 0.92}, {'cbd': 'Pasar Uler', 'lat': -6.12743, 'lon': 106.88898, 'radius_km': 1.0}, {'cbd': 'Pasaraya Blok M', 'lat': -6.246434, 'lon': 106.804877, 'radius_km': 1.0}, {'cbd': 'Pasaraya Manggarai', 'lat': -6.203191, 'lon': 106.843015, 'radius_km': 0.8}, {'cbd': 'pasific place mall', 'lat': -6.241325, 'lon': 106.818512, 'radius_km': 3.4}, {'cbd': 'Pejanten Mall dan Plaza', 'lat': -6.267594, 'lon': 106.829376, 'radius_km': 1.77}, {'cbd': 'Pejaten Mal dan Plaza', 'lat': -6.286338, 'lon': 106.834469, 'radius_km': 1.95}, {'cbd': 'Pejaten Mall & Plaza', 'lat': -6.270361, 'lon': 106.812355, 'radius_km': 3.39}, {'cbd': 'pejaten park', 'lat': -6.28868, 'lon': 106.839308, 'radius_km': 1.8}, {'cbd': 'Pejaten Village', 'lat': -6.269545, 'lon': 106.830718, 'radius_km': 2.44}, {'cbd': 'pejaten village mall', 'lat': -6.269015, 'lon': 106.830057, 'radius_km': 2.04}, {'cbd': 'Pertokoan Pasar Baru', 'lat': -6.163929, 'lon': 106.833893, 'radius_km': 1.0}, {'cbd': 'PGC', 'lat': -6.287065, 'lon': 106.85701, 'radius_km': 4.4}, {'cbd': 'PGC Cililitan', 'lat': -6.262635, 'lon': 106.857309, 'radius_km': 3.28}, {'cbd': 'PIK Avenue', 'lat': -6.116981, 'lon': 106.745669, 'radius_km': 3.08}, {'cbd': 'PIK Mall Avenue', 'lat': -6.118749, 'lon': 106.747566, 'radius_km': 1.0}, {'cbd': 'PIM', 'lat': -6.249612, 'lon': 106.777845, 'radius_km': 2.0}, {'cbd': 'PIM 1', 'lat': -6.2301, 'lon': 106.785144, 'radius_km': 4.67}, {'cbd': 'plasa cibubur', 'lat': -6.342041, 'lon': 106.902764, 'radius_km': 6.0}, {'cbd': 'plasa senayan', 'lat': -6.237824, 'lon': 106.795299, 'radius_km': 2.9}, {'cbd': 'Plaza Atrium', 'lat': -6.173577, 'lon': 106.842381, 'radius_km': 2.2}, {'cbd': 'PLAZA BINTARO', 'lat': -6.270004, 'lon': 106.758748, 'radius_km': 2.36}, {'cbd': 'Plaza Bintaro Satoe', 'lat': -6.263187, 'lon': 106.758693, 'radius_km': 1.0}, {'cbd': 'PLAZA BLOK M', 'lat': -6.253068, 'lon': 106.794815, 'radius_km': 1.46}, {'cbd': 'Plaza Festival Mall Kuningan', 'lat': -6.214657, 'lon': 106.833406, 'radius_km': 1.9}, {'cbd': 'plaza indonesia', 'lat': -6.187329, 'lon': 106.835571, 'radius_km': 3.5}, {'cbd': 'Plaza Kenari Mas', 'lat': -6.190795, 'lon': 106.850901, 'radius_km': 1.75}, {'cbd': 'Plaza Kuningan', 'lat': -6.223933, 'lon': 106.832873, 'radius_km': 3.53}, {'cbd': 'plaza pondok gede', 'lat': -6.295293, 'lon': 106.908888, 'radius_km': 2.0}, {'cbd': 'Plaza PP', 'lat': -6.302481, 'lon': 106.854854, 'radius_km': 3.0}, {'cbd': 'Plaza Senayan', 'lat': -6.209731, 'lon': 106.770651, 'radius_km': 4.78}, {'cbd': 'Plaza Slipi', 'lat': -6.192773, 'lon': 106.788891, 'radius_km': 3.2}, {'cbd': 'Plaza slipi jaya', 'lat': -6.189299, 'lon': 106.787841, 'radius_km': 1.06}, {'cbd': 'Pluit Junction Mall', 'lat': -6.125013, 'lon': 106.792533, 'radius_km': 0.5}, {'cbd': 'Pluit village', 'lat': -6.113021, 'lon': 106.788521, 'radius_km': 1.8}, {'cbd': 'Pluit Village Mall', 'lat': -6.097963, 'lon': 106.792962, 'radius_km': 2.07}, {'cbd': 'poin square', 'lat': -6.291414, 'lon': 106.770407, 'radius_km': 3.28}, {'cbd': 'POINS MALL', 'lat': -6.300369, 'lon': 106.774845, 'radius_km': 2.52}, {'cbd': 'poins square', 'lat': -6.295169, 'lon': 106.77164, 'radius_km': 3.0}, {'cbd': 'Point Square', 'lat': -6.292735, 'lon': 106.779927, 'radius_km': 3.75}, {'cbd': 'Pondok Gede Plaza', 'lat': -6.292257, 'lon': 106.909526, 'radius_km': 2.0}, {'cbd': 'Pondok Indah', 'lat': -6.267213, 'lon': 106.787859, 'radius_km': 3.59}, {'cbd': 'Pondok Indah CBD', 'lat': -6.274951, 'lon': 106.769936, 'radius_km': 3.0}, {'cbd': 'pondok indah mall', 'lat': -6.272458, 'lon': 106.774844, 'radius_km': 3.68}, {'cbd': 'pondok indah mall 1', 'lat': -6.259125, 'lon': 106.778765, 'radius_km': 2.95}, {'cbd': 'pondok indah mall 2', 'lat': -6.26781, 'lon': 106.782826, 'radius_km': 0.5}, {'cbd': 'Pondok Indah Mall 3', 'lat': -6.268977, 'lon': 106.771865, 'radius_km': 1.6}, {'cbd': 'Pondok Kelapa Town Square', 'lat': -6.238667, 'lon': 106.922951, 'radius_km': 4.0}, {'cbd': 'PRJ Kemayoran', 'lat': -6.141391, 'lon': 106.856014, 'radius_km': 1.9}, {'cbd': 'PTC Pulo Gadung', 'lat': -6.190168, 'lon': 106.919339, 'radius_km': 3.67}, {'cbd': 'Pulogadung Trade Center', 'lat': -6.187467, 'lon': 106.922371, 'radius_km': 1.9}, {'cbd': 'Pulogadung Trade Centre', 'lat': -6.18014, 'lon': 106.91375, 'radius_km': 1.0}, {'cbd': 'Puri Indah Mall', 'lat': -6.206533, 'lon': 106.729851, 'radius_km': 3.5}, {'cbd': 'Pusat Grosir Metro Cipulir', 'lat': -6.232642, 'lon': 106.760738, 'radius_km': 1.0}, {'cbd': 'Pusat Grosir Perniagaan Pasar jaya', 'lat': -6.14465, 'lon': 106.81057, 'radius_km': 0.5}, {'cbd': 'Ramayana Cengkareng', 'lat': -6.154873, 'lon': 106.744565, 'radius_km': 1.8}, {'cbd': 'ramayana pasar cengkareng', 'lat': -6.147716, 'lon': 106.728864, 'radius_km': 1.0}, {'cbd': 'Ramayana Pasar Kebayoran Lama', 'lat': -6.229836, 'lon': 106.779469, 'radius_km': 1.0}, {'cbd': 'Ramayana Pasar Kopro', 'lat': -6.176462, 'lon': 106.780209, 'radius_km': 1.0}, {'cbd': 'Ramayana Pondok Gede', 'lat': -6.298523, 'lon': 106.906058, 'radius_km': 3.3}, {'cbd': 'Ramayana PTC Pulogadung', 'lat': -6.177342, 'lon': 106.914985, 'radius_km': 2.0}, {'cbd': 'Ramayana Semper', 'lat': -6.129586, 'lon': 106.91925, 'radius_km': 2.6}, {'cbd': 'Ramayana Semper Koja', 'lat': -6.128297, 'lon': 106.920763, 'radius_km': 0.5}, {'cbd': 'Ranch Market', 'lat': -6.188949, 'lon': 106.756526, 'radius_km': 1.0}, {'cbd': 'ratu plaza', 'lat': -6.227278, 'lon': 106.802363, 'radius_km': 0.5}, {'cbd': 'Rawamangun Square', 'lat': -6.199237, 'lon': 106.886674, 'radius_km': 1.59}, {'cbd': 'Rindam Jaya', 'lat': -6.294647, 'lon': 106.855881, 'radius_km': 3.0}, {'cbd': 'Roxy Square', 'lat': -6.173127, 'lon': 106.801053, 'radius_km': 0.95}, {'cbd': 'Ruko Bandengan Megah', 'lat': -6.134158, 'lon': 106.795521, 'radius_km': 0.5}, {'cbd': 'Ruko Green Garden', 'lat': -6.174949, 'lon': 106.758754, 'radius_km': 2.4}, {'cbd': 'ruko puri botanical', 'lat': -6.21957, 'lon': 106.733449, 'radius_km': 2.35}, {'cbd': 'RUKO PURI BOTANIKA', 'lat': -6.217703, 'lon': 106.744179, 'radius_km': 1.0}, {'cbd': 'Ruko Puri Delta Mas', 'lat': -6.139025, 'lon': 106.799173, 'radius_km': 1.0}, {'cbd': 'Rumah Sakit Harum Sisma Medika', 'lat': -6.242072, 'lon': 106.920964, 'radius_km': 2.92}, {'cbd': 'Rumah Sakit Islam Jakarta Sukapura', 'lat': -6.139376, 'lon': 106.917586, 'radius_km': 1.0}, {'cbd': 'Rumah Sakit St. Carolus', 'lat': -6.195638, 'lon': 106.853529, 'radius_km': 1.0}, {'cbd': 'Sarinah', 'lat': -6.185824, 'lon': 106.825132, 'radius_km': 2.8}, {'cbd': 'Sarinah Mall', 'lat': -6.187235, 'lon': 106.825124, 'radius_km': 0.78}, {'cbd': 'SCBD', 'lat': -6.194694, 'lon': 106.88382, 'radius_km': 6.0}, {'cbd': 'Season City', 'lat': -6.159534, 'lon': 106.791878, 'radius_km': 0.8}, {'cbd': 'Seasons City', 'lat': -6.147959, 'lon': 106.774029, 'radius_km': 2.5}, {'cbd': 'sedayu square', 'lat': -6.13124, 'lon': 106.746659, 'radius_km': 3.0}, {'cbd': 'Sekolah NJIS', 'lat': -6.156193, 'lon': 106.896796, 'radius_km': 1.0}, {'cbd': 'senayan', 'lat': -6.222489, 'lon': 106.781752, 'radius_km': 3.22}, {'cbd': 'Senayan City', 'lat': -6.228079, 'lon': 106.790048, 'radius_km': 2.92}, {'cbd': 'senayan city mall', 'lat': -6.229842, 'lon': 106.797178, 'radius_km': 1.0}, {'cbd': 'Senayan Park', 'lat': -6.208916, 'lon': 106.806324, 'radius_km': 1.08}, {'cbd': 'Senen Jaya', 'lat': -6.167096, 'lon': 106.844201, 'radius_km': 2.57}, {'cbd': 'Serengseng Junction', 'lat': -6.206513, 'lon': 106.758349, 'radius_km': 2.04}, {'cbd': 'Slipi Jaya', 'lat': -6.18845, 'lon': 106.792412, 'radius_km': 1.0}, {'cbd': 'Slipi Jaya Plaza', 'lat': -6.206238, 'lon': 106.796241, 'radius_km': 1.9}, {'cbd': 'Srengseng Junction', 'lat': -6.212933, 'lon': 106.759264, 'radius_km': 2.0}, {'cbd': 'Stasiun Bojong Indah', 'lat': -6.161016, 'lon': 106.73446, 'radius_km': 1.0}, {'cbd': 'Stasiun Cikini', 'lat': -6.195198, 'lon': 106.841363, 'radius_km': 2.7}, {'cbd': 'Stasiun Gondangdia', 'lat': -6.190258, 'lon': 106.836137, 'radius_km': 1.5}, {'cbd': 'Stasiun Jatinegara', 'lat': -6.221388, 'lon': 106.868721, 'radius_km': 3.0}, {'cbd': 'stasiun kalideres', 'lat': -6.159225, 'lon': 106.692338, 'radius_km': 2.0}, {'cbd': 'Stasiun Kebayoran', 'lat': -6.239672, 'lon': 106.781035, 'radius_km': 1.0}, {'cbd': 'stasiun kereta cikini', 'lat': -6.200866, 'lon': 106.840844, 'radius_km': 1.0}, {'cbd': 'stasiun lenteng agung', 'lat': -6.335799, 'lon': 106.83563, 'radius_km': 1.0}, {'cbd': 'Stasiun Manggarai', 'lat': -6.204754, 'lon': 106.836019, 'radius_km': 2.0}, {'cbd': 'Stasiun MRT Cipete', 'lat': -6.277834, 'lon': 106.806158, 'radius_km': 1.0}, {'cbd': 'stasiun mrt lebak bulu', 'lat': -6.291586, 'lon': 106.771369, 'radius_km': 0.95}, {'cbd': 'Stasiun Tanah Abanh', 'lat': -6.173542, 'lon': 106.809273, 'radius_km': 5.0}, {'cbd': 'STIKIM', 'lat': -6.330391, 'lon': 106.834181, 'radius_km': 1.01}, {'cbd': 'Sudirman CBD', 'lat': -6.232106, 'lon': 106.792196, 'radius_km': 1.0}, {'cbd': 'Sumareccon Mall Kelapa Gading', 'lat': -6.15446, 'lon': 106.91423, 'radius_km': 1.0}, {'cbd': 'sumarecon mall kelapa gading', 'lat': -6.149216, 'lon': 106.915268, 'radius_km': 2.0}, {'cbd': 'Summarecon Mall', 'lat': -6.1757, 'lon': 106.89762, 'radius_km': 2.0}, {'cbd': 'Summarecon Mall Kelapa Gading', 'lat': -6.164357, 'lon': 106.910509, 'radius_km': 3.15}, {'cbd': 'SUNSET AVENUE CITRA 8', 'lat': -6.121785, 'lon': 106.698264, 'radius_km': 2.95}, {'cbd': 'Sunter Mall', 'lat': -6.137755, 'lon': 106.860896, 'radius_km': 2.97}, {'cbd': 'Sunter Podomoro', 'lat': -6.131896, 'lon': 106.869527, 'radius_km': 1.0}, {'cbd': 'Super Indo Cipinang', 'lat': -6.219939, 'lon': 106.886813, 'radius_km': 1.1}, {'cbd': 'Superindo Bintaro', 'lat': -6.271398, 'lon': 106.76315, 'radius_km': 1.73}, {'cbd': 'SUPERINDO CILEDUK', 'lat': -6.234731, 'lon': 106.744545, 'radius_km': 1.8}, {'cbd': 'taman anggrek mall', 'lat': -6.194713, 'lon': 106.769129, 'radius_km': 3.0}, {'cbd': 'taman impian jaya Ancol', 'lat': -6.122705, 'lon': 106.824584, 'radius_km': 1.0}, {'cbd': 'Taman Menteng', 'lat': -6.198646, 'lon': 106.83563, 'radius_km': 1.1}, {'cbd': 'Tamini Square', 'lat': -6.287706, 'lon': 106.8794, 'radius_km': 3.72}, {'cbd': 'Tanah Impian Jaya Ancol', 'lat': -6.125382, 'lon': 106.84967, 'radius_km': 1.0}, {'cbd': 'TEBET ECO PARK', 'lat': -6.236045, 'lon': 106.852633, 'radius_km': 0.5}, {'cbd': 'TERMINAL BUS TANJUNG PRIOK', 'lat': -6.111749, 'lon': 106.882092, 'radius_km': 1.1}, {'cbd': 'Terminal Kampung Rambutan', 'lat': -6.299864, 'lon': 106.877694, 'radius_km': 4.2}, {'cbd': 'Terminal Pulogebang', 'lat': -6.210414, 'lon': 106.949161, 'radius_km': 1.0}, {'cbd': 'Thamrin City', 'lat': -6.198176, 'lon': 106.81529, 'radius_km': 1.9}, {'cbd': 'The Centro - Metro PIK', 'lat': -6.10819, 'lon': 106.75942, 'radius_km': 1.0}, {'cbd': 'the east tower', 'lat': -6.23046, 'lon': 106.82513, 'radius_km': 1.0}, {'cbd': 'The Park Pejaten', 'lat': -6.273483, 'lon': 106.831446, 'radius_km': 2.52}, {'cbd': 'THE PRIME OFFICE SUITE', 'lat': -6.12919, 'lon': 106.893398, 'radius_km': 1.0}, {'cbd': 'Tip Top Pondok Bambu', 'lat': -6.248909, 'lon': 106.904966, 'radius_km': 2.56}, {'cbd': 'tip top rawamangun', 'lat': -6.202314, 'lon': 106.896903, 'radius_km': 1.2}, {'cbd': 'TMII', 'lat': -6.307693, 'lon': 106.902416, 'radius_km': 6.0}, {'cbd': 'Tower Cibis CBD', 'lat': -6.310341, 'lon': 106.826917, 'radius_km': 2.77}, {'cbd': 'Tower Cibis Park CBD', 'lat': -6.306037, 'lon': 106.824062, 'radius_km': 2.31}, {'cbd': 'Trans Studio Mall Cibubur', 'lat': -6.361623, 'lon': 106.89898, 'radius_km': 2.37}, {'cbd': 'Transamart Cilandak', 'lat': -6.314111, 'lon': 106.806367, 'radius_km': 2.0}, {'cbd': 'transmart carefour cempaka putih', 'lat': -6.175173, 'lon': 106.876069, 'radius_km': 1.0}, {'cbd': 'Transmart Carrefour Cempaka Putih', 'lat': -6.173363, 'lon': 106.880072, 'radius_km': 1.07}, {'cbd': 'Transmart Cempaka Putih', 'lat': -6.172978, 'lon': 106.872226, 'radius_km': 3.26}, {'cbd': 'Transmart Cilandak', 'lat': -6.310964, 'lon': 106.810927, 'radius_km': 4.12}, {'cbd': 'Transmart Kalimalang', 'lat': -6.242432, 'lon': 106.92063, 'radius_km': 2.0}, {'cbd': 'Universitas Negeri Jakarta', 'lat': -6.194766, 'lon': 106.883722, 'radius_km': 1.84}, {'cbd': 'Universitas Pancasila', 'lat': -6.337265, 'lon': 106.835854, 'radius_km': 1.0}, {'cbd': 'Universitas Pertamina', 'lat': -6.226021, 'lon': 106.785809, 'radius_km': 1.0}, {'cbd': 'Wisata Kota Tua', 'lat': -6.136366, 'lon': 106.806, 'radius_km': 0.8}, {'cbd': 'Wisata Taman Impian Jaya Ancol', 'lat': -6.130843, 'lon': 106.82473, 'radius_km': 1.0}, {'cbd': 'WTC mangga dua', 'lat': -6.124006, 'lon': 106.82481, 'radius_km': 2.0}]
-
-
-def pick_cbd_jakarta(lat, lon):
-    best = ("Non-CBD/Other", float("inf"), None)
-    for r in CBD_POINTS_JAKARTA:
-        d = haversine_km(lat, lon, r["lat"], r["lon"])
-        if d < best[1]:
-            best = (r["cbd"], d, r)
-    if best[2] and best[1] <= best[2]["radius_km"]:
-        return best[0], round(best[1], 3)
-    return "Non-CBD/Other", round(best[1], 3)
-
 MANUAL_LABEL = "Manual… (ketik sendiri)"
 ADDR_TREE = {
     "DKI Jakarta": {
@@ -212,63 +208,30 @@ ADDR_TREE = {
     },
 }
 
-# ---------- [CRITICAL] DATA CLEANING FUNCTION ----------
-def clean_and_standardize_data(df):
-    elevasi_map = {
-        "sama dengan jalan": "Sama Dengan Jalan", "Sama dengan jalan": "Sama Dengan Jalan", "Sama Dengan Jalan": "Sama Dengan Jalan",
-        "lebih tinggi dari jalan": "Lebih Tinggi", "lebih tinggi": "Lebih Tinggi", "Lebih tinggi": "Lebih Tinggi", "Lebih Tinggi": "Lebih Tinggi",
-        "lebih rendah dari jalan": "Lebih Rendah", "lebih rendah": "Lebih Rendah", "Lebih rendah": "Lebih Rendah", "Lebih Rendah": "Lebih Rendah",
-    }
-    kontur_map = {
-        "datar": "Datar", "Datar": "Datar", "1 datar": "Datar", "2 datar": "Datar", "datar dan butuh uruk": "Datar",
-        "bergelombang": "Bergelombang", "Bergelombang": "Bergelombang",
-        "miring": "Miring", "Miring": "Miring", "Miring-Mendaki": "Miring",
-        "terasering": "Terasering", "Terasering": "Terasering"
-    }
-    
-    if "elavasi" in df.columns:
-        df["elavasi"] = df["elavasi"].astype(str).str.strip().map(elevasi_map).fillna("Datar")
-    if "kontur" in df.columns:
-        df["kontur"] = df["kontur"].astype(str).str.strip().map(kontur_map).fillna("Rata")
-        
-    cols_title = ["kondisi_jalan", "kontruksi_jalan", "pemanfaatan_sekitar", "dokumen_kepemilikan"]
-    for col in cols_title:
-        if col in df.columns:
-            df[col] = df[col].astype(str).str.strip().str.title()
-    return df
-
 # ---------- load default model/config ----------
-def _coerce_to_predictor(obj):
-    try:
-        if hasattr(obj, "predict") and callable(getattr(obj, "predict")): return obj
-        if isinstance(obj, dict):
-            for k in ("model","pipeline","pipe","estimator"):
-                if k in obj and hasattr(obj[k], "predict"): return obj[k]
-        if isinstance(obj, (list, tuple)):
-            for v in obj:
-                p = _coerce_to_predictor(v)
-                if p is not None: return p
-    except: pass
-    return None
+# Dimuat + dipanaskan di thread background (singleton per proses, dibagi semua sesi)
+default_loader = inference.get_default_loader(ROOT / "models")
 
+# Pipeline upload user: satu pool per proses, key = hash isi file, eviksi LRU sesuai budget memori
 @st.cache_resource(show_spinner=False)
-def load_default_model_and_config():
-    models_dir = ROOT / "models"
-    cfg = None; model = None
-    if models_dir.exists():
-        cfg_path = models_dir / "config_latest.json"
-        if cfg_path.exists():
-            try: cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
-            except: cfg = None
-        for fname in ("model_bundle_latest.pkl", "model_latest.pkl"):
-            f = models_dir / fname
-            if f.exists():
-                try:
-                    obj = joblib.load(f) if JOBLIB_OK else pickle.load(open(f, "rb"))
-                    p = _coerce_to_predictor(obj)
-                    if p is not None: model = p; break
-                except: continue
-    return model, cfg
+def get_model_pool():
+    return ModelPool(budget_mb=float(os.environ.get("TANAH_MODEL_POOL_MB", 2048)))
+
+def _load_pipeline_bytes(data: bytes):
+    raw = joblib.load(io.BytesIO(data)) if JOBLIB_OK else pickle.loads(data)
+    return _coerce_to_predictor(raw)
+
+model_pool = get_model_pool()
+
+# Audit trail prediksi: event diantrekan di memori, ditulis thread background ke SQLite (append-only)
+audit = get_audit_logger(os.environ.get("TANAH_AUDIT_DB", str(ROOT / "logs" / "prediksi_audit.sqlite")))
+audit_session = st.session_state.setdefault("_audit_session", uuid.uuid4().hex[:12])
+
+@st.fragment(run_every=1.0)
+def default_model_status():
+    if default_loader.state != "loading":
+        st.rerun()
+    st.info("⏳ Model default sedang dimuat di background…")
 
 # ==============================================================================
 # SIDEBAR
@@ -279,22 +242,34 @@ with st.sidebar:
     st.markdown("---")
     
     st.subheader("🤖 Status Model")
-    model_obj = st.session_state.get("trained_model")
+    # file default disimpan ulang / di-promote → loader memuat versi baru; sesi berhenti memakai versi lama
+    if default_loader.ready and st.session_state.get("default_version") not in (None, default_loader.version):
+        st.session_state.pop("trained_model", None)
+        st.session_state.pop("default_version")
+        if st.session_state.pop("_cfg_from_default", False):
+            st.session_state.pop("feature_cfg", None)
+    model_obj = st.session_state.get("trained_model") or model_pool.get(st.session_state.get("trained_model_key"))
     feature_cfg = st.session_state.get("feature_cfg")
 
     use_default = st.toggle("Pakai Model Default", value=True, help="Otomatis memuat dari folder ./models")
     
     if use_default:
         if model_obj is None:
-            with st.spinner("Memuat model default..."):
-                m, c = load_default_model_and_config()
-                if m is not None:
-                    model_obj = m
-                    st.session_state["trained_model"] = m
-                    st.success("✅ Model Default Aktif")
-                if c is not None:
-                    feature_cfg = c
-                    st.session_state["feature_cfg"] = c
+            if default_loader.ready:
+                model_obj = default_loader.model
+                st.session_state["trained_model"] = model_obj
+                st.session_state["default_version"] = default_loader.version
+                st.success("✅ Model Default Aktif")
+                lm = default_loader.metrics
+                st.caption(f"Load {lm['load_s']:.1f} s • warm-up {lm['warmup_s']:.2f} s • RSS {lm['rss_mb']:,.0f} MB")
+            elif default_loader.state == "loading":
+                default_model_status()
+            else:
+                st.error(f"Model default gagal dimuat: {default_loader.error}")
+            if default_loader.cfg is not None and feature_cfg is None:
+                feature_cfg = default_loader.cfg
+                st.session_state["feature_cfg"] = feature_cfg
+                st.session_state["_cfg_from_default"] = True
     else:
         st.info("Mode Manual Aktif")
 
@@ -302,14 +277,18 @@ with st.sidebar:
         up = st.file_uploader("Upload Pipeline (.pkl/.joblib)", type=["pkl","joblib","bin"])
         if up is not None:
             try:
-                raw = joblib.load(up) if JOBLIB_OK else pickle.load(up)
-                pred = _coerce_to_predictor(raw)
-                if pred:
-                    model_obj = pred
-                    st.session_state["trained_model"] = model_obj
-                    st.success("✅ Model Terupload")
-                else:
-                    st.error("File tidak valid.")
+                # hash 100 MB cukup sekali per file upload; rerun berikutnya langsung ambil dari pool
+                key = st.session_state.get("trained_model_key")
+                pred = model_pool.get(key) if st.session_state.get("_upload_file_id") == up.file_id else None
+                if pred is None:
+                    key, pred = model_pool.load_bytes(up.getvalue(), _load_pipeline_bytes, label=up.name)
+                model_obj = pred
+                st.session_state["trained_model_key"] = key
+                st.session_state["_upload_file_id"] = up.file_id
+                st.session_state.pop("trained_model", None)
+                st.success("✅ Model Terupload")
+            except ValueError:
+                st.error("File tidak valid.")
             except Exception as e:
                 st.error(f"Error: {e}")
 
@@ -318,10 +297,17 @@ with st.sidebar:
             try:
                 feature_cfg = json.loads(cfg_up.read().decode("utf-8"))
                 st.session_state["feature_cfg"] = feature_cfg
+                st.session_state.pop("_cfg_from_default", None)
                 st.success("✅ Config Dimuat")
             except:
                 st.error("Config error")
 
+    pool_fp = model_pool.footprint()
+    if not pool_fp.empty:
+        with st.expander(f"🧠 Pool Model ({model_pool.total_bytes / 1e6:,.0f} / {model_pool.budget_bytes / 1e6:,.0f} MB)"):
+            st.dataframe(pool_fp, use_container_width=True, hide_index=True)
+            st.caption(f"Model dikeluarkan (LRU): {model_pool.evictions}")
+
     # --- [NEW] BAGIAN CARA PENGGUNAAN DI SIDEBAR ---
     st.markdown("---")
     st.subheader("💡 Cara Penggunaan")
@@ -350,9 +336,24 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 if model_obj is None:
-    st.warning("⚠️ Model belum dimuat. Silakan cek sidebar.")
+    if use_default and default_loader.state == "loading":
+        st.info("⏳ Model default sedang disiapkan. Halaman akan aktif otomatis begitu model siap.")
+    else:
+        st.warning("⚠️ Model belum dimuat. Silakan cek sidebar.")
     st.stop()
 
+# Versi model aktif (untuk key cache hasil turunan model)
+if model_obj is default_loader.model:
+    model_version = f"default:{default_loader.version}"
+elif st.session_state.get("trained_model_key"):
+    model_version = f"upload:{st.session_state['trained_model_key'][:12]}"
+else:
+    model_version = f"session:{id(model_obj)}"
+
+# Indeks pembanding hanya ada di bundle default (pipeline upload tidak membawa data training)
+comps_index = default_loader.bundle.get("comps") \
+    if (model_obj is default_loader.model and isinstance(default_loader.bundle, dict)) else None
+
 # --- LAYOUT BARU: KIRI INPUT (70%), KANAN TIPS (30%) ---
 col_left, col_right = st.columns([2.5, 1])
 
@@ -439,6 +440,21 @@ with col_left:
         st.markdown("### ⚙️ Setting Analisis")
         ignore_latlon = st.checkbox("Abaikan Lat/Lon di analisis fitur", value=True)
         SENS_PCT = st.slider("Sensitivitas Numerik (±%)", 1, 20, 5, 1) / 100.0
+        N_COMPS = st.slider("Jumlah listing pembanding", 3, 20, 5, 1, disabled=comps_index is None)
+        uncertainty_on = st.toggle("Mode ketidakpastian (interval antar pohon)", value=True,
+                                   disabled=not supports_intervals(model_obj))
+        INTERVAL_LEVEL = st.select_slider("Level interval", options=[0.8, 0.9], value=0.8,
+                                          format_func=lambda v: f"{v:.0%}", disabled=not uncertainty_on)
+        # default: seluruh ensemble; progresif = pilihan eksplisit (nilai utama bisa berasal dari sebagian pohon)
+        progressive_on = st.toggle("Prediksi progresif (estimasi awal dari sebagian pohon)", value=False,
+                                   disabled=not supports_intervals(model_obj)) and supports_intervals(model_obj)
+        p1, p2 = st.columns(2)
+        with p1:
+            PROG_TOL = st.select_slider("Berhenti saat selisih ≤", options=[0.0, 0.005, 0.01, 0.02], value=0.01,
+                                        format_func=lambda v: "semua pohon" if v == 0 else f"{v:.1%}",
+                                        disabled=not progressive_on)
+        with p2:
+            PROG_DEADLINE_S = st.number_input("Deadline (detik)", 0.1, 30.0, 5.0, 0.5, disabled=not progressive_on)
         st.markdown('</div>', unsafe_allow_html=True)
 
 # --- KOLOM KANAN: TIPS & CATATAN (STICKY) ---
@@ -477,14 +493,17 @@ with col_right:
     st.image("https://img.freepik.com/free-photo/delimitation-land-plots_23-2150170946.jpg", caption="Prediksi Tanah AI", use_container_width=True)
 
 # PREPARE DATA
-DEFAULT_REQUIRED_COLS = [
-    "nama_cbd","sumber_data","elavasi","jarak_ke_jalan","kontur",
-    "kontruksi_jalan","kota_kabupaten","kondisi_jalan","jenis_transaksi",
-    "luas","dokumen_kepemilikan","jarak_cbd","pemanfaatan_sekitar",
-    "latitude","longitude","provinsi"
-]
 required_cols = feature_cfg.get("required_cols", DEFAULT_REQUIRED_COLS) if isinstance(feature_cfg, dict) else DEFAULT_REQUIRED_COLS
 
+@st.cache_data(show_spinner=False)
+def load_canon_tables(cfg):
+    return tables_from_config(cfg)
+
+# Tabel kanonikalisasi: nilai input → kategori persis seperti saat training
+canon_tables = load_canon_tables(feature_cfg)
+# Faktor kalibrasi interval dari test split saat training (None → kuantil antar pohon apa adanya)
+interval_cal = feature_cfg.get("interval_calibration") if isinstance(feature_cfg, dict) else None
+
 row = {
     "nama_cbd": nama_cbd, "sumber_data": sumber_data, "elavasi": elavasi,
     "jarak_ke_jalan": float(jarak_ke_jalan), "kontur": kontur, "kontruksi_jalan": kontruksi_jalan,
@@ -501,59 +520,6 @@ X_pred = pd.DataFrame([[row.get(c, np.nan) for c in required_cols]], columns=req
 st.markdown("###")
 predict_btn = st.button("🚀 HITUNG PREDIKSI & ANALISIS", type="primary", use_container_width=True)
 
-# Helper Functions
-def _is_number(x): return isinstance(x, (int, float, np.integer, np.floating)) and np.isfinite(x)
-
-def explain_numeric_local(model, X_row, pct, skip_cols=None):
-    skip = set(skip_cols or [])
-    base = float(model.predict(X_row)[0])
-    recs = []
-    for col in X_row.columns:
-        if col in skip: continue
-        v = X_row.iloc[0][col]
-        if _is_number(v):
-            delta = pct * (abs(v) if v != 0 else 1.0)
-            up = v + delta; dn = v - delta
-            Xu = X_row.copy(); Xd = X_row.copy()
-            Xu.iloc[0, X_row.columns.get_loc(col)] = up
-            Xd.iloc[0, X_row.columns.get_loc(col)] = dn
-            try:
-                pu = float(model.predict(Xu)[0]); pdn = float(model.predict(Xd)[0])
-                grad = (pu - pdn) / (up - dn + 1e-12)
-                abs_effect = max(abs(pu - base), abs(pdn - base))
-                recs.append({
-                    "feature": col, "type": "numeric", "current": v, "base_pred": base,
-                    "effect_up": pu - base, "effect_down": pdn - base, "sensitivity": grad, "abs_effect": abs_effect
-                })
-            except: continue
-    return pd.DataFrame(recs)
-
-def explain_categorical_contrast(model, X_row, choices_map, skip_cols=None):
-    skip = set(skip_cols or [])
-    base = float(model.predict(X_row)[0])
-    recs = []
-    for col in X_row.columns:
-        if col in skip: continue
-        if col in choices_map:
-            curr = X_row.iloc[0][col]
-            alts = [a for a in choices_map[col] if a != curr]
-            preds = []
-            for alt in alts:
-                Xtmp = X_row.copy()
-                Xtmp.iloc[0, X_row.columns.get_loc(col)] = alt
-                try: preds.append((alt, float(model.predict(Xtmp)[0])))
-                except: continue
-            if preds:
-                avg_alt = float(np.mean([p for _, p in preds]))
-                delta_vs_avg = base - avg_alt
-                best_alt, best_pred = max(preds, key=lambda t: abs(t[1] - base))
-                recs.append({
-                    "feature": col, "type": "categorical", "current": curr, "base_pred": base,
-                    "delta_vs_avg_alt": delta_vs_avg, "best_alt": best_alt, "effect_if_best_alt": best_pred - base,
-                    "n_valid_alts": len(preds), "abs_effect": abs(delta_vs_avg)
-                })
-    return pd.DataFrame(recs)
-
 # Update Choices UI dengan Kategori Standar
 CAT_CHOICES_UI = {
     "elavasi": ["Sama Dengan Jalan", "Lebih Rendah", "Lebih Tinggi"],
@@ -569,51 +535,115 @@ CAT_CHOICES_UI = {
     "kota_kabupaten": list(ADDR_TREE.get(provinsi_val, {}).keys()),
 }
 
+# Nilai persis seluruh forest (on demand) setelah prediksi progresif berhenti lebih awal;
+# fragment → klik tombol hanya menjalankan ulang bagian ini, hasil prediksi di atas tetap
+@st.fragment
+def exact_forest_value(model, X_row, y_partial: float, n_trees: int, n_total: int):
+    if st.button(f"Hitung nilai persis (semua {n_total} pohon)", key="prog_exact"):
+        with stage("predict.exact", n_trees=n_total):
+            y_full = float(model.predict(X_row)[0])
+        st.caption(f"Nilai persis seluruh ensemble: {fmt_rp(y_full)} • estimasi {n_trees} pohon "
+                   f"{(y_partial - y_full) / y_full if y_full else 0.0:+.2%} dari nilai persis")
+
 if predict_btn:
-    progress_text = "Sedang menganalisis..."
-    my_bar = st.progress(0, text=progress_text)
+    my_bar = st.progress(0, text="Validasi input...")
 
     try:
         # --- [CRITICAL UPDATE] CLEAN DATA ---
-        X_pred = clean_and_standardize_data(X_pred)
+        with stage("clean_input"):
+            X_pred = clean_and_standardize_data(X_pred, canon_tables)
+        unmapped_cols = [c for c, r in X_pred.attrs.get("canon_report", {}).items() if r["unmapped_rows"]]
+        remapped_vals = [v for r in X_pred.attrs.get("canon_report", {}).values() for v in r.get("remapped_values", {})]
         # -------------------------------------
 
-        # Simulation animation
-        for percent_complete in range(0, 40, 10):
-            time.sleep(0.05)
-            my_bar.progress(percent_complete, text="Validasi input...")
-        
-        y_hat = float(model_obj.predict(X_pred)[0])
-        rpm2 = (y_hat / float(luas)) if (luas and luas > 0) else np.nan
-        
-        for percent_complete in range(40, 80, 10):
-            time.sleep(0.05)
-            my_bar.progress(percent_complete, text="Menghitung kontribusi fitur...")
-
-        # Analisis
-        skip_cols = {"_kecamatan","_kelurahan"}
-        if ignore_latlon: skip_cols |= {"latitude","longitude"}
-        
-        df_num = explain_numeric_local(model_obj, X_pred, pct=SENS_PCT, skip_cols=skip_cols)
-        df_cat = explain_categorical_contrast(model_obj, X_pred, CAT_CHOICES_UI, skip_cols=skip_cols)
-        
-        my_bar.progress(100, text="Selesai!")
-        time.sleep(0.2)
-        my_bar.empty()
-        st.toast("Prediksi Selesai!", icon="✅")
-
         # --- RESULT DISPLAY ---
         st.markdown("---")
         st.subheader("📊 Hasil Prediksi")
         
         res_col1, res_col2 = st.columns(2)
         with res_col1:
-            st.metric(label="Estimasi Harga Total", value=fmt_rp(y_hat), delta="Output Model")
+            est_slot = st.empty()
         with res_col2:
-            st.metric(label="Harga per Meter Persegi", value=fmt_rp(rpm2), delta_color="off")
+            m2_slot = st.empty()
+
+        # Prediksi progresif: pohon dievaluasi per potongan, estimasi sementara langsung tampil
+        # lalu diperhalus sampai konvergen / deadline / semua pohon.
+        per_tree, prog = None, None
+        with stage("predict", mode="progresif" if progressive_on else ("interval" if uncertainty_on else "titik")):
+            if progressive_on:
+                for prog in progressive_tree_predictions(model_obj, X_pred, rel_tol=PROG_TOL, deadline_s=PROG_DEADLINE_S):
+                    my_bar.progress(int(60 * prog["n_trees"] / prog["n_total"]),
+                                    text=f"Mengevaluasi pohon {prog['n_trees']}/{prog['n_total']}...")
+                    if not prog["done"]:
+                        est_slot.metric(label="Estimasi Harga Total (sementara)", value=fmt_rp(float(prog["mean"][0])),
+                                        delta=f"{prog['n_trees']}/{prog['n_total']} pohon • ±{2 * prog['rel_sem']:.1%}",
+                                        delta_color="off")
+                per_tree = prog["per_tree"]
+            elif uncertainty_on:
+                # Mode ketidakpastian: semua output pohon dalam satu pass; rerata = prediksi forest
+                per_tree = tree_predictions(model_obj, X_pred)
+            y_hat = float(per_tree.mean()) if per_tree is not None else float(model_obj.predict(X_pred)[0])
+        rpm2 = (y_hat / float(luas)) if (luas and luas > 0) else np.nan
+
+        partial = prog is not None and prog["n_trees"] < prog["n_total"]
+        est_slot.metric(label="Estimasi Harga Total", value=fmt_rp(y_hat),
+                        delta=f"Estimasi parsial {prog['n_trees']}/{prog['n_total']} pohon" if partial else "Output Model",
+                        delta_color="off" if partial else "normal")
+        m2_slot.metric(label="Harga per Meter Persegi", value=fmt_rp(rpm2), delta_color="off")
+        if partial:
+            with res_col1:
+                st.caption(f"Dari {prog['n_trees']}/{prog['n_total']} pohon ({prog['reason']}, "
+                           f"{prog['elapsed_s'] * 1000:.0f} ms) • selisih thd. seluruh ensemble ≈ ±{2 * prog['rel_sem']:.1%}")
+                exact_forest_value(model_obj, X_pred, y_hat, prog["n_trees"], prog["n_total"])
+        lo = hi = None
+        if per_tree is not None and uncertainty_on:
+            lo, hi = (float(v[0]) for v in interval_bounds(per_tree, INTERVAL_LEVEL, interval_cal))
+            calibrated = f"{INTERVAL_LEVEL:.2f}" in ((interval_cal or {}).get("levels") or {})
+            with res_col1:
+                st.caption(f"Interval {INTERVAL_LEVEL:.0%}{' (terkalibrasi)' if calibrated else ''}: "
+                           f"{fmt_rp(lo)} – {fmt_rp(hi)} • sebaran antar pohon (std) {fmt_rp(per_tree.std())}")
+            if luas and luas > 0:
+                with res_col2:
+                    st.caption(f"Interval {INTERVAL_LEVEL:.0%}: {fmt_rp(lo / float(luas))} – {fmt_rp(hi / float(luas))} per m²")
+        if unmapped_cols:
+            st.caption(f"⚠️ Nilai berikut tidak ada di kategori training dan diabaikan model: {', '.join(unmapped_cols)}")
+        if remapped_vals:
+            st.caption(f"ℹ️ Nilai dipetakan ulang ke kategori training: {', '.join(remapped_vals)}")
+        audit.log_single(X_pred, y_hat, model_version, audit_session, lower=lo, upper=hi,
+                         extra={"mode": "progresif" if progressive_on else ("interval" if uncertainty_on else "titik"),
+                                "n_trees": prog["n_trees"] if prog is not None else None,
+                                "n_total": prog["n_total"] if prog is not None else None, "partial": partial})
+
+        # --- COMPS ---
+        if comps_index is not None:
+            st.markdown("### 🏘️ Listing Pembanding Terdekat")
+            try:
+                t0 = time.perf_counter()
+                with stage("comps"):
+                    comps_df = comps_index.query(X_pred, k=N_COMPS)
+                comps_ms = (time.perf_counter() - t0) * 1000
+                st.dataframe(comps_df.style.format({"harga": "{:,.0f}", "rp_per_m2": "{:,.0f}", "jarak_km": "{:.2f}"}),
+                             use_container_width=True, hide_index=True)
+                st.caption(f"Median Rp/m² pembanding: {fmt_rp(comps_df['rp_per_m2'].median()) if 'rp_per_m2' in comps_df else '-'} "
+                           f"• {comps_index.n_:,} listing terindeks • {comps_ms:.1f} ms")
+            except Exception as e:
+                st.caption(f"Pembanding tidak tersedia: {e}")
 
         # --- EXPLANATION TABS ---
         st.markdown("### 🔍 Analisis Faktor Penentu")
+        my_bar.progress(70, text="Menghitung kontribusi fitur...")
+
+        # Analisis
+        skip_cols = {"_kecamatan","_kelurahan"}
+        if ignore_latlon: skip_cols |= {"latitude","longitude"}
+        
+        with stage("explain.numeric"):
+            df_num = explain_numeric_local(model_obj, X_pred, pct=SENS_PCT, skip_cols=skip_cols)
+        with stage("explain.categorical"):
+            df_cat = explain_categorical_contrast(model_obj, X_pred, canonicalize_choices(CAT_CHOICES_UI, canon_tables), skip_cols=skip_cols)
+        
+        my_bar.empty()
+        st.toast("Prediksi Selesai!", icon="✅")
         
         parts = []
         if df_num is not None and not df_num.empty: parts.append(df_num)
@@ -662,6 +692,75 @@ if predict_btn:
     except Exception as e:
         st.error(f"Terjadi kesalahan saat prediksi: {str(e)}")
 
+# ==============================================================================
+# WHAT-IF: LUAS × JARAK CBD
+# ==============================================================================
+@st.cache_data(show_spinner=False, max_entries=32)
+def cached_price_surface(_model, model_version, row_json, n, luas_span, jarak_span_km):
+    # _model tidak di-hash; key cache = versi model + isi baris + parameter grid
+    X_row = pd.read_json(io.StringIO(row_json), orient="split")
+    luas_vals, jarak_vals = whatif_axes(X_row.iloc[0]["luas"], X_row.iloc[0]["jarak_cbd"], n, luas_span, jarak_span_km)
+    return luas_vals, jarak_vals, price_surface(_model, X_row, luas_vals, jarak_vals)
+
+st.markdown("<br>", unsafe_allow_html=True)
+with st.expander("🗺️ What-if: Luas × Jarak ke CBD", expanded=False):
+    st.caption("Semua titik grid dihitung dalam satu panggilan model, lalu di-cache per input & versi model.")
+    w1, w2, w3 = st.columns(3)
+    with w1: grid_n = st.select_slider("Resolusi grid", options=[20, 30, 50, 80], value=50)
+    with w2: luas_span = st.slider("Rentang luas (× input)", 0.1, 5.0, (0.5, 2.0), 0.1)
+    with w3: jarak_span_km = st.slider("Rentang jarak CBD (± km)", 1.0, 20.0, 5.0, 0.5)
+    per_m2 = st.toggle("Tampilkan Rp/m²", value=False)
+    if st.button("Hitung Permukaan Harga"):
+        st.session_state["whatif_on"] = True
+    if st.session_state.get("whatif_on"):
+        try:
+            X_row = clean_and_standardize_data(X_pred.copy(), canon_tables)
+            t0 = time.perf_counter()
+            with stage("whatif.surface", n=int(grid_n)):
+                luas_vals, jarak_vals, Z = cached_price_surface(
+                    model_obj, model_version, X_row.to_json(orient="split"), int(grid_n), tuple(luas_span), float(jarak_span_km))
+            st.caption(f"{Z.size:,} titik • {time.perf_counter() - t0:.2f} s")
+            if MPL_OK:
+                import matplotlib.pyplot as plt
+                fig_c, fig_s = plot_surface(luas_vals, jarak_vals, Z, current=(float(luas), float(jarak_cbd)), per_m2=per_m2)
+                g1, g2 = st.columns(2)
+                with g1: st.pyplot(fig_c)
+                with g2: st.pyplot(fig_s)
+                plt.close(fig_c); plt.close(fig_s)
+            else:
+                st.dataframe(pd.DataFrame(Z, index=np.round(jarak_vals, 2), columns=np.round(luas_vals, 0)))
+        except Exception as e:
+            st.error(f"Gagal menghitung what-if: {e}")
+
+# ==============================================================================
+# HEATMAP HARGA (TILE PRECOMPUTED)
+# ==============================================================================
+@st.cache_resource(show_spinner=False)
+def get_tile_store(tile_dir: str):
+    return TileStore(tile_dir)
+
+with st.expander("🌏 Peta Harga Rp/m² (Precomputed)", expanded=False):
+    tile_sets = list_tile_sets(ROOT / "models" / "tiles", default_loader.version) \
+        if (model_obj is default_loader.model and default_loader.version) else []
+    if not tile_sets:
+        st.caption("Belum ada tile untuk model ini. Jalankan: `python heatmap_tiles.py models/model_bundle_latest.pkl`.")
+    else:
+        stores = {str(d): get_tile_store(str(d)) for d in tile_sets}
+        def _profile_label(d):
+            p = stores[d].meta["profile"]
+            return f"luas {p.get('luas')} m² • {p.get('dokumen_kepemilikan')} • {p.get('pemanfaatan_sekitar')} ({stores[d].meta['created']})"
+        tile_dir = st.selectbox("Profil atribut tanah", list(stores), format_func=_profile_label)
+        store = stores[tile_dir]
+        st.metric("Rp/m² di koordinat input (tile)", fmt_rp(store.lookup(float(lat), float(lon))))
+        if MPL_OK:
+            import matplotlib.pyplot as plt
+            fig, ax = plt.subplots(figsize=(8, 6))
+            im = ax.imshow(store.mosaic(), extent=store.extent, origin="upper", cmap="magma", aspect="auto")
+            ax.scatter([lon], [lat], c="cyan", marker="x", s=80, label="Input saat ini")
+            fig.colorbar(im, ax=ax, label="Rp/m²")
+            ax.set_xlabel("Longitude"); ax.set_ylabel("Latitude"); ax.legend(loc="upper right")
+            st.pyplot(fig); plt.close(fig)
+
 # ==============================================================================
 # BATCH PREDICTION SECTION
 # ==============================================================================
@@ -671,33 +770,121 @@ with st.expander("📂 Prediksi Batch (Upload File)", expanded=False):
     batch_file = st.file_uploader("Upload Data", type=["csv","xlsx"], key="batch_file")
     
     if batch_file:
-        if batch_file.name.lower().endswith(".csv"): df_in = pd.read_csv(batch_file)
-        else: df_in = pd.read_excel(batch_file)
+        with stage("batch.read", file=batch_file.name):
+            if batch_file.name.lower().endswith(".csv"): df_in = pd.read_csv(batch_file)
+            else: df_in = pd.read_excel(batch_file)
         
         st.write(f"Preview ({len(df_in)} baris):")
         st.dataframe(df_in.head(), use_container_width=True)
         
+        batch_interval = st.checkbox(f"Tambahkan kolom interval {INTERVAL_LEVEL:.0%} ({LOWER_COL}/{UPPER_COL}/{STD_COL})",
+                                     value=False, disabled=not supports_intervals(model_obj))
+        b1, b2 = st.columns([3, 1])
+        with b1:
+            batch_explain = st.checkbox("Tambahkan faktor penentu per baris (Faktor_i / Efek_i)", value=False,
+                                        help="Metode sama dengan panel analisis (sensitivitas ±% & kontras kategori, "
+                                             "pengaturan di form); model boosting memakai atribusi pohon (SHAP).")
+        with b2:
+            batch_top_k = st.number_input("Top-k", 1, 10, 3, 1, disabled=not batch_explain)
+        export_fmt = st.radio("Format unduhan", available_formats(), horizontal=True,
+                              format_func=lambda f: FORMATS[f]["label"], key="batch_export_fmt",
+                              help="Parquet / CSV gzip jauh lebih cepat untuk file besar; Excel dipecah per 1.048.575 baris.")
         if st.button("Proses Batch"):
-            defaults_for_missing = {"sumber_data": "Iklan", "elavasi": "Datar", "kontur": "Rata", "kontruksi_jalan": "Aspal", "kondisi_jalan": "Baik", "jenis_transaksi": "Jual", "dokumen_kepemilikan": "SHM", "pemanfaatan_sekitar": "Perumahan", "luas": 100.0, "jarak_ke_jalan": 50.0, "provinsi": "DKI Jakarta", "nama_cbd": "Non-CBD/Other"}
-            for col in defaults_for_missing:
-                if col not in df_in.columns: df_in[col] = defaults_for_missing[col]
-            
             try:
-                # --- [CRITICAL UPDATE] CLEAN DATA ---
-                # Bersihkan data Excel yang kotor sebelum masuk model
-                df_in = clean_and_standardize_data(df_in)
-                # -------------------------------------
-
-                Xb = df_in[required_cols].copy()
-                y_batch = model_obj.predict(Xb)
-                df_in["Prediksi_Harga"] = y_batch
-                
+                # Default kolom hilang + cleaning + prediksi dijalankan paralel per potongan baris
+                with stage("batch.predict", rows=len(df_in)):
+                    # model default → worker memuat file bundle (mmap), bukan unpickle salinan penuh per worker
+                    df_in = predict_frame(model_obj, df_in, required_cols, canon_tables=canon_tables,
+                                          bundle_path=default_loader.bundle_path_for(model_obj),
+                                          interval={"level": INTERVAL_LEVEL, "calibration": interval_cal} if batch_interval else None,
+                                          drift_sketches=sketches_from_config(feature_cfg))
+                driver_cols = []
+                if batch_explain:
+                    # semua perturbasi semua baris dalam blok besar → satu predict per blok
+                    skip_batch = {"_kecamatan", "_kelurahan"} | ({"latitude", "longitude"} if ignore_latlon else set())
+                    choices_batch = {c: v for c, v in canonicalize_choices(CAT_CHOICES_UI, canon_tables).items()
+                                     if c not in ("provinsi", "kota_kabupaten")}  # pilihan alamat bergantung form
+                    exp_bar = st.progress(0.0, text="Menghitung faktor penentu per baris…")
+                    with stage("batch.explain", rows=len(df_in)):
+                        drivers = explain_frame(model_obj, df_in[required_cols], SENS_PCT, choices_batch, skip_batch,
+                                                top_k=int(batch_top_k),
+                                                on_progress=lambda f: exp_bar.progress(f, text=f"Faktor penentu {f:.0%}"))
+                    exp_bar.empty()
+                    for c in drivers.columns:  # assign per kolom → attrs (laporan canon/drift) tetap
+                        df_in[c] = drivers[c].to_numpy()
+                    driver_cols = list(drivers.columns)
+                    st.caption("Faktor penentu: " + ("atribusi pohon (SHAP)" if drivers.attrs["method"] == "attribution"
+                                                     else f"sensitivitas ±{SENS_PCT:.0%} & kontras kategori")
+                               + " • Efek dalam Rp (positif = menaikkan harga).")
+                audit.log_batch(df_in[required_cols], df_in[PRED_COL], model_version, audit_session, source=batch_file.name,
+                                lower=df_in[LOWER_COL] if LOWER_COL in df_in else None,
+                                upper=df_in[UPPER_COL] if UPPER_COL in df_in else None,
+                                extra={"interval_level": INTERVAL_LEVEL if batch_interval else None})
+                canon_rep = report_frame(df_in.attrs.get("canon_report", {}))
+
                 st.success("Selesai!")
-                st.dataframe(df_in[["Prediksi_Harga"] + required_cols[:3]].head(), use_container_width=True)
+                pred_cols = [c for c in (PRED_COL, LOWER_COL, UPPER_COL, STD_COL) if c in df_in.columns]
+                st.dataframe(df_in[pred_cols + driver_cols + required_cols[:3]].head(), use_container_width=True)
+                if canon_rep["baris_tak_terpetakan"].sum() > 0:
+                    st.warning("Sebagian nilai kategori tidak dikenal model (diabaikan saat prediksi):")
+                    st.dataframe(canon_rep[canon_rep["baris_tak_terpetakan"] > 0], use_container_width=True)
+                if canon_rep["baris_dipetakan_ulang"].sum() > 0:
+                    st.info("Sebagian nilai kategori dipetakan ulang ke kategori training (sinonim config / level jarang / fuzzy):")
+                    st.dataframe(canon_rep.loc[canon_rep["baris_dipetakan_ulang"] > 0,
+                                               ["kolom", "baris_dipetakan_ulang", "contoh_pemetaan"]], use_container_width=True)
+
+                # Laporan drift terhadap distribusi training (dihitung per potongan saat scoring)
+                drift_mon = df_in.attrs.get("drift")
+                if drift_mon is None:
+                    st.caption("Laporan drift tidak tersedia: config model tidak memuat `drift_sketches` (latih ulang di app.py).")
+                else:
+                    drift_rep = drift_mon.report()
+                    n_high = int((drift_rep["status"] == "tinggi").sum())
+                    with st.expander(f"📉 Drift Input vs Data Training ({n_high} fitur drift tinggi)", expanded=n_high > 0):
+                        st.dataframe(drift_rep.style.format({"psi": "{:.3f}", "ks": "{:.3f}", "missing_train": "{:.1%}",
+                                                             "missing_batch": "{:.1%}", "porsi_baru": "{:.1%}"}, na_rep="-"),
+                                     use_container_width=True, hide_index=True)
+                        st.caption("PSI < 0.1 stabil • 0.1–0.25 sedang • ≥ 0.25 tinggi. KS = selisih CDF maksimum antar bin kuantil training.")
                 
-                buf = io.BytesIO()
-                with pd.ExcelWriter(buf, engine="openpyxl") as w:
-                    df_in.to_excel(w, index=False)
-                st.download_button("⬇️ Download Hasil Excel", data=buf.getvalue(), file_name="hasil_prediksi.xlsx")
+                # ditulis per potongan ke file temp; file baru dibaca saat tombol unduh diklik
+                with stage("batch.export", rows=len(df_in), fmt=export_fmt):
+                    exp = export_frames({"Prediksi": df_in}, export_fmt, "hasil_prediksi")
+                discard_export(st.session_state.get("batch_export"))
+                st.session_state["batch_export"] = exp
+                st.download_button(f"⬇️ Download Hasil ({FORMATS[export_fmt]['label']})", data=deferred_reader(exp["path"]),
+                                   file_name=exp["file_name"], mime=exp["mime"], on_click="ignore")
+                n_sheet = exp["sheets"].get("Prediksi", 1)
+                st.caption(f"{exp['bytes'] / 1e6:,.1f} MB • ditulis {exp['seconds']:.1f} s"
+                           + (f" • {n_sheet} sheet (batas baris Excel)" if n_sheet > 1 else ""))
             except Exception as e:
-                st.error(f"Error batch: {e}")
\ No newline at end of file
+                st.error(f"Error batch: {e}")
+
+# ==============================================================================
+# AUDIT LOG
+# ==============================================================================
+am = audit.metrics()
+with st.expander(f"🧾 Audit Prediksi ({am['written_rows']:,} baris tercatat proses ini)"):
+    a1, a2, a3, a4 = st.columns(4)
+    a1.metric("Antrean (event / baris)", f"{am['queue_events']} / {am['queue_rows']:,}")
+    a2.metric("Dibuang (antrean penuh)", f"{am['dropped_rows']:,}", delta=f"{am['dropped_events']} event", delta_color="off")
+    a3.metric("Lag tulis terakhir", f"{am['lag_s_last'] * 1000:,.0f} ms" if am["lag_s_last"] is not None else "-",
+              delta=f"maks {am['lag_s_max'] * 1000:,.0f} ms", delta_color="off")
+    a4.metric("Gagal tulis", f"{am['failed_rows']:,}", delta="writer hidup" if am["writer_alive"] else "writer MATI",
+              delta_color="off" if am["writer_alive"] else "inverse")
+    if am["last_error"]:
+        st.caption(f"Error terakhir: {am['last_error']}")
+    if st.button("Tampilkan 20 record terakhir"):
+        st.dataframe(audit.recent(20), use_container_width=True, hide_index=True)
+    st.caption(f"DB: `{audit.db_path}` (env TANAH_AUDIT_DB)")
+
+# ==============================================================================
+# PANEL PROFILING
+# ==============================================================================
+prof_df = records_frame()
+if not prof_df.empty:
+    with st.expander("⏱️ Profil Tahapan (wall / CPU / puncak RSS)"):
+        st.dataframe(prof_df.style.format({"wall_s": "{:.3f}", "cpu_s": "{:.3f}", "peak_rss_delta_mb": "{:,.1f}",
+                                           "rss_end_mb": "{:,.0f}"}), use_container_width=True, hide_index=True)
+        st.caption("Ringkasan per tahap:")
+        st.dataframe(summary_frame(), use_container_width=True, hide_index=True)
+        st.caption("Record yang sama ditulis sebagai JSON ke logger `tanah.stages` (file: env TANAH_PROFILE_LOG).")
@@ -0,0 +1,159 @@
+# run_store.py — Riwayat run training (SQLite) + memoization berdasarkan hash konfigurasi
+#
+# Key run = hash data train/test + hash pipeline (belum di-fit) beserta semua hyperparameter.
+# Request training identik → pipeline & metrik diambil dari store, tanpa fit ulang.
+# Artefak: <root>/<run_key[:16]>/pipeline.joblib ; DB: <root>/runs.sqlite
+import hashlib, json, sqlite3, threading, time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+try:
+    import joblib
+    JOBLIB_OK = True
+except Exception:
+    JOBLIB_OK = False
+    import pickle  # type: ignore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_key       TEXT UNIQUE NOT NULL,
+    created       TEXT NOT NULL,
+    algo          TEXT,
+    target_col    TEXT,
+    params_json   TEXT,
+    features_json TEXT,
+    metrics_json  TEXT,
+    timings_json  TEXT,
+    data_hash     TEXT,
+    n_train       INTEGER,
+    n_test        INTEGER,
+    artifact_path TEXT,
+    hits          INTEGER DEFAULT 0,
+    last_hit      TEXT
+)
+"""
+
+
+def frame_hash(*objs) -> str:
+    """Hash isi DataFrame/Series (nilai + index + nama kolom)."""
+    h = hashlib.sha256()
+    for o in objs:
+        h.update(pd.util.hash_pandas_object(o, index=True).values.tobytes())
+        cols = o.columns if isinstance(o, pd.DataFrame) else [o.name]
+        h.update(json.dumps([str(c) for c in cols]).encode())
+    return h.hexdigest()
+
+
+def pipeline_hash(model) -> str:
+    """Hash pipeline yang belum di-fit (struktur + semua parameter, termasuk random_state)."""
+    if JOBLIB_OK:
+        return joblib.hash(model, hash_name="sha1")
+    return hashlib.sha1(pickle.dumps(model)).hexdigest()
+
+
+def training_run_key(data_hash: str, model, extra: Optional[Dict] = None) -> str:
+    payload = json.dumps({"data": data_hash, "pipeline": pipeline_hash(model), "extra": extra or {}},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class RunStore:
+    def __init__(self, root="models/runs"):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.root / "runs.sqlite"
+        self._lock = threading.Lock()
+        with self._connect() as con:
+            con.execute(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Koneksi per operasi: commit (rollback bila error) lalu selalu ditutup."""
+        con = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    @staticmethod
+    def _row_to_dict(cur, row) -> Dict:
+        d = {col[0]: v for col, v in zip(cur.description, row)}
+        for k in ("params_json", "features_json", "metrics_json", "timings_json"):
+            d[k[:-5]] = json.loads(d.pop(k) or "{}")
+        return d
+
+    def find(self, run_key: str) -> Optional[Dict]:
+        """Run dengan key sama + artefak masih ada → dict run (hits bertambah); selain itu None."""
+        with self._lock, self._connect() as con:
+            cur = con.execute("SELECT * FROM runs WHERE run_key = ?", (run_key,))
+            row = cur.fetchone()
+            if row is None:
+                return None
+            run = self._row_to_dict(cur, row)
+            if not Path(run["artifact_path"] or "").exists():
+                return None
+            con.execute("UPDATE runs SET hits = hits + 1, last_hit = ? WHERE id = ?",
+                        (time.strftime("%Y-%m-%d %H:%M:%S"), run["id"]))
+            return run
+
+    def record(self, run_key: str, pipeline, algo: str, params: Dict, metrics: Dict, timings: Dict,
+               data_hash: str, n_train: int, n_test: int, target_col: str = "", features: Optional[Dict] = None) -> Dict:
+        art_dir = self.root / run_key[:16]
+        art_dir.mkdir(parents=True, exist_ok=True)
+        art = art_dir / "pipeline.joblib"
+        if JOBLIB_OK:
+            joblib.dump(pipeline, art)
+        else:
+            with open(art, "wb") as f:
+                pickle.dump(pipeline, f)
+        with self._lock, self._connect() as con:
+            con.execute(
+                "INSERT OR REPLACE INTO runs (run_key, created, algo, target_col, params_json, features_json, "
+                "metrics_json, timings_json, data_hash, n_train, n_test, artifact_path) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_key, time.strftime("%Y-%m-%d %H:%M:%S"), algo, target_col,
+                 json.dumps(params, default=str), json.dumps(features or {}, default=str),
+                 json.dumps(metrics, default=str), json.dumps(timings, default=str),
+                 data_hash, int(n_train), int(n_test), str(art)))
+            cur = con.execute("SELECT * FROM runs WHERE run_key = ?", (run_key,))
+            return self._row_to_dict(cur, cur.fetchone())
+
+    def load_pipeline(self, run: Dict):
+        if JOBLIB_OK:
+            return joblib.load(run["artifact_path"])
+        with open(run["artifact_path"], "rb") as f:
+            return pickle.load(f)
+
+    def runs(self, limit: int = 200) -> List[Dict]:
+        with self._connect() as con:
+            cur = con.execute("SELECT * FROM runs ORDER BY id DESC LIMIT ?", (int(limit),))
+            return [self._row_to_dict(cur, r) for r in cur.fetchall()]
+
+    def runs_frame(self, limit: int = 200) -> pd.DataFrame:
+        """Satu baris per run: info dasar + metrik + timing per tahap (kolom datar)."""
+        rows = []
+        for r in self.runs(limit):
+            row = {"id": r["id"], "created": r["created"], "algo": r["algo"], "target": r["target_col"],
+                   "n_train": r["n_train"], "n_test": r["n_test"], "hits": r["hits"], "data_hash": (r["data_hash"] or "")[:10]}
+            row.update(r["metrics"])
+            row.update({f"t_{k}_s": v for k, v in r["timings"].items()})
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+    def compare(self, ids: List[int]) -> pd.DataFrame:
+        """Perbandingan berdampingan (baris = param/metrik/timing, kolom = run) untuk run terpilih."""
+        sel = [r for r in self.runs(limit=10_000) if r["id"] in set(ids)]
+        cols = {}
+        for r in sorted(sel, key=lambda r: r["id"]):
+            d = {"algo": r["algo"], "target": r["target_col"], "data_hash": (r["data_hash"] or "")[:10]}
+            d.update({f"param.{k}": v for k, v in r["params"].items()})
+            d.update({f"fitur.{k}": ", ".join(map(str, v)) if isinstance(v, list) else v for k, v in r["features"].items()})
+            d.update({f"metrik.{k}": v for k, v in r["metrics"].items()})
+            d.update({f"waktu.{k}_s": v for k, v in r["timings"].items()})
+            cols[f"run #{r['id']}"] = d
+        return pd.DataFrame(cols)
@@ -0,0 +1,127 @@
+# score_cli.py — Batch scoring headless (tanpa Streamlit) untuk job terjadwal
+# Jalankan: python score_cli.py models/model_bundle_latest.pkl data/portofolio/ -o hasil/ --workers 32
+#
+# Input: file atau folder berisi CSV/Parquet/XLSX. Output (default: subfolder prediksi/ di folder input):
+# <nama>_prediksi.parquet per file input (+ <nama>_drift.csv jika config memuat drift_sketches).
+# File hasil (<nama>_prediksi / <nama>_drift) tidak pernah ikut di-scoring ulang oleh run berikutnya.
+# Jalur cleaning/default/CBD sama dengan expander batch di halaman Form Prediksi (inference.predict_frame).
+
+import argparse, json, os, sys, time
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+from canonical import tables_from_config, report_frame
+from drift import sketches_from_config
+from export import write_parquet
+from inference import DEFAULT_REQUIRED_COLS, PRED_COL, load_predictor, predict_frame
+
+SUPPORTED_SUFFIXES = {".csv", ".parquet", ".pq", ".xlsx", ".xls"}
+PRED_SUFFIX, DRIFT_SUFFIX = "_prediksi", "_drift"  # akhiran nama file output
+DEFAULT_OUTPUT_DIR = "prediksi"
+
+
+def is_output_file(path: Path) -> bool:
+    return path.stem.endswith((PRED_SUFFIX, DRIFT_SUFFIX))
+
+
+def list_inputs(path: Path) -> List[Path]:
+    if path.is_dir():
+        return sorted(p for p in path.iterdir()
+                      if p.is_file() and p.suffix.lower() in SUPPORTED_SUFFIXES and not is_output_file(p))
+    if path.suffix.lower() not in SUPPORTED_SUFFIXES:
+        raise SystemExit(f"Format tidak didukung: {path.name}")
+    return [path]
+
+
+def read_input(path: Path) -> pd.DataFrame:
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return pd.read_csv(path)
+    if suffix in (".parquet", ".pq"):
+        return pd.read_parquet(path)
+    return pd.read_excel(path)
+
+
+def load_config(bundle_path: Path, config_path=None):
+    if config_path:
+        return json.loads(Path(config_path).read_text(encoding="utf-8"))
+    default_cfg = bundle_path.parent / "config_latest.json"
+    if default_cfg.exists():
+        return json.loads(default_cfg.read_text(encoding="utf-8"))
+    return None
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Batch scoring nilai tanah dari file/folder (CSV/Parquet/XLSX).")
+    ap.add_argument("bundle", help="Path bundle/pipeline (.pkl/.joblib)")
+    ap.add_argument("input", help="File atau folder input")
+    ap.add_argument("-o", "--output", default=None, help=f"Folder output (default: <folder input>/{DEFAULT_OUTPUT_DIR}/)")
+    ap.add_argument("--config", default=None, help="Config JSON (default: config_latest.json di sebelah bundle)")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--chunk-rows", type=int, default=20_000)
+    ap.add_argument("--interval", type=float, default=None, metavar="LEVEL",
+                    help="Tambah kolom interval prediksi (mis. 0.8) untuk model RandomForest/ExtraTrees")
+    args = ap.parse_args(argv)
+
+    bundle_path = Path(args.bundle)
+    in_path = Path(args.input)
+    out_dir = Path(args.output) if args.output else (in_path if in_path.is_dir() else in_path.parent) / DEFAULT_OUTPUT_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    t0 = time.perf_counter()
+    model = load_predictor(bundle_path, mmap_mode="r")
+    if model is None:
+        print(f"Bundle tidak berisi model yang valid: {bundle_path}", file=sys.stderr)
+        return 1
+    cfg = load_config(bundle_path, args.config)
+    required_cols = cfg.get("required_cols", DEFAULT_REQUIRED_COLS) if isinstance(cfg, dict) else DEFAULT_REQUIRED_COLS
+    canon_tables = tables_from_config(cfg)
+    drift_sketches = sketches_from_config(cfg)
+    interval = None
+    if args.interval:
+        interval = {"level": args.interval,
+                    "calibration": cfg.get("interval_calibration") if isinstance(cfg, dict) else None}
+    t_load = time.perf_counter() - t0
+
+    timings = {"read": 0.0, "score": 0.0, "write": 0.0}
+    n_rows = 0
+    files = list_inputs(in_path)
+    for f in files:
+        t = time.perf_counter(); df = read_input(f); timings["read"] += time.perf_counter() - t
+        t = time.perf_counter()
+        out = predict_frame(model, df, required_cols, n_workers=args.workers,
+                            chunk_rows=args.chunk_rows, bundle_path=bundle_path, canon_tables=canon_tables,
+                            interval=interval, drift_sketches=drift_sketches)
+        timings["score"] += time.perf_counter() - t
+        pred_path = out_dir / f"{f.stem}{PRED_SUFFIX}.parquet"
+        t = time.perf_counter(); write_parquet(out, pred_path); timings["write"] += time.perf_counter() - t
+        n_rows += len(out)
+        print(f"  {f.name}: {len(out):,} baris → {pred_path} (rata-rata {PRED_COL}: {out[PRED_COL].mean():,.0f})")
+        rep = report_frame(out.attrs.get("canon_report", {}))
+        for _, r in rep[rep["baris_tak_terpetakan"] > 0].iterrows():
+            print(f"    ! {r['kolom']}: {r['baris_tak_terpetakan']:,} baris tak terpetakan ({r['contoh_nilai']})")
+        for _, r in rep[rep["baris_dipetakan_ulang"] > 0].iterrows():
+            print(f"    > {r['kolom']}: {r['baris_dipetakan_ulang']:,} baris dipetakan ulang ({r['contoh_pemetaan']})")
+        if out.attrs.get("drift") is not None:
+            drift_rep = out.attrs["drift"].report()
+            drift_rep.to_csv(out_dir / f"{f.stem}{DRIFT_SUFFIX}.csv", index=False)
+            for _, r in drift_rep[drift_rep["status"].isin(["sedang", "tinggi"])].iterrows():
+                print(f"    ~ drift {r['status']}: {r['kolom']} (PSI {r['psi']:.3f})")
+
+    total = time.perf_counter() - t0
+    print("\nRingkasan")
+    print(f"  file        : {len(files)}")
+    print(f"  baris       : {n_rows:,}")
+    print(f"  workers     : {args.workers}")
+    print(f"  load model  : {t_load:.2f} s")
+    for k, v in timings.items():
+        print(f"  {k:<12}: {v:.2f} s")
+    print(f"  total       : {total:.2f} s")
+    print(f"  throughput  : {n_rows / timings['score'] if timings['score'] > 0 else 0:,.0f} baris/s (scoring)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
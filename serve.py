@@ -0,0 +1,201 @@
+# serve.py — HTTP service prediksi (lokal) dengan micro-batching request
+# Jalankan: python serve.py --port 8765 --max-batch 256 --max-wait-ms 5
+#
+# POST /predict   body: {"rows": [{...kolom DEFAULT_REQUIRED_COLS...}, ...]} atau satu objek baris
+#                 resp: {"predictions": [...]}
+# GET  /health    resp: status model + statistik batch
+
+import argparse, json, logging, queue, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from canonical import tables_from_config
+from inference import (
+    DEFAULT_REQUIRED_COLS, clean_and_standardize_data, enrich_cbd, load_default_model_and_config,
+)
+
+logger = logging.getLogger("serve")
+
+# Kolom yang boleh tidak dikirim karena bisa diturunkan dari latitude/longitude
+DERIVABLE_COLS = {"nama_cbd", "jarak_cbd"}
+
+
+class _Pending:
+    __slots__ = ("df", "event", "result", "error")
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class MicroBatcher:
+    """
+    Gabungkan request yang datang bersamaan jadi satu panggilan `predict_fn`.
+    Batch dikirim saat jumlah baris ≥ `max_batch_rows` atau `max_wait_ms` sejak request pertama habis.
+    """
+    def __init__(self, predict_fn: Callable[[pd.DataFrame], np.ndarray],
+                 max_batch_rows: int = 256, max_wait_ms: float = 5.0):
+        self.predict_fn = predict_fn
+        self.max_batch_rows = int(max_batch_rows)
+        self.max_wait_s = float(max_wait_ms) / 1000.0
+        self._q: "queue.Queue[_Pending]" = queue.Queue()
+        self._lock = threading.Lock()
+        self.stats = {"batches": 0, "rows": 0, "requests": 0, "predict_s": 0.0}
+        self._thread = threading.Thread(target=self._loop, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, df: pd.DataFrame, timeout: Optional[float] = 30.0) -> np.ndarray:
+        item = _Pending(df)
+        self._q.put(item)
+        if not item.event.wait(timeout):
+            raise TimeoutError("Prediksi melewati batas waktu.")
+        if item.error is not None:
+            raise item.error
+        return item.result
+
+    def _collect(self) -> List[_Pending]:
+        batch = [self._q.get()]
+        rows = len(batch[0].df)
+        deadline = time.monotonic() + self.max_wait_s
+        while rows < self.max_batch_rows:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._q.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item); rows += len(item.df)
+        return batch
+
+    def _run(self, batch: List[_Pending]):
+        t0 = time.perf_counter()
+        try:
+            preds = np.asarray(self.predict_fn(pd.concat([b.df for b in batch], ignore_index=True)))
+            offset = 0
+            for b in batch:
+                b.result = preds[offset:offset + len(b.df)]; offset += len(b.df)
+        except Exception:
+            # Satu request rusak jangan menggagalkan request lain di batch yang sama
+            for b in batch:
+                try: b.result = np.asarray(self.predict_fn(b.df))
+                except Exception as e: b.error = e
+        with self._lock:
+            self.stats["batches"] += 1
+            self.stats["requests"] += len(batch)
+            self.stats["rows"] += sum(len(b.df) for b in batch)
+            self.stats["predict_s"] += time.perf_counter() - t0
+        for b in batch:
+            b.event.set()
+
+    def _loop(self):
+        while True:
+            self._run(self._collect())
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            s = dict(self.stats)
+        s["avg_batch_rows"] = (s["rows"] / s["batches"]) if s["batches"] else 0.0
+        return s
+
+
+def make_predict_fn(model, required_cols: List[str], canon_tables=None) -> Callable[[pd.DataFrame], np.ndarray]:
+    def _predict(df: pd.DataFrame) -> np.ndarray:
+        df = clean_and_standardize_data(enrich_cbd(df), canon_tables)
+        return model.predict(df[required_cols])
+    return _predict
+
+
+def rows_to_frame(payload, required_cols: List[str]) -> pd.DataFrame:
+    rows = payload.get("rows", payload) if isinstance(payload, dict) else payload
+    if isinstance(rows, dict):
+        rows = [rows]
+    if not isinstance(rows, list) or not rows or not all(isinstance(r, dict) for r in rows):
+        raise ValueError("Body harus berisi objek baris atau {'rows': [...]}.")
+    df = pd.DataFrame.from_records(rows)
+    has_latlon = {"latitude", "longitude"} <= set(df.columns)
+    missing = [c for c in required_cols if c not in df.columns and not (has_latlon and c in DERIVABLE_COLS)]
+    if missing:
+        raise ValueError(f"Kolom wajib tidak ada: {missing}")
+    return df
+
+
+class PredictHandler(BaseHTTPRequestHandler):
+    batcher: MicroBatcher = None
+    required_cols: List[str] = DEFAULT_REQUIRED_COLS
+
+    def _send(self, code: int, body: dict):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/health":
+            self._send(200, {"status": "ok", "required_cols": self.required_cols, **self.batcher.snapshot()})
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/predict":
+            self._send(404, {"error": "not found"}); return
+        try:
+            n = int(self.headers.get("Content-Length", 0))
+            df = rows_to_frame(json.loads(self.rfile.read(n) or b"null"), self.required_cols)
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send(400, {"error": str(e)}); return
+        try:
+            preds = self.batcher.submit(df)
+        except Exception as e:
+            logger.exception("Prediksi gagal")
+            self._send(500, {"error": str(e)}); return
+        self._send(200, {"predictions": [float(v) for v in preds]})
+
+    def log_message(self, fmt, *args):
+        logger.debug("%s - " + fmt, self.address_string(), *args)
+
+
+class PredictServer(ThreadingHTTPServer):
+    # backlog default (5) terlalu kecil untuk ratusan request/detik
+    request_queue_size = 256
+    daemon_threads = True
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="HTTP service prediksi nilai tanah (micro-batching).")
+    ap.add_argument("--models-dir", default=str(Path(__file__).resolve().parent / "models"))
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--max-batch", type=int, default=256, help="Maksimum baris per panggilan predict")
+    ap.add_argument("--max-wait-ms", type=float, default=5.0, help="Maksimum tunggu untuk mengisi batch")
+    args = ap.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    model, cfg = load_default_model_and_config(args.models_dir)
+    if model is None:
+        raise SystemExit(f"Model tidak ditemukan di {args.models_dir}")
+    required_cols = cfg.get("required_cols", DEFAULT_REQUIRED_COLS) if isinstance(cfg, dict) else DEFAULT_REQUIRED_COLS
+
+    PredictHandler.batcher = MicroBatcher(make_predict_fn(model, required_cols, tables_from_config(cfg)), args.max_batch, args.max_wait_ms)
+    PredictHandler.required_cols = list(required_cols)
+    server = PredictServer((args.host, args.port), PredictHandler)
+    logger.info("Service siap di http://%s:%d (max_batch=%d, max_wait_ms=%.1f)",
+                args.host, args.port, args.max_batch, args.max_wait_ms)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# tests/conftest.py — fixture bersama: data listing sintetis (skema models/config_latest.json) + pipeline kecil
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+for p in (ROOT, ROOT / "benchmarks"):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.pipeline import Pipeline
+
+from synth import load_schema, synthetic_frame
+from training_pipeline import build_preprocess
+
+
+@pytest.fixture(scope="session")
+def schema():
+    return load_schema()
+
+
+@pytest.fixture(scope="session")
+def features(schema):
+    return list(dict.fromkeys(schema["numeric_feats"] + schema["onehot_feats"]
+                              + schema["freq_feats"] + schema["addr_feats"]))
+
+
+@pytest.fixture(scope="session")
+def listings(schema):
+    return synthetic_frame(800, schema, seed=0)
+
+
+def fit_forest(schema, features, df, n_estimators=20, seed=0):
+    prep = build_preprocess(schema["numeric_feats"], schema["onehot_feats"], schema["freq_feats"],
+                            schema["addr_feats"], int(schema["top_n_addr"]))
+    model = Pipeline([("prep", prep), ("reg", RandomForestRegressor(n_estimators=n_estimators, max_depth=8,
+                                                                    random_state=seed, n_jobs=1))])
+    return model.fit(df[features], df[schema["target_col"]])
+
+
+@pytest.fixture(scope="session")
+def forest(schema, features, listings):
+    return fit_forest(schema, features, listings)
@@ -0,0 +1,23 @@
+# tests/test_audit_log.py — audit trail prediksi: antrean di memori, writer background, SQLite append-only
+import pandas as pd
+
+from audit_log import AuditLogger
+
+
+def test_events_are_written_in_order(tmp_path):
+    log = AuditLogger(tmp_path / "audit.sqlite")
+    assert log.log_single(pd.DataFrame({"luas": [100.0]}), 1e9, "v1", "s1", lower=8e8, upper=1.2e9)
+    assert log.log_batch(pd.DataFrame({"luas": [10.0, 20.0]}), [1.0, 2.0], "v1", "s1", source="batch.csv")
+    assert log.flush()
+    log.close()
+    rows = log.recent().sort_values("id")
+    assert rows["kind"].tolist() == ["single", "batch", "batch"]
+    assert rows["prediction"].tolist() == [1e9, 1.0, 2.0]
+    assert log.metrics()["written_rows"] == 3
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    log = AuditLogger(tmp_path / "audit.sqlite", max_queue_rows=5)
+    log.close()  # writer berhenti → event baru ditolak tanpa menunggu
+    assert not log.log_batch(pd.DataFrame({"luas": range(10)}), range(10))
+    assert log.metrics()["dropped_rows"] == 10
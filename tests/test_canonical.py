@@ -0,0 +1,42 @@
+# tests/test_canonical.py — tabel kanonikalisasi: hanya lipat ejaan bawaan, sinonim dari config, laporan pemetaan
+import json
+
+import pandas as pd
+
+from canonical import (canonicalize_frame, compile_canon_tables, load_synonyms, merge_reports, report_frame,
+                       tables_from_config)
+
+CATS = {"sumber_data": ["Eksternal", "Internal"], "kondisi_jalan": ["Baik", "Sedang", "Jelek/Rusak"]}
+
+
+def test_builtin_tables_only_fold_spelling():
+    tables = compile_canon_tables(CATS)
+    df, rep = canonicalize_frame(pd.DataFrame({"sumber_data": [" eksternal", "INTERNAL", "Iklan"],
+                                               "kondisi_jalan": ["jelek / rusak", "cukup", None]}), tables)
+    assert df["sumber_data"].tolist() == ["Eksternal", "Internal", "Iklan"]
+    assert df["kondisi_jalan"].tolist()[:2] == ["Jelek/Rusak", "cukup"]
+    assert rep["sumber_data"]["unmapped_values"] == {"Iklan": 1}
+    assert rep["kondisi_jalan"]["unmapped_values"] == {"cukup": 1}
+    assert rep["sumber_data"]["remapped_rows"] == 0  # lipat kapitalisasi/spasi bukan pemetaan ulang
+
+
+def test_config_synonyms_are_applied_and_reported(tmp_path):
+    path = tmp_path / "category_synonyms.json"
+    path.write_text(json.dumps({"sumber_data": {"iklan": "Eksternal", "x": "Tidak Ada"}}), encoding="utf-8")
+    synonyms = load_synonyms(path)
+    tables = tables_from_config({"ohe_categories": CATS, "synonyms": synonyms})
+    assert "x" not in tables["sumber_data"]["lookup"]  # target bukan kategori training → diabaikan
+    df, rep = canonicalize_frame(pd.DataFrame({"sumber_data": ["Iklan", "Iklan", "Internal"]}), tables, fuzzy_cutoff=1.0)
+    assert df["sumber_data"].tolist() == ["Eksternal", "Eksternal", "Internal"]
+    assert rep["sumber_data"]["remapped_values"] == {"Iklan → Eksternal": 2}
+    assert load_synonyms(tmp_path / "tidak_ada.json") == {}
+
+
+def test_consolidation_and_merged_report():
+    tables = compile_canon_tables(CATS, consolidation={"kondisi_jalan": {"becek": "Lainnya (jarang)"}})
+    parts = [canonicalize_frame(pd.DataFrame({"kondisi_jalan": vals}), tables, fuzzy_cutoff=1.0)[1]
+             for vals in (["becek", "baik"], ["becek", "??"])]
+    rep = report_frame(merge_reports(parts)).set_index("kolom")
+    assert rep.loc["kondisi_jalan", "baris_dipetakan_ulang"] == 2
+    assert rep.loc["kondisi_jalan", "contoh_pemetaan"] == "becek → Lainnya (jarang)"
+    assert rep.loc["kondisi_jalan", "baris_tak_terpetakan"] == 1
@@ -0,0 +1,40 @@
+# tests/test_comps.py — indeks pembanding: urutan = brute force, kategori berbeda menurunkan peringkat
+import numpy as np
+import pandas as pd
+
+from comps import ComparablesIndex, build_comps_index
+
+
+def _brute_force(index: ComparablesIndex, df: pd.DataFrame, row: pd.DataFrame, k: int) -> np.ndarray:
+    d2 = ((index._vectors(df) - index._vectors(row)) ** 2).sum(axis=1)
+    d2 = d2 + (index._cat_codes(df) != index._cat_codes(row)[0]).sum(axis=1) * index.cat_weight ** 2
+    return np.sort(np.sqrt(d2))[:k]
+
+
+def test_query_matches_brute_force(schema, listings):
+    y = listings[schema["target_col"]]
+    index = build_comps_index(listings, y, schema["numeric_feats"], schema["onehot_feats"])
+    index.oversample = len(listings)  # kandidat = semua baris → hasil harus persis brute force
+    row = listings.iloc[[11]]
+    res = index.query(row, k=5)
+    assert res["harga"].iloc[0] == y.iloc[11] and res["skor_kemiripan"].iloc[0] == 1.0  # dirinya sendiri
+    np.testing.assert_allclose(1 / res["skor_kemiripan"] - 1, _brute_force(index, listings, row, 5),
+                               rtol=5e-3)  # skor dibulatkan 3 desimal
+    np.testing.assert_allclose(res["rp_per_m2"], res["harga"] / res["luas"].astype(float), rtol=1e-6)
+
+
+def test_category_mismatch_ranks_lower(schema, listings):
+    base = listings.iloc[[0]]
+    df = pd.concat([base.assign(dokumen_kepemilikan="SHM"), base.assign(dokumen_kepemilikan="Girik")],
+                   ignore_index=True)
+    index = ComparablesIndex(numeric_cols=["luas", "jarak_ke_jalan"], cat_cols=["dokumen_kepemilikan"]).fit(
+        df, pd.Series([1e9, 2e9]))
+    # ejaan berbeda tetap cocok (norm_key)
+    res = index.query(base.assign(dokumen_kepemilikan=" shm "), k=2)
+    assert res["dokumen_kepemilikan"].tolist() == ["SHM", "Girik"]
+    assert res["skor_kemiripan"].iloc[0] > res["skor_kemiripan"].iloc[1]
+
+
+def test_no_coordinates_no_index(schema, listings):
+    df = listings.drop(columns=["latitude", "longitude"])
+    assert build_comps_index(df, listings[schema["target_col"]], schema["numeric_feats"], schema["onehot_feats"]) is None
@@ -0,0 +1,51 @@
+# tests/test_drift.py — sketsa training + DriftMonitor (PSI, porsi nilai baru, penggabungan antar potongan)
+import numpy as np
+import pandas as pd
+import pytest
+
+from drift import DriftMonitor, build_sketches, merge_monitors
+
+
+@pytest.fixture()
+def sketches():
+    rng = np.random.default_rng(0)
+    train = pd.DataFrame({"luas": rng.lognormal(5, 0.5, 5000), "kota": rng.choice(["A", "B", "C"], 5000)})
+    return build_sketches(train, ["luas"], ["kota"])
+
+
+def _report(monitor):
+    return monitor.report().set_index("kolom")
+
+
+def test_same_distribution_is_stable(sketches):
+    rng = np.random.default_rng(1)
+    batch = pd.DataFrame({"luas": rng.lognormal(5, 0.5, 5000), "kota": rng.choice(["a ", "B", "c"], 5000)})
+    rep = _report(DriftMonitor(sketches).update(batch))
+    assert (rep["status"] == "stabil").all()
+    assert rep.loc["kota", "porsi_baru"] == 0
+
+
+def test_shifted_numeric_is_flagged(sketches):
+    rng = np.random.default_rng(2)
+    rep = _report(DriftMonitor(sketches).update(pd.DataFrame({"luas": rng.lognormal(6, 0.5, 5000), "kota": "A"})))
+    assert rep.loc["luas", "status"] == "tinggi"
+    assert rep.loc["luas", "ks"] > 0.5
+
+
+def test_high_cardinality_new_values_are_fully_counted(sketches):
+    # 1000 nilai baru berbeda (> max_examples*4) di 2 potongan + 1000 baris lama
+    new = pd.DataFrame({"luas": 150.0, "kota": [f"kota_{i}" for i in range(1000)]})
+    parts = [DriftMonitor(sketches, max_examples=5).update(new.iloc[:500]),
+             DriftMonitor(sketches, max_examples=5).update(new.iloc[500:]),
+             DriftMonitor(sketches, max_examples=5).update(pd.DataFrame({"luas": 150.0, "kota": ["A"] * 1000}))]
+    rep = _report(merge_monitors(parts))
+    assert rep.loc["kota", "porsi_baru"] == pytest.approx(0.5)
+    assert len(rep.loc["kota", "contoh_baru"].split(", ")) == 5
+
+
+def test_merge_matches_single_pass(sketches):
+    rng = np.random.default_rng(3)
+    batch = pd.DataFrame({"luas": rng.lognormal(5.3, 0.6, 3000), "kota": rng.choice(["A", "B", "D"], 3000)})
+    whole = DriftMonitor(sketches).update(batch).report()
+    merged = merge_monitors(DriftMonitor(sketches).update(batch.iloc[i:i + 700]) for i in range(0, 3000, 700)).report()
+    pd.testing.assert_frame_equal(whole.drop(columns="contoh_baru"), merged.drop(columns="contoh_baru"))
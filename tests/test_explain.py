@@ -0,0 +1,78 @@
+# tests/test_explain.py — penjelasan batch: blok perturbasi = predict per varian, atribusi pohon menjumlah ke prediksi
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.pipeline import Pipeline
+
+from explain import (EFFECT_COL, FACTOR_COL, explain_categorical_contrast, explain_frame, explain_numeric_local,
+                     perturbation_effects, tree_attributions)
+from training_pipeline import LGBM_OK, build_estimator, build_preprocess
+
+PCT = 0.1
+SKIP = ["latitude", "longitude", "nama_cbd"]
+
+
+@pytest.fixture(scope="module")
+def choices(listings, schema):
+    return {c: sorted(listings[c].dropna().unique().tolist()) for c in schema["onehot_feats"]}
+
+
+def test_numeric_effects_match_naive_predict(forest, listings, features):
+    row = listings[features].iloc[[4]]
+    rep = explain_numeric_local(forest, row, PCT, skip_cols=SKIP).set_index("feature")
+    base = forest.predict(row)[0]
+    for col in ("luas", "jarak_cbd"):
+        v = float(row[col].iloc[0])
+        up = forest.predict(row.assign(**{col: v + PCT * abs(v)}))[0]
+        down = forest.predict(row.assign(**{col: v - PCT * abs(v)}))[0]
+        assert rep.loc[col, "effect_up"] == pytest.approx(up - base)
+        assert rep.loc[col, "effect_down"] == pytest.approx(down - base)
+    assert not set(SKIP) & set(rep.index)
+
+
+def test_categorical_contrast_match_naive_predict(forest, listings, features, choices):
+    row = listings[features].iloc[[4]]
+    rep = explain_categorical_contrast(forest, row, choices, skip_cols=SKIP).set_index("feature")
+    base = forest.predict(row)[0]
+    col = "dokumen_kepemilikan"
+    alts = [a for a in choices[col] if a != row[col].iloc[0]]
+    preds = np.array([forest.predict(row.assign(**{col: a}))[0] for a in alts])
+    assert rep.loc[col, "n_valid_alts"] == len(alts)
+    assert rep.loc[col, "delta_vs_avg_alt"] == pytest.approx(base - preds.mean())
+    assert rep.loc[col, "best_alt"] == alts[int(np.argmax(np.abs(preds - base)))]
+
+
+def test_batch_blocks_do_not_change_effects(forest, listings, features, choices):
+    X = listings[features].iloc[:60]
+    big = perturbation_effects(forest, X, PCT, choices, SKIP)
+    small = perturbation_effects(forest, X, PCT, choices, SKIP, block_rows=200)  # banyak blok kecil
+    pd.testing.assert_frame_equal(big, small)
+    # baris ke-i batch = panel satu baris
+    local = explain_numeric_local(forest, X.iloc[[7]], PCT, skip_cols=SKIP).set_index("feature")
+    for col in ("luas", "jarak_ke_jalan"):
+        assert abs(big[col].iloc[7]) == pytest.approx(local.loc[col, "abs_effect"])
+
+
+def test_explain_frame_top_k(forest, listings, features, choices):
+    X = listings[features].iloc[:30]
+    out = explain_frame(forest, X, PCT, choices, SKIP, top_k=3)
+    assert out.attrs["method"] == "perturbation" and list(out.index) == list(X.index)
+    assert list(out.columns) == [f(i) for i in (1, 2, 3) for f in (FACTOR_COL.format, EFFECT_COL.format)]
+    eff = perturbation_effects(forest, X, PCT, choices, SKIP)
+    assert (out[FACTOR_COL.format(1)] == eff.abs().idxmax(axis=1)).all()
+    assert (out[EFFECT_COL.format(1)].abs() >= out[EFFECT_COL.format(2)].abs()).all()
+
+
+@pytest.mark.skipif(not LGBM_OK, reason="lightgbm tidak terpasang")
+def test_tree_attributions_sum_to_prediction(schema, features, listings, choices):
+    prep = build_preprocess(schema["numeric_feats"], schema["onehot_feats"], schema["freq_feats"],
+                            schema["addr_feats"], int(schema["top_n_addr"]))
+    model = Pipeline([("prep", prep), ("reg", build_estimator("LightGBM", {"n_estimators": 30}, random_state=0))])
+    model.fit(listings[features], listings[schema["target_col"]])
+    X = listings[features].iloc[:40]
+    contrib = tree_attributions(model, X)
+    assert set(contrib.columns) <= set(features)
+    pred = model.predict(X)
+    bias = pred - contrib.sum(axis=1).to_numpy()
+    np.testing.assert_allclose(bias, bias[0], rtol=1e-6)  # sisa = nilai harapan (sama untuk semua baris)
+    assert explain_frame(model, X, PCT, choices, SKIP).attrs["method"] == "attribution"
@@ -0,0 +1,78 @@
+# tests/test_export.py — ekspor per potongan: isi file sama dengan frame, sheet Excel dipecah per batas baris
+import gzip
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import export
+from export import (EXCEL_MAX_ROWS, PARQUET_OK, XLSX_OK, available_formats, deferred_reader, discard_export,
+                    excel_sheet_parts, export_frames)
+
+
+@pytest.fixture
+def frame():
+    df = pd.DataFrame({"Prediksi": np.arange(7, dtype=float) * 1.5e8,
+                       "kota": ["Bandung", "Depok", None, "Bogor", "Bekasi", "Depok", "Bandung"],
+                       "campur": [1, "dua", 3.5, None, "lima", 6, "tujuh"]})
+    df.attrs["drift"] = {"tidak": "diekspor"}
+    return df
+
+
+def test_sheet_parts_split_at_excel_limit():
+    assert excel_sheet_parts("Hasil", 10) == [("Hasil", 0, 10)]
+    parts = excel_sheet_parts("x" * 40, EXCEL_MAX_ROWS + 5)
+    assert [p[0] for p in parts] == ["x" * 31, "x" * 27 + "_2"]
+    assert parts[0][2] == EXCEL_MAX_ROWS - 1 and parts[1][1:] == (EXCEL_MAX_ROWS - 1, EXCEL_MAX_ROWS + 5)
+
+
+def test_csv_gz_roundtrip(frame):
+    res = export_frames({"Hasil": frame}, "csv.gz", "prediksi", chunk_rows=3)
+    try:
+        assert res["rows"] == len(frame) and res["file_name"] == "prediksi.csv.gz"
+        with gzip.open(res["path"], "rt", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert lines[0] == "Prediksi,kota,campur" and len(lines) == len(frame) + 1  # header sekali saja
+        back = pd.read_csv(res["path"])
+        np.testing.assert_allclose(back["Prediksi"], frame["Prediksi"])
+        assert deferred_reader(res["path"])()[:2] == b"\x1f\x8b"
+    finally:
+        discard_export(res)
+    assert not os.path.exists(res["path"])
+
+
+@pytest.mark.skipif(not PARQUET_OK, reason="pyarrow tidak terpasang")
+@pytest.mark.filterwarnings("error")  # mis. Pandas4Warning select_dtypes(include="object")
+def test_parquet_roundtrip(frame):
+    res = export_frames({"Hasil": frame, "Lain": frame.head(1)}, "parquet", "hasil", chunk_rows=2)
+    try:
+        back = pd.read_parquet(res["path"])
+        assert len(back) == len(frame)
+        np.testing.assert_allclose(back["Prediksi"], frame["Prediksi"])
+        # kolom object campuran angka + teks ditulis sebagai string
+        assert back["campur"].dropna().tolist() == [str(v) for v in frame["campur"].dropna()]
+        assert back["campur"].isna().tolist() == frame["campur"].isna().tolist()
+    finally:
+        discard_export(res)
+
+
+@pytest.mark.skipif(not XLSX_OK, reason="openpyxl tidak terpasang")
+def test_excel_splits_sheets(frame, monkeypatch):
+    monkeypatch.setattr(export, "EXCEL_MAX_ROWS", 4)  # 3 baris data per sheet
+    res = export_frames({"Hasil": frame, "Drift": frame.head(2)}, "xlsx", "hasil", chunk_rows=2)
+    try:
+        assert res["sheets"] == {"Hasil": 3, "Drift": 1}
+        sheets = pd.read_excel(res["path"], sheet_name=None)
+        assert list(sheets) == ["Hasil", "Hasil_2", "Hasil_3", "Drift"]
+        hasil = pd.concat([sheets[k] for k in ("Hasil", "Hasil_2", "Hasil_3")], ignore_index=True)
+        np.testing.assert_allclose(hasil["Prediksi"], frame["Prediksi"])
+        assert hasil["kota"].isna().tolist() == frame["kota"].isna().tolist()
+    finally:
+        discard_export(res)
+
+
+def test_unknown_format_and_available():
+    with pytest.raises(ValueError):
+        export_frames({"Hasil": pd.DataFrame({"a": [1]})}, "json", "x")
+    assert "csv.gz" in available_formats()
@@ -0,0 +1,29 @@
+# tests/test_heatmap_tiles.py — tile heatmap: lookup per koordinat = prediksi model di pusat sel
+import numpy as np
+import pandas as pd
+
+from heatmap_tiles import DEFAULT_PROFILE, TileStore, build_tiles, list_tile_sets
+from inference import PRED_COL, predict_frame
+
+BBOX = (-6.30, -6.20, 106.75, 106.87)  # 10 × 12 sel @0.01° → 3 × 3 tile @4
+
+
+def test_tiles_lookup_and_mosaic(tmp_path, forest, features):
+    out = build_tiles(forest, {}, tmp_path, "v1", DEFAULT_PROFILE, bbox=BBOX, cell_deg=0.01, tile_size=4,
+                      n_workers=1)
+    assert list_tile_sets(tmp_path, "v1") == [out]
+    store = TileStore(out)
+    assert store.meta["n_rows"] == 10 and store.meta["n_cols"] == 12 and store.meta["n_tiles"] == [3, 3]
+
+    # sel (baris 5, kolom 9) → pusat sel; baris 0 = utara
+    lat, lon = BBOX[1] - 5.5 * 0.01, BBOX[2] + 9.5 * 0.01
+    df = pd.DataFrame([{k: v for k, v in DEFAULT_PROFILE.items() if k != "jarak_cbd"}])
+    df["latitude"], df["longitude"] = lat, lon
+    expected = predict_frame(forest, df, features, n_workers=1)[PRED_COL].iloc[0] / DEFAULT_PROFILE["luas"]
+    assert store.lookup(lat + 0.004, lon - 0.004) == np.float32(expected)
+    assert np.isnan(store.lookup(BBOX[1] + 0.01, lon))  # di luar bbox
+
+    full = store.mosaic()
+    assert full.shape == (10, 12) and not np.isnan(full).any()
+    assert full[5, 9] == np.float32(expected)
+    np.testing.assert_allclose(store.extent, [BBOX[2], BBOX[3], BBOX[0], BBOX[1]])
@@ -0,0 +1,51 @@
+# tests/test_incremental.py — pembaruan bertahap: ensemble lama tidak berubah, pohon/iterasi bertambah
+import copy
+
+import numpy as np
+import pytest
+from sklearn.pipeline import Pipeline
+
+from custom_transformers import FrequencyEncoder
+from incremental import check_old_members, n_members, update_pipeline
+from training_pipeline import CAT_OK, LGBM_OK, XGB_OK, build_estimator, build_preprocess
+
+ALGOS = ["RandomForest"] + (["XGBoost"] if XGB_OK else []) + (["LightGBM"] if LGBM_OK else []) \
+        + (["CatBoost"] if CAT_OK else [])
+PARAMS = {"n_estimators": 20, "iterations": 20, "max_depth": 6, "depth": 4}
+
+
+def _fit(algo, schema, features, df):
+    prep = build_preprocess(schema["numeric_feats"], schema["onehot_feats"], schema["freq_feats"],
+                            schema["addr_feats"], int(schema["top_n_addr"]))
+    model = Pipeline([("prep", prep), ("reg", build_estimator(algo, PARAMS, random_state=0))])
+    return model.fit(df[features], df[schema["target_col"]])
+
+
+@pytest.fixture(scope="module")
+def old_new(listings):
+    # data baru dengan pergeseran frekuensi kategori (baris kota tertentu diperbanyak)
+    new = listings.sample(400, replace=True, random_state=1)
+    return listings.iloc[:400], new.reset_index(drop=True)
+
+
+@pytest.mark.parametrize("algo", ALGOS)
+def test_update_keeps_old_ensemble(algo, schema, features, old_new):
+    old_df, new_df = old_new
+    base = _fit(algo, schema, features, old_df)
+    before = base.predict(old_df[features])
+    snapshot = copy.deepcopy(base)
+    model = update_pipeline(base, new_df[features], new_df[schema["target_col"]], n_add=10)
+    assert n_members(model) == n_members(base) + 10
+    np.testing.assert_allclose(base.predict(old_df[features]), before)  # pipeline asli tidak diubah
+    assert check_old_members(snapshot, model, old_df[features]) <= 1e-5
+    assert not np.allclose(model.predict(old_df[features]), before)  # pohon baru ikut memengaruhi
+
+
+def test_shifted_frequency_maps_are_detected(schema, features, forest, old_new):
+    old_df, new_df = old_new
+    model = update_pipeline(forest, new_df[features], new_df[schema["target_col"]], n_add=5)
+    for _, enc, cols in model.steps[0][1].transformers_:
+        if isinstance(enc, FrequencyEncoder):
+            enc.partial_fit(new_df[cols])  # perilaku lama: hitungan data baru ditambahkan
+    with pytest.raises(RuntimeError):
+        check_old_members(forest, model, old_df[features])
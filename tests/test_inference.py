@@ -0,0 +1,140 @@
+# tests/test_inference.py — batch scoring paralel (predict_frame + pool worker per versi model), loader default
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import joblib
+import numpy as np
+
+from conftest import ROOT, fit_forest
+import inference
+from inference import (PRED_COL, _POOLS, _RETIRED_POOLS, DefaultModelLoader, dump_bundle, get_default_loader, get_scoring_pool,
+                       load_bundle, model_version_of, predict_frame, promote_bundle, save_bundle, shutdown_pools)
+
+
+def _parallel(model, df, features, **kw):
+    return predict_frame(model, df, features, n_workers=2, chunk_rows=1000, min_parallel_rows=0, **kw)
+
+
+def test_parallel_matches_serial(forest, listings, features):
+    serial = predict_frame(forest, listings, features, n_workers=1)
+    parallel = _parallel(forest, listings, features)
+    assert list(parallel.index) == list(serial.index)
+    np.testing.assert_allclose(parallel[PRED_COL], serial[PRED_COL])
+
+
+def test_pool_reused_per_model(forest, listings, features):
+    _parallel(forest, listings.iloc[:100], features)
+    pool = get_scoring_pool(forest, 2)
+    _parallel(forest, listings.iloc[:100], features)
+    assert get_scoring_pool(forest, 2) is pool
+
+
+def test_concurrent_sessions_use_their_own_model(schema, forest, listings, features):
+    # dua "sesi" (thread) dengan model berbeda memakai pool masing-masing — tidak ada model global bersama
+    other = fit_forest(schema, features, listings, n_estimators=5, seed=1)
+    expected = {id(m): predict_frame(m, listings, features, n_workers=1)[PRED_COL] for m in (forest, other)}
+    with ThreadPoolExecutor(4) as ex:
+        jobs = [(m, ex.submit(_parallel, m, listings, features)) for m in (forest, other, forest, other)]
+        for m, job in jobs:
+            np.testing.assert_allclose(job.result()[PRED_COL], expected[id(m)])
+
+
+def test_bundle_path_workers(tmp_path, forest, listings, features):
+    path = tmp_path / "bundle.pkl"
+    joblib.dump({"pipeline": forest, "config": {}}, path)
+    out = _parallel(None, listings, features, bundle_path=path)
+    np.testing.assert_allclose(out[PRED_COL], predict_frame(forest, listings, features, n_workers=1)[PRED_COL])
+    shutdown_pools()
+    assert not _POOLS
+
+
+def test_mmap_bundle_predicts_same(tmp_path, forest, listings, features):
+    path = tmp_path / "bundle.pkl"
+    joblib.dump({"pipeline": forest, "config": {"algo": "RandomForest"}}, path)
+    bundle = load_bundle(path, mmap_mode="r")
+    assert bundle["config"]["algo"] == "RandomForest"
+    np.testing.assert_array_equal(bundle["pipeline"].predict(listings[features]), forest.predict(listings[features]))
+
+
+def test_default_loader_warms_up_in_background(tmp_path, forest, features):
+    models = tmp_path / "models"
+    models.mkdir()
+    joblib.dump({"pipeline": forest, "config": {}}, models / "model_bundle_latest.pkl")
+    (models / "config_latest.json").write_text(json.dumps({"required_cols": features}), encoding="utf-8")
+    loader = get_default_loader(models)
+    assert get_default_loader(models) is loader  # satu loader per folder per proses
+    assert loader.wait(120) and loader.ready
+    assert loader.version == model_version_of(models / "model_bundle_latest.pkl")
+    assert {"load_s", "warmup_s", "rss_mb"} <= set(loader.metrics)
+
+    missing = DefaultModelLoader(tmp_path / "kosong").start()
+    assert missing.wait(30) and missing.state == "failed" and isinstance(missing.error, FileNotFoundError)
+
+
+def test_overwrite_keeps_mmapped_bundle_alive(tmp_path):
+    # menimpa file yang sedang di-mmap di tempat → SIGBUS; dump_bundle (tmp + os.replace) tidak
+    script = (
+        "import joblib, numpy as np\n"
+        "from sklearn.dummy import DummyRegressor\n"
+        "from inference import dump_bundle, load_bundle\n"
+        f"p = {str(tmp_path / 'bundle.pkl')!r}\n"
+        "m = DummyRegressor().fit([[0]], [1])\n"
+        "joblib.dump({'pipeline': m, 'comps': np.ones(2_000_000)}, p)\n"
+        "b = load_bundle(p, mmap_mode='r')\n"
+        "dump_bundle({'pipeline': m, 'comps': np.ones(10)}, p)\n"
+        "print(int(b['comps'].sum()), int(load_bundle(p)['comps'].sum()))\n")
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.split() == ["2000000", "10"]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_default_loader_reloads_after_promote(tmp_path, schema, forest, listings, features):
+    models = tmp_path / "models"
+    dump_bundle({"pipeline": forest, "config": {}}, models / "model_bundle_latest.pkl")
+    old = get_default_loader(models)
+    assert old.wait(120) and old.model is not None
+
+    other = fit_forest(schema, features, listings, n_estimators=5, seed=1)
+    promote_bundle(save_bundle({"pipeline": other, "config": {"algo": "baru"}}, tmp_path / "baru.pkl"), models)
+    deadline = time.time() + 120
+    while (loader := get_default_loader(models)) is old and time.time() < deadline:
+        assert old.ready  # model lama tetap melayani selama pengganti dimuat
+        time.sleep(0.05)
+    assert loader is not old and loader.ready and loader.cfg == {"algo": "baru"}
+    assert loader.version == model_version_of(models / "model_bundle_latest.pkl") != old.version
+    np.testing.assert_allclose(loader.model.predict(listings[features]), other.predict(listings[features]))
+    assert get_default_loader(models) is loader
+
+
+def test_evicted_pool_finishes_jobs_then_exits(monkeypatch, schema, forest, listings, features):
+    monkeypatch.setattr(inference, "MAX_POOLS", 1)
+    shutdown_pools()
+    old = get_scoring_pool(forest, 2)
+    job = old.apply_async(time.sleep, (0.5,))
+    other = fit_forest(schema, features, listings, n_estimators=5, seed=2)
+    get_scoring_pool(other, 2)  # melebihi MAX_POOLS → pool lama pensiun
+    assert old in _RETIRED_POOLS and len(_POOLS) == 1
+    job.get(timeout=60)  # job yang sudah masuk tetap selesai
+    deadline = time.time() + 60
+    while old in _RETIRED_POOLS and time.time() < deadline:
+        time.sleep(0.05)
+    assert old not in _RETIRED_POOLS and not any(w.is_alive() for w in old._pool)
+    shutdown_pools()
+
+
+def test_default_loader_bundle_path_only_for_its_model(tmp_path, forest, listings, features):
+    models = tmp_path / "models"
+    dump_bundle({"pipeline": forest, "config": {}}, models / "model_bundle_latest.pkl")
+    loader = DefaultModelLoader(models).start()
+    assert loader.wait(120) and loader.ready
+    assert loader.bundle_path_for(loader.model) == models / "model_bundle_latest.pkl"
+    assert loader.bundle_path_for(forest) is None and loader.bundle_path_for(None) is None
+    out = _parallel(loader.model, listings, features, bundle_path=loader.bundle_path_for(loader.model))
+    np.testing.assert_allclose(out[PRED_COL], predict_frame(forest, listings, features, n_workers=1)[PRED_COL])
+    dump_bundle({"pipeline": forest, "config": {"baru": 1}}, models / "model_bundle_latest.pkl")
+    assert loader.bundle_path_for(loader.model) is None  # file sudah versi lain → worker tidak boleh memuatnya
+    shutdown_pools()
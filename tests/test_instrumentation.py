@@ -0,0 +1,69 @@
+# tests/test_instrumentation.py — timing & memori per tahap
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from instrumentation import _RSS_SAMPLABLE, begin_run, records, stage, timed
+
+
+def _busy(seconds: float):
+    t = time.perf_counter()
+    while time.perf_counter() - t < seconds:
+        pass
+
+
+def test_disabled_stage_records_nothing():
+    begin_run(False)
+    with stage("x"):
+        pass
+    assert records() == []
+
+
+def test_nested_records_and_decorator():
+    begin_run(True)
+
+    @timed("inner")
+    def inner():
+        return 1
+
+    with stage("outer", rows=3):
+        inner()
+    recs = records()
+    assert [(r["stage"], r["depth"]) for r in recs] == [("inner", 1), ("outer", 0)]
+    assert recs[1]["rows"] == 3
+
+
+def test_cpu_is_per_thread():
+    # thread lain sibuk → CPU tahap yang hanya menunggu tetap ≈ 0
+    begin_run(True)
+    t = threading.Thread(target=_busy, args=(0.3,))
+    with stage("wait"):
+        t.start()
+        t.join()
+    rec = records()[-1]
+    assert rec["wall_s"] >= 0.25
+    assert rec["cpu_s"] < 0.1
+
+
+@pytest.mark.skipif(not _RSS_SAMPLABLE, reason="butuh /proc/self/statm")
+def test_peak_survives_other_threads_stages():
+    begin_run(True)
+    seen = {}
+
+    def other():
+        begin_run(True)
+        with stage("other"):
+            pass
+        seen["done"] = True
+
+    with stage("alloc"):
+        a = np.ones(200 * 2**20 // 8)  # ~200 MB, halaman disentuh
+        time.sleep(0.1)
+        del a
+        t = threading.Thread(target=other)
+        t.start()
+        t.join()
+    assert seen["done"]
+    assert records()[-1]["peak_rss_delta_mb"] > 150
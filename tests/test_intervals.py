@@ -0,0 +1,59 @@
+# tests/test_intervals.py — output per-pohon, kalibrasi interval (split-conformal), evaluasi pohon progresif
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from conftest import fit_forest
+from intervals import (calibrate_intervals, interval_bounds, progressive_tree_predictions, supports_intervals,
+                       tree_predictions)
+
+
+def test_tree_predictions_mean_equals_predict(forest, features, listings):
+    X = listings[features].iloc[:100]
+    per_tree = tree_predictions(forest, X)
+    assert per_tree.shape == (100, len(forest.steps[-1][1].estimators_))
+    np.testing.assert_allclose(per_tree.mean(axis=1), forest.predict(X), rtol=1e-9)
+
+
+def test_non_forest_has_no_intervals():
+    X = np.arange(20, dtype=float).reshape(-1, 1)
+    model = LinearRegression().fit(X, X[:, 0])
+    assert not supports_intervals(model)
+    assert tree_predictions(model, X) is None
+    with pytest.raises(ValueError):
+        next(progressive_tree_predictions(model, X))
+
+
+def test_calibration_restores_coverage():
+    # sebaran antar pohon terlalu sempit dibanding galat sebenarnya → coverage mentah jauh di bawah nominal
+    rng = np.random.default_rng(0)
+    mu = rng.uniform(1e8, 1e9, 4000)
+    per_tree = mu[:, None] + rng.normal(0, 0.5, (4000, 50)) * mu[:, None] * 0.05
+    y = mu + rng.normal(0, 2, 4000) * mu * 0.05
+    cal = calibrate_intervals(per_tree, y, levels=(0.8, 0.9))
+    for level in (0.8, 0.9):
+        rep = cal["levels"][f"{level:.2f}"]
+        assert rep["coverage_raw"] < level - 0.2
+        assert rep["scale"] > 1
+        assert abs(rep["coverage_calibrated"] - level) < 0.03
+        lo, hi = interval_bounds(per_tree, level, cal)
+        assert abs(np.mean((y >= lo) & (y <= hi)) - level) < 0.03
+        raw_lo, raw_hi = interval_bounds(per_tree, level)
+        assert np.all(hi - lo >= raw_hi - raw_lo)
+
+
+def test_progressive_all_trees_matches_predict(forest, features, listings):
+    X = listings[features].iloc[:50]
+    steps = list(progressive_tree_predictions(forest, X, chunk_trees=8, rel_tol=0, min_trees=1))
+    assert [s["n_trees"] for s in steps] == [8, 16, 20]
+    assert steps[-1]["reason"] == "semua_pohon"
+    np.testing.assert_allclose(steps[-1]["mean"], forest.predict(X), rtol=1e-9)
+
+
+def test_progressive_stops_early(schema, features, listings):
+    X = listings[features].iloc[:20]
+    model = fit_forest(schema, features, listings, n_estimators=100)
+    steps = list(progressive_tree_predictions(model, X, chunk_trees=16, rel_tol=1.0, min_trees=32))
+    assert steps[-1]["reason"] == "konvergen" and steps[-1]["n_trees"] == 32
+    first = next(progressive_tree_predictions(model, X, chunk_trees=16, rel_tol=0, deadline_s=0))
+    assert first["reason"] == "deadline" and first["n_trees"] == 16
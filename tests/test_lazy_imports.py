@@ -0,0 +1,29 @@
+# tests/test_lazy_imports.py — modul inti tidak mengimpor library opsional berat sebelum benar-benar dipakai
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+from training_pipeline import LGBM_OK
+
+HEAVY = ("xgboost", "lightgbm", "catboost", "matplotlib", "seaborn")
+MODULES = ("training_pipeline", "inference", "explain", "intervals", "incremental", "out_of_core", "serve",
+           "score_cli", "drift", "comps", "whatif", "heatmap_tiles")
+
+
+def _loaded_after(code: str):
+    script = (f"import sys; {code}\n"
+              f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))")
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    return [m for m in out.stdout.strip().split(",") if m]
+
+
+def test_core_modules_import_without_heavy_deps():
+    assert _loaded_after("import " + ", ".join(MODULES)) == []
+
+
+@pytest.mark.skipif(not LGBM_OK, reason="lightgbm tidak terpasang")
+def test_estimator_import_happens_on_use():
+    code = "from training_pipeline import build_estimator; build_estimator('LightGBM', {}, random_state=0)"
+    assert _loaded_after(code) == ["lightgbm"]
@@ -0,0 +1,61 @@
+# tests/test_model_pool.py — pool model per proses: satu salinan per isi file, eviksi LRU sesuai budget
+import pytest
+
+from model_pool import ModelPool, content_key, estimate_model_bytes
+
+
+class _Dummy:
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def predict(self, X):
+        return [0.0] * len(X)
+
+
+def _blob(tag: str, n: int = 1000) -> bytes:
+    return tag.encode() * (n // len(tag))
+
+
+def test_identical_bytes_share_one_copy():
+    pool, calls = ModelPool(budget_mb=1), []
+
+    def loader(data):
+        calls.append(data)
+        return _Dummy(data)
+
+    k1, m1 = pool.load_bytes(_blob("a"), loader, "a.pkl")
+    k2, m2 = pool.load_bytes(_blob("a"), loader, "salinan_a.pkl")
+    assert k1 == k2 == content_key(_blob("a"))
+    assert m1 is m2 and len(calls) == 1
+    assert pool.footprint()["hits"].tolist() == [1]
+
+
+def test_lru_eviction_within_budget():
+    pool = ModelPool(budget_mb=0.0025)  # 2500 byte → muat 2 model @1000 byte (ukuran fallback = ukuran file)
+    ka, _ = pool.load_bytes(_blob("a"), _Dummy)
+    kb, _ = pool.load_bytes(_blob("b"), _Dummy)
+    assert pool.get(ka) is not None  # a baru dipakai → b yang paling lama
+    kc, _ = pool.load_bytes(_blob("c"), _Dummy)
+    assert pool.get(kb) is None and pool.get(ka) is not None and pool.get(kc) is not None
+    assert pool.evictions == 1 and pool.total_bytes <= pool.budget_bytes
+
+
+def test_model_larger_than_budget_is_kept():
+    pool = ModelPool(budget_mb=0.0005)
+    ka, _ = pool.load_bytes(_blob("a"), _Dummy)
+    kb, _ = pool.load_bytes(_blob("b"), _Dummy)
+    assert pool.get(ka) is None and pool.get(kb) is not None  # model terbaru tidak pernah dikeluarkan
+
+
+def test_loader_without_model_raises():
+    pool = ModelPool()
+    with pytest.raises(ValueError):
+        pool.load_bytes(b"bukan model", lambda data: None)
+    assert pool.get(content_key(b"bukan model")) is None
+
+
+def test_estimate_counts_tree_nodes(forest):
+    est = estimate_model_bytes(forest, fallback=1)
+    nodes = sum(t.tree_.capacity for t in forest.steps[-1][1].estimators_)
+    assert est >= nodes * 64
+    assert estimate_model_bytes(_Dummy(b""), fallback=123) == 123
@@ -0,0 +1,75 @@
+# tests/test_out_of_core.py — training out-of-core: input yang diterima, bundle bisa dipakai, default tidak ditimpa
+import joblib
+import numpy as np
+import pytest
+
+from inference import named_bundle_path, promote_bundle, save_bundle
+from training_pipeline import LGBM_OK
+
+pytestmark = pytest.mark.skipif(not LGBM_OK, reason="lightgbm tidak terpasang")
+
+PARAMS = {"n_estimators": 30, "num_leaves": 15, "min_child_samples": 5}
+
+
+@pytest.fixture(scope="module")
+def stream_dir(tmp_path_factory, listings):
+    d = tmp_path_factory.mktemp("stream")
+    listings.iloc[:400].to_csv(d / "a.csv", index=False)
+    listings.iloc[400:600].to_csv(d / "b.csv.gz", index=False)
+    listings.iloc[600:].to_parquet(d / "c.parquet", index=False)
+    return d
+
+
+@pytest.fixture(scope="module")
+def bundle(stream_dir, schema):
+    from out_of_core import list_stream_inputs, train_out_of_core
+    return train_out_of_core(list_stream_inputs(stream_dir), dict(schema), PARAMS, chunk_rows=150,
+                             sample_rows=300, holdout=0.2, early_stopping_rounds=None, min_category_count=None)
+
+
+def test_list_stream_inputs_suffixes(stream_dir, tmp_path):
+    from out_of_core import list_stream_inputs
+    assert [p.name for p in list_stream_inputs(stream_dir)] == ["a.csv", "b.csv.gz", "c.parquet"]
+    assert [p.name for p in list_stream_inputs(stream_dir / "*.csv*")] == ["a.csv", "b.csv.gz"]
+    for name in ("x.parquet.gz", "x.xlsx.gz", "x.xlsx"):
+        (tmp_path / name).write_bytes(b"")
+        with pytest.raises(ValueError):
+            list_stream_inputs(tmp_path / name)
+    # folder tanpa file yang didukung
+    with pytest.raises(ValueError):
+        list_stream_inputs(tmp_path)
+
+
+def test_bundle_predicts(bundle, listings, schema):
+    info = bundle["config"]["out_of_core"]
+    assert info["n_raw"] == len(listings)
+    assert info["n_train"] + info["n_holdout"] == info["n_rows"]
+    X = listings[bundle["config"]["features_in"]].iloc[:50]
+    pred = bundle["pipeline"].predict(X)
+    assert pred.shape == (50,) and np.isfinite(pred).all()
+    assert bundle["config"]["drift_sketches"]["n_rows"] > 0
+
+
+def test_update_booster_regressor(bundle, listings, schema):
+    from incremental import check_old_members, n_members, update_pipeline
+    X = listings[bundle["config"]["features_in"]]
+    base = bundle["pipeline"]
+    model = update_pipeline(base, X.iloc[:200], listings[schema["target_col"]].iloc[:200], n_add=5)
+    assert n_members(model) == n_members(base) + 5
+    assert check_old_members(base, model, X.iloc[200:300]) <= 1e-5
+
+
+def test_save_and_promote(bundle, tmp_path):
+    models = tmp_path / "models"
+    models.mkdir()
+    (models / "model_bundle_latest.pkl").write_bytes(b"lama")
+    out = save_bundle(bundle, named_bundle_path(models / "ooc"))
+    assert out.parent == models / "ooc" and out.with_suffix(".json").exists()
+    assert (models / "model_bundle_latest.pkl").read_bytes() == b"lama"  # simpan ≠ jadi default
+
+    promote_bundle(out, models)
+    assert (models / "model_bundle_latest.pkl").read_bytes() == out.read_bytes()
+    assert (models / "config_latest.json").read_text(encoding="utf-8") == out.with_suffix(".json").read_text(
+        encoding="utf-8")
+    assert not list(models.glob("*.tmp"))
+    assert joblib.load(models / "model_bundle_latest.pkl")["config"]["algo"] == "LightGBM"
@@ -0,0 +1,40 @@
+# tests/test_page_latency.py — harness latensi: agregasi per skenario, sandbox tidak menyentuh models/ repo
+import shutil
+from types import SimpleNamespace
+
+import joblib
+import numpy as np
+
+from page_latency import PAGE, LatencyRecorder, make_sandbox, train_bundle
+
+
+class _FakeAppTest:
+    def __init__(self, errors=()):
+        self.exception = [SimpleNamespace(value=e) for e in errors]
+
+
+def test_recorder_aggregates_per_scenario():
+    rec = LatencyRecorder(data_rows=10)
+    for k in range(4):
+        rec.rerun("idle", lambda: _FakeAppTest())
+    rec.rerun("klik", lambda: _FakeAppTest(["ValueError: rusak"]))
+    res = {r["name"]: r for r in rec.results()}
+    assert res["idle"]["repeats"] == 4 and res["idle"]["errors"] == 0
+    assert res["klik"]["errors"] == 1 and res["klik"]["data_rows"] == 10
+    assert res["idle"]["min_s"] <= res["idle"]["median_s"] <= res["idle"]["p95_s"] <= res["idle"]["max_s"]
+    assert res["idle"]["peak_rss_mb"] > 0
+
+
+def test_sandbox_has_app_bundle_and_data(schema, features, listings):
+    bundle = train_bundle(listings.iloc[:300], schema, n_estimators=5, seed=0)
+    assert np.isfinite(bundle["pipeline"].predict(listings[features].iloc[:5])).all()
+    assert bundle["comps"] is not None
+
+    args = SimpleNamespace(train_rows=300, batch_rows=50, bundle=None, bundle_trees=5, seed=0)
+    box = make_sandbox(args, schema)
+    try:
+        assert (box / "app.py").exists() and (box / PAGE).exists()
+        assert joblib.load(box / "models" / "model_bundle_latest.pkl")["config"]["target_col"] == schema["target_col"]
+        assert (box / "train.csv").exists() and (box / "batch.csv").exists()
+    finally:
+        shutil.rmtree(box, ignore_errors=True)
@@ -0,0 +1,37 @@
+# tests/test_precision.py — mode presisi float32: matriks fitur float32, flag biner uint8 per cabang, nilai = float64
+import numpy as np
+import pandas as pd
+import pytest
+
+from custom_transformers import AddressTopTokens, CastDtype, FrequencyEncoder
+from training_pipeline import build_preprocess, fit_preprocess
+
+
+def _args(schema):
+    return (schema["numeric_feats"], schema["onehot_feats"], schema["freq_feats"], schema["addr_feats"],
+            int(schema["top_n_addr"]))
+
+
+def test_float32_matches_float64(schema, features, listings):
+    y = listings[schema["target_col"]]
+    _, X64 = fit_preprocess(build_preprocess(*_args(schema)), listings[features], y)
+    _, X32 = fit_preprocess(build_preprocess(*_args(schema), precision="float32"), listings[features], y)
+    assert X32.dtype == np.float32
+    assert X32.nbytes * 2 == X64.nbytes
+    np.testing.assert_allclose(X32, X64, rtol=1e-6)
+
+
+def test_branch_dtypes():
+    addr = pd.DataFrame({"alamat": ["Jl Melati Raya", "Jl Mawar", "Jl Melati Indah"]})
+    assert (AddressTopTokens("alamat", top_n=2, dtype="uint8").fit(addr).transform(addr).dtypes == np.uint8).all()
+    assert (AddressTopTokens("alamat", top_n=2).fit(addr).transform(addr).dtypes == np.int64).all()  # perilaku lama
+    kota = pd.DataFrame({"kota": ["A", "A", "B"]})
+    assert FrequencyEncoder("kota", dtype="float32").fit(kota).transform(kota).dtypes.iloc[0] == np.float32
+    assert FrequencyEncoder("kota").fit(kota).transform(kota).dtypes.iloc[0] == np.float64
+    out = CastDtype().fit(np.ones((2, 3))).transform(np.ones((2, 3)))
+    assert out.dtype == np.float32 and list(CastDtype().fit(out).get_feature_names_out()) == ["x0", "x1", "x2"]
+
+
+def test_unknown_precision_rejected(schema):
+    with pytest.raises(ValueError):
+        build_preprocess(*_args(schema), precision="float16")
@@ -0,0 +1,45 @@
+# tests/test_run_store.py — riwayat run SQLite + memoization key
+import sqlite3
+
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression, Ridge
+
+import run_store
+from run_store import RunStore, frame_hash, training_run_key
+
+
+def test_key_depends_on_data_and_params():
+    a = pd.DataFrame({"x": [1.0, 2.0]})
+    h = frame_hash(a)
+    assert training_run_key(h, Ridge(alpha=1.0)) == training_run_key(frame_hash(a.copy()), Ridge(alpha=1.0))
+    assert training_run_key(h, Ridge(alpha=1.0)) != training_run_key(h, Ridge(alpha=2.0))
+    assert training_run_key(h, Ridge()) != training_run_key(frame_hash(a + 1), Ridge())
+
+
+def test_record_find_and_hits(tmp_path):
+    store = RunStore(tmp_path)
+    model = LinearRegression().fit([[0.0], [1.0]], [0.0, 1.0])
+    store.record("k" * 64, model, "LinearRegression", {"alpha": 1.0}, {"r2": 1.0}, {"fit": 0.1}, "h", 2, 0)
+    assert store.find("x" * 64) is None
+    run = store.find("k" * 64)
+    assert run["metrics"] == {"r2": 1.0}
+    assert store.load_pipeline(run).predict([[2.0]])[0] == pytest.approx(2.0)
+    assert store.runs_frame()["hits"].tolist() == [1]
+
+
+def test_connections_are_closed(tmp_path, monkeypatch):
+    opened, real_connect = [], sqlite3.connect
+
+    def connect(*args, **kwargs):
+        opened.append(real_connect(*args, **kwargs))
+        return opened[-1]
+    monkeypatch.setattr(run_store.sqlite3, "connect", connect)
+    store = RunStore(tmp_path)
+    store.record("k" * 64, LinearRegression(), "LinearRegression", {}, {}, {}, "h", 0, 0)
+    store.find("k" * 64)
+    store.runs_frame()
+    assert len(opened) == 4
+    for con in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            con.execute("SELECT 1")
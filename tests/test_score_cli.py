@@ -0,0 +1,35 @@
+# tests/test_score_cli.py — scorer headless: output terpisah & tidak men-scoring ulang hasilnya sendiri
+import joblib
+import pandas as pd
+
+import score_cli
+from inference import PRED_COL
+
+
+def _run(bundle, in_dir, *extra):
+    assert score_cli.main([str(bundle), str(in_dir), "--workers", "1", *extra]) == 0
+
+
+def test_nightly_rerun_scores_only_listings(tmp_path, forest, listings):
+    bundle = tmp_path / "model.pkl"
+    joblib.dump({"pipeline": forest, "config": {}}, bundle)
+    in_dir = tmp_path / "portofolio"
+    in_dir.mkdir()
+    listings.iloc[:50].to_csv(in_dir / "a.csv", index=False)
+    listings.iloc[50:80].to_parquet(in_dir / "b.parquet")
+
+    _run(bundle, in_dir)
+    out_dir = in_dir / score_cli.DEFAULT_OUTPUT_DIR
+    first = sorted(p.name for p in out_dir.iterdir())
+    assert first == ["a_prediksi.parquet", "b_prediksi.parquet"]
+    assert len(pd.read_parquet(out_dir / "a_prediksi.parquet")[PRED_COL]) == 50
+
+    _run(bundle, in_dir)  # run kedua: hasil di prediksi/ tidak ikut terbaca
+    assert sorted(p.name for p in out_dir.iterdir()) == first
+
+
+def test_outputs_in_input_dir_are_skipped(tmp_path, listings):
+    listings.iloc[:5].to_csv(tmp_path / "a.csv", index=False)
+    listings.iloc[:5].to_parquet(tmp_path / "a_prediksi.parquet")
+    pd.DataFrame({"kolom": []}).to_csv(tmp_path / "a_drift.csv", index=False)
+    assert [p.name for p in score_cli.list_inputs(tmp_path)] == ["a.csv"]
@@ -0,0 +1,75 @@
+# tests/test_serve.py — micro-batching: hasil per request benar, request rusak terisolasi, endpoint HTTP
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from serve import MicroBatcher, PredictHandler, PredictServer, rows_to_frame
+
+
+def _double(df: pd.DataFrame) -> np.ndarray:
+    return pd.to_numeric(df["x"], errors="raise").to_numpy(dtype=float) * 2
+
+
+def test_concurrent_requests_are_batched():
+    batcher = MicroBatcher(_double, max_batch_rows=1000, max_wait_ms=50)
+    frames = [pd.DataFrame({"x": np.arange(i, i + 1 + i % 3)}) for i in range(40)]
+    with ThreadPoolExecutor(16) as ex:
+        results = list(ex.map(batcher.submit, frames))
+    for df, res in zip(frames, results):
+        np.testing.assert_array_equal(res, df["x"].to_numpy() * 2)
+    snap = batcher.snapshot()
+    assert snap["requests"] == 40 and snap["rows"] == sum(len(f) for f in frames)
+    assert snap["batches"] < 40
+
+
+def test_bad_request_does_not_fail_batch():
+    batcher = MicroBatcher(_double, max_batch_rows=1000, max_wait_ms=50)
+    frames = [pd.DataFrame({"x": [1, 2]}), pd.DataFrame({"x": ["bukan angka"]}), pd.DataFrame({"x": [3]})]
+    with ThreadPoolExecutor(3) as ex:
+        futs = [ex.submit(batcher.submit, f) for f in frames]
+    np.testing.assert_array_equal(futs[0].result(), [2, 4])
+    np.testing.assert_array_equal(futs[2].result(), [6])
+    with pytest.raises(ValueError):
+        futs[1].result()
+
+
+def test_rows_to_frame_validation():
+    assert len(rows_to_frame({"x": 1}, ["x"])) == 1
+    assert len(rows_to_frame({"rows": [{"x": 1}, {"x": 2}]}, ["x"])) == 2
+    # nama_cbd/jarak_cbd boleh tidak dikirim bila latitude/longitude ada
+    assert len(rows_to_frame([{"latitude": -6.2, "longitude": 106.8}], ["latitude", "longitude", "jarak_cbd"])) == 1
+    for bad in (None, [], {"rows": [1]}, {"y": 1}):
+        with pytest.raises(ValueError):
+            rows_to_frame(bad, ["x"])
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(PredictHandler, "batcher", MicroBatcher(_double, max_wait_ms=1))
+    monkeypatch.setattr(PredictHandler, "required_cols", ["x"])
+    srv = PredictServer(("127.0.0.1", 0), PredictHandler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown(); srv.server_close()
+
+
+def _post(url, body):
+    req = urllib.request.Request(url, data=json.dumps(body).encode(), headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=10) as r:
+        return r.status, json.loads(r.read())
+
+
+def test_http_predict_and_health(server):
+    assert _post(server + "/predict", {"rows": [{"x": 1}, {"x": 2.5}]}) == (200, {"predictions": [2.0, 5.0]})
+    with pytest.raises(urllib.error.HTTPError) as e:
+        _post(server + "/predict", {"rows": [{"y": 1}]})
+    assert e.value.code == 400
+    with urllib.request.urlopen(server + "/health", timeout=10) as r:
+        health = json.loads(r.read())
+    assert health["status"] == "ok" and health["requests"] == 1
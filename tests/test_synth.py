@@ -0,0 +1,27 @@
+# tests/test_synth.py — generator benchmark: skema sama dengan config model, deterministik, per potongan
+import numpy as np
+import pandas as pd
+
+from inference import pick_cbd_vectorized
+from synth import iter_synthetic, synthetic_frame
+
+
+def test_columns_and_levels_follow_config(schema, features, listings):
+    assert set(features) | {schema["target_col"]} <= set(listings.columns)
+    for c, levels in schema["ohe_categories"].items():
+        assert set(listings[c].dropna()) <= set(levels), c
+    assert (listings[schema["target_col"]] > 0).all()
+    nama, jarak = pick_cbd_vectorized(listings["latitude"].to_numpy(), listings["longitude"].to_numpy())
+    ok = listings["jarak_cbd"].notna()
+    np.testing.assert_allclose(listings.loc[ok, "jarak_cbd"], np.asarray(jarak)[ok.to_numpy()])
+    assert (listings["nama_cbd"].to_numpy() == np.asarray(nama, dtype=object)).all()
+
+
+def test_seeded_and_chunked(schema):
+    a = synthetic_frame(1000, schema, seed=3, chunk_rows=300)
+    b = synthetic_frame(1000, schema, seed=3, chunk_rows=300)
+    pd.testing.assert_frame_equal(a, b)
+    assert not a.equals(synthetic_frame(1000, schema, seed=4, chunk_rows=300))
+    parts = list(iter_synthetic(1000, schema, seed=3, chunk_rows=300))
+    assert [len(p) for p in parts] == [300, 300, 300, 100]
+    assert list(a.index) == list(range(1000))
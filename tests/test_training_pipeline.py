@@ -0,0 +1,71 @@
+# tests/test_training_pipeline.py — preprocess + estimator dari build_estimator
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from custom_transformers import RARE_LABEL, CategoryConsolidator
+from training_pipeline import (CAT_OK, apply_outliers, build_estimator, build_preprocess, category_consolidation,
+                               fit_preprocess, prepare_xy, rupiah_to_number, split_xy, stage_key)
+
+
+@pytest.mark.parametrize("text,value", [("Rp 1,5 milyar", 1.5e9), ("750 juta", 750e6), ("Rp 1.250.000,50", 1_250_000.5)])
+def test_rupiah_to_number(text, value):
+    assert rupiah_to_number(text) == pytest.approx(value)
+
+
+@pytest.mark.skipif(not CAT_OK, reason="catboost tidak terpasang")
+def test_catboost_writes_no_train_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 3))
+    build_estimator("CatBoost", {"iterations": 10}, random_state=0).fit(X, X[:, 0])
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_stage_key_is_stable_and_order_sensitive():
+    assert stage_key("split", ["a", "b"], 0.2) == stage_key("split", ["a", "b"], 0.2)
+    assert stage_key("split", ["a", "b"], 0.2) != stage_key("split", ["b", "a"], 0.2)
+    assert stage_key("clean", {"k": 1, "z": 2}) == stage_key("clean", {"z": 2, "k": 1})
+
+
+def test_stages_do_not_mutate_cached_inputs(schema, features, listings):
+    # output stage di-cache (st.cache_resource) dan dibagi antar rerun → stage berikutnya tidak boleh mengubahnya
+    raw = listings.assign(luas=listings["luas"].map(lambda v: f"{v:,.0f}".replace(",", ".") + " m2"))
+    snapshot = raw.copy()
+    df, y = prepare_xy(raw, schema["target_col"], schema["numeric_feats"], [], True)
+    pd.testing.assert_frame_equal(raw, snapshot)
+    assert pd.api.types.is_numeric_dtype(df["luas"])
+
+    df_snap, y_snap = df.copy(), y.copy()
+    out_df, out_y, info = apply_outliers(df, y, ["luas"], "iqr", 1.5, 3.0, 0.01, 0.99, "Drop rows outlier")
+    pd.testing.assert_frame_equal(df, df_snap)
+    pd.testing.assert_series_equal(y, y_snap)
+    assert len(out_df) == len(out_y) == len(df) - info["luas"][2]
+
+    a = split_xy(out_df, out_y, features, 0.2, 42)
+    b = split_xy(out_df, out_y, features, 0.2, 42)
+    assert a[4] == b[4] and a[4] != split_xy(out_df, out_y, features, 0.2, 7)[4]
+
+
+def test_category_consolidation_folds_and_pools_rare_levels():
+    X = pd.DataFrame({"kontur": ["Rata"] * 6 + ["rata "] * 3 + ["Miring"] * 10 + ["Curam"] * 2 + [None]})
+    consol = CategoryConsolidator(min_count=5).fit(X)
+    out = consol.transform(pd.DataFrame({"kontur": ["RATA", "Miring", "Curam", "Bergelombang", None]}))
+    assert out["kontur"].tolist()[:4] == ["Rata", "Miring", RARE_LABEL, RARE_LABEL]  # ejaan dilipat, jarang/baru → rare
+    assert pd.isna(out["kontur"].iloc[4])
+    assert consol.stats_["kontur"] == {"level_mentah": 4, "setelah_lipat": 3, "level_jarang": 1, "level_akhir": 3}
+
+
+def test_consolidation_shrinks_one_hot_width(schema, features, listings):
+    y = listings[schema["target_col"]]
+    args = (schema["numeric_feats"], schema["onehot_feats"], schema["freq_feats"], schema["addr_feats"],
+            int(schema["top_n_addr"]))
+    plain, X_plain = fit_preprocess(build_preprocess(*args), listings[features], y)
+    prep, X_cons = fit_preprocess(build_preprocess(*args, min_category_count=30), listings[features], y)
+    assert X_cons.shape[1] < X_plain.shape[1]
+    assert category_consolidation(plain) is None
+    info = category_consolidation(prep)
+    assert info["min_count"] == 30 and set(info["mapping"]) == set(schema["onehot_feats"])
+    json.dumps(info)  # disimpan di config bundle
@@ -0,0 +1,29 @@
+# tests/test_whatif.py — permukaan what-if: satu predict untuk seluruh grid = predict per titik
+import numpy as np
+
+from whatif import price_surface, whatif_axes, whatif_grid
+
+
+def test_axes_around_current_values():
+    luas, jarak = whatif_axes(200.0, 2.0, n=5, jarak_span_km=5.0)
+    np.testing.assert_allclose(luas, [100, 175, 250, 325, 400])
+    assert jarak[0] == 0.0 and jarak[-1] == 7.0  # jarak tidak negatif
+    assert whatif_axes(None, None, n=3)[0][1] == 100.0 * 1.25  # luas kosong → 100 m²
+
+
+def test_grid_layout(listings, features):
+    row = listings[features].iloc[[3]]
+    grid = whatif_grid(row, np.array([10.0, 20.0, 30.0]), np.array([1.0, 2.0]))
+    assert grid["luas"].tolist() == [10, 20, 30, 10, 20, 30]
+    assert grid["jarak_cbd"].tolist() == [1, 1, 1, 2, 2, 2]
+    assert (grid["kota_kabupaten"] == row["kota_kabupaten"].iloc[0]).all()
+
+
+def test_surface_matches_pointwise_predict(forest, listings, features):
+    row = listings[features].iloc[[7]]
+    luas_vals, jarak_vals = whatif_axes(float(row["luas"].iloc[0]), float(row["jarak_cbd"].iloc[0]), n=6)
+    Z = price_surface(forest, row, luas_vals, jarak_vals)
+    assert Z.shape == (6, 6)
+    for i, j in [(0, 0), (2, 5), (5, 3)]:
+        point = row.assign(luas=luas_vals[j], jarak_cbd=jarak_vals[i])
+        assert Z[i, j] == forest.predict(point)[0]
@@ -0,0 +1,78 @@
+# train_cli.py — Training out-of-core headless (tanpa Streamlit) untuk data listing lebih besar dari RAM
+# Jalankan: python train_cli.py "data/listing_*.parquet" --config models/config_latest.json [--promote]
+#
+# Input: file, folder, atau pola glob CSV/CSV.gz/Parquet (dialirkan per potongan, lihat out_of_core.py).
+# Fitur & target diambil dari config JSON (kunci sama dengan config bundle: target_col, numeric_feats,
+# onehot_feats, freq_feats, addr_feats, top_n_addr). Output: bundle + config JSON di models/ooc/ (bertanda waktu);
+# model default halaman Form Prediksi hanya diganti bila --promote diberikan.
+import argparse, json, sys, time
+from pathlib import Path
+
+from inference import named_bundle_path, promote_bundle, save_bundle
+from out_of_core import DEFAULT_PARAMS, OOC_DIR, list_stream_inputs, train_out_of_core
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Training LightGBM out-of-core dari CSV/Parquet besar.")
+    ap.add_argument("input", help="File, folder, atau pola glob")
+    ap.add_argument("--config", default="models/config_latest.json", help="Config JSON berisi target & daftar fitur")
+    ap.add_argument("-o", "--output", default=None, help="default: models/ooc/model_bundle_<waktu>.pkl")
+    ap.add_argument("--promote", action="store_true",
+                    help="jadikan bundle hasil model default (models/model_bundle_latest.pkl + config_latest.json)")
+    ap.add_argument("--chunk-rows", type=int, default=100_000)
+    ap.add_argument("--sample-rows", type=int, default=200_000, help="sampel untuk fit imputer/One-Hot/token alamat")
+    ap.add_argument("--holdout", type=float, default=0.1)
+    ap.add_argument("--max-holdout-rows", type=int, default=200_000)
+    ap.add_argument("--early-stopping", type=int, default=50, help="0 = nonaktif")
+    ap.add_argument("--min-category-count", type=int, default=10, help="0 = tanpa konsolidasi kategori One-Hot")
+    ap.add_argument("--target-per-m2", action="store_true", help="target berisi harga per m²")
+    ap.add_argument("--work-dir", default=None, help="folder memmap/dataset biner sementara (default: temp sistem)")
+    ap.add_argument("--keep-binary", default=None, help="simpan dataset LightGBM ter-binning ke path ini")
+    ap.add_argument("--seed", type=int, default=42)
+    for k, v in DEFAULT_PARAMS.items():
+        ap.add_argument(f"--{k.replace('_', '-')}", type=type(v), default=v)
+    args = ap.parse_args(argv)
+
+    cfg = json.loads(Path(args.config).read_text(encoding="utf-8"))
+    missing = [k for k in ("target_col", "numeric_feats", "onehot_feats", "freq_feats", "addr_feats") if k not in cfg]
+    if missing:
+        print(f"Config tidak lengkap (kunci hilang: {missing})", file=sys.stderr)
+        return 1
+    cfg["target_is_per_m2"] = bool(args.target_per_m2 or cfg.get("target_is_per_m2", False))
+    files = list_stream_inputs(args.input)
+    params = {k: getattr(args, k) for k in DEFAULT_PARAMS}
+
+    last = {}
+
+    def progress(step, value):
+        now = time.perf_counter()
+        if now - last.get(step, 0) >= 5:  # log paling sering 5 detik sekali per tahap
+            last[step] = now
+            print(f"  {step}: {value:,.0f} baris" if step == "pass1" else f"  {step}: {value:.0%}", flush=True)
+
+    t0 = time.perf_counter()
+    print(f"{len(files)} file: " + ", ".join(p.name for p in files), flush=True)
+    bundle = train_out_of_core(
+        files, cfg, params, chunk_rows=args.chunk_rows, sample_rows=args.sample_rows, holdout=args.holdout,
+        max_holdout_rows=args.max_holdout_rows, early_stopping_rounds=args.early_stopping or None,
+        min_category_count=args.min_category_count or None, seed=args.seed, work_dir=args.work_dir,
+        keep_binary=Path(args.keep_binary) if args.keep_binary else None, on_progress=progress)
+    out = save_bundle(bundle, args.output or named_bundle_path(OOC_DIR))
+
+    info = bundle["config"]["out_of_core"]
+    print("\nRingkasan")
+    print(f"  baris         : {info['n_rows']:,} valid dari {info['n_raw']:,} (train {info['n_train']:,}, holdout {info['n_holdout']:,})")
+    print(f"  fitur         : {info['n_features']:,} • iterasi booster {info['rounds']:,}")
+    for k, v in info["metrics"].items():
+        print(f"  {k:<14}: {v:,.4f}" if k == "r2" else f"  {k:<14}: {v:,.0f}")
+    for k, v in info["timings"].items():
+        print(f"  {k:<14}: {v:.2f} s")
+    print(f"  total         : {time.perf_counter() - t0:.2f} s")
+    print(f"Bundle → {out} (+ {out.with_suffix('.json').name})")
+    if args.promote:
+        print(f"Default → {promote_bundle(out)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,388 @@
+# training_pipeline.py — Tahap data training (load → parse → clean → split → preprocess) + build_estimator, fungsi murni
+# (tanpa Streamlit; dipakai app.py dan benchmarks/)
+#
+# app.py membungkus tiap tahap dengan cache Streamlit ber-key eksplisit:
+#   key tahap = stage_key(key tahap hulu, parameter widget milik tahap itu)
+# sehingga perubahan satu widget hanya menghitung ulang tahap di hilirnya. Fungsi di sini tidak
+# memodifikasi input; output tahap dibagi antar rerun (tanpa salinan) dan diperlakukan read-only.
+import hashlib, io, json, re, unicodedata
+from importlib.util import find_spec
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LinearRegression, ElasticNet
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.neighbors import KNeighborsRegressor
+from sklearn.preprocessing import OneHotEncoder
+from sklearn.svm import SVR
+
+from custom_transformers import AddressTopTokens, CastDtype, CategoryConsolidator, FrequencyEncoder
+from inference import _map_unique  # parse sekali per nilai unik (kolom teks listing banyak berulang)
+from run_store import frame_hash
+
+# Algo opsional — cukup dicek ada/tidaknya (find_spec, tanpa import); import asli baru saat algoritma dipilih.
+XGB_OK = find_spec("xgboost") is not None
+LGBM_OK = find_spec("lightgbm") is not None
+CAT_OK = find_spec("catboost") is not None
+
+# Algoritma yang butuh StandardScaler setelah ColumnTransformer
+ALGOS_NEED_SCALING = {"LinearRegression", "ElasticNet", "SVR", "KNN"}
+
+# Presisi matriks fitur hasil ColumnTransformer. "float32": numerik & frekuensi float32, flag biner
+# (One-Hot, token alamat) uint8 per cabang → digabung ColumnTransformer menjadi float32.
+# Model pohon (RF/XGBoost/LightGBM/CatBoost) mem-binning/mengubah ke float32 sendiri, jadi float64 hanya boros memori.
+PRECISIONS = ("float64", "float32")
+
+
+def stage_key(*parts) -> str:
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def content_key(raw: bytes) -> str:
+    return hashlib.sha1(raw).hexdigest()
+
+
+# =========================
+# Util parsing angka lokal
+# =========================
+def _to_float_local(num_str: str) -> Optional[float]:
+    if not isinstance(num_str, str):
+        return None
+    s = re.sub(r"[^0-9\-,\.]", "", num_str.strip())
+    if "," in s and "." in s:
+        s = s.replace(".", "").replace(",", ".")
+    elif "," in s:
+        s = s.replace(",", ".")
+    try:
+        return float(s)
+    except:
+        return None
+
+def rupiah_to_number(text: str) -> Optional[float]:
+    if not isinstance(text, str):
+        return None
+    s = text.lower()
+    m = re.search(r"([0-9\.\,]+)", s)
+    if not m:
+        return None
+    val = _to_float_local(m.group(1))
+    if val is None:
+        return None
+    if   "triliun" in s: val *= 1_000_000_000_000
+    elif "milyar" in s or "miliar" in s: val *= 1_000_000_000
+    elif "juta"  in s: val *= 1_000_000
+    elif "ribu"  in s: val *= 1_000
+    return float(val)
+
+def try_convert_numeric_series(ser: pd.Series, force_currency=False) -> pd.Series:
+    s = ser.copy()
+    if pd.api.types.is_numeric_dtype(s):
+        return s
+    if force_currency:
+        conv = _map_unique(s, rupiah_to_number)
+        if pd.notna(conv).mean() >= 0.5:
+            return pd.to_numeric(conv, errors="coerce")
+    conv = _map_unique(s, _to_float_local)
+    if pd.notna(conv).mean() >= 0.7:
+        return pd.to_numeric(conv, errors="coerce")
+    return s
+
+
+# =========================
+# Encoder & helper
+# =========================
+def make_ohe(dtype=np.float64):
+    try:
+        return OneHotEncoder(handle_unknown="ignore", sparse_output=False, dtype=dtype)
+    except TypeError:
+        return OneHotEncoder(handle_unknown="ignore", sparse=False, dtype=dtype)
+
+def slugify_name(text: str) -> str:
+    if not isinstance(text, str):
+        text = str(text)
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    text = re.sub(r'[^0-9A-Za-z_]+', '_', text)
+    text = re.sub(r'_+', '_', text).strip('_')
+    text = text.replace('__', '_')
+    return text or "col"
+
+
+# =========================
+# Outlier helpers
+# =========================
+def _numeric_copy(s: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(s):
+        return s.astype(float)
+    s1 = try_convert_numeric_series(s, force_currency=True)
+    return pd.to_numeric(s1, errors="coerce")
+
+def _bounds_iqr(x: pd.Series, k: float = 1.5) -> Tuple[float, float]:
+    q1, q3 = x.quantile(0.25), x.quantile(0.75)
+    iqr = q3 - q1
+    return (q1 - k * iqr, q3 + k * iqr)
+
+def _bounds_zscore(x: pd.Series, z: float = 3.0) -> Tuple[float, float]:
+    mu, sd = x.mean(), x.std(ddof=0)
+    if sd == 0 or np.isnan(sd):
+        return (x.min(), x.max())
+    return (mu - z * sd, mu + z * sd)
+
+def _bounds_log_iqr(x: pd.Series, k: float = 1.5) -> Tuple[float, float]:
+    pos = x[x > 0]
+    if pos.empty:
+        return _bounds_iqr(x, k)
+    min_pos = float(pos.min())
+    x_clip = x.clip(lower=max(min_pos * 0.1, 1e-9))
+    lx = np.log10(x_clip)
+    llo, lhi = _bounds_iqr(lx, k)
+    return (10 ** llo, 10 ** lhi)
+
+def _bounds_quantile(x: pd.Series, q_low: float = 0.01, q_high: float = 0.99) -> Tuple[float, float]:
+    return (x.quantile(q_low), x.quantile(q_high))
+
+def detect_outlier_mask_series(
+    s_raw: pd.Series,
+    method: str = "auto",
+    iqr_k: float = 1.5,
+    z_k: float = 3.0,
+    q_low: float = 0.01,
+    q_high: float = 0.99,
+) -> Tuple[pd.Series, Tuple[float, float]]:
+    x = _numeric_copy(s_raw).dropna()
+    if x.empty:
+        return pd.Series(False, index=s_raw.index), (np.nan, np.nan)
+    if method == "auto":
+        sk = float(x.skew())
+        method_eff = "log_iqr" if sk > 1.0 else "iqr"
+    else:
+        method_eff = method
+    if method_eff == "iqr":
+        lo, hi = _bounds_iqr(x, iqr_k)
+    elif method_eff == "zscore":
+        lo, hi = _bounds_zscore(x, z_k)
+    elif method_eff == "log_iqr":
+        lo, hi = _bounds_log_iqr(x, iqr_k)
+    elif method_eff == "quantile":
+        lo, hi = _bounds_quantile(x, q_low, q_high)
+    else:
+        lo, hi = _bounds_iqr(x, iqr_k)
+    xx = pd.to_numeric(s_raw, errors="coerce")
+    mask = (xx < lo) | (xx > hi)
+    return mask.fillna(False), (lo, hi)
+
+def winsorize_series(s_raw: pd.Series, lower: float, upper: float) -> pd.Series:
+    x = pd.to_numeric(s_raw, errors="coerce")
+    return x.clip(lower=lower, upper=upper)
+
+
+# =========================
+# Tahap-tahap
+# =========================
+def read_table(raw: bytes, name: str) -> pd.DataFrame:
+    """load: bytes file upload → DataFrame (CSV atau sheet pertama Excel)."""
+    buf = io.BytesIO(raw)
+    return pd.read_csv(buf) if name.lower().endswith(".csv") else pd.read_excel(buf, sheet_name=0)
+
+
+def column_nunique(s: pd.Series) -> int:
+    return int(s.astype(str).nunique(dropna=True))
+
+
+def column_is_numeric_like(s: pd.Series) -> bool:
+    """Kolom dianggap numerik jika ≥70% nilai bisa diparse (termasuk format rupiah)."""
+    return bool(pd.notna(try_convert_numeric_series(s, force_currency=True)).mean() >= 0.7)
+
+
+def prepare_xy(df0: pd.DataFrame, target_col: str, numeric_feats: List[str],
+               force_currency_cols: List[str], auto_num_convert: bool) -> Tuple[pd.DataFrame, pd.Series]:
+    """parse: buang baris target kosong, konversi string→angka di fitur numerik."""
+    df = df0.copy()
+    y = pd.to_numeric(df[target_col], errors="coerce"); mask = y.notna()
+    df = df.loc[mask].reset_index(drop=True); y = y.loc[mask].reset_index(drop=True)
+    for c in numeric_feats:
+        if c in df.columns and (auto_num_convert or (c in force_currency_cols)):
+            df[c] = try_convert_numeric_series(df[c], force_currency=(c in force_currency_cols))
+    return df, y
+
+
+def apply_outliers(df: pd.DataFrame, y: pd.Series, out_cols: List[str], method: str, iqr_k: float, z_k: float,
+                   q_low: float, q_high: float, action: str) -> Tuple[pd.DataFrame, pd.Series, Dict]:
+    """clean: deteksi outlier per kolom → drop baris atau winsorize. bounds_info: kolom → (lower, upper, n_outlier)."""
+    bounds_info = {}
+    if not out_cols:
+        return df, y, bounds_info
+    df = df.copy()
+    full_mask_out = pd.Series(False, index=df.index)
+    for c in out_cols:
+        ser_num = try_convert_numeric_series(df[c], force_currency=True); df[c] = ser_num
+        m_out, (lo, hi) = detect_outlier_mask_series(ser_num, method=method, iqr_k=iqr_k, z_k=z_k, q_low=q_low, q_high=q_high)
+        bounds_info[c] = (lo, hi, int(m_out.sum()))
+        full_mask_out = full_mask_out | m_out.reindex(df.index, fill_value=False)
+    if action == "Drop rows outlier":
+        keep_mask = ~full_mask_out
+        df = df.loc[keep_mask].reset_index(drop=True)
+        y  = y.loc[keep_mask].reset_index(drop=True)
+    else:
+        for c in out_cols:
+            lo, hi, _ = bounds_info[c]
+            if np.isfinite(lo) and np.isfinite(hi):
+                df[c] = winsorize_series(df[c], lo, hi)
+    return df, y, bounds_info
+
+
+def split_xy(df: pd.DataFrame, y: pd.Series, chosen_feats: List[str], test_size: float,
+             random_state: int) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series, str]:
+    """split: train/test + hash datanya (dipakai key run store)."""
+    X_train, X_test, y_train, y_test = train_test_split(
+        df[chosen_feats], y, test_size=float(test_size), random_state=int(random_state)
+    )
+    return X_train, X_test, y_train, y_test, frame_hash(X_train, y_train, X_test, y_test)
+
+
+def build_preprocess(numeric_feats: List[str], onehot_feats: List[str], freq_feats: List[str],
+                     addr_feats: List[str], top_n_addr: int, precision: str = "float64",
+                     min_category_count: Optional[int] = None) -> ColumnTransformer:
+    """
+    ColumnTransformer (belum di-fit) sesuai pilihan encoding per kolom; precision ∈ PRECISIONS.
+    min_category_count: None = kategori One-Hot apa adanya; angka = CategoryConsolidator sebelum One-Hot
+    (lipat ejaan + level < min_category_count baris digabung) → kolom One-Hot lebih sedikit.
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"precision tidak dikenal: {precision}")
+    f32 = precision == "float32"
+    transformers = []
+    if numeric_feats:
+        # median dihitung di float64 (sama dengan jalur float64), baru hasilnya di-cast
+        num = (Pipeline(steps=[("imp", SimpleImputer(strategy="median")), ("cast", CastDtype("float32"))])
+               if f32 else SimpleImputer(strategy="median"))
+        transformers.append(("num", num, numeric_feats))
+    if onehot_feats:
+        transformers.append((
+            "catOneHot",
+            Pipeline(steps=([] if min_category_count is None
+                            else [("consol", CategoryConsolidator(min_count=int(min_category_count)))])
+                           + [("imp", SimpleImputer(strategy="most_frequent")),
+                              ("ohe", make_ohe(np.uint8) if f32 else make_ohe())]),
+            onehot_feats
+        ))
+    freq_dtype, tok_dtype = ("float32", "uint8") if f32 else (None, None)
+    for c in freq_feats:
+        transformers.append((f"freq_{slugify_name(c)}", FrequencyEncoder(c, dtype=freq_dtype), [c]))
+    for c in addr_feats:
+        safe = slugify_name(c)
+        transformers.append((f"addrTok_{safe}",  AddressTopTokens(c, top_n=int(top_n_addr), dtype=tok_dtype), [c]))
+        transformers.append((f"addrFreq_{safe}", FrequencyEncoder(c, dtype=freq_dtype), [c]))
+    return ColumnTransformer(transformers=transformers, remainder="drop")
+
+
+def fit_preprocess(preprocess: ColumnTransformer, X_train: pd.DataFrame, y_train: pd.Series):
+    """preprocess: fit ColumnTransformer (salinan) → (transformer ter-fit, X_train ter-transform)."""
+    prep = clone(preprocess)
+    return prep, prep.fit_transform(X_train, y_train)
+
+
+def category_consolidation(prep: ColumnTransformer) -> Optional[Dict]:
+    """Tabel konsolidasi kategori dari ColumnTransformer ter-fit (JSON-serializable) atau None bila tidak dipakai."""
+    cat = getattr(prep, "named_transformers_", {}).get("catOneHot")
+    consol = getattr(cat, "named_steps", {}).get("consol")
+    if consol is None:
+        return None
+    return {"min_count": int(consol.min_count), "rare_label": consol.rare_label,
+            "mapping": consol.mapping_, "stats": consol.stats_}
+
+
+def matrix_memory(Xt) -> Dict[str, float]:
+    """Ukuran matriks fitur (MB) vs ukuran bila seluruhnya float64."""
+    nbytes, f64 = Xt.nbytes, Xt.size * 8
+    return {"dtype": str(Xt.dtype), "mb": nbytes / 2**20, "mb_float64": f64 / 2**20,
+            "saved_mb": (f64 - nbytes) / 2**20, "saved_frac": 1 - nbytes / f64 if f64 else 0.0}
+
+
+def prediction_diff(y_ref, y_new) -> Dict[str, float]:
+    """Selisih prediksi dua jalur (mis. float32 vs float64): maks/rata-rata absolut & relatif."""
+    a, b = np.asarray(y_ref, dtype=float), np.asarray(y_new, dtype=float)
+    d = np.abs(b - a)
+    rel = d / np.maximum(np.abs(a), 1e-12)
+    return {"max_abs": float(d.max(initial=0.0)), "mean_abs": float(d.mean()) if d.size else 0.0,
+            "max_rel": float(rel.max(initial=0.0)), "mean_rel": float(rel.mean()) if rel.size else 0.0,
+            "n_diff": int((d > 0).sum())}
+
+
+# =========================
+# Build estimator sesuai pilihan
+# =========================
+def build_estimator(name: str, params: Dict, random_state: int):
+    if name == "RandomForest":
+        max_features = 1.0 if params.get("max_features") == "1.0" else params.get("max_features", "sqrt")
+        return RandomForestRegressor(
+            n_estimators=int(params.get("n_estimators", 600)),
+            max_depth=params.get("max_depth", None),
+            max_features=max_features,
+            min_samples_split=int(params.get("min_samples_split", 2)),
+            min_samples_leaf=int(params.get("min_samples_leaf", 1)),
+            n_jobs=-1,
+            random_state=int(random_state),
+        )
+    if name == "LinearRegression":
+        return LinearRegression()
+    if name == "ElasticNet":
+        return ElasticNet(alpha=float(params.get("alpha", 1.0)),
+                          l1_ratio=float(params.get("l1_ratio", 0.5)),
+                          max_iter=int(params.get("max_iter", 5000)),
+                          random_state=int(random_state))
+    if name == "SVR":
+        return SVR(kernel=params.get("kernel", "rbf"),
+                   C=float(params.get("C", 10.0)),
+                   epsilon=float(params.get("epsilon", 0.2)))
+    if name == "KNN":
+        return KNeighborsRegressor(n_neighbors=int(params.get("n_neighbors", 7)),
+                                   weights=params.get("weights", "distance"),
+                                   p=int(params.get("p", 2)))
+    if name == "XGBoost" and XGB_OK:
+        from xgboost import XGBRegressor
+        return XGBRegressor(
+            n_estimators=int(params.get("n_estimators", 800)),
+            max_depth=int(params.get("max_depth", 8)),
+            learning_rate=float(params.get("learning_rate", 0.05)),
+            subsample=float(params.get("subsample", 0.9)),
+            colsample_bytree=float(params.get("colsample_bytree", 0.9)),
+            reg_lambda=float(params.get("reg_lambda", 1.0)),
+            min_child_weight=float(params.get("min_child_weight", 1.0)),
+            n_jobs=-1,
+            random_state=int(random_state),
+            tree_method="hist",
+            objective="reg:squarederror",
+        )
+    if name == "LightGBM" and LGBM_OK:
+        from lightgbm import LGBMRegressor
+        return LGBMRegressor(
+            n_estimators=int(params.get("n_estimators", 1000)),
+            num_leaves=int(params.get("num_leaves", 64)),
+            max_depth=int(params.get("max_depth", -1)),
+            learning_rate=float(params.get("learning_rate", 0.05)),
+            subsample=float(params.get("subsample", 0.9)),
+            colsample_bytree=float(params.get("colsample_bytree", 0.9)),
+            reg_lambda=float(params.get("reg_lambda", 1.0)),
+            min_child_samples=int(params.get("min_child_samples", 20)),
+            random_state=int(random_state),
+            n_jobs=-1,
+        )
+    if name == "CatBoost" and CAT_OK:
+        from catboost import CatBoostRegressor
+        return CatBoostRegressor(
+            iterations=int(params.get("iterations", 1000)),
+            learning_rate=float(params.get("learning_rate", 0.05)),
+            depth=int(params.get("depth", 8)),
+            l2_leaf_reg=float(params.get("l2_leaf_reg", 3.0)),
+            random_seed=int(random_state),
+            loss_function="RMSE",
+            verbose=False,
+            allow_writing_files=False,  # tanpa folder catboost_info/ di direktori kerja
+        )
+    raise ValueError("Algoritma tidak tersedia atau dependency belum terpasang.")
@@ -0,0 +1,55 @@
+# whatif.py — Permukaan harga what-if (luas × jarak_cbd) dari satu baris input, dievaluasi dalam 1 kali predict
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def whatif_axes(luas: float, jarak_cbd: float, n: int = 50,
+                luas_span: Tuple[float, float] = (0.5, 2.0),
+                jarak_span_km: float = 5.0) -> Tuple[np.ndarray, np.ndarray]:
+    """Sumbu grid di sekitar nilai saat ini: luas × [span_bawah, span_atas], jarak_cbd ± span km (≥ 0)."""
+    luas = float(luas) if luas and luas > 0 else 100.0
+    jarak = max(float(jarak_cbd or 0.0), 0.0)
+    luas_vals = np.linspace(luas * luas_span[0], luas * luas_span[1], n)
+    jarak_vals = np.linspace(max(jarak - jarak_span_km, 0.0), jarak + jarak_span_km, n)
+    return luas_vals, jarak_vals
+
+
+def whatif_grid(X_row: pd.DataFrame, luas_vals: np.ndarray, jarak_vals: np.ndarray) -> pd.DataFrame:
+    """Replikasi baris input ke semua titik grid (baris = jarak, kolom = luas; urutan C)."""
+    grid = X_row.iloc[np.zeros(len(luas_vals) * len(jarak_vals), dtype=int)].reset_index(drop=True)
+    grid["luas"] = np.tile(luas_vals, len(jarak_vals))
+    grid["jarak_cbd"] = np.repeat(jarak_vals, len(luas_vals))
+    return grid
+
+
+def price_surface(model, X_row: pd.DataFrame, luas_vals: np.ndarray, jarak_vals: np.ndarray) -> np.ndarray:
+    """Harga total untuk seluruh grid dalam satu panggilan predict → array (len(jarak_vals), len(luas_vals))."""
+    preds = np.asarray(model.predict(whatif_grid(X_row, luas_vals, jarak_vals)), dtype=float)
+    return preds.reshape(len(jarak_vals), len(luas_vals))
+
+
+def plot_surface(luas_vals, jarak_vals, Z, current=None, per_m2: bool = False):
+    """Gambar kontur + permukaan 3D (matplotlib). `current` = (luas, jarak_cbd) untuk penanda titik input."""
+    import matplotlib.pyplot as plt
+
+    L, J = np.meshgrid(luas_vals, jarak_vals)
+    Zp = Z / L if per_m2 else Z
+    label = "Rp/m²" if per_m2 else "Harga total (Rp)"
+
+    fig_c, ax = plt.subplots(figsize=(6, 4.5))
+    cs = ax.contourf(L, J, Zp, levels=20, cmap="viridis")
+    ax.contour(L, J, Zp, levels=10, colors="white", linewidths=0.4, alpha=0.6)
+    fig_c.colorbar(cs, ax=ax, label=label)
+    if current is not None:
+        ax.scatter([current[0]], [current[1]], c="red", marker="x", s=80, label="Input saat ini")
+        ax.legend(loc="upper right")
+    ax.set_xlabel("Luas (m²)"); ax.set_ylabel("Jarak ke CBD (km)"); ax.set_title(f"Kontur {label}")
+
+    fig_s = plt.figure(figsize=(6, 4.5))
+    ax3 = fig_s.add_subplot(projection="3d")
+    ax3.plot_surface(L, J, Zp, cmap="viridis", linewidth=0, antialiased=True)
+    ax3.set_xlabel("Luas (m²)"); ax3.set_ylabel("Jarak CBD (km)"); ax3.set_zlabel(label)
+    ax3.set_title(f"Permukaan {label}")
+    return fig_c, fig_s